@@ -2,6 +2,11 @@
 Basic Statistics and Activity Analysis
 Deterministic calculations without AI/LLM dependencies
 
+With numpy available, temporal pattern analysis converts each timestamp
+once into an int64 array of wall-clock seconds (or microseconds for meeting
+recurrence) and buckets, diffs and counts the whole array at once. The
+pure-Python loops remain as the fallback and give the same results.
+
 References:
 - src/search/database.py - Database connection and query patterns (lines 45-80)
 - src/core/compression.py - Error handling and atomic operations (lines 95-120)
@@ -12,16 +17,72 @@ import sqlite3
 import logging
 from datetime import datetime, date, timedelta
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from collections import defaultdict, Counter
 import json
-import statistics
 from dataclasses import dataclass
 import os
 import glob
 
+from ..core.archive_reader import read_jsonl
+from ..core.lazy_import import LazyImportError, lazy_import
+
+try:
+    np = lazy_import('numpy')
+    HAS_NUMPY = True
+except LazyImportError:
+    HAS_NUMPY = False
+
 logger = logging.getLogger(__name__)
 
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_DATE = _EPOCH.date()
+_SECOND = timedelta(seconds=1)
+_MICROSECOND = timedelta(microseconds=1)
+_MICROSECONDS_PER_DAY = 86400 * 10**6
+
+
+def wall_clock_seconds(timestamps: Iterable[Optional[datetime]]) -> 'np.ndarray':
+    """
+    Convert timestamps to an int64 array of wall-clock seconds since 1970-01-01
+
+    The UTC offset is dropped, so hour and day buckets of the array match
+    .hour and .date() of the timestamps themselves.
+
+    Args:
+        timestamps: Parsed timestamps; None entries are skipped
+
+    Returns:
+        int64 array with one entry per timestamp
+    """
+    return np.array([(ts.replace(tzinfo=None) - _EPOCH) // _SECOND for ts in timestamps if ts],
+                    dtype=np.int64)
+
+
+def elapsed_microseconds(timestamps: List[datetime]) -> Optional[List[int]]:
+    """
+    Microseconds since 1970-01-01 whose differences match datetime subtraction
+
+    Timestamps sharing one tzinfo (or all naive) are subtracted on the wall
+    clock, others in UTC, as datetime does.
+
+    Args:
+        timestamps: Parsed timestamps
+
+    Returns:
+        One integer per timestamp, or None when the timestamps cannot be
+        compared on a single scale (naive mixed with aware)
+    """
+    offsets = defaultdict(set)
+    for ts in timestamps:
+        offsets[id(ts.tzinfo)].add(ts.utcoffset())
+
+    if len(offsets) == 1:
+        return [(ts.replace(tzinfo=None) - _EPOCH) // _MICROSECOND for ts in timestamps]
+    if all(len(utcoffsets) == 1 and None not in utcoffsets for utcoffsets in offsets.values()):
+        return [(ts.replace(tzinfo=None) - ts.utcoffset() - _EPOCH) // _MICROSECOND for ts in timestamps]
+    return None
+
 
 @dataclass
 class ActivityMetrics:
@@ -42,100 +103,172 @@ class ActivityMetrics:
         }
 
 
+class MessageStatsAccumulator:
+    """
+    Single-pass message counters
+    
+    Each message updates the volume, per-channel, per-author and hourly
+    counters at once, so statistics over a stream of messages take one pass
+    and memory bounded by the number of distinct channels and authors.
+    """
+    
+    def __init__(self, parse_timestamp: Callable[[Any], Optional[datetime]]):
+        """
+        Initialize empty counters
+        
+        Args:
+            parse_timestamp: Parses a message timestamp, None if invalid
+        """
+        self.parse_timestamp = parse_timestamp
+        self.total_messages = 0
+        self.by_channel = Counter()
+        self.by_author = Counter()
+        self.by_hour = Counter()
+        self.timestamp_count = 0
+        self.first_timestamp: Optional[datetime] = None
+        self.last_timestamp: Optional[datetime] = None
+        # Ranked channel -> [message count, authors, timestamp count, first, last]
+        self.channels: Dict[str, list] = {}
+    
+    def add(self, msg: Optional[Dict[str, Any]]):
+        """Update all counters with one message"""
+        self.total_messages += 1
+        if msg is None:  # Handle None messages
+            return
+        
+        author = msg.get('author')
+        if author:
+            self.by_author[author] += 1
+        if msg.get('channel'):
+            self.by_channel[msg['channel']] += 1
+        
+        timestamp = self.parse_timestamp(msg.get('timestamp'))
+        if timestamp:
+            self.by_hour[timestamp.hour] += 1
+            self.timestamp_count += 1
+            if self.first_timestamp is None or timestamp < self.first_timestamp:
+                self.first_timestamp = timestamp
+            if self.last_timestamp is None or timestamp > self.last_timestamp:
+                self.last_timestamp = timestamp
+        
+        channel = msg.get('channel', 'unknown')
+        if channel:
+            stats = self.channels.get(channel)
+            if stats is None:
+                stats = self.channels[channel] = [0, set(), 0, None, None]
+            stats[0] += 1
+            if author:
+                stats[1].add(author)
+            if timestamp:
+                stats[2] += 1
+                if stats[3] is None or timestamp < stats[3]:
+                    stats[3] = timestamp
+                if stats[4] is None or timestamp > stats[4]:
+                    stats[4] = timestamp
+    
+    def add_all(self, messages: Iterable[Optional[Dict[str, Any]]]) -> 'MessageStatsAccumulator':
+        """Update all counters with a stream of messages"""
+        for msg in messages:
+            self.add(msg)
+        return self
+
+
 class MessageStatsCalculator:
     """
     Pure mathematical message statistics calculator
     No database dependencies - works with in-memory data
+    
+    Messages may be any iterable (e.g. records streamed from JSONL
+    archives); each statistic reads every message once.
     """
     
     def __init__(self):
         self.logger = logging.getLogger(__name__ + '.MessageStatsCalculator')
     
-    def calculate_volume_stats(self, messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def accumulate(self, messages: Iterable[Optional[Dict[str, Any]]]) -> MessageStatsAccumulator:
         """
-        Calculate basic volume statistics from message list
+        Read messages once into single-pass counters
         
         Args:
-            messages: List of message dictionaries
+            messages: Iterable of message dictionaries
             
         Returns:
-            Dictionary with volume statistics
+            MessageStatsAccumulator for volume_stats / channel_rankings
         """
-        if not messages:
-            return self._empty_volume_stats()
-        
-        # Extract basic counts
-        total_messages = len(messages)
-        unique_authors = len(set(
-            msg.get('author', 'unknown') for msg in messages 
-            if msg and msg.get('author')
-        ))
-        unique_channels = len(set(
-            msg.get('channel', 'unknown') for msg in messages 
-            if msg and msg.get('channel')
-        ))
-        
-        # Calculate temporal patterns
-        timestamps = [
-            self._parse_timestamp(msg.get('timestamp'))
-            for msg in messages if msg
-        ]
-        valid_timestamps = [ts for ts in timestamps if ts]
-        
-        avg_per_hour = 0.0
-        if valid_timestamps:
-            time_span = self._calculate_time_span_hours(valid_timestamps)
-            if time_span > 0:
-                avg_per_hour = total_messages / time_span
+        return MessageStatsAccumulator(self._parse_timestamp).add_all(messages)
+    
+    def calculate_stats(self, messages: Iterable[Optional[Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Calculate volume statistics and channel rankings in one pass
         
+        Args:
+            messages: Iterable of message dictionaries
+            
+        Returns:
+            Dictionary with 'volume' and 'channel_rankings'
+        """
+        accumulator = self.accumulate(messages)
         return {
-            'total_messages': total_messages,
-            'unique_authors': unique_authors,
-            'channels_active': unique_channels,
-            'avg_messages_per_hour': round(avg_per_hour, 2),
-            'by_channel': self._count_by_field(messages, 'channel'),
-            'by_author': self._count_by_field(messages, 'author'),
-            'temporal_distribution': self._analyze_temporal_distribution(valid_timestamps)
+            'volume': self.volume_stats(accumulator),
+            'channel_rankings': self.channel_rankings(accumulator)
         }
     
-    def calculate_channel_rankings(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def calculate_volume_stats(self, messages: Iterable[Optional[Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Calculate basic volume statistics from message list
+        
+        Args:
+            messages: Iterable of message dictionaries
+            
+        Returns:
+            Dictionary with volume statistics
+        """
+        return self.volume_stats(self.accumulate(messages))
+    
+    def calculate_channel_rankings(self, messages: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Rank channels by activity level with scoring
         
         Args:
-            messages: List of message dictionaries
+            messages: Iterable of message dictionaries
             
         Returns:
             List of channel statistics sorted by activity
         """
-        channel_stats = defaultdict(lambda: {
-            'message_count': 0,
-            'unique_authors': set(),
-            'timestamps': []
-        })
+        return self.channel_rankings(self.accumulate(messages))
+    
+    def volume_stats(self, accumulator: MessageStatsAccumulator) -> Dict[str, Any]:
+        """Volume statistics from accumulated counters"""
+        if not accumulator.total_messages:
+            return self._empty_volume_stats()
         
-        # Aggregate data by channel
-        for msg in messages:
-            channel = msg.get('channel', 'unknown')
-            if channel:
-                channel_stats[channel]['message_count'] += 1
-                if msg.get('author'):
-                    channel_stats[channel]['unique_authors'].add(msg.get('author'))
-                
-                timestamp = self._parse_timestamp(msg.get('timestamp'))
-                if timestamp:
-                    channel_stats[channel]['timestamps'].append(timestamp)
+        avg_per_hour = 0.0
+        if accumulator.timestamp_count:
+            time_span = self._calculate_time_span_hours(
+                accumulator.timestamp_count, accumulator.first_timestamp, accumulator.last_timestamp
+            )
+            if time_span > 0:
+                avg_per_hour = accumulator.total_messages / time_span
         
-        # Calculate rankings
+        return {
+            'total_messages': accumulator.total_messages,
+            'unique_authors': len(accumulator.by_author),
+            'channels_active': len(accumulator.by_channel),
+            'avg_messages_per_hour': round(avg_per_hour, 2),
+            'by_channel': dict(accumulator.by_channel),
+            'by_author': dict(accumulator.by_author),
+            'temporal_distribution': self._analyze_temporal_distribution(accumulator.by_hour)
+        }
+    
+    def channel_rankings(self, accumulator: MessageStatsAccumulator) -> List[Dict[str, Any]]:
+        """Channel rankings from accumulated counters"""
         rankings = []
-        for channel, stats in channel_stats.items():
-            unique_authors = len(stats['unique_authors'])
-            message_count = stats['message_count']
+        for channel, (message_count, authors, timestamp_count, first, last) in accumulator.channels.items():
+            unique_authors = len(authors)
             
             # Calculate activity score (0-1)
-            activity_score = self._calculate_activity_score(
-                message_count, unique_authors, stats['timestamps']
-            )
+            time_span = self._calculate_time_span_hours(timestamp_count, first, last) if timestamp_count else None
+            activity_score = self._calculate_activity_score(message_count, unique_authors, time_span)
             
             rankings.append({
                 'channel_name': channel,
@@ -160,16 +293,6 @@ class MessageStatsCalculator:
             'temporal_distribution': {}
         }
     
-    def _count_by_field(self, messages: List[Dict[str, Any]], field: str) -> Dict[str, int]:
-        """Count messages by a specific field"""
-        counter = Counter()
-        for msg in messages:
-            if msg:  # Handle None messages
-                value = msg.get(field)
-                if value:
-                    counter[value] += 1
-        return dict(counter)
-    
     def _parse_timestamp(self, timestamp: Any) -> Optional[datetime]:
         """Parse various timestamp formats into datetime"""
         if not timestamp:
@@ -190,27 +313,22 @@ class MessageStatsCalculator:
         
         return None
     
-    def _calculate_time_span_hours(self, timestamps: List[datetime]) -> float:
-        """Calculate time span in hours"""
-        if len(timestamps) < 2:
+    def _calculate_time_span_hours(self, timestamp_count: int, first: datetime, last: datetime) -> float:
+        """Calculate time span in hours between the first and last of timestamp_count timestamps"""
+        if timestamp_count < 2:
             return 24.0  # Default to 1 day if insufficient data
         
-        min_time = min(timestamps)
-        max_time = max(timestamps)
-        
-        time_diff = max_time - min_time
+        time_diff = last - first
         return time_diff.total_seconds() / 3600.0
     
-    def _analyze_temporal_distribution(self, timestamps: List[datetime]) -> Dict[str, Any]:
+    def _analyze_temporal_distribution(self, hour_counts: Counter) -> Dict[str, Any]:
         """Analyze when messages are sent (hour of day patterns)"""
-        if not timestamps:
+        if not hour_counts:
             return {}
         
-        hour_counts = Counter(ts.hour for ts in timestamps)
-        
         return {
             'by_hour': dict(hour_counts),
-            'peak_hour': hour_counts.most_common(1)[0][0] if hour_counts else None,
+            'peak_hour': hour_counts.most_common(1)[0][0],
             'total_hours_active': len(hour_counts)
         }
     
@@ -218,7 +336,7 @@ class MessageStatsCalculator:
         self, 
         message_count: int, 
         unique_authors: int, 
-        timestamps: List[datetime]
+        time_span_hours: Optional[float]
     ) -> float:
         """
         Calculate activity score (0-1) based on multiple factors
@@ -226,7 +344,8 @@ class MessageStatsCalculator:
         Args:
             message_count: Total messages
             unique_authors: Number of unique participants
-            timestamps: List of message timestamps
+            time_span_hours: Hours spanned by the message timestamps, None
+                without timestamps
             
         Returns:
             Activity score between 0.0 and 1.0
@@ -242,11 +361,9 @@ class MessageStatsCalculator:
         
         # Temporal consistency score (how spread out are the messages)
         consistency_score = 0.0
-        if timestamps:
-            time_span = self._calculate_time_span_hours(timestamps)
-            if time_span > 0:
-                # Higher score for consistent activity over time
-                consistency_score = min(time_span / 168.0, 1.0)  # 1 week = max consistency score
+        if time_span_hours is not None and time_span_hours > 0:
+            # Higher score for consistent activity over time
+            consistency_score = min(time_span_hours / 168.0, 1.0)  # 1 week = max consistency score
         
         # Weighted combination
         activity_score = (
@@ -347,6 +464,40 @@ class ActivityAnalyzer:
         else:
             raise ValueError(f"Unsupported granularity: {granularity}")
     
+    def analyze_temporal_profile(self, messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Hour-of-week activity profile and message cadence (requires numpy)
+        
+        Args:
+            messages: List of message dictionaries
+            
+        Returns:
+            Dictionary with the hourly histogram, the weekday x hour matrix
+            (Monday first), inter-arrival gap statistics in seconds and the
+            dominant activity period in hours (None if there is none)
+        """
+        if not HAS_NUMPY:
+            raise ImportError("numpy is required for temporal profiles")
+        
+        seconds = self._message_seconds(messages)
+        hours = seconds // 3600
+        weekday_hour = np.bincount(
+            (hours // 24 + _EPOCH_DATE.weekday()) % 7 * 24 + hours % 24, minlength=7 * 24
+        ).reshape(7, 24)
+        gaps = np.diff(np.sort(seconds))
+        
+        return {
+            'message_count': int(hours.size),
+            'by_hour': weekday_hour.sum(axis=0).tolist(),
+            'weekday_hour': weekday_hour.tolist(),
+            'inter_arrival_seconds': {
+                'median': float(np.median(gaps)) if gaps.size else None,
+                'mean': float(gaps.mean()) if gaps.size else None,
+                'p90': float(np.percentile(gaps, 90)) if gaps.size else None
+            },
+            'dominant_period_hours': self._dominant_period(hours)
+        }
+    
     def calculate_cross_source_activity(self, activity_data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Calculate activity correlation across multiple data sources
@@ -453,12 +604,16 @@ class ActivityAnalyzer:
             normalized_title = self._normalize_meeting_title(title)
             title_groups[normalized_title].append(meeting)
         
+        # Need at least 3 occurrences to detect pattern
+        candidates = [(title, group) for title, group in title_groups.items() if len(group) >= 3]
+        if HAS_NUMPY:
+            return self._detect_recurrence_batch(candidates)
+        
         patterns = []
-        for title, meeting_group in title_groups.items():
-            if len(meeting_group) >= 3:  # Need at least 3 occurrences to detect pattern
-                pattern = self._analyze_meeting_recurrence(title, meeting_group)
-                if pattern:
-                    patterns.append(pattern)
+        for title, meeting_group in candidates:
+            pattern = self._analyze_meeting_recurrence(title, meeting_group)
+            if pattern:
+                patterns.append(pattern)
         
         return patterns
     
@@ -762,8 +917,20 @@ class ActivityAnalyzer:
     
     # Helper methods for complex calculations
     
+    def _message_seconds(self, messages: List[Dict[str, Any]]) -> 'np.ndarray':
+        """Wall-clock seconds since 1970-01-01 of the parseable message timestamps"""
+        parse = self.message_calculator._parse_timestamp
+        return wall_clock_seconds(parse(message.get('timestamp')) for message in messages)
+    
     def _analyze_daily_patterns(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Analyze daily message patterns"""
+        if HAS_NUMPY:
+            days, counts = np.unique(self._message_seconds(messages) // 86400, return_counts=True)
+            return [
+                {'date': (_EPOCH_DATE + timedelta(days=int(day))).isoformat(), 'message_count': int(count)}
+                for day, count in zip(days[::-1][:7], counts[::-1][:7])
+            ]
+        
         daily_counts = defaultdict(int)
         
         for message in messages:
@@ -784,6 +951,10 @@ class ActivityAnalyzer:
     
     def _analyze_hourly_patterns(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Analyze hourly message patterns"""
+        if HAS_NUMPY:
+            counts = np.bincount(self._message_seconds(messages) // 3600 % 24, minlength=24)
+            return [{'hour': hour, 'message_count': int(count)} for hour, count in enumerate(counts)]
+        
         hourly_counts = defaultdict(int)
         
         for message in messages:
@@ -803,6 +974,17 @@ class ActivityAnalyzer:
     
     def _analyze_weekly_patterns(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Analyze weekly message patterns"""
+        if HAS_NUMPY:
+            # Monday-based week numbers: 1970-01-01 was a Thursday
+            weeks, counts = np.unique(
+                (self._message_seconds(messages) // 86400 + _EPOCH_DATE.weekday()) // 7, return_counts=True
+            )
+            return [
+                {'week_start': (_EPOCH_DATE + timedelta(days=int(week) * 7 - _EPOCH_DATE.weekday())).isoformat(),
+                 'message_count': int(count)}
+                for week, count in zip(weeks[::-1][:4], counts[::-1][:4])
+            ]
+        
         # Similar to daily but group by week
         weekly_counts = defaultdict(int)
         
@@ -895,7 +1077,72 @@ class ActivityAnalyzer:
         if len(meetings) < 3:
             return None
         
-        # Extract start times
+        start_times = self._meeting_start_times(meetings)
+        if len(start_times) < 3:
+            return None
+        
+        # Sort by start time
+        start_times.sort()
+        
+        # Calculate intervals between meetings
+        intervals = []
+        for i in range(1, len(start_times)):
+            interval = start_times[i] - start_times[i-1]
+            intervals.append(interval.days)
+        
+        return self._recurrence_pattern(
+            title, len(meetings), len(intervals), sum(intervals), sum(i * i for i in intervals)
+        )
+    
+    def _detect_recurrence_batch(self, candidates: List[Tuple[str, List[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        """
+        Recurrence patterns of all title groups from one array of start times
+        
+        Start times of every group are sorted, diffed and summed per group
+        in one pass; groups whose start times mix naive and aware datetimes
+        go through _analyze_meeting_recurrence.
+        """
+        patterns = {}
+        group_ids = []
+        offsets = []
+        for index, (title, meetings) in enumerate(candidates):
+            start_times = self._meeting_start_times(meetings)
+            if len(start_times) < 3:
+                continue
+            elapsed = elapsed_microseconds(start_times)
+            if elapsed is None:
+                patterns[index] = self._analyze_meeting_recurrence(title, meetings)
+                continue
+            group_ids.extend([index] * len(elapsed))
+            offsets.extend(elapsed)
+        
+        if offsets:
+            group_ids = np.array(group_ids)
+            offsets = np.array(offsets, dtype=np.int64)
+            order = np.lexsort((offsets, group_ids))
+            group_ids, offsets = group_ids[order], offsets[order]
+            
+            # Whole days between consecutive meetings of the same group
+            same_group = group_ids[1:] == group_ids[:-1]
+            interval_groups = group_ids[1:][same_group]
+            intervals = (np.diff(offsets) // _MICROSECONDS_PER_DAY)[same_group]
+            
+            counts = np.bincount(interval_groups, minlength=len(candidates))
+            sums = np.zeros(len(candidates), dtype=np.int64)
+            square_sums = np.zeros(len(candidates), dtype=np.int64)
+            np.add.at(sums, interval_groups, intervals)
+            np.add.at(square_sums, interval_groups, intervals * intervals)
+            
+            for index in np.flatnonzero(counts):
+                title, meetings = candidates[index]
+                patterns[int(index)] = self._recurrence_pattern(
+                    title, len(meetings), int(counts[index]), int(sums[index]), int(square_sums[index])
+                )
+        
+        return [patterns[index] for index in sorted(patterns) if patterns[index]]
+    
+    def _meeting_start_times(self, meetings: List[Dict[str, Any]]) -> List[datetime]:
+        """Parseable start times of meetings"""
         start_times = []
         for meeting in meetings:
             start = meeting.get('start')
@@ -908,46 +1155,73 @@ class ActivityAnalyzer:
                 except ValueError:
                     continue
         
-        if len(start_times) < 3:
+        return start_times
+    
+    def _recurrence_pattern(
+        self,
+        title: str,
+        occurrence_count: int,
+        interval_count: int,
+        interval_sum: int,
+        interval_square_sum: int
+    ) -> Optional[Dict[str, Any]]:
+        """Classify a recurring pattern from the sums of its intervals in days"""
+        if not interval_count:
             return None
         
-        # Sort by start time
-        start_times.sort()
+        # Detect pattern (weekly = 7 days, daily = 1 day, etc.)
+        avg_interval = interval_sum / interval_count
+        
+        if 6 <= avg_interval <= 8:
+            pattern_type = "weekly"
+        elif 13 <= avg_interval <= 15:
+            pattern_type = "biweekly"
+        elif 25 <= avg_interval <= 35:
+            pattern_type = "monthly"
+        elif avg_interval == 1:
+            pattern_type = "daily"
+        else:
+            pattern_type = "irregular"
         
-        # Calculate intervals between meetings
-        intervals = []
-        for i in range(1, len(start_times)):
-            interval = start_times[i] - start_times[i-1]
-            intervals.append(interval.days)
+        # Calculate confidence based on consistency: sample variance, computed
+        # exactly on integers as statistics.variance does
+        variance = 0
+        if interval_count > 1:
+            variance = ((interval_count * interval_square_sum - interval_sum * interval_sum)
+                        / (interval_count * (interval_count - 1)))
+        confidence = max(0, 1 - (variance / avg_interval)) if avg_interval > 0 else 0
         
-        # Detect pattern (weekly = 7 days, daily = 1 day, etc.)
-        if intervals:
-            avg_interval = sum(intervals) / len(intervals)
-            
-            if 6 <= avg_interval <= 8:
-                pattern_type = "weekly"
-            elif 13 <= avg_interval <= 15:
-                pattern_type = "biweekly"
-            elif 25 <= avg_interval <= 35:
-                pattern_type = "monthly"
-            elif avg_interval == 1:
-                pattern_type = "daily"
-            else:
-                pattern_type = "irregular"
-            
-            # Calculate confidence based on consistency
-            variance = statistics.variance(intervals) if len(intervals) > 1 else 0
-            confidence = max(0, 1 - (variance / avg_interval)) if avg_interval > 0 else 0
-            
-            return {
-                'title': title,
-                'pattern_type': pattern_type,
-                'occurrence_count': len(meetings),
-                'average_interval_days': round(avg_interval, 1),
-                'confidence': round(confidence, 2)
-            }
+        return {
+            'title': title,
+            'pattern_type': pattern_type,
+            'occurrence_count': occurrence_count,
+            'average_interval_days': round(avg_interval, 1),
+            'confidence': round(confidence, 2)
+        }
+    
+    def _dominant_period(self, hours: 'np.ndarray') -> Optional[int]:
+        """
+        Strongest activity period in hours, from the autocorrelation of hourly counts
         
-        return None
+        The autocorrelation is computed with a zero-padded FFT and searched
+        from its first negative lag up to half the observed span.
+        """
+        if hours.size < 2:
+            return None
+        
+        counts = np.bincount(hours - hours.min()).astype(np.float64)
+        span = counts.size
+        centered = counts - counts.mean()
+        spectrum = np.fft.rfft(centered, 2 * span)
+        # Biased estimate: shrinks with the lag, so multiples of a period lose to the period
+        autocorrelation = np.fft.irfft(spectrum * np.conj(spectrum), 2 * span)[:span]
+        
+        search = autocorrelation[:span // 2 + 1]
+        negative = np.flatnonzero(search < 0)
+        if not negative.size:
+            return None
+        lag = int(negative[0] + np.argmax(search[negative[0]:]))
+        return lag if search[lag] > 0 else None
     
     def _is_virtual_location(self, location: str) -> bool:
         """Check if meeting location is virtual"""
@@ -1022,6 +1296,119 @@ class ActivityAnalyzer:
 # ACTIVITY ANALYZER IMPLEMENTATION
 # =============================================================================
 
+class ActivityAccumulator:
+    """
+    Single-pass Slack and Calendar counters for one day of activity
+    
+    Messages and events are streamed from the raw archives and update every
+    counter (volume, per-channel, per-author, hourly histogram, meeting
+    durations and types) as they are read, so no day's records are kept in
+    memory.
+    """
+    
+    def __init__(self, person: Optional[str] = None):
+        """
+        Initialize empty counters
+        
+        Args:
+            person: Optional person filter (message author/user, event
+                attendee/organizer email)
+        """
+        self.person = person
+        self.messages_seen = 0
+        self.events_seen = 0
+        
+        self.message_count = 0
+        self.authors = set()
+        self.channel_counts = Counter()
+        self.hourly_counts = Counter()
+        
+        self.meeting_count = 0
+        self.total_duration = 0.0
+        self.meeting_types = Counter()
+    
+    def add_message(self, msg: Dict[str, Any]):
+        """Update Slack counters with one message"""
+        self.messages_seen += 1
+        person = self.person
+        if person and msg.get('author') != person and msg.get('user') != person:
+            return
+        
+        self.message_count += 1
+        self.authors.add(msg.get('author', msg.get('user', 'unknown')))
+        if msg.get('channel'):
+            self.channel_counts[msg['channel']] += 1
+        
+        timestamp = msg.get('timestamp')
+        if timestamp:
+            try:
+                # Handle different timestamp formats
+                if isinstance(timestamp, str):
+                    dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+                else:
+                    dt = datetime.fromtimestamp(float(timestamp))
+                self.hourly_counts[dt.hour] += 1
+            except (ValueError, TypeError, OverflowError, OSError):
+                pass
+    
+    def add_event(self, event: Dict[str, Any]):
+        """Update Calendar counters with one event"""
+        self.events_seen += 1
+        person = self.person
+        if person:
+            # Attendee or organizer
+            attendees = event.get('attendees', [])
+            organizer = event.get('organizer', {}).get('email', '')
+            if not (any(person in att.get('email', '') for att in attendees) or person in organizer):
+                return
+        
+        self.meeting_count += 1
+        
+        # Calculate duration
+        start = event.get('start', {}).get('dateTime')
+        end = event.get('end', {}).get('dateTime')
+        if start and end:
+            try:
+                start_dt = datetime.fromisoformat(start.replace('Z', '+00:00'))
+                end_dt = datetime.fromisoformat(end.replace('Z', '+00:00'))
+                self.total_duration += (end_dt - start_dt).total_seconds() / 60  # minutes
+            except (ValueError, TypeError, AttributeError):
+                pass
+        
+        # Categorize meeting types (simple heuristic)
+        summary = event.get('summary', '').lower()
+        if 'standup' in summary or 'daily' in summary:
+            self.meeting_types['standup'] += 1
+        elif 'review' in summary or 'retro' in summary:
+            self.meeting_types['review'] += 1
+        elif 'planning' in summary or 'plan' in summary:
+            self.meeting_types['planning'] += 1
+        else:
+            self.meeting_types['general'] += 1
+    
+    def slack_activity(self) -> Dict[str, Any]:
+        """Slack activity summary of the accumulated messages"""
+        hourly_counts = self.hourly_counts
+        peak_hour = max(hourly_counts.items(), key=lambda x: x[1])[0] if hourly_counts else None
+        
+        return {
+            'message_count': self.message_count,
+            'channels_active': [channel for channel, _ in self.channel_counts.most_common(10)],
+            'unique_authors': len(self.authors),
+            'peak_activity_hour': peak_hour
+        }
+    
+    def calendar_activity(self) -> Dict[str, Any]:
+        """Calendar activity summary of the accumulated events"""
+        meeting_count = self.meeting_count
+        return {
+            'meeting_count': meeting_count,
+            'total_duration_minutes': int(self.total_duration),
+            'meeting_types': dict(self.meeting_types),
+            'average_duration': int(self.total_duration / meeting_count) if meeting_count > 0 else 0
+        }
+
+
 class ActivityAnalyzerImpl:
     """
     Real implementation of ActivityAnalyzer interface
@@ -1065,16 +1452,19 @@ class ActivityAnalyzerImpl:
             }
         }
         
-        # Load Slack data
-        slack_data = self._load_slack_data(target_date)
-        if slack_data:
-            summary['slack_activity'] = self._analyze_slack_activity(slack_data, person)
+        # Stream Slack messages and Calendar events into the counters
+        activity = ActivityAccumulator(person)
+        for msg in self._iter_slack_messages(target_date):
+            activity.add_message(msg)
+        for event in self._iter_calendar_events(target_date):
+            activity.add_event(event)
+        
+        if activity.messages_seen:
+            summary['slack_activity'] = activity.slack_activity()
             summary['generation_metadata']['data_sources_found'].append('slack')
             
-        # Load Calendar data
-        calendar_data = self._load_calendar_data(target_date)
-        if calendar_data:
-            summary['calendar_activity'] = self._analyze_calendar_activity(calendar_data, person)
+        if activity.events_seen:
+            summary['calendar_activity'] = activity.calendar_activity()
             summary['generation_metadata']['data_sources_found'].append('calendar')
             
         # Load Drive data
@@ -1104,13 +1494,7 @@ class ActivityAnalyzerImpl:
             Weekly summary dictionary
         """
         start_date = datetime.fromisoformat(week_start).date()
-        
-        # Generate daily summaries for the week
-        daily_summaries = []
-        for i in range(7):
-            day = start_date + timedelta(days=i)
-            daily_summary = self.generate_daily_summary(day.isoformat(), person)
-            daily_summaries.append(daily_summary)
+        daily_summaries = self._daily_summaries(start_date, 7, person)
         
         # Aggregate weekly data
         return {
@@ -1126,6 +1510,39 @@ class ActivityAnalyzerImpl:
             }
         }
     
+    def generate_monthly_summary(self, month_start: str, person: Optional[str] = None,
+                                 **kwargs) -> Dict[str, Any]:
+        """
+        Generate monthly activity summary
+        
+        Covers month_start through the last day of its month.
+        
+        Args:
+            month_start: First date in YYYY-MM-DD format
+            person: Optional person filter
+            **kwargs: Additional parameters
+            
+        Returns:
+            Monthly summary dictionary
+        """
+        start_date = datetime.fromisoformat(month_start).date()
+        next_month = (start_date.replace(day=1) + timedelta(days=32)).replace(day=1)
+        daily_summaries = self._daily_summaries(start_date, (next_month - start_date).days, person)
+        
+        return {
+            'month_start': month_start,
+            'month_end': (next_month - timedelta(days=1)).isoformat(),
+            'person': person,
+            'summary_stats': self._aggregate_weekly_stats(daily_summaries),
+            'trends': self._analyze_weekly_trends(daily_summaries),
+            'top_achievements': self._extract_weekly_achievements(daily_summaries),
+            'metadata': {
+                'generated_at': datetime.now().isoformat(),
+                'daily_summaries_count': len(daily_summaries),
+                'real_implementation': True
+            }
+        }
+    
     def get_statistics(self, time_range: str, breakdown: Optional[str] = None, **kwargs) -> Dict[str, Any]:
         """
         Get activity statistics for time range
@@ -1149,60 +1566,55 @@ class ActivityAnalyzerImpl:
     
     # Private helper methods
     
-    def _load_slack_data(self, target_date: date) -> Optional[Dict[str, Any]]:
-        """Load Slack data for the target date"""
+    def _daily_summaries(self, start_date: date, days: int, person: Optional[str]) -> List[Dict[str, Any]]:
+        """Daily summaries of consecutive days; each day's records are streamed once"""
+        return [self.generate_daily_summary((start_date + timedelta(days=i)).isoformat(), person)
+                for i in range(days)]
+    
+    def _iter_slack_messages(self, target_date: date) -> Iterator[Dict[str, Any]]:
+        """Stream Slack messages of the target date from its JSONL files"""
         date_str = target_date.isoformat()
         slack_dir = self.data_dir / 'slack' / date_str
         
         if not slack_dir.exists():
             self.logger.debug(f"No Slack data found for {date_str}")
-            return None
+            return
             
         # Look for JSONL files with message data
-        message_files = list(slack_dir.glob('messages_*.jsonl'))
+        message_files = sorted(slack_dir.glob('messages_*.jsonl'))
         if not message_files:
             self.logger.debug(f"No Slack message files found in {slack_dir}")
-            return None
+            return
             
-        # Load and parse JSONL data
-        messages = []
         for file_path in message_files:
             try:
-                with open(file_path, 'r') as f:
-                    for line in f:
-                        if line.strip():
-                            messages.append(json.loads(line))
+                for _, record in read_jsonl(file_path):
+                    if isinstance(record, dict):
+                        yield record
             except Exception as e:
                 self.logger.error(f"Failed to load {file_path}: {e}")
-                
-        return {'messages': messages} if messages else None
     
-    def _load_calendar_data(self, target_date: date) -> Optional[Dict[str, Any]]:
-        """Load Calendar data for the target date"""
+    def _iter_calendar_events(self, target_date: date) -> Iterator[Dict[str, Any]]:
+        """Stream Calendar events of the target date, one events file at a time"""
         date_str = target_date.isoformat()
         calendar_dir = self.data_dir / 'calendar' / date_str
         
         if not calendar_dir.exists():
-            return None
+            return
             
         # Look for JSON files with event data
-        event_files = list(calendar_dir.glob('events_*.json'))
-        if not event_files:
-            return None
-            
-        events = []
-        for file_path in event_files:
+        for file_path in sorted(calendar_dir.glob('events_*.json')):
             try:
                 with open(file_path, 'r') as f:
                     data = json.load(f)
-                    if isinstance(data, list):
-                        events.extend(data)
-                    elif isinstance(data, dict) and 'events' in data:
-                        events.extend(data['events'])
             except Exception as e:
                 self.logger.error(f"Failed to load {file_path}: {e}")
-                
-        return {'events': events} if events else None
+                continue
+            
+            if isinstance(data, dict):
+                data = data.get('events', [])
+            if isinstance(data, list):
+                yield from data
     
     def _load_drive_data(self, target_date: date) -> Optional[Dict[str, Any]]:
         """Load Drive data for the target date"""
@@ -1223,92 +1635,6 @@ class ActivityAnalyzerImpl:
                 
         return None
     
-    def _analyze_slack_activity(self, slack_data: Dict[str, Any], person: Optional[str]) -> Dict[str, Any]:
-        """Analyze Slack activity data"""
-        messages = slack_data.get('messages', [])
-        
-        if person:
-            # Filter messages for specific person
-            messages = [msg for msg in messages if msg.get('author') == person or msg.get('user') == person]
-        
-        # Calculate basic metrics
-        message_count = len(messages)
-        unique_authors = len(set(msg.get('author', msg.get('user', 'unknown')) for msg in messages))
-        channels = set(msg.get('channel') for msg in messages if msg.get('channel'))
-        
-        # Find peak activity hour
-        hourly_counts = defaultdict(int)
-        for msg in messages:
-            timestamp = msg.get('timestamp')
-            if timestamp:
-                try:
-                    # Handle different timestamp formats
-                    if isinstance(timestamp, str):
-                        dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                    else:
-                        dt = datetime.fromtimestamp(float(timestamp))
-                    hourly_counts[dt.hour] += 1
-                except:
-                    continue
-        
-        peak_hour = max(hourly_counts.items(), key=lambda x: x[1])[0] if hourly_counts else None
-        
-        return {
-            'message_count': message_count,
-            'channels_active': list(channels)[:10],  # Limit to top 10
-            'unique_authors': unique_authors,
-            'peak_activity_hour': peak_hour
-        }
-    
-    def _analyze_calendar_activity(self, calendar_data: Dict[str, Any], person: Optional[str]) -> Dict[str, Any]:
-        """Analyze Calendar activity data"""
-        events = calendar_data.get('events', [])
-        
-        if person:
-            # Filter events for specific person (attendee or organizer)
-            filtered_events = []
-            for event in events:
-                attendees = event.get('attendees', [])
-                organizer = event.get('organizer', {}).get('email', '')
-                if any(person in att.get('email', '') for att in attendees) or person in organizer:
-                    filtered_events.append(event)
-            events = filtered_events
-        
-        meeting_count = len(events)
-        total_duration = 0
-        meeting_types = defaultdict(int)
-        
-        for event in events:
-            # Calculate duration
-            start = event.get('start', {}).get('dateTime')
-            end = event.get('end', {}).get('dateTime')
-            if start and end:
-                try:
-                    start_dt = datetime.fromisoformat(start.replace('Z', '+00:00'))
-                    end_dt = datetime.fromisoformat(end.replace('Z', '+00:00'))
-                    duration = (end_dt - start_dt).total_seconds() / 60  # minutes
-                    total_duration += duration
-                except:
-                    pass
-            
-            # Categorize meeting types (simple heuristic)
-            summary = event.get('summary', '').lower()
-            if 'standup' in summary or 'daily' in summary:
-                meeting_types['standup'] += 1
-            elif 'review' in summary or 'retro' in summary:
-                meeting_types['review'] += 1
-            elif 'planning' in summary or 'plan' in summary:
-                meeting_types['planning'] += 1
-            else:
-                meeting_types['general'] += 1
-        
-        return {
-            'meeting_count': meeting_count,
-            'total_duration_minutes': int(total_duration),
-            'meeting_types': dict(meeting_types),
-            'average_duration': int(total_duration / meeting_count) if meeting_count > 0 else 0
-        }
-    
     def _analyze_drive_activity(self, drive_data: Dict[str, Any], person: Optional[str]) -> Dict[str, Any]:
         """Analyze Drive activity data"""
         stats = drive_data.get('file_statistics', {})
@@ -15,12 +15,15 @@ from typing import Dict, List, Optional, Any
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.search.database import SearchDatabase, DatabaseError
+from src.search.database import DatabaseError
+from src.search.pagination import InvalidCursorError
 from src.core.permission_checker import get_permission_checker, validate_permissions
+from src.cli.query_daemon import open_search_database
 
 logger = logging.getLogger(__name__)
 
-def execute_search(query: str, source: Optional[str] = None, limit: int = 5) -> Dict[str, Any]:
+def execute_search(query: str, source: Optional[str] = None, limit: int = 5,
+                   cursor: Optional[str] = None) -> Dict[str, Any]:
     """
     Execute search command with direct SearchDatabase integration
     
@@ -28,6 +31,7 @@ def execute_search(query: str, source: Optional[str] = None, limit: int = 5) ->
         query: Search query string
         source: Optional source filter (slack, calendar, drive, employees)
         limit: Maximum results to return
+        cursor: Continuation token from a previous page ("More results" button)
         
     Returns:
         Dict containing search results or error information
@@ -46,18 +50,27 @@ def execute_search(query: str, source: Optional[str] = None, limit: int = 5) ->
                 "suggestion": "Run data collection first"
             }
         
-        # Create database connection and perform search
-        search_db = SearchDatabase(str(db_path))
-        results = search_db.search(query=query, source=source, limit=limit)
+        # Search through the query daemon when running, else in-process
+        search_db = open_search_database(str(db_path))
+        page = search_db.search_page(query=query, source=source, limit=limit, cursor=cursor)
+        results = page['results']
         
         return {
             "query": query,
             "source_filter": source,
             "results": results,
             "total": len(results),
+            "next_cursor": page['next_cursor'],
             "error": None
         }
         
+    except InvalidCursorError as e:
+        logger.warning(f"Rejected search cursor: {e}")
+        return {
+            "error": "These results have expired, please run the search again",
+            "query": query,
+            "results": []
+        }
     except DatabaseError as e:
         logger.error(f"Database error during search: {e}")
         return {
@@ -15,20 +15,22 @@ import sys
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 
-from slack_bolt import App
-from slack_sdk import WebClient
-
 # Add project root for imports
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-# Import from existing infrastructure
+# Import from existing infrastructure. Slack Bolt, the credential vault and
+# the collectors load when the bot is constructed, not when this module is
+# imported, so command modules and tests don't pay for them.
 try:
-    from src.core.auth_manager import credential_vault
-    from src.core.permission_checker import get_permission_checker, PermissionLevel
-    from src.search.database import SearchDatabase
-    from src.collectors.slack_collector import SlackRateLimiter
-    from src.cli.interfaces import get_activity_analyzer
+    from src.core.lazy_import import lazy_import
+    from src.bot.utils.formatters import (
+        SEARCH_MORE_ACTION_ID, format_more_results_actions, parse_more_results_value
+    )
+    slack_bolt = lazy_import('slack_bolt')
+    auth_manager = lazy_import('src.core.auth_manager')
+    permission_checker = lazy_import('src.core.permission_checker')
+    slack_collector = lazy_import('src.collectors.slack_collector')
 except ImportError as e:
     logging.error(f"Failed to import bot infrastructure: {e}")
     raise
@@ -46,23 +48,25 @@ class SimpleSlackBot:
     - Basic error handling
     """
     
+    SEARCH_PAGE_SIZE = 3  # Results shown per response / "More results" page
+    
     def __init__(self):
         """Initialize Slack bot with direct CLI integration"""
         # Get bot token from existing auth system
-        self.bot_token = credential_vault.get_slack_bot_token()
+        self.bot_token = auth_manager.credential_vault.get_slack_bot_token()
         if not self.bot_token:
             raise ValueError("Slack bot token not available - check authentication setup")
         
         # Initialize direct integrations
-        self.permission_checker = get_permission_checker()
-        self.rate_limiter = SlackRateLimiter(base_delay=1.0)
+        self.permission_checker = permission_checker.get_permission_checker()
+        self.rate_limiter = slack_collector.SlackRateLimiter(base_delay=1.0)
         
         # Direct tool integrations
         self.search_db = None  # Will be created on demand
         self.activity_analyzer = None  # Will be created on demand
         
         # Create Bolt app
-        self.app = App(token=self.bot_token)
+        self.app = slack_bolt.App(token=self.bot_token)
         
         # Register handlers
         self._register_handlers()
@@ -77,6 +81,11 @@ class SimpleSlackBot:
         def handle_cos_command(ack, respond, command):
             self._handle_cos_command(ack, respond, command)
         
+        # "More results" button on search responses
+        @self.app.action(SEARCH_MORE_ACTION_ID)
+        def handle_search_more(ack, respond, body):
+            self._handle_search_more(ack, respond, body)
+        
         # Simple error handler
         @self.app.error
         def error_handler(error, body, logger):
@@ -114,22 +123,48 @@ class SimpleSlackBot:
             logger.error(f"Command error: {e}")
             respond("❌ Command failed. Please try again.")
     
-    def _handle_search(self, respond, query):
+    def _handle_search(self, respond, query, cursor=None, page=1, source=None):
         """Handle search sub-command using command module"""
         try:
             from .commands.search import execute_search, format_search_response
             
-            # Execute search using command module
-            result = execute_search(query, limit=5)
+            # Execute search using command module (one displayed page per call)
+            result = execute_search(query, source=source, limit=self.SEARCH_PAGE_SIZE, cursor=cursor)
             
             # Format and respond
             response = format_search_response(result)
-            respond(response)
+            next_cursor = result.get('next_cursor')
+            if next_cursor:
+                respond(text=response, blocks=[
+                    {"type": "section", "text": {"type": "mrkdwn", "text": response}},
+                    format_more_results_actions(query, next_cursor, page + 1, source)
+                ])
+            else:
+                respond(response)
             
         except Exception as e:
             logger.error(f"Search error: {e}")
             respond("❌ Search failed. Please try again.")
     
+    def _handle_search_more(self, ack, respond, body):
+        """Handle the "More results" button by continuing from its cursor"""
+        ack()
+        
+        try:
+            actions = body.get('actions') or [{}]
+            more = parse_more_results_value(actions[0].get('value', ''))
+            if not more:
+                respond("❌ These results have expired, please run the search again.")
+                return
+            
+            self.rate_limiter.wait_for_api_limit()
+            self._handle_search(respond, more['query'], cursor=more['cursor'], page=more['page'],
+                                source=more['source'])
+            
+        except Exception as e:
+            logger.error(f"More results error: {e}")
+            respond("❌ Search failed. Please try again.")
+    
     def _handle_brief(self, respond, options):
         """Handle brief sub-command using command module"""
         try:
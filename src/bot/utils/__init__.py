@@ -10,15 +10,24 @@ Provides utilities for Slack bot functionality including:
 
 from .formatters import (
     format_search_results_blocks,
+    format_more_results_actions,
+    parse_more_results_value,
     format_brief_blocks,
     format_error_blocks,
     format_loading_blocks
 )
 
-from .async_bridge import run_sync_in_thread, AsyncBridge
+try:
+    from .async_bridge import run_sync_in_thread, AsyncBridge
+except ImportError:
+    # Async bridge is optional; formatters must stay importable without it
+    run_sync_in_thread = None
+    AsyncBridge = None
 
 __all__ = [
     'format_search_results_blocks',
+    'format_more_results_actions',
+    'parse_more_results_value',
     'format_brief_blocks', 
     'format_error_blocks',
     'format_loading_blocks',
@@ -18,8 +18,10 @@ Block Kit Reference:
 - https://api.slack.com/block-kit/interactive-components
 """
 
+import hashlib
 import json
 import logging
+from collections import OrderedDict
 from datetime import datetime, date
 from typing import Dict, List, Optional, Any, Union
 from urllib.parse import quote
@@ -30,10 +32,19 @@ logger = logging.getLogger(__name__)
 MAX_TEXT_LENGTH = 3000
 MAX_BLOCKS_PER_MESSAGE = 50
 MAX_ELEMENTS_PER_SECTION = 10
+MAX_BUTTON_VALUE_LENGTH = 2000
+
+# Interactive action identifiers
+SEARCH_MORE_ACTION_ID = "search_more_results"
+
+# Queries too long for a button value, kept here and referenced by key
+MAX_STORED_QUERIES = 256
+_stored_queries: "OrderedDict[str, str]" = OrderedDict()
 
 def format_search_results_blocks(results: List[Dict[str, Any]], query: str,
                                 total_results: int, search_duration: float,
-                                page: int = 1, source_filter: Optional[str] = None) -> List[Dict[str, Any]]:
+                                page: int = 1, source_filter: Optional[str] = None,
+                                next_cursor: Optional[str] = None) -> List[Dict[str, Any]]:
     """
     Format search results as Slack Block Kit blocks
     
@@ -44,6 +55,7 @@ def format_search_results_blocks(results: List[Dict[str, Any]], query: str,
         search_duration: Time taken for search
         page: Current page number
         source_filter: Applied source filter if any
+        next_cursor: Continuation token; adds a "More results" button when set
         
     Returns:
         List of Block Kit blocks
@@ -88,6 +100,10 @@ def format_search_results_blocks(results: List[Dict[str, Any]], query: str,
         if i < len(results) - 1:
             blocks.append({"type": "divider"})
     
+    # "More results" button continues from the keyset cursor
+    if next_cursor:
+        blocks.append(format_more_results_actions(query, next_cursor, page + 1, source_filter))
+    
     # Add footer with tips
     blocks.extend(_create_search_footer(query, source_filter))
     
@@ -178,6 +194,90 @@ def _format_result_metadata(metadata: Dict[str, Any]) -> List[Dict[str, str]]:
     # Limit to MAX_ELEMENTS_PER_SECTION
     return elements[:MAX_ELEMENTS_PER_SECTION]
 
+def format_more_results_actions(query: str, next_cursor: str, next_page: int = 2,
+                                source_filter: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Build an actions block with a "More results" button
+    
+    The button value carries everything needed to fetch the next page, so the
+    action handler stays stateless. The cursor only matches the exact query it
+    was issued for, so a query too long for the button value is kept in a
+    bounded in-process store and the value carries its key instead.
+    
+    Args:
+        query: Original search query
+        next_cursor: Continuation token for the next page
+        next_page: Page number the button leads to
+        source_filter: Applied source filter if any
+        
+    Returns:
+        Block Kit actions block
+    """
+    payload = {
+        "query": query,
+        "cursor": next_cursor,
+        "page": next_page,
+        "source": source_filter
+    }
+    value = json.dumps(payload)
+    if len(value) > MAX_BUTTON_VALUE_LENGTH:
+        query_key = hashlib.sha256(query.encode('utf-8')).hexdigest()[:16]
+        _stored_queries[query_key] = query
+        _stored_queries.move_to_end(query_key)
+        while len(_stored_queries) > MAX_STORED_QUERIES:
+            _stored_queries.popitem(last=False)
+        
+        del payload["query"]
+        payload["query_key"] = query_key
+        value = json.dumps(payload)
+    
+    return {
+        "type": "actions",
+        "elements": [
+            {
+                "type": "button",
+                "text": {
+                    "type": "plain_text",
+                    "text": "More results"
+                },
+                "action_id": SEARCH_MORE_ACTION_ID,
+                "value": value
+            }
+        ]
+    }
+
+def parse_more_results_value(value: str) -> Dict[str, Any]:
+    """
+    Decode the value of a "More results" button
+    
+    Args:
+        value: Button value produced by format_more_results_actions()
+        
+    Returns:
+        Dict with query, cursor, page and source (empty dict if unreadable)
+    """
+    try:
+        payload = json.loads(value)
+    except (TypeError, json.JSONDecodeError):
+        return {}
+    
+    if not isinstance(payload, dict) or not payload.get("cursor"):
+        return {}
+    
+    query = payload.get("query", "")
+    if "query_key" in payload:
+        # Long query kept in-process; gone after a restart or eviction
+        query = _stored_queries.get(payload["query_key"])
+        if query is None:
+            return {}
+    
+    return {
+        "query": query,
+        "cursor": payload["cursor"],
+        "page": int(payload.get("page") or 2),
+        "source": payload.get("source")
+    }
+
 def _create_search_footer(query: str, source_filter: Optional[str]) -> List[Dict[str, Any]]:
     """Create footer with search tips and actions"""
     return [
@@ -306,7 +306,7 @@ def get_availability_engine() -> Union[AvailabilityEngine, 'MockAvailabilityEngi
         return MockAvailabilityEngine()
     
     try:
-        from src.scheduling.availability import AvailabilityEngineImpl
+        from src.scheduling.busy_index import AvailabilityEngineImpl
         return AvailabilityEngineImpl()
     except ImportError:
         return MockAvailabilityEngine()
@@ -324,6 +324,12 @@ def get_activity_analyzer() -> Union[ActivityAnalyzer, 'MockActivityAnalyzer']:
     if test_mode:
         return MockActivityAnalyzer()
     
+    # A running query daemon serves summaries from a warm process
+    from src.cli.query_daemon import remote_activity_analyzer
+    remote = remote_activity_analyzer()
+    if remote is not None:
+        return remote
+    
     try:
         from src.aggregators.basic_stats import ActivityAnalyzerImpl
         return ActivityAnalyzerImpl()
@@ -0,0 +1,590 @@
+"""
+Resident query daemon for CLI tools and the Slack bot
+
+Every CLI invocation starts a fresh interpreter, imports the search stack,
+opens SQLite and re-reads collected data before doing any work. The query
+daemon is an optional long-running process that keeps those warm:
+
+- one SearchDatabase (connection pool, prepared schema) per database file
+- one ActivityAnalyzer per AICOS_BASE_DIR
+- the latest calendar collection, reloaded only when its files change;
+  slot and conflict queries run against it and return only their results
+
+Protocol: newline-delimited JSON over a Unix socket. Each request is
+{"op": ..., "params": {...}} and each response is {"ok": true, "result": ...}
+or {"ok": false, "error": {"type": ..., "message": ...}}. A connection may
+carry any number of requests.
+
+Clients never require the daemon. open_search_database(),
+remote_activity_analyzer() and call_or_none() return in-process
+implementations (or None) when no daemon is listening, and a proxy that
+loses its daemon mid-session falls back to in-process execution.
+
+Socket path: AICOS_QUERY_DAEMON_SOCKET, else $XDG_RUNTIME_DIR, else the
+temp directory (per-user name). The socket is created with mode 0600.
+Set AICOS_QUERY_DAEMON=off to make clients ignore a running daemon.
+
+References:
+- tools/query_daemon.py - start/stop/status entry point
+- tools/search_cli.py, tools/query_facts.py, tools/find_slots.py - clients
+- src/bot/commands/search.py - bot search client
+"""
+
+import logging
+import os
+import socket
+import socketserver
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+from ..core import json_codec
+
+logger = logging.getLogger(__name__)
+
+SOCKET_ENV_VAR = 'AICOS_QUERY_DAEMON_SOCKET'
+ENABLE_ENV_VAR = 'AICOS_QUERY_DAEMON'
+SOCKET_NAME = 'aicos-query-daemon.sock'
+PROTOCOL_VERSION = 1
+
+CONNECT_TIMEOUT = 0.25     # seconds; a live daemon accepts immediately
+REQUEST_TIMEOUT = 60.0     # seconds; covers slow full-archive statistics
+MAX_REQUEST_BYTES = 1024 * 1024
+POLL_INTERVAL = 0.5
+
+# ActivityAnalyzer methods the daemon may run on behalf of a client
+ANALYZER_METHODS = ('generate_daily_summary', 'generate_weekly_summary', 'generate_monthly_summary',
+                    'get_statistics')
+
+
+class QueryDaemonError(Exception):
+    """Raised when the daemon cannot start or a request is invalid"""
+    pass
+
+
+class DaemonUnavailableError(QueryDaemonError):
+    """Raised when no daemon is listening on the socket"""
+    pass
+
+
+class RemoteError(QueryDaemonError):
+    """Raised when a request failed inside the daemon"""
+
+    def __init__(self, error_type: str, message: str):
+        super().__init__(message)
+        self.error_type = error_type
+
+
+def default_socket_path() -> Path:
+    """
+    Resolve the daemon socket path
+
+    Returns:
+        AICOS_QUERY_DAEMON_SOCKET, else a per-user path in the runtime or temp dir
+    """
+    configured = os.getenv(SOCKET_ENV_VAR)
+    if configured:
+        return Path(configured)
+    runtime_dir = os.getenv('XDG_RUNTIME_DIR')
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return Path(runtime_dir) / SOCKET_NAME
+    return Path(tempfile.gettempdir()) / f"aicos-query-daemon-{os.getuid()}.sock"
+
+
+def daemon_enabled() -> bool:
+    """Check whether clients may use a running daemon"""
+    return os.getenv(ENABLE_ENV_VAR, '').strip().lower() not in ('off', '0', 'false', 'no')
+
+
+# Client side
+
+class QueryDaemonClient:
+    """Synchronous client for the daemon's JSON-lines protocol"""
+
+    def __init__(self, socket_path: Optional[Union[str, Path]] = None,
+                 timeout: float = REQUEST_TIMEOUT):
+        self.socket_path = Path(socket_path) if socket_path else default_socket_path()
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+        self._reader = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(CONNECT_TIMEOUT)
+        try:
+            sock.connect(str(self.socket_path))
+        except (FileNotFoundError, ConnectionRefusedError, socket.timeout, OSError) as e:
+            sock.close()
+            raise DaemonUnavailableError(f"No query daemon at {self.socket_path}: {e}")
+        sock.settimeout(self.timeout)
+        self._sock = sock
+        self._reader = sock.makefile('rb')
+
+    def call(self, op: str, **params) -> Any:
+        """
+        Run one operation in the daemon
+
+        Args:
+            op: Operation name (see QueryDaemon.handlers)
+            **params: JSON-serializable operation parameters
+
+        Returns:
+            The operation's result
+
+        Raises:
+            DaemonUnavailableError: If no daemon is listening or it went away
+            RemoteError: If the operation raised inside the daemon
+        """
+        request = json_codec.dumps({'op': op, 'params': params}, default=str).encode('utf-8') + b'\n'
+        with self._lock:
+            if self._sock is None:
+                self._connect()
+            try:
+                self._sock.sendall(request)
+                line = self._reader.readline()
+            except OSError as e:
+                self.close()
+                raise DaemonUnavailableError(f"Query daemon connection lost: {e}")
+            if not line:
+                self.close()
+                raise DaemonUnavailableError("Query daemon closed the connection")
+
+        response = json_codec.loads(line)
+        if response.get('ok'):
+            return response.get('result')
+        error = response.get('error') or {}
+        raise RemoteError(error.get('type', 'QueryDaemonError'), error.get('message', 'Unknown error'))
+
+    def ping(self) -> Dict[str, Any]:
+        """Return daemon status (pid, version, uptime, request count)"""
+        return self.call('ping')
+
+    def close(self):
+        """Close the connection; the next call reconnects"""
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def get_client() -> Optional[QueryDaemonClient]:
+    """
+    Client for the running daemon, if any
+
+    Returns:
+        QueryDaemonClient when the daemon is enabled and its socket exists,
+        otherwise None. Only the socket file is checked; a stale socket
+        surfaces as DaemonUnavailableError on the first call.
+    """
+    if not daemon_enabled():
+        return None
+    socket_path = default_socket_path()
+    if not socket_path.exists():
+        return None
+    return QueryDaemonClient(socket_path)
+
+
+def call_or_none(op: str, **params) -> Any:
+    """
+    Run an operation in the daemon, or return None if none is running
+
+    RemoteError still propagates: the daemon ran the operation and it failed.
+    """
+    client = get_client()
+    if client is None:
+        return None
+    try:
+        return client.call(op, **params)
+    except DaemonUnavailableError as e:
+        logger.debug(f"Falling back to in-process execution: {e}")
+        return None
+    finally:
+        client.close()
+
+
+class RemoteSearchDatabase:
+    """
+    SearchDatabase stand-in that runs queries in the daemon
+
+    Implements the read paths the CLIs and bot use (search_page,
+    get_stats). If the daemon goes away the proxy opens the database
+    in-process and carries on.
+    """
+
+    def __init__(self, db_path: str, client: QueryDaemonClient):
+        self.db_path = str(Path(db_path).resolve())
+        self._client = client
+        self._local = None
+
+    def _local_db(self):
+        if self._local is None:
+            from ..search.database import SearchDatabase
+            self._local = SearchDatabase(self.db_path)
+        return self._local
+
+    def _call(self, op: str, fallback: Callable[[Any], Any], **params) -> Any:
+        if self._local is None:
+            try:
+                return self._client.call(op, db_path=self.db_path, **params)
+            except DaemonUnavailableError as e:
+                logger.debug(f"Query daemon unavailable, searching in-process: {e}")
+            except RemoteError as e:
+                raise _search_error(e)
+        return fallback(self._local_db())
+
+    def search_page(self, query: str, source: Optional[str] = None, date_range=None,
+                    limit: int = 100, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """Same contract as SearchDatabase.search_page"""
+        return self._call('search_page',
+                          lambda db: db.search_page(query=query, source=source, date_range=date_range,
+                                                    limit=limit, cursor=cursor),
+                          query=query, source=source,
+                          date_range=list(date_range) if date_range else None,
+                          limit=limit, cursor=cursor)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Same contract as SearchDatabase.get_stats"""
+        return self._call('search_stats', lambda db: db.get_stats())
+
+    def close(self):
+        """Release the daemon connection and any in-process fallback"""
+        self._client.close()
+        if self._local is not None:
+            self._local.close()
+
+
+def _search_error(error: RemoteError) -> Exception:
+    """Map a daemon-side search failure back to the in-process exception type"""
+    from ..search.database import DatabaseError
+    from ..search.pagination import InvalidCursorError
+    if error.error_type == 'InvalidCursorError':
+        return InvalidCursorError(str(error))
+    return DatabaseError(str(error))
+
+
+def open_search_database(db_path: str):
+    """
+    Search database for a CLI or bot request
+
+    Args:
+        db_path: Path to the search database
+
+    Returns:
+        RemoteSearchDatabase when a daemon is running, else SearchDatabase
+    """
+    client = get_client()
+    if client is not None:
+        return RemoteSearchDatabase(db_path, client)
+    from ..search.database import SearchDatabase
+    return SearchDatabase(db_path)
+
+
+class RemoteActivityAnalyzer:
+    """ActivityAnalyzer stand-in that runs summaries in the daemon"""
+
+    def __init__(self, base_dir: str, client: QueryDaemonClient):
+        self.base_dir = base_dir
+        self._client = client
+        self._local = None
+
+    def _run(self, method: str, **kwargs) -> Any:
+        if self._local is None:
+            try:
+                return self._client.call('activity', base_dir=self.base_dir, method=method,
+                                         kwargs=kwargs)
+            except DaemonUnavailableError as e:
+                logger.debug(f"Query daemon unavailable, analyzing in-process: {e}")
+                from ..aggregators.basic_stats import ActivityAnalyzerImpl
+                self._local = ActivityAnalyzerImpl(self.base_dir)
+        return getattr(self._local, method)(**kwargs)
+
+    def generate_daily_summary(self, date: str, person: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+        return self._run('generate_daily_summary', date=date, person=person, **kwargs)
+
+    def generate_weekly_summary(self, week_start: str, person: Optional[str] = None,
+                                **kwargs) -> Dict[str, Any]:
+        return self._run('generate_weekly_summary', week_start=week_start, person=person, **kwargs)
+
+    def generate_monthly_summary(self, month_start: str, person: Optional[str] = None,
+                                 **kwargs) -> Dict[str, Any]:
+        return self._run('generate_monthly_summary', month_start=month_start, person=person, **kwargs)
+
+    def get_statistics(self, time_range: str, breakdown: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+        return self._run('get_statistics', time_range=time_range, breakdown=breakdown, **kwargs)
+
+
+def remote_activity_analyzer() -> Optional[RemoteActivityAnalyzer]:
+    """
+    Activity analyzer backed by the daemon, if one is running
+
+    Returns:
+        RemoteActivityAnalyzer for this process's AICOS_BASE_DIR, or None
+    """
+    client = get_client()
+    if client is None:
+        return None
+    return RemoteActivityAnalyzer(str(Path(os.environ.get('AICOS_BASE_DIR', '.')).resolve()), client)
+
+
+# Server side
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Serves JSON-lines requests until the client disconnects"""
+
+    def handle(self):
+        daemon: 'QueryDaemon' = self.server.query_daemon
+        while True:
+            line = self.rfile.readline(MAX_REQUEST_BYTES + 1)
+            if not line:
+                return
+            if len(line) > MAX_REQUEST_BYTES:
+                self._reply({'ok': False, 'error': {'type': 'QueryDaemonError',
+                                                    'message': 'Request too large'}})
+                return
+            self._reply(daemon.dispatch(line))
+
+    def _reply(self, response: Dict[str, Any]):
+        self.wfile.write(json_codec.dumps(response, default=str).encode('utf-8') + b'\n')
+        self.wfile.flush()
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class QueryDaemon:
+    """
+    Long-running process holding warm databases, analyzers and caches
+
+    Args:
+        socket_path: Unix socket to listen on (default: default_socket_path())
+        idle_timeout: Exit after this many seconds without requests (None: never)
+    """
+
+    def __init__(self, socket_path: Optional[Union[str, Path]] = None,
+                 idle_timeout: Optional[float] = None):
+        self.socket_path = Path(socket_path) if socket_path else default_socket_path()
+        self.idle_timeout = idle_timeout
+        self.started_at = time.time()
+        self.last_request = self.started_at
+        self.request_count = 0
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._server: Optional[_UnixServer] = None
+        self._databases: Dict[str, tuple] = {}  # path -> (inode, SearchDatabase)
+        self._analyzers: Dict[str, Any] = {}
+        self._calendar_cache: Dict[str, tuple] = {}
+
+        self.handlers: Dict[str, Callable[..., Any]] = {
+            'ping': self._ping,
+            'search_page': self._search_page,
+            'search_stats': self._search_stats,
+            'activity': self._activity,
+            'calendar_slots': self._calendar_slots,
+            'calendar_conflicts': self._calendar_conflicts,
+            'shutdown': self._shutdown,
+        }
+
+    # Lifecycle
+
+    def bind(self):
+        """
+        Create the listening socket
+
+        Raises:
+            QueryDaemonError: If another daemon is already listening
+        """
+        if self.socket_path.exists():
+            try:
+                with QueryDaemonClient(self.socket_path, timeout=CONNECT_TIMEOUT) as probe:
+                    probe.ping()
+                raise QueryDaemonError(f"A query daemon is already running on {self.socket_path}")
+            except DaemonUnavailableError:
+                # Left behind by a daemon that did not shut down cleanly
+                self.socket_path.unlink()
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        old_umask = os.umask(0o177)
+        try:
+            self._server = _UnixServer(str(self.socket_path), _RequestHandler)
+        finally:
+            os.umask(old_umask)
+        self._server.query_daemon = self
+        self._server.timeout = POLL_INTERVAL
+        logger.info(f"Query daemon listening on {self.socket_path}")
+
+    def serve(self):
+        """Serve requests until stop(), a shutdown request or the idle timeout"""
+        if self._server is None:
+            self.bind()
+        try:
+            while not self._stop.is_set():
+                self._server.handle_request()
+                if self.idle_timeout and time.time() - self.last_request > self.idle_timeout:
+                    logger.info("Query daemon idle, shutting down")
+                    break
+        finally:
+            self.close()
+
+    def stop(self):
+        """Ask serve() to return after the current poll interval"""
+        self._stop.set()
+
+    def close(self):
+        """Close the socket and every warm resource"""
+        if self._server is not None:
+            self._server.server_close()
+            self._server = None
+            try:
+                self.socket_path.unlink()
+            except FileNotFoundError:
+                pass
+        with self._lock:
+            for _, db in self._databases.values():
+                try:
+                    db.close()
+                except Exception as e:
+                    logger.warning(f"Error closing search database: {e}")
+            self._databases.clear()
+            self._analyzers.clear()
+            self._calendar_cache.clear()
+
+    # Dispatch
+
+    def dispatch(self, line: bytes) -> Dict[str, Any]:
+        """
+        Run one encoded request
+
+        Args:
+            line: JSON request line
+
+        Returns:
+            Response dict; failures are reported, never raised
+        """
+        self.last_request = time.time()
+        self.request_count += 1
+        try:
+            request = json_codec.loads(line)
+            if not isinstance(request, dict):
+                raise QueryDaemonError("Request must be a JSON object")
+            handler = self.handlers.get(request.get('op'))
+            if handler is None:
+                raise QueryDaemonError(f"Unknown operation: {request.get('op')!r}")
+            params = request.get('params') or {}
+            return {'ok': True, 'result': handler(**params)}
+        except Exception as e:
+            logger.debug(f"Request failed: {type(e).__name__}: {e}")
+            return {'ok': False, 'error': {'type': type(e).__name__, 'message': str(e)}}
+
+    # Warm resources
+
+    def _database(self, db_path: str):
+        """SearchDatabase for db_path, reopened if the file was replaced"""
+        from ..search.database import SearchDatabase
+
+        path = str(Path(db_path).resolve())
+        try:
+            inode = os.stat(path).st_ino
+        except FileNotFoundError:
+            inode = None
+        with self._lock:
+            entry = self._databases.get(path)
+            if entry is not None and inode is not None and entry[0] == inode:
+                return entry[1]
+            if entry is not None:
+                entry[1].close()
+            db = SearchDatabase(path)
+            self._databases[path] = (os.stat(path).st_ino, db)
+            return db
+
+    def _analyzer(self, base_dir: str):
+        from ..aggregators.basic_stats import ActivityAnalyzerImpl
+
+        with self._lock:
+            analyzer = self._analyzers.get(base_dir)
+            if analyzer is None:
+                analyzer = self._analyzers[base_dir] = ActivityAnalyzerImpl(base_dir)
+            return analyzer
+
+    # Operations
+
+    def _ping(self) -> Dict[str, Any]:
+        return {
+            'pid': os.getpid(),
+            'version': PROTOCOL_VERSION,
+            'uptime': round(time.time() - self.started_at, 3),
+            'requests': self.request_count,
+            'databases': sorted(self._databases),
+        }
+
+    def _search_page(self, db_path: str, query: str, source: Optional[str] = None,
+                     date_range=None, limit: int = 100, cursor: Optional[str] = None) -> Dict[str, Any]:
+        return self._database(db_path).search_page(
+            query=query, source=source, date_range=tuple(date_range) if date_range else None,
+            limit=limit, cursor=cursor)
+
+    def _search_stats(self, db_path: str) -> Dict[str, Any]:
+        return self._database(db_path).get_stats()
+
+    def _activity(self, base_dir: str, method: str, kwargs: Optional[Dict[str, Any]] = None) -> Any:
+        if method not in ANALYZER_METHODS:
+            raise QueryDaemonError(f"Unsupported analyzer method: {method!r}")
+        return getattr(self._analyzer(base_dir), method)(**(kwargs or {}))
+
+    def _calendar_snapshot(self, calendar_dir: str):
+        from ..scheduling.calendar_data import load_latest_calendar_events, snapshot_signature
+
+        path = Path(calendar_dir)
+        signature = snapshot_signature(path)
+        cached = self._calendar_cache.get(calendar_dir)
+        if cached is not None and signature is not None and cached[0] == signature:
+            return cached[1]
+
+        snapshot = load_latest_calendar_events(path)
+        if signature is not None and not snapshot.warnings:
+            self._calendar_cache[calendar_dir] = (signature, snapshot)
+        return snapshot
+
+    def _calendar_slots(self, calendar_dir: str, date: str, duration_minutes: int, days: int = 1,
+                        working_hours=(9, 17), timezone: str = 'UTC',
+                        buffer_minutes: int = 0) -> Dict[str, Any]:
+        from datetime import datetime
+        from ..scheduling.calendar_data import find_slots_in_events
+
+        snapshot = self._calendar_snapshot(calendar_dir)
+        result = snapshot.summary()
+        result['slots'] = []
+        if snapshot.events:
+            slots = find_slots_in_events(
+                snapshot.events, duration_minutes,
+                start_date=datetime.strptime(date, '%Y-%m-%d').date(), days=days,
+                working_hours=tuple(working_hours), timezone=timezone, buffer_minutes=buffer_minutes
+            )
+            result['slots'] = [slot.to_dict() for slot in slots]
+        return result
+
+    def _calendar_conflicts(self, calendar_dir: str, timezone: str = 'UTC') -> Dict[str, Any]:
+        from ..scheduling.calendar_data import detect_conflicts_in_events
+
+        snapshot = self._calendar_snapshot(calendar_dir)
+        result = snapshot.summary()
+        result['conflicts'] = []
+        if len(snapshot.events) >= 2:
+            result['conflicts'] = detect_conflicts_in_events(snapshot.events, timezone=timezone)
+        return result
+
+    def _shutdown(self) -> Dict[str, Any]:
+        self.stop()
+        return {'pid': os.getpid()}
@@ -73,9 +73,13 @@ class BaseArchiveCollector:
                 self.system_config = system_config
                 
             if state_manager is None:
-                self.state_manager = StateManager()
+                # Cursor updates arrive once per page; batch them instead of
+                # committing each one
+                self.state_manager = StateManager(write_behind=True)
+                self._owns_state_manager = True
             else:
                 self.state_manager = state_manager
+                self._owns_state_manager = False
                 
             if archive_writer is None:
                 self.archive_writer = ArchiveWriter(source_name=collector_type)
@@ -337,6 +341,18 @@ class BaseArchiveCollector:
             }
         }
     
+    def close(self) -> None:
+        """Flush pending state and release the state manager this collector created."""
+        if getattr(self, '_owns_state_manager', False):
+            self.state_manager.close()
+            self._owns_state_manager = False
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
     def __repr__(self) -> str:
         """String representation for debugging."""
         return f"<{self.__class__.__name__}(type={self.collector_type}, state={self.get_state()})>"
\ No newline at end of file
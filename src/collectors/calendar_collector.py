@@ -297,6 +297,14 @@ class CalendarCollector(BaseArchiveCollector):
         if jsonl_results:
             total_jsonl_events = sum(jsonl_results.values())
             print(f"💾 JSONL archive: {total_jsonl_events} events persisted permanently")
+        
+        # Keep the scheduling busy index in step with the new collection
+        try:
+            from ..scheduling.busy_index import update_busy_index
+            if update_busy_index(self.data_path.parent):
+                print(f"💾 Busy index updated for {self.data_path.parent}")
+        except Exception as e:
+            print(f"⚠️ Busy index update failed: {e}")
 
     def setup_calendar_service(self) -> bool:
         """Setup Google Calendar service"""
@@ -376,8 +384,8 @@ class CalendarCollector(BaseArchiveCollector):
         
         try:
             # Get employee roster from Slack (contains email addresses)
-            employee_collector = EmployeeCollector()
-            slack_employees = employee_collector.build_roster_from_slack()
+            with EmployeeCollector() as employee_collector:
+                slack_employees = employee_collector.build_roster_from_slack()
             
             total_employees = len(slack_employees)
             print(f"📋 Found {total_employees} employees from Slack roster")
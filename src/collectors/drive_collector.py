@@ -41,7 +41,7 @@ try:
     from ..core.archive_writer import ArchiveWriter
     from .base import BaseArchiveCollector, CollectorError
     from .circuit_breaker import CircuitBreaker
-    from ..extractors.docx_extractor import DocxContentExtractor, ExtractedDocument
+    from ..extractors.docx_extractor import DocxContentExtractor, ExtractedDocument, extract_docx_content
 except ImportError:
     # Fallback for direct execution
     print("Warning: Could not import core components. Running in standalone mode.")
@@ -803,6 +803,42 @@ class DriveCollector(BaseArchiveCollector):
                 rate_limit_hits=self.rate_limiter.consecutive_rate_limits
             )
     
+    def extract_local_docx_file(self, file_path: str) -> Dict[str, Any]:
+        """
+        Extract one local DOCX meeting notes file into an archive record
+        
+        The record is also written to the archive when an archive writer is
+        available.
+        
+        Args:
+            file_path: Path to the .docx file
+            
+        Returns:
+            Archive record with extracted content and metadata
+        """
+        if not self.docx_extractor:
+            raise DriveCollectorError("DOCX extractor not available")
+        
+        # Extract content using DOCX extractor
+        extracted_doc = self.docx_extractor.extract_content(file_path)
+        archive_record = docx_archive_record(extracted_doc, file_path)
+        self.archive_docx_records([archive_record])
+        
+        print(f"✅ Processed: {extracted_doc.title or os.path.basename(file_path)}")
+        
+        return archive_record
+    
+    def archive_docx_records(self, archive_records: List[Dict[str, Any]]):
+        """
+        Write extracted DOCX records to the archive in one batch
+        
+        Args:
+            archive_records: Records from extract_docx_archive_record
+        """
+        # Archive the records (if archive writer available)
+        if archive_records and hasattr(self, 'archive_writer') and self.archive_writer:
+            self.archive_writer.write_records(archive_records)
+    
     def collect_local_docx_files(self, directory: str) -> Dict[str, Any]:
         """
         Enhanced Drive collector method to process local DOCX meeting notes
@@ -849,34 +885,12 @@ class DriveCollector(BaseArchiveCollector):
                 results['files_processed'] += 1
                 
                 try:
-                    # Extract content using DOCX extractor
-                    extracted_doc = self.docx_extractor.extract_content(file_path)
-                    
-                    # Create archive record in JSONL format
-                    archive_record = {
-                        'type': 'google_docs_meeting_notes',
-                        'source_file': file_path,
-                        'filename': extracted_doc.filename,
-                        'title': extracted_doc.title,
-                        'meeting_metadata': extracted_doc.meeting_metadata,
-                        'content': extracted_doc.content,
-                        'structured_content': extracted_doc.structured_content,
-                        'confidence_score': extracted_doc.confidence_score,
-                        'extraction_stats': extracted_doc.extraction_stats,
-                        'collected_at': datetime.now(timezone.utc).isoformat(),
-                        'collector_type': 'drive_local_docx'
-                    }
+                    archive_record = self.extract_local_docx_file(file_path)
                     
                     # Add to results
                     results['extracted_documents'].append(archive_record)
                     results['successful_extractions'] += 1
                     
-                    # Archive the record (if archive writer available)
-                    if hasattr(self, 'archive_writer') and self.archive_writer:
-                        self.archive_writer.write_record(archive_record)
-                    
-                    print(f"✅ Processed: {extracted_doc.title or os.path.basename(file_path)}")
-                    
                 except Exception as e:
                     results['failed_extractions'] += 1
                     error_record = {
@@ -909,6 +923,53 @@ class DriveCollector(BaseArchiveCollector):
             return results
 
 
+# =============================================================================
+# LOCAL DOCX RECORDS
+# =============================================================================
+
+def docx_archive_record(extracted_doc: ExtractedDocument, file_path: str) -> Dict[str, Any]:
+    """
+    Archive record (JSONL format) of an extracted DOCX meeting notes file
+
+    Args:
+        extracted_doc: Extracted document content and metadata
+        file_path: Path to the .docx file
+
+    Returns:
+        Archive record with extracted content and metadata
+    """
+    return {
+        'type': 'google_docs_meeting_notes',
+        'source_file': file_path,
+        'filename': extracted_doc.filename,
+        'title': extracted_doc.title,
+        'meeting_metadata': extracted_doc.meeting_metadata,
+        'content': extracted_doc.content,
+        'structured_content': extracted_doc.structured_content,
+        'confidence_score': extracted_doc.confidence_score,
+        'extraction_stats': extracted_doc.extraction_stats,
+        'collected_at': datetime.now(timezone.utc).isoformat(),
+        'collector_type': 'drive_local_docx'
+    }
+
+
+def extract_docx_archive_record(file_path: str) -> Dict[str, Any]:
+    """
+    Extract a local DOCX file into an archive record without a collector
+
+    Module-level so extraction can run on a process pool (see
+    src/core/extraction_cache.py). The record is not archived; pass the
+    results to DriveCollector.archive_docx_records.
+
+    Args:
+        file_path: Path to the .docx file
+
+    Returns:
+        Archive record with extracted content and metadata
+    """
+    return docx_archive_record(extract_docx_content(file_path), file_path)
+
+
 # =============================================================================
 # LEGACY COMPATIBILITY
 # =============================================================================
@@ -9,7 +9,9 @@ provide immediate value to the AI Chief of Staff system.
 
 Architecture:
 - Uses existing DocxContentExtractor for document parsing
-- Integrates with search database for indexing
+- Extracts new or changed documents on a process pool and reuses cached
+  results of unchanged ones (src/core/extraction_cache.py)
+- Integrates with search database for indexing, one batch per run
 - Provides structured output compatible with Phase 1 components
 - Lab-grade implementation focused on essential functionality
 
@@ -25,9 +27,10 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
 
-from ..extractors.docx_extractor import DocxContentExtractor, ExtractedDocument
+from ..extractors.docx_extractor import DocxContentExtractor, ExtractedDocument, extract_docx_content
 from ..search.database import SearchDatabase
 from ..core.config import get_config
+from ..core.extraction_cache import ExtractionCache
 
 logger = logging.getLogger(__name__)
 
@@ -51,10 +54,13 @@ class DriveContentExtractor:
     immediate value while preparing for Phase 2 intelligence integration.
     """
     
-    def __init__(self, base_path: Path = None):
+    def __init__(self, base_path: Path = None, max_workers: Optional[int] = None):
         self.base_path = Path(base_path or get_config().base_dir)
         self.docx_extractor = DocxContentExtractor(preserve_structure=True)
+        # Creates the data directory the search database lives in
+        self.extraction_cache = ExtractionCache(self.base_path / "data" / "drive_extraction_cache.db")
         self.search_db = SearchDatabase(str(self.base_path / "data" / "search.db"))
+        self.max_workers = max_workers or os.cpu_count() or 1
         
         # Common Drive document locations for lab-grade detection
         self.search_paths = [
@@ -73,17 +79,19 @@ class DriveContentExtractor:
         Extract and index Drive content from local paths
         
         This is a Phase 1.5 implementation that focuses on local document
-        processing without requiring Drive API integration.
+        processing without requiring Drive API integration. Documents
+        unchanged since the previous run are neither parsed nor indexed
+        again.
         """
         start_time = datetime.now()
         extracted_documents = []
         errors = []
-        documents_processed = 0
         documents_indexed = 0
         
         logger.info("Starting Drive content extraction...")
         
-        # Find and process DOCX files in search paths
+        # Find DOCX files (meeting notes, documents) in search paths
+        docx_files = []
         for search_path in self.search_paths:
             if not search_path.exists():
                 continue
@@ -91,36 +99,9 @@ class DriveContentExtractor:
             logger.info(f"Scanning path: {search_path}")
             
             try:
-                # Find DOCX files (meeting notes, documents)
-                docx_files = list(search_path.rglob("*.docx"))
-                logger.info(f"Found {len(docx_files)} DOCX files in {search_path}")
-                
-                for docx_file in docx_files:
-                    try:
-                        # Extract content using existing extractor
-                        extracted_doc = self.docx_extractor.extract_content(str(docx_file))
-                        
-                        if extracted_doc and extracted_doc.content.strip():
-                            # Convert to searchable record format
-                            search_record = self._convert_to_search_record(extracted_doc, docx_file)
-                            
-                            # Index in search database
-                            result = self.search_db.index_records_batch([search_record], 'drive')
-                            
-                            if result['indexed'] > 0:
-                                extracted_documents.append(search_record)
-                                documents_indexed += 1
-                                logger.info(f"Indexed document: {docx_file.name}")
-                            else:
-                                errors.append(f"Failed to index: {docx_file.name}")
-                        
-                        documents_processed += 1
-                        
-                    except Exception as e:
-                        error_msg = f"Error processing {docx_file.name}: {str(e)}"
-                        errors.append(error_msg)
-                        logger.error(error_msg)
-                        continue
+                path_files = sorted(str(docx_file) for docx_file in search_path.rglob("*.docx"))
+                logger.info(f"Found {len(path_files)} DOCX files in {search_path}")
+                docx_files.extend(path_files)
                         
             except Exception as e:
                 error_msg = f"Error scanning path {search_path}: {str(e)}"
@@ -128,6 +109,41 @@ class DriveContentExtractor:
                 logger.error(error_msg)
                 continue
         
+        # Search paths may overlap
+        docx_files = list(dict.fromkeys(docx_files))
+        
+        extractions = self.extraction_cache.extract_files(docx_files, 'drive', extract_drive_record,
+                                                          self.max_workers)
+        new_documents = []
+        for extraction in extractions:
+            if extraction.error:
+                error_msg = f"Error processing {Path(extraction.file_path).name}: {extraction.error}"
+                errors.append(error_msg)
+                logger.error(error_msg)
+            elif extraction.record:
+                extracted_documents.append(extraction.record)
+                if not extraction.cached:
+                    new_documents.append((extraction.file_path, extraction.record))
+        
+        # Index new documents in one batch; cached ones were indexed when first extracted
+        if new_documents:
+            try:
+                result = self.search_db.index_records_batch([record for _, record in new_documents], 'drive')
+                documents_indexed = result['indexed']
+                failed_ids = {detail['record_id'] for detail in result['error_details']}
+            except Exception as e:
+                logger.error(f"Error indexing Drive documents: {e}")
+                failed_ids = {record['id'] for _, record in new_documents}
+            
+            failed = [(file_path, record) for file_path, record in new_documents if record['id'] in failed_ids]
+            for file_path, record in failed:
+                errors.append(f"Failed to index: {Path(file_path).name}")
+                extracted_documents.remove(record)
+            # Extract unindexed documents again next run
+            self.extraction_cache.forget([file_path for file_path, _ in failed])
+        
+        documents_processed = len(extractions) - sum(1 for extraction in extractions if extraction.error)
+        
         # Calculate processing duration
         processing_duration = (datetime.now() - start_time).total_seconds()
         
@@ -135,7 +151,7 @@ class DriveContentExtractor:
         result = DriveContentResult(
             documents_processed=documents_processed,
             documents_indexed=documents_indexed,
-            content_extracted=documents_indexed > 0,
+            content_extracted=bool(extracted_documents),
             processing_duration=processing_duration,
             extracted_documents=extracted_documents,
             errors=errors
@@ -149,8 +165,9 @@ class DriveContentExtractor:
         
         return result
     
-    def _convert_to_search_record(self, extracted_doc: ExtractedDocument, 
-                                 file_path: Path) -> Dict[str, Any]:
+    @staticmethod
+    def _convert_to_search_record(extracted_doc: ExtractedDocument,
+                                  file_path: Path) -> Dict[str, Any]:
         """
         Convert extracted document to search database record format
         
@@ -207,6 +224,18 @@ class DriveContentExtractor:
         return drive_stats
 
 
+def extract_drive_record(file_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Extract a DOCX file into a search record, or None if it has no content
+    
+    Module-level so extraction can run on a process pool.
+    """
+    extracted_doc = extract_docx_content(file_path)
+    if extracted_doc and extracted_doc.content.strip():
+        return DriveContentExtractor._convert_to_search_record(extracted_doc, Path(file_path))
+    return None
+
+
 def create_drive_content_extractor(base_path: Path = None) -> DriveContentExtractor:
     """Factory function to create Drive content extractor"""
     return DriveContentExtractor(base_path)
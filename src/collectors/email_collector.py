@@ -41,6 +41,7 @@ try:
     from ..core.archive_writer import ArchiveWriter
     from .base import BaseArchiveCollector, CollectorError
     from .circuit_breaker import CircuitBreaker
+    from ..core.extraction_cache import extract_files_parallel
 except ImportError:
     # Fallback for direct execution
     print("Warning: Could not import core components. Running in standalone mode.")
@@ -76,50 +77,21 @@ class EmailParsingError(CollectorError):
     pass
 
 
-class EmailCollector(BaseArchiveCollector):
+class EmailParser:
     """
-    Collector for processing meeting notes emails (.eml files)
+    Parser for Google Meet/Gemini meeting notes .eml files
     
-    Features:
-    - Google Meet/Gemini email detection and parsing
-    - Base64 content decoding with error recovery
-    - Meeting metadata extraction (title, participants, date)
-    - Integration with existing archive system
-    - Robust error handling for malformed emails
+    Holds only the compiled patterns, so it is cheap to create in extraction
+    worker processes; EmailCollector parses through one as well.
     """
     
-    def __init__(self, config_path: Optional[str] = None):
-        """
-        Initialize EmailCollector
-        
-        Args:
-            config_path: Optional path to config file
-        """
-        super().__init__(collector_type="email", config_path=config_path)
-        self.logger = logging.getLogger(f"{__name__}.EmailCollector")
-        
-        # Email parsing patterns
+    def __init__(self):
+        self.logger = logging.getLogger(f"{__name__}.EmailParser")
         self._compile_patterns()
-        
-        # Processing statistics
-        self.stats = {
-            'files_processed': 0,
-            'successful_parses': 0,
-            'failed_parses': 0,
-            'emails_extracted': 0,
-            'start_time': None,
-            'end_time': None
-        }
     
     def _compile_patterns(self):
         """Compile regex patterns for email content extraction"""
         
-        # Meeting notes file pattern
-        self.meeting_notes_pattern = re.compile(
-            r'Notes_.*\.eml$', 
-            re.IGNORECASE
-        )
-        
         # Google Meet/Gemini signature patterns
         self.gemini_patterns = [
             re.compile(r'Notes from ["\u201c](.+?)["\u201d]', re.IGNORECASE),
@@ -142,107 +114,6 @@ class EmailCollector(BaseArchiveCollector):
             re.compile(r'including\s+([A-Za-z\s,]+?)(?:\s+discussed|\s+,)', re.IGNORECASE)
         ]
     
-    def collect(self, source_dirs: Optional[List[str]] = None) -> Dict[str, Any]:
-        """
-        Main collection method - scan directories for meeting notes emails
-        
-        Args:
-            source_dirs: Optional list of directories to scan. Defaults to Downloads.
-            
-        Returns:
-            Dict with collection results and statistics
-        """
-        self.stats['start_time'] = datetime.now()
-        self.logger.info(f"Starting email collection for meeting notes")
-        
-        try:
-            # Default to user's Downloads directory if not specified
-            if source_dirs is None:
-                source_dirs = [
-                    os.path.expanduser("~/Downloads"),
-                    "/Users/david.campos/Downloads"  # Explicit path for user's setup
-                ]
-            
-            all_emails = []
-            
-            for source_dir in source_dirs:
-                if os.path.exists(source_dir):
-                    self.logger.info(f"Scanning directory: {source_dir}")
-                    dir_emails = self._scan_directory(source_dir)
-                    all_emails.extend(dir_emails)
-                else:
-                    self.logger.warning(f"Directory not found: {source_dir}")
-            
-            # Process discovered emails
-            processed_emails = []
-            for email_file in all_emails:
-                try:
-                    parsed_email = self.parse_eml_file(email_file)
-                    if parsed_email:
-                        processed_emails.append(parsed_email)
-                        self.stats['successful_parses'] += 1
-                        self.stats['emails_extracted'] += 1
-                except Exception as e:
-                    self.logger.error(f"Failed to parse {email_file}: {e}")
-                    self.stats['failed_parses'] += 1
-                
-                self.stats['files_processed'] += 1
-            
-            # Archive processed emails using existing system
-            if processed_emails and hasattr(self, 'archive_writer'):
-                for email_data in processed_emails:
-                    self.archive_writer.write_record(email_data.__dict__)
-            
-            self.stats['end_time'] = datetime.now()
-            processing_time = (self.stats['end_time'] - self.stats['start_time']).total_seconds()
-            
-            results = {
-                'success': True,
-                'emails_processed': len(processed_emails),
-                'files_scanned': self.stats['files_processed'],
-                'processing_time_seconds': processing_time,
-                'emails': [email.__dict__ for email in processed_emails],
-                'statistics': self.stats
-            }
-            
-            self.logger.info(f"Email collection completed: {len(processed_emails)} emails processed")
-            return results
-            
-        except Exception as e:
-            self.logger.error(f"Email collection failed: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'statistics': self.stats
-            }
-    
-    def _scan_directory(self, directory: str) -> List[str]:
-        """
-        Scan directory for meeting notes .eml files
-        
-        Args:
-            directory: Directory path to scan
-            
-        Returns:
-            List of .eml file paths that match meeting notes patterns
-        """
-        email_files = []
-        
-        try:
-            for filename in os.listdir(directory):
-                if self.meeting_notes_pattern.match(filename):
-                    file_path = os.path.join(directory, filename)
-                    if os.path.isfile(file_path):
-                        email_files.append(file_path)
-                        self.logger.debug(f"Found meeting notes email: {filename}")
-        
-        except PermissionError:
-            self.logger.warning(f"Permission denied scanning directory: {directory}")
-        except Exception as e:
-            self.logger.error(f"Error scanning directory {directory}: {e}")
-        
-        return sorted(email_files)  # Process in alphabetical order
-    
     def parse_eml_file(self, file_path: str) -> Optional[ParsedEmail]:
         """
         Parse a single .eml file and extract meeting notes data
@@ -560,6 +431,163 @@ class EmailCollector(BaseArchiveCollector):
             confidence += 0.1
         
         return min(1.0, confidence)
+
+
+class EmailCollector(BaseArchiveCollector):
+    """
+    Collector for processing meeting notes emails (.eml files)
+    
+    Features:
+    - Google Meet/Gemini email detection and parsing
+    - Base64 content decoding with error recovery
+    - Meeting metadata extraction (title, participants, date)
+    - Integration with existing archive system
+    - Robust error handling for malformed emails
+    """
+    
+    def __init__(self, config_path: Optional[str] = None, max_workers: Optional[int] = None):
+        """
+        Initialize EmailCollector
+        
+        Args:
+            config_path: Optional path to config file
+            max_workers: Worker processes for parsing .eml files (defaults
+                to the CPU count)
+        """
+        super().__init__(collector_type="email", config_path=config_path)
+        self.logger = logging.getLogger(f"{__name__}.EmailCollector")
+        self.max_workers = max_workers or os.cpu_count() or 1
+        
+        # Email parsing patterns
+        self._compile_patterns()
+        self.parser = EmailParser()
+        
+        # Processing statistics
+        self.stats = {
+            'files_processed': 0,
+            'successful_parses': 0,
+            'failed_parses': 0,
+            'emails_extracted': 0,
+            'start_time': None,
+            'end_time': None
+        }
+    
+    def _compile_patterns(self):
+        """Compile the regex pattern matching meeting notes file names"""
+        self.meeting_notes_pattern = re.compile(
+            r'Notes_.*\.eml$', 
+            re.IGNORECASE
+        )
+    
+    def collect(self, source_dirs: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Main collection method - scan directories for meeting notes emails
+        
+        Args:
+            source_dirs: Optional list of directories to scan. Defaults to Downloads.
+            
+        Returns:
+            Dict with collection results and statistics
+        """
+        self.stats['start_time'] = datetime.now()
+        self.logger.info(f"Starting email collection for meeting notes")
+        
+        try:
+            # Default to user's Downloads directory if not specified
+            if source_dirs is None:
+                source_dirs = [
+                    os.path.expanduser("~/Downloads"),
+                    "/Users/david.campos/Downloads"  # Explicit path for user's setup
+                ]
+            
+            all_emails = []
+            
+            for source_dir in source_dirs:
+                if os.path.exists(source_dir):
+                    self.logger.info(f"Scanning directory: {source_dir}")
+                    dir_emails = self._scan_directory(source_dir)
+                    all_emails.extend(dir_emails)
+                else:
+                    self.logger.warning(f"Directory not found: {source_dir}")
+            
+            # Parse discovered emails on a process pool
+            processed_emails = []
+            for extraction in extract_files_parallel(all_emails, parse_eml, self.max_workers):
+                if extraction.error:
+                    self.logger.error(f"Failed to parse {extraction.file_path}: {extraction.error}")
+                    self.stats['failed_parses'] += 1
+                elif extraction.record:
+                    processed_emails.append(extraction.record)
+                    self.stats['successful_parses'] += 1
+                    self.stats['emails_extracted'] += 1
+                
+                self.stats['files_processed'] += 1
+            
+            # Archive processed emails using existing system
+            if processed_emails and hasattr(self, 'archive_writer'):
+                self.archive_writer.write_records([email_data.__dict__ for email_data in processed_emails])
+            
+            self.stats['end_time'] = datetime.now()
+            processing_time = (self.stats['end_time'] - self.stats['start_time']).total_seconds()
+            
+            results = {
+                'success': True,
+                'emails_processed': len(processed_emails),
+                'files_scanned': self.stats['files_processed'],
+                'processing_time_seconds': processing_time,
+                'emails': [email.__dict__ for email in processed_emails],
+                'statistics': self.stats
+            }
+            
+            self.logger.info(f"Email collection completed: {len(processed_emails)} emails processed")
+            return results
+            
+        except Exception as e:
+            self.logger.error(f"Email collection failed: {e}")
+            return {
+                'success': False,
+                'error': str(e),
+                'statistics': self.stats
+            }
+    
+    def _scan_directory(self, directory: str) -> List[str]:
+        """
+        Scan directory for meeting notes .eml files
+        
+        Args:
+            directory: Directory path to scan
+            
+        Returns:
+            List of .eml file paths that match meeting notes patterns
+        """
+        email_files = []
+        
+        try:
+            for filename in os.listdir(directory):
+                if self.meeting_notes_pattern.match(filename):
+                    file_path = os.path.join(directory, filename)
+                    if os.path.isfile(file_path):
+                        email_files.append(file_path)
+                        self.logger.debug(f"Found meeting notes email: {filename}")
+        
+        except PermissionError:
+            self.logger.warning(f"Permission denied scanning directory: {directory}")
+        except Exception as e:
+            self.logger.error(f"Error scanning directory {directory}: {e}")
+        
+        return sorted(email_files)  # Process in alphabetical order
+    
+    def parse_eml_file(self, file_path: str) -> Optional[ParsedEmail]:
+        """
+        Parse a single .eml file and extract meeting notes data
+        
+        Args:
+            file_path: Path to .eml file
+            
+        Returns:
+            ParsedEmail object with extracted data, or None if parsing fails
+        """
+        return self.parser.parse_eml_file(file_path)
     
     def detect_meeting_notes_emails(self, directory: str) -> List[str]:
         """
@@ -578,6 +606,30 @@ class EmailCollector(BaseArchiveCollector):
         return self.stats.copy()
 
 
+# Parser reused by every parse_eml call in a process
+_process_parser: Optional[EmailParser] = None
+
+
+def parse_eml(file_path: str) -> Optional[ParsedEmail]:
+    """
+    Parse a .eml file with this process's shared parser
+    
+    Module-level so parsing can run in extraction worker processes (see
+    src/core/extraction_cache.py). EmailParser only holds the compiled
+    patterns, without the archive and state components of a collector.
+    
+    Args:
+        file_path: Path to .eml file
+        
+    Returns:
+        ParsedEmail object with extracted data, or None if there is no content
+    """
+    global _process_parser
+    if _process_parser is None:
+        _process_parser = EmailParser()
+    return _process_parser.parse_eml_file(file_path)
+
+
 # Standalone execution for testing
 if __name__ == "__main__":
     import sys
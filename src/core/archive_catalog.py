@@ -0,0 +1,687 @@
+#!/usr/bin/env python3
+"""
+SQLite catalog of archive files
+
+Archive statistics, compression candidate selection, verification and the
+dashboard each used to walk the whole archive tree and stat every file on
+every command. The catalog records one row per archive file instead:
+
+    path (relative to the archive root), source, day, kind, compression,
+    size, mtime_ns, record_count, checksum, original_size,
+    frame_indexed (seekable .idx sidecar present),
+    indexed_mtime_ns (file mtime when the search index last absorbed it)
+
+Writers keep it current: ArchiveWriter records each append and the
+compression engine records every file it replaces. reconcile() is the one
+remaining tree walk; it catches drift from files written or deleted behind
+the catalog's back (restored backups, rsync, other writers). ensure_fresh()
+runs it when the last reconcile is older than RECONCILE_INTERVAL or when any
+catalogued directory changed since: reconcile records every directory's
+mtime, so adding or removing a file anywhere is caught by one stat per
+directory. Everything else is a catalog query.
+
+The database lives at <root>/.archive_catalog.db and is only created for an
+explicit archive root (ArchiveWriter's archive_dir). Readers such as
+verification, statistics and the dashboard use a catalog only if one already
+exists at the directory they were given and walk the tree otherwise, so they
+never leave nested catalogs behind. Hidden files and directories, temp files
+and lock files are never catalogued.
+
+References:
+- src/core/state.py - SQLite/WAL connection pattern
+- src/core/archive_stats.py - statistics served from catalog queries
+- src/core/compression_engine.py - records compressed replacements
+- src/core/archive_writer.py - records appends
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from .seekable_archive import INDEX_SUFFIX
+
+logger = logging.getLogger(__name__)
+
+CATALOG_FILENAME = '.archive_catalog.db'
+RECONCILE_INTERVAL = 3600  # seconds before ensure_fresh() walks the tree again
+RACY_MTIME_NS = 2 * 10**9  # directories modified this recently are re-checked next time
+COMPRESSION_BY_SUFFIX = {'.gz': 'gzip', '.zst': 'zstd'}
+DATA_SUFFIXES = ('.jsonl', '.jsonl.gz', '.jsonl.zst')
+IGNORED_SUFFIXES = ('.tmp', '.lock')
+
+# Open catalogs keyed by resolved root, shared by writers in this process
+_catalogs: Dict[str, 'ArchiveCatalog'] = {}
+_catalogs_lock = threading.Lock()
+
+
+class ArchiveCatalogError(Exception):
+    """Raised when the archive catalog cannot be read or updated"""
+    pass
+
+
+def classify(name: str) -> Dict[str, str]:
+    """
+    Classify an archive file by name
+
+    Args:
+        name: File name
+
+    Returns:
+        Dict with 'kind' (data, manifest, index, other) and 'compression'
+        (none, gzip, zstd)
+    """
+    compression = COMPRESSION_BY_SUFFIX.get(os.path.splitext(name)[1], 'none')
+    if name.endswith(DATA_SUFFIXES):
+        kind = 'data'
+    elif name == 'manifest.json':
+        kind = 'manifest'
+    elif name.endswith(INDEX_SUFFIX):
+        kind = 'index'
+        compression = 'none'
+    else:
+        kind = 'other'
+    return {'kind': kind, 'compression': compression}
+
+
+def _is_day(name: str) -> bool:
+    return len(name) == 10 and name.count('-') == 2
+
+
+class ArchiveCatalog:
+    """
+    SQLite-backed catalog of the files under one archive root
+
+    Features:
+    - Incremental updates from writers (record_file, record_compression)
+    - Drift correction with a single tree walk (reconcile)
+    - Aggregate statistics, compression candidates and pending-index
+      queries without touching the filesystem
+    """
+
+    def __init__(self, root: Path, db_path: Optional[Path] = None, create: bool = True):
+        """
+        Open the catalog for an archive root
+
+        Args:
+            root: Archive root directory
+            db_path: Catalog database (defaults to <root>/.archive_catalog.db)
+            create: Create the database if it does not exist yet
+
+        Raises:
+            ArchiveCatalogError: If the database cannot be opened, or does not
+                exist and create is False
+        """
+        self.root = Path(root).resolve()
+        self.db_path = Path(db_path) if db_path else self.root / CATALOG_FILENAME
+        self._local = threading.local()
+        if not create and not self.db_path.exists():
+            raise ArchiveCatalogError(f"No archive catalog at {self.db_path}")
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._init_database()
+        except (OSError, sqlite3.Error) as e:
+            raise ArchiveCatalogError(f"Cannot open archive catalog {self.db_path}: {e}")
+
+    @classmethod
+    def for_root(cls, root: Path, create: bool = False) -> 'ArchiveCatalog':
+        """
+        Shared catalog instance for an archive root
+
+        Args:
+            root: Archive root directory
+            create: Create the catalog if the root has none (explicit archive
+                roots only)
+
+        Returns:
+            ArchiveCatalog (one per root per process)
+
+        Raises:
+            ArchiveCatalogError: If the catalog cannot be opened, or the root
+                has none and create is False
+        """
+        key = str(Path(root).resolve())
+        with _catalogs_lock:
+            catalog = _catalogs.get(key)
+            if catalog is None or not catalog.db_path.exists():
+                catalog = cls(Path(key), create=create)
+                _catalogs[key] = catalog
+            return catalog
+
+    @classmethod
+    def find_for(cls, path: Path) -> Optional['ArchiveCatalog']:
+        """
+        Catalog of the nearest ancestor directory that already has one
+
+        Args:
+            path: File inside an archive
+
+        Returns:
+            ArchiveCatalog, or None if no ancestor has a catalog
+        """
+        for parent in Path(path).resolve().parents:
+            if (parent / CATALOG_FILENAME).exists():
+                try:
+                    return cls.for_root(parent)
+                except ArchiveCatalogError as e:
+                    logger.warning(str(e))
+                    return None
+        return None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get thread-local database connection"""
+        if not hasattr(self._local, 'connection'):
+            conn = sqlite3.connect(str(self.db_path), timeout=30.0, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = conn
+        return self._local.connection
+
+    def _init_database(self):
+        """Initialize database schema"""
+        with self._get_connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS archive_files (
+                    path TEXT PRIMARY KEY,
+                    source TEXT NOT NULL,
+                    day TEXT,
+                    kind TEXT NOT NULL,
+                    compression TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    record_count INTEGER,
+                    checksum TEXT,
+                    original_size INTEGER,
+                    frame_indexed INTEGER NOT NULL DEFAULT 0,
+                    indexed_mtime_ns INTEGER,
+                    updated_at REAL NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS archive_dirs (
+                    path TEXT PRIMARY KEY,
+                    mtime_ns INTEGER NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS catalog_meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_catalog_source ON archive_files(source, day)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_catalog_kind ON archive_files(kind, compression, mtime_ns)")
+            conn.commit()
+
+    @contextmanager
+    def transaction(self):
+        """Context manager for atomic catalog updates"""
+        conn = self._get_connection()
+        try:
+            conn.execute("BEGIN")
+            yield conn
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            raise ArchiveCatalogError(f"Catalog transaction failed: {e}")
+
+    def close(self):
+        """Close this thread's connection"""
+        if hasattr(self._local, 'connection'):
+            self._local.connection.close()
+            del self._local.connection
+
+    def relative(self, path: Path) -> str:
+        """
+        Catalog key for a file
+
+        Args:
+            path: File under the archive root
+
+        Returns:
+            POSIX path relative to the root
+
+        Raises:
+            ArchiveCatalogError: If the path is outside the root
+        """
+        try:
+            return Path(os.path.abspath(path)).relative_to(self.root).as_posix()
+        except ValueError:
+            try:
+                return Path(path).resolve().relative_to(self.root).as_posix()
+            except ValueError:
+                raise ArchiveCatalogError(f"{path} is not under archive root {self.root}")
+
+    def _row_values(self, relative: str, stat: os.stat_result) -> Dict[str, Any]:
+        parts = relative.split('/')
+        source = parts[0] if len(parts) > 1 else ''
+        day = next((part for part in reversed(parts[:-1]) if _is_day(part)), None)
+        values = {'path': relative, 'source': source, 'day': day,
+                  'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'updated_at': time.time()}
+        values.update(classify(parts[-1]))
+        return values
+
+    def _upsert(self, conn: sqlite3.Connection, values: Dict[str, Any], **known):
+        """
+        Insert or refresh a row; facts about the old contents are kept only
+        while size and mtime are unchanged, unless new ones are supplied
+        """
+        row = conn.execute("SELECT size, mtime_ns, record_count, checksum, original_size, "
+                           "indexed_mtime_ns FROM archive_files WHERE path = ?",
+                           (values['path'],)).fetchone()
+        unchanged = row is not None and row['size'] == values['size'] and row['mtime_ns'] == values['mtime_ns']
+        for field in ('record_count', 'checksum', 'original_size'):
+            if known.get(field) is not None:
+                values[field] = known[field]
+            else:
+                values[field] = row[field] if unchanged else None
+        values['indexed_mtime_ns'] = row['indexed_mtime_ns'] if row is not None else None
+        values['frame_indexed'] = int(bool(known.get('frame_indexed')))
+
+        conn.execute("""
+            INSERT OR REPLACE INTO archive_files
+            (path, source, day, kind, compression, size, mtime_ns, record_count, checksum,
+             original_size, frame_indexed, indexed_mtime_ns, updated_at)
+            VALUES (:path, :source, :day, :kind, :compression, :size, :mtime_ns, :record_count,
+                    :checksum, :original_size, :frame_indexed, :indexed_mtime_ns, :updated_at)
+        """, values)
+
+    def record_file(self, path: Path, record_count: Optional[int] = None,
+                    checksum: Optional[str] = None, original_size: Optional[int] = None):
+        """
+        Record the current state of a file a writer just produced
+
+        Args:
+            path: File under the archive root
+            record_count: Records in the file, if the writer knows it
+            checksum: SHA-256 of the uncompressed content, if known
+            original_size: Uncompressed size, for compressed files
+        """
+        path = Path(path)
+        stat = path.stat()
+        frame_indexed = path.with_name(path.name + INDEX_SUFFIX).exists()
+        with self.transaction() as conn:
+            self._upsert(conn, self._row_values(self.relative(path), stat),
+                         record_count=record_count, checksum=checksum,
+                         original_size=original_size, frame_indexed=frame_indexed)
+
+    def record_compression(self, source_path: Path, output_path: Path, original_size: int,
+                           checksum: Optional[str] = None, record_count: Optional[int] = None):
+        """
+        Replace the row of a compressed original with its compressed output
+
+        The output inherits the original's record count and search-index
+        state, since its decompressed contents are identical.
+
+        Args:
+            source_path: Original (now deleted) file
+            output_path: Compressed replacement
+            original_size: Uncompressed size in bytes
+            checksum: SHA-256 of the uncompressed content
+            record_count: Lines in the file, if known
+        """
+        output_path = Path(output_path)
+        source_key = self.relative(source_path)
+        stat = output_path.stat()
+        frame_indexed = output_path.with_name(output_path.name + INDEX_SUFFIX).exists()
+        values = self._row_values(self.relative(output_path), stat)
+
+        with self.transaction() as conn:
+            old = conn.execute("SELECT record_count, mtime_ns, indexed_mtime_ns FROM archive_files "
+                               "WHERE path = ?", (source_key,)).fetchone()
+            if record_count is None and old is not None:
+                record_count = old['record_count']
+            conn.execute("DELETE FROM archive_files WHERE path = ?", (source_key,))
+            self._upsert(conn, values, record_count=record_count, checksum=checksum,
+                         original_size=original_size, frame_indexed=frame_indexed)
+            if old is not None and old['indexed_mtime_ns'] == old['mtime_ns']:
+                conn.execute("UPDATE archive_files SET indexed_mtime_ns = mtime_ns WHERE path = ?",
+                             (values['path'],))
+            if frame_indexed:
+                self._upsert(conn, self._row_values(
+                    values['path'] + INDEX_SUFFIX,
+                    output_path.with_name(output_path.name + INDEX_SUFFIX).stat()))
+
+    def mark_indexed(self, path: Path):
+        """
+        Record that the search index has absorbed the file's current contents
+
+        Args:
+            path: Archive file that was indexed
+        """
+        path = Path(path)
+        with self.transaction() as conn:
+            self._upsert(conn, self._row_values(self.relative(path), path.stat()),
+                         frame_indexed=path.with_name(path.name + INDEX_SUFFIX).exists())
+            conn.execute("UPDATE archive_files SET indexed_mtime_ns = mtime_ns WHERE path = ?",
+                         (self.relative(path),))
+
+    def remove(self, path: Path):
+        """Forget a file that was deleted"""
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM archive_files WHERE path = ?", (self.relative(path),))
+
+    @staticmethod
+    def _catalogued(entry: os.DirEntry) -> bool:
+        return not entry.name.startswith('.') and (
+            entry.is_dir(follow_symlinks=False) or not entry.name.endswith(IGNORED_SUFFIXES))
+
+    def _root_entries(self) -> List[str]:
+        """Names under the root that reconcile would visit"""
+        with os.scandir(self.root) as entries:
+            return sorted(entry.name for entry in entries if self._catalogued(entry))
+
+    def _walk(self, directories: Optional[Dict[str, int]] = None) -> Iterable[os.DirEntry]:
+        """
+        Yield catalogued files under the root with one scandir per directory
+
+        Args:
+            directories: Filled with relative path -> mtime_ns for every
+                directory below the root, taken before it is scanned
+        """
+        stack = [str(self.root)]
+        while stack:
+            directory = stack.pop()
+            try:
+                if directories is not None and directory != str(self.root):
+                    mtime_ns = os.stat(directory).st_mtime_ns
+                    if time.time_ns() - mtime_ns < RACY_MTIME_NS:
+                        # Changes within the same timestamp tick would go unnoticed
+                        mtime_ns = -1
+                    directories[self.relative(directory)] = mtime_ns
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.name.startswith('.'):
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file() and not entry.name.endswith(IGNORED_SUFFIXES):
+                            yield entry
+            except OSError as e:
+                logger.warning(f"Cannot scan archive directory: {e}")
+
+    def reconcile(self) -> Dict[str, int]:
+        """
+        Walk the archive once and correct any drift
+
+        New files are added, files whose size or mtime changed are refreshed
+        (their record count and checksum become unknown) and rows for files
+        that no longer exist are removed.
+
+        Returns:
+            Dict with files, added, updated and removed counts
+        """
+        start = time.time()
+        counts = {'files': 0, 'added': 0, 'updated': 0, 'removed': 0}
+        conn = self._get_connection()
+        known = {row['path']: (row['size'], row['mtime_ns'])
+                 for row in conn.execute("SELECT path, size, mtime_ns FROM archive_files")}
+
+        root_entries = self._root_entries()
+        directories: Dict[str, int] = {}
+        entries = list(self._walk(directories))
+        names = {entry.path for entry in entries}
+        with self.transaction() as conn:
+            for entry in entries:
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                relative = self.relative(entry.path)
+                counts['files'] += 1
+                previous = known.pop(relative, None)
+                if previous == (stat.st_size, stat.st_mtime_ns):
+                    continue
+                counts['added' if previous is None else 'updated'] += 1
+                self._upsert(conn, self._row_values(relative, stat),
+                             frame_indexed=(entry.path + INDEX_SUFFIX) in names)
+
+            for relative in known:
+                conn.execute("DELETE FROM archive_files WHERE path = ?", (relative,))
+            counts['removed'] = len(known)
+            conn.execute("DELETE FROM archive_dirs")
+            conn.executemany("INSERT INTO archive_dirs (path, mtime_ns) VALUES (?, ?)",
+                             directories.items())
+            conn.executemany("INSERT OR REPLACE INTO catalog_meta (key, value) VALUES (?, ?)",
+                             [('last_reconciled', str(start)),
+                              ('root_entries', json.dumps(root_entries))])
+
+        logger.info(f"Reconciled archive catalog for {self.root} in {time.time() - start:.2f}s: "
+                    f"{counts['added']} added, {counts['updated']} updated, {counts['removed']} removed")
+        return counts
+
+    def last_reconciled(self) -> Optional[float]:
+        """Time of the last reconcile, or None if the catalog was never reconciled"""
+        row = self._get_connection().execute(
+            "SELECT value FROM catalog_meta WHERE key = 'last_reconciled'").fetchone()
+        return float(row['value']) if row else None
+
+    def changed_since_reconcile(self) -> bool:
+        """
+        Check directory mtimes for files added or removed behind the catalog's back
+
+        The root itself is compared by listing, since the catalog's own
+        database files change its mtime. Appends to existing files do not
+        change directory mtimes; queries that depend on file contents
+        (compression_candidates) re-stat what they return.
+
+        Returns:
+            True if any directory changed, appeared or disappeared
+        """
+        conn = self._get_connection()
+        row = conn.execute("SELECT value FROM catalog_meta WHERE key = 'root_entries'").fetchone()
+        try:
+            if row is None or json.loads(row['value']) != self._root_entries():
+                return True
+            for entry in conn.execute("SELECT path, mtime_ns FROM archive_dirs"):
+                if os.stat(self.root / entry['path']).st_mtime_ns != entry['mtime_ns']:
+                    return True
+        except OSError:
+            return True
+        return False
+
+    def ensure_fresh(self, max_age: float = RECONCILE_INTERVAL) -> bool:
+        """
+        Reconcile unless the last reconcile is recent and no directory changed since
+
+        Args:
+            max_age: Seconds a reconcile stays valid (0 forces a reconcile)
+
+        Returns:
+            True if a reconcile ran
+        """
+        last = self.last_reconciled()
+        if (last is not None and max_age > 0 and time.time() - last < max_age
+                and not self.changed_since_reconcile()):
+            return False
+        self.reconcile()
+        return True
+
+    def _entries(self, where: str = '', params: tuple = ()) -> List[Dict[str, Any]]:
+        rows = self._get_connection().execute(
+            f"SELECT * FROM archive_files {where} ORDER BY path", params).fetchall()
+        entries = []
+        for row in rows:
+            entry = dict(row)
+            entry['path'] = str(self.root / entry['path'])
+            entries.append(entry)
+        return entries
+
+    def files(self, source: Optional[str] = None, kind: Optional[str] = None,
+              compression: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Catalogued files matching the filters, ordered by path
+
+        Args:
+            source: Only this source directory
+            kind: data, manifest, index or other
+            compression: none, gzip or zstd
+
+        Returns:
+            Row dicts with an absolute 'path'
+        """
+        clauses, params = [], []
+        for column, value in (('source', source), ('kind', kind), ('compression', compression)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        return self._entries(where, tuple(params))
+
+    def compression_candidates(self, cutoff_time: float,
+                               extensions: Iterable[str] = ('.jsonl',)) -> List[Path]:
+        """
+        Uncompressed files last modified before cutoff_time with no compressed sibling
+
+        Args:
+            cutoff_time: Epoch seconds; newer files are left alone
+            extensions: File suffixes eligible for compression
+
+        Returns:
+            Sorted absolute paths
+        """
+        rows = self._get_connection().execute("""
+            SELECT f.path FROM archive_files f
+            WHERE f.compression = 'none' AND f.mtime_ns < ?
+              AND NOT EXISTS (SELECT 1 FROM archive_files c
+                              WHERE c.path IN (f.path || '.gz', f.path || '.zst'))
+            ORDER BY f.path
+        """, (int(cutoff_time * 1e9),)).fetchall()
+        extensions = tuple(extensions)
+
+        candidates = []
+        for row in rows:
+            if not row['path'].endswith(extensions):
+                continue
+            path = self.root / row['path']
+            # Candidates are about to be rewritten, so confirm them against disk
+            try:
+                if path.stat().st_mtime < cutoff_time:
+                    candidates.append(path)
+                else:
+                    self.record_file(path)
+            except FileNotFoundError:
+                self.remove(path)
+        return candidates
+
+    def pending_index(self, source: Optional[str] = None) -> List[Path]:
+        """
+        Data files the search index has not absorbed in their current state
+
+        Args:
+            source: Only this source directory
+
+        Returns:
+            Sorted absolute paths
+        """
+        query = ("SELECT path FROM archive_files WHERE kind = 'data' "
+                 "AND (indexed_mtime_ns IS NULL OR indexed_mtime_ns != mtime_ns)")
+        params: tuple = ()
+        if source is not None:
+            query += " AND source = ?"
+            params = (source,)
+        rows = self._get_connection().execute(query + " ORDER BY path", params).fetchall()
+        return [self.root / row['path'] for row in rows]
+
+    def breakdown(self) -> List[Dict[str, Any]]:
+        """
+        File count and size grouped by source, kind and compression
+
+        Returns:
+            Row dicts with source, kind, compression, files and size
+        """
+        return [dict(row) for row in self._get_connection().execute("""
+            SELECT source, kind, compression, COUNT(*) AS files, SUM(size) AS size
+            FROM archive_files GROUP BY source, kind, compression ORDER BY source
+        """)]
+
+    def totals(self) -> Dict[str, int]:
+        """Total file count and size in bytes"""
+        row = self._get_connection().execute(
+            "SELECT COUNT(*) AS files, COALESCE(SUM(size), 0) AS size FROM archive_files").fetchone()
+        return {'files': row['files'], 'size': row['size']}
+
+    def summary(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Aggregate statistics computed in SQL
+
+        Args:
+            now: Reference time for age buckets (defaults to time.time())
+
+        Returns:
+            Dict with 'by_source', 'by_type' and 'by_age' aggregates. Age
+            buckets are week (<7d), month (<30d), year (<365d) and ancient.
+            Files directly under the root belong to no source and are excluded.
+            Frame index sidecars (.idx) are only counted in by_type, so file
+            counts per source and age match the archives themselves.
+        """
+        now = time.time() if now is None else now
+        conn = self._get_connection()
+
+        by_source = {}
+        for row in conn.execute("""
+            SELECT source, COUNT(*) AS files, SUM(size) AS size,
+                   SUM(compression != 'none') AS compressed_files,
+                   SUM(kind = 'data' AND compression = 'none') AS uncompressed_files,
+                   COUNT(DISTINCT day) AS days_of_data,
+                   MIN(mtime_ns) AS oldest_ns, MAX(mtime_ns) AS latest_ns,
+                   SUM(CASE WHEN kind = 'data' THEN record_count END) AS records
+            FROM archive_files WHERE source != '' AND kind != 'index' GROUP BY source
+        """):
+            by_source[row['source']] = dict(row)
+
+        by_type = {}
+        for row in conn.execute("""
+            SELECT kind, compression, COUNT(*) AS files, SUM(size) AS size,
+                   SUM(original_size) AS original_size,
+                   SUM(CASE WHEN original_size IS NULL THEN size ELSE 0 END) AS size_without_original
+            FROM archive_files WHERE source != '' GROUP BY kind, compression
+        """):
+            by_type[(row['kind'], row['compression'])] = dict(row)
+
+        boundaries = [int((now - days * 86400) * 1e9) for days in (7, 30, 365)]
+        by_age = {}
+        for row in conn.execute("""
+            SELECT CASE WHEN mtime_ns >= ? THEN 'week'
+                        WHEN mtime_ns >= ? THEN 'month'
+                        WHEN mtime_ns >= ? THEN 'year'
+                        ELSE 'ancient' END AS bucket,
+                   COUNT(*) AS files, SUM(size) AS size
+            FROM archive_files WHERE source != '' AND kind != 'index' GROUP BY bucket
+        """, boundaries):
+            by_age[row['bucket']] = dict(row)
+
+        return {'by_source': by_source, 'by_type': by_type, 'by_age': by_age}
+
+
+def catalog_for(root: Path, max_age: float = RECONCILE_INTERVAL) -> Optional[ArchiveCatalog]:
+    """
+    Fresh catalog for an archive root, or None if it has none or it cannot be opened
+
+    Never creates a catalog: only directories that already have one (archive
+    roots set up by ArchiveWriter) are served from it. Callers fall back to
+    walking the directory when this returns None (not an archive root,
+    read-only archive, unsupported filesystem).
+
+    Args:
+        root: Archive root directory
+        max_age: Reconcile if the last reconcile is older than this
+
+    Returns:
+        ArchiveCatalog or None
+    """
+    if not (Path(root) / CATALOG_FILENAME).exists():
+        return None
+    try:
+        catalog = ArchiveCatalog.for_root(root)
+        catalog.ensure_fresh(max_age)
+        return catalog
+    except (ArchiveCatalogError, sqlite3.Error, OSError) as e:
+        logger.warning(f"Archive catalog unavailable for {root}, scanning directly: {e}")
+        return None
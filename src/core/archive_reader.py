@@ -0,0 +1,246 @@
+"""
+Shared memory-mapped JSONL reader for archive scans
+
+Every subsystem that scanned archives (ArchiveWriter.read_records, the
+search indexer, the activity analyzer) had its own loop over a text-mode
+file: decode each line to str, strip() it into another copy, then parse.
+This module is the one read path they now share:
+
+- Uncompressed .jsonl files are mmapped and split on b'\\n' directly in the
+  mapped buffer. Each line becomes a single bytes slice handed straight to
+  the JSON decoder, with no text decoding or strip() copies.
+- Decoding goes through the process-wide json_codec, which uses orjson or
+  msgspec when installed and matches the standard library's results and
+  errors.
+- A LineIndex of line-start byte offsets lets resumed reads jump to line N
+  without rescanning the file. Indexes are cached per process and
+  invalidated when the file's size or mtime changes.
+- Compressed .gz/.zst archives go through seekable_archive.open_at_line,
+  which seeks via the frame index.
+
+Line numbers follow the rest of the archive code. start_line is a 0-based
+count of lines to skip, and yielded line numbers are 1-based physical line
+numbers (blank lines are counted).
+
+References:
+- src/core/json_codec.py - pluggable decoder
+- src/core/seekable_archive.py - frame-indexed reads of compressed archives
+- src/core/archive_writer.py - ArchiveWriter.read_records
+- src/search/indexer.py - ArchiveIndexer._stream_jsonl_batches
+- src/aggregators/basic_stats.py - ActivityAnalyzerImpl._iter_slack_messages
+"""
+
+import json
+import logging
+import mmap
+import os
+import threading
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, Tuple, Union
+
+from .json_codec import get_codec
+from .seekable_archive import open_at_line
+
+logger = logging.getLogger(__name__)
+
+COMPRESSED_SUFFIXES = ('.gz', '.zst')
+LINE_INDEX_CACHE_SIZE = 64
+RAW_LINE_PREVIEW = 100
+
+# Errors that mark a single line as malformed rather than the file unreadable
+DECODE_ERRORS = (json.JSONDecodeError, UnicodeDecodeError)
+
+ErrorHandler = Callable[[int, str, Exception], None]
+
+
+def loads(line: Union[bytes, str]) -> Any:
+    """
+    Parse one JSON document with the process-wide codec
+
+    Args:
+        line: JSON text as bytes or str
+
+    Returns:
+        Decoded value
+
+    Raises:
+        json.JSONDecodeError / UnicodeDecodeError: If the line is malformed
+    """
+    return get_codec().loads(line)
+
+
+class LineIndex:
+    """
+    Byte offsets of line starts in an uncompressed file
+
+    offsets[n] is where 0-based line n starts; a trailing line without a
+    newline still gets an entry.
+    """
+
+    def __init__(self, offsets: array, size: int, mtime_ns: int):
+        self.offsets = offsets
+        self.size = size
+        self.mtime_ns = mtime_ns
+
+    @classmethod
+    def build(cls, buffer, size: int, mtime_ns: int) -> 'LineIndex':
+        """
+        Scan a buffer once for newlines
+
+        Args:
+            buffer: mmap (or bytes) holding the file contents
+            size: File size in bytes
+            mtime_ns: File mtime the index belongs to
+
+        Returns:
+            LineIndex for the buffer
+        """
+        offsets = array('Q')
+        position = 0
+        find = buffer.find
+        while position < size:
+            offsets.append(position)
+            newline = find(b'\n', position)
+            if newline == -1:
+                break
+            position = newline + 1
+        return cls(offsets, size, mtime_ns)
+
+    @property
+    def line_count(self) -> int:
+        return len(self.offsets)
+
+    def offset(self, line_number: int) -> int:
+        """
+        Byte offset where a 0-based line starts
+
+        Args:
+            line_number: Line to locate
+
+        Returns:
+            Offset, or the file size for lines past the end
+        """
+        if line_number >= len(self.offsets):
+            return self.size
+        return self.offsets[line_number]
+
+
+_line_indexes: 'OrderedDict[str, LineIndex]' = OrderedDict()
+_line_indexes_lock = threading.Lock()
+
+
+def line_index(path: Path, buffer=None) -> LineIndex:
+    """
+    Cached LineIndex for an uncompressed file, rebuilt when the file changes
+
+    Args:
+        path: Uncompressed JSONL file
+        buffer: Already mapped contents (mapped here when None)
+
+    Returns:
+        LineIndex matching the file's current size and mtime
+    """
+    key = str(Path(path).resolve())
+    stat = os.stat(path)
+    with _line_indexes_lock:
+        index = _line_indexes.get(key)
+        if index is not None and (index.size, index.mtime_ns) == (stat.st_size, stat.st_mtime_ns):
+            _line_indexes.move_to_end(key)
+            return index
+
+    if buffer is not None:
+        index = LineIndex.build(buffer, stat.st_size, stat.st_mtime_ns)
+    elif stat.st_size == 0:
+        index = LineIndex(array('Q'), 0, stat.st_mtime_ns)
+    else:
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            index = LineIndex.build(mapped, stat.st_size, stat.st_mtime_ns)
+
+    with _line_indexes_lock:
+        _line_indexes[key] = index
+        _line_indexes.move_to_end(key)
+        while len(_line_indexes) > LINE_INDEX_CACHE_SIZE:
+            _line_indexes.popitem(last=False)
+    return index
+
+
+def _iter_mapped_lines(path: Path, start_line: int) -> Iterator[Tuple[int, bytes]]:
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if start_line > 0:
+                index = line_index(path, mapped)
+                # The cached index may predate an append made after we mapped
+                position = min(index.offset(start_line), size)
+            else:
+                position = 0
+            line_number = start_line
+            find = mapped.find
+            while position < size:
+                newline = find(b'\n', position)
+                end = size if newline == -1 else newline
+                line_number += 1
+                yield line_number, mapped[position:end]
+                position = end + 1
+
+
+def iter_lines(path: Path, start_line: int = 0) -> Iterator[Tuple[int, Union[bytes, str]]]:
+    """
+    Iterate raw lines of an archive without their trailing newline
+
+    Args:
+        path: Archive file (.jsonl, .jsonl.gz or .jsonl.zst)
+        start_line: Number of lines to skip (0-based)
+
+    Yields:
+        (line_number, line) pairs with 1-based line numbers. Lines are bytes
+        for uncompressed files and str for compressed ones; loads() accepts both.
+    """
+    path = Path(path)
+    start_line = max(0, start_line)
+    if path.suffix in COMPRESSED_SUFFIXES:
+        with open_at_line(path, start_line) as f:
+            for line_number, line in enumerate(f, start_line + 1):
+                yield line_number, line.rstrip('\n')
+        return
+    yield from _iter_mapped_lines(path, start_line)
+
+
+def _preview(line: Union[bytes, str]) -> str:
+    text = line.decode('utf-8', errors='replace') if isinstance(line, bytes) else line
+    text = text.strip()
+    return text[:RAW_LINE_PREVIEW] + '...' if len(text) > RAW_LINE_PREVIEW else text
+
+
+def read_jsonl(path: Path, start_line: int = 0,
+               on_error: Optional[ErrorHandler] = None) -> Iterator[Tuple[int, Any]]:
+    """
+    Iterate parsed records of a JSONL archive, skipping blank lines
+
+    Args:
+        path: Archive file (.jsonl, .jsonl.gz or .jsonl.zst)
+        start_line: Number of lines to skip (0-based)
+        on_error: Called as on_error(line_number, preview, exception) for each
+                  malformed line; malformed lines are logged and skipped when None
+
+    Yields:
+        (line_number, record) pairs with 1-based line numbers
+
+    Raises:
+        OSError: If the file cannot be opened or read
+    """
+    decode = get_codec().loads
+    for line_number, line in iter_lines(path, start_line):
+        if not line or line.isspace():
+            continue
+        try:
+            yield line_number, decode(line)
+        except DECODE_ERRORS as e:
+            if on_error is not None:
+                on_error(line_number, _preview(line), e)
+            else:
+                logger.warning(f"Skipping malformed JSON on line {line_number} in {path}: {e}")
@@ -9,6 +9,10 @@ Features:
 - Source-by-source breakdown
 - Health scoring with recommendations
 - Performance optimization suggestions
+
+Statistics are aggregated in SQL from the archive catalog
+(src/core/archive_catalog.py) instead of walking and stat-ing every file;
+the directory walk below is only used when the catalog cannot be opened.
 """
 
 import json
@@ -18,6 +22,9 @@ from typing import Dict, Any, List
 import logging
 import time
 
+from .archive_catalog import catalog_for
+from .seekable_archive import INDEX_SUFFIX
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,9 +40,10 @@ class ArchiveStats:
     - Performance metrics for large archives
     """
     
-    def __init__(self):
+    def __init__(self, use_catalog: bool = True):
         self.stats = {}
         self.scan_start_time = None
+        self.use_catalog = use_catalog
     
     def calculate(self, archive_dir: Path) -> Dict[str, Any]:
         """
@@ -70,6 +78,7 @@ class ArchiveStats:
                 'jsonl': {'count': 0, 'size_mb': 0.0},
                 'compressed': {'count': 0, 'size_mb': 0.0},
                 'manifest': {'count': 0, 'size_mb': 0.0},
+                'index': {'count': 0, 'size_mb': 0.0},
                 'other': {'count': 0, 'size_mb': 0.0}
             },
             'health_score': 0,
@@ -92,7 +101,11 @@ class ArchiveStats:
         
         # Process each source directory
         try:
-            self._scan_directory(archive_dir, stats, week_ago, month_ago, year_ago)
+            catalog = catalog_for(archive_dir) if self.use_catalog else None
+            if catalog is not None:
+                self._load_from_catalog(catalog, stats, now)
+            else:
+                self._scan_directory(archive_dir, stats, week_ago, month_ago, year_ago)
         except Exception as e:
             logger.error(f"Error scanning archive directory: {e}")
             stats['error'] = str(e)
@@ -113,6 +126,48 @@ class ArchiveStats:
         
         return stats
     
+    def _load_from_catalog(self, catalog, stats: Dict, now: datetime):
+        """Fill file, source, type and age statistics from catalog aggregates"""
+        mb = 1024 ** 2
+        summary = catalog.summary(now.timestamp())
+        
+        for source_name, row in sorted(summary['by_source'].items()):
+            stats['total_files'] += row['files']
+            stats['total_size_mb'] += row['size'] / mb
+            stats['by_source'][source_name] = {
+                'files': row['files'],
+                'size_mb': row['size'] / mb,
+                'compressed_files': row['compressed_files'] or 0,
+                'uncompressed_files': row['uncompressed_files'] or 0,
+                'days_of_data': row['days_of_data'],
+                'latest': datetime.fromtimestamp(row['latest_ns'] / 1e9).isoformat(),
+                'oldest': datetime.fromtimestamp(row['oldest_ns'] / 1e9).isoformat(),
+                'avg_file_size_mb': row['size'] / mb / row['files']
+            }
+        
+        for (kind, compression), row in summary['by_type'].items():
+            size_mb = row['size'] / mb
+            if compression != 'none':
+                file_type = 'compressed'
+                stats['compressed_files'] += row['files']
+                # Exact original sizes where the compressor recorded them, else assume 4:1
+                stats['original_size_mb'] += ((row['original_size'] or 0) +
+                                              (row['size_without_original'] or 0) * 4) / mb
+            elif kind == 'data':
+                file_type = 'jsonl'
+                stats['uncompressed_files'] += row['files']
+                stats['original_size_mb'] += size_mb
+            elif kind in ('manifest', 'index'):
+                file_type = kind
+            else:
+                file_type = 'other'
+            stats['file_types'][file_type]['count'] += row['files']
+            stats['file_types'][file_type]['size_mb'] += size_mb
+        
+        for bucket, row in summary['by_age'].items():
+            stats['age_distribution'][bucket]['count'] += row['files']
+            stats['age_distribution'][bucket]['size_mb'] += row['size'] / mb
+    
     def _scan_directory(self, archive_dir: Path, stats: Dict, week_ago: datetime, 
                        month_ago: datetime, year_ago: datetime):
         """Scan archive directory and collect file statistics"""
@@ -153,9 +208,15 @@ class ArchiveStats:
                 continue
             
             try:
-                file_size = file_path.stat().st_size
-                file_size_mb = file_size / (1024 ** 2)
-                file_mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
+                file_stat = file_path.stat()
+                file_size_mb = file_stat.st_size / (1024 ** 2)
+                file_mtime = datetime.fromtimestamp(file_stat.st_mtime)
+                
+                # Frame index sidecars belong to their archive; report them apart
+                if file_path.name.endswith(INDEX_SUFFIX):
+                    stats['file_types']['index']['count'] += 1
+                    stats['file_types']['index']['size_mb'] += file_size_mb
+                    continue
                 
                 # Update totals
                 stats['total_files'] += 1
@@ -197,7 +258,7 @@ class ArchiveStats:
             source_stats['uncompressed_files'] += 1
             stats['original_size_mb'] += file_size_mb
             
-        elif file_path.suffixes == ['.jsonl', '.gz'] or file_path.suffix == '.gz':
+        elif file_path.suffix in ('.gz', '.zst'):
             stats['file_types']['compressed']['count'] += 1
             stats['file_types']['compressed']['size_mb'] += file_size_mb
             stats['compressed_files'] += 1
@@ -16,7 +16,10 @@ import logging
 import fcntl
 from collections import defaultdict
 
+from src.core.archive_catalog import ArchiveCatalog, ArchiveCatalogError
+from src.core.archive_reader import read_jsonl
 from src.core.config import get_config
+from src.core.json_codec import get_codec
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -114,8 +117,8 @@ class ArchiveWriter:
         if target_date is None:
             target_date = date.today()
         
-        # Validate all records are JSON-serializable before starting write
-        self._validate_records(records)
+        # Serialize (validating every record) before starting the write
+        content = self._serialize_records(records)
         
         with self._lock:
             try:
@@ -127,10 +130,13 @@ class ArchiveWriter:
                 manifest_file = daily_dir / "manifest.json"
                 
                 # Atomic write operation using temp file + rename pattern
-                self._atomic_append_jsonl(data_file, records)
+                self._atomic_append_jsonl(data_file, content)
                 
                 # Update metadata
-                self._update_metadata(manifest_file, data_file, len(records))
+                record_count = self._update_metadata(manifest_file, data_file, len(records))
+                
+                # Keep the archive catalog current so stats never need a tree walk
+                self._update_catalog(data_file, manifest_file, record_count)
                 
                 logger.debug(f"Successfully wrote {len(records)} records to {data_file}")
                 
@@ -143,37 +149,40 @@ class ArchiveWriter:
                 logger.error(error_msg)
                 raise ArchiveError(error_msg) from e
     
-    def _validate_records(self, records: List[Dict[str, Any]]) -> None:
-        """Validate that all records are JSON-serializable"""
+    def _serialize_records(self, records: List[Dict[str, Any]]) -> str:
+        """
+        Encode records as JSONL, validating that each is JSON-serializable
+        
+        Records without an archive_timestamp get one; the originals are not modified.
+        """
+        codec = get_codec()
+        archive_timestamp = None
+        jsonl_lines = []
         for i, record in enumerate(records):
+            # Ensure consistent timestamp format if not present
+            if 'archive_timestamp' not in record:
+                if archive_timestamp is None:
+                    archive_timestamp = datetime.now().isoformat()
+                record = dict(record)  # Don't modify original
+                record['archive_timestamp'] = archive_timestamp
+            
             try:
-                json.dumps(record)  # Test JSON serialization
+                jsonl_lines.append(codec.dumps(record) + '\n')
             except (TypeError, ValueError) as e:
                 raise ArchiveError(f"Record {i} is not JSON serializable: {str(e)}") from e
+        
+        return ''.join(jsonl_lines)
     
     def _get_daily_directory(self, target_date: date) -> Path:
         """Get daily directory path for given date"""
         date_str = target_date.isoformat()  # YYYY-MM-DD format
         return self.source_dir / date_str
     
-    def _atomic_append_jsonl(self, data_file: Path, records: List[Dict[str, Any]]) -> None:
+    def _atomic_append_jsonl(self, data_file: Path, content: str) -> None:
         """
-        Atomically append records to JSONL file using temp file + rename pattern
+        Atomically append serialized JSONL content using temp file + rename pattern
         Implements atomic write operations for data safety
         """
-        # Prepare JSONL content
-        jsonl_lines = []
-        for record in records:
-            # Ensure consistent timestamp format if not present
-            if 'archive_timestamp' not in record:
-                record = dict(record)  # Don't modify original
-                record['archive_timestamp'] = datetime.now().isoformat()
-            
-            json_line = json.dumps(record, ensure_ascii=False, separators=(',', ':'))
-            jsonl_lines.append(json_line + '\n')
-        
-        content = ''.join(jsonl_lines)
-        
         # Use atomic write pattern: temp file + rename
         temp_file = None
         try:
@@ -229,8 +238,8 @@ class ArchiveWriter:
                     pass
             raise
     
-    def _update_metadata(self, manifest_file: Path, data_file: Path, records_added: int) -> None:
-        """Update manifest.json with current metadata"""
+    def _update_metadata(self, manifest_file: Path, data_file: Path, records_added: int) -> Optional[int]:
+        """Update manifest.json with current metadata, returning the file's record count"""
         try:
             # Load existing metadata
             metadata = {}
@@ -269,10 +278,23 @@ class ArchiveWriter:
             
             # Atomic write of metadata
             self._atomic_write_json(manifest_file, metadata)
+            return record_count
             
         except Exception as e:
             logger.warning(f"Failed to update metadata for {manifest_file}: {e}")
             # Don't fail the whole operation if metadata update fails
+            return None
+    
+    def _update_catalog(self, data_file: Path, manifest_file: Path, record_count: Optional[int]) -> None:
+        """Record the written files in the archive catalog"""
+        try:
+            catalog = ArchiveCatalog.for_root(self.archive_dir, create=True)
+            catalog.record_file(data_file, record_count=record_count)
+            if manifest_file.exists():
+                catalog.record_file(manifest_file)
+        except (ArchiveCatalogError, OSError) as e:
+            # The next reconcile picks the files up; never fail a write over it
+            logger.warning(f"Failed to update archive catalog for {data_file}: {e}")
     
     def _atomic_write_json(self, json_file: Path, data: Dict[str, Any]) -> None:
         """Atomically write JSON data using temp file + rename pattern"""
@@ -345,21 +367,10 @@ class ArchiveWriter:
         
         records = []
         try:
-            with open(data_file, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    if limit and len(records) >= limit:
-                        break
-                    
-                    line = line.strip()
-                    if not line:  # Skip empty lines
-                        continue
-                    
-                    try:
-                        record = json.loads(line)
-                        records.append(record)
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"Skipping malformed JSON on line {line_num} in {data_file}: {e}")
-                        continue
+            for _, record in read_jsonl(data_file):
+                records.append(record)
+                if limit and len(records) >= limit:
+                    break
             
             return records
             
@@ -1,7 +1,7 @@
 """
 Safe compression system for JSONL archives
-Uses gzip with atomic operations and backup protection
-References: ArchiveWriter for integration patterns
+Uses gzip (or zstd, see compression_engine) with atomic operations and backup protection
+References: ArchiveWriter for integration patterns, compression_engine for parallel batches
 
 CRITICAL SAFETY FIXES APPLIED:
 - Atomic compression using temp file + rename pattern
@@ -74,6 +74,12 @@ try:
 except ImportError:
     HAS_ZSTD = False
 
+from .compression_engine import (
+    CompressionEngine, compress_stream, compressed_files, compressed_path_for, find_candidates,
+    install_output, record_outcome
+)
+from .seekable_archive import open_at_line
+
 logger = logging.getLogger(__name__)
 
 class CompressionError(Exception):
@@ -90,9 +96,18 @@ class SafeCompressor:
     - Concurrent access protection
     - Streaming for large files
     - Progress indicators
+    - Parallel batch compression (gzip, or zstd with per-source dictionaries)
     """
     
-    def __init__(self, backup_days: int = 7, chunk_size: int = 1024*1024):
+    def __init__(self, backup_days: int = 7, chunk_size: int = 1024*1024,
+                 algorithm: str = 'gzip', max_workers: Optional[int] = None):
+        """
+        Args:
+            backup_days: Days to keep backups
+            chunk_size: Read size for streaming compression
+            algorithm: 'gzip' or 'zstd' (zstd requires zstandard)
+            max_workers: Worker processes for batch compression (default: CPU count)
+        """
         self.backup_days = backup_days
         self.chunk_size = chunk_size
         self.stats = {
@@ -102,9 +117,10 @@ class SafeCompressor:
             'bytes_saved': 0
         }
         
-        # Use gzip for lab-grade simplicity
-        self.extension = '.gz'
-        self.algorithm = 'gzip'
+        self.engine = CompressionEngine(algorithm, max_workers=max_workers,
+                                        chunk_size=chunk_size)
+        self.algorithm = self.engine.algorithm
+        self.extension = self.engine.suffix
         
         # CRITICAL FIX: Initialize backup tracking
         self._backup_registry = {}
@@ -124,31 +140,24 @@ class SafeCompressor:
             logger.error(f"File not found: {file_path}")
             return False
             
-        temp_path = file_path.with_suffix('.tmp.gz')
-        gz_path = file_path.with_suffix('.jsonl.gz')
+        gz_path = compressed_path_for(file_path, self.algorithm)
+        temp_path = gz_path.with_name(gz_path.name + '.tmp')
         
         try:
-            # Compress to temporary file
-            original_size = file_path.stat().st_size
-            
-            with open(file_path, 'rb') as f_in:
-                with gzip.open(temp_path, 'wb', compresslevel=6) as f_out:
-                    shutil.copyfileobj(f_in, f_out, length=self.chunk_size)
-            
-            compressed_size = temp_path.stat().st_size
-            
-            # CRITICAL FIX: Real two-phase commit with content verification
-            self._verify_compressed_content(temp_path, file_path)
+            # Compress to temporary file; the input checksum and the decompressed
+            # round trip are compared in the same streaming pass, so the output
+            # is verified without reading it back
+            result = compress_stream(file_path, temp_path, self.algorithm,
+                                     self.engine.level, chunk_size=self.chunk_size,
+                                     frame_records=self.engine.frame_records)
+            original_size = result['original_size']
+            compressed_size = result['compressed_size']
             
             # ATOMIC PHASE 1: Rename only after successful compression and verification
-            temp_path.rename(gz_path)
+            install_output(temp_path, gz_path, result['index'])
             
-            # ATOMIC PHASE 2: Verify renamed file and then delete original
+            # ATOMIC PHASE 2: Delete original only once the verified output is in place
             try:
-                # Verify the renamed file is still readable
-                self._verify_compressed_content(gz_path, file_path)
-                
-                # Only delete original after successful verification
                 file_path.unlink()
                 
             except Exception as e:
@@ -163,6 +172,9 @@ class SafeCompressor:
             # Update stats
             self.stats['compressed'] += 1
             self.stats['bytes_saved'] += original_size - compressed_size
+            record_outcome({'status': 'compressed', 'path': str(file_path), 'output': str(gz_path),
+                            'original_size': original_size, 'checksum': result['checksum'],
+                            'record_count': result['index'].total_lines if result['index'] else None})
             
             logger.info(f"Compressed {file_path.name}: "
                        f"{original_size:,} → {compressed_size:,} bytes "
@@ -187,20 +199,10 @@ class SafeCompressor:
         Returns:
             True if compressed successfully
         """
-        # Create backup first
-        backup_dir = file_path.parent / '.backup'
-        backup_dir.mkdir(exist_ok=True)
-        
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        backup_path = backup_dir / f"{file_path.name}.{timestamp}"
-        
+        backup_path = None
         try:
-            shutil.copy2(file_path, backup_path)
-            logger.debug(f"Created backup: {backup_path}")
-            
-            # CRITICAL FIX: Register backup for cleanup tracking
-            with self._lock:
-                self._backup_registry[str(backup_path)] = datetime.now()
+            # Create backup first
+            backup_path = self._create_backup(file_path)
             
             # Compress with atomic operation
             result = self.compress_file_atomic(file_path)
@@ -213,12 +215,31 @@ class SafeCompressor:
             
         except Exception as e:
             # Remove backup if compression failed
-            backup_path.unlink(missing_ok=True)
-            # Remove from registry if it was added
-            with self._lock:
-                self._backup_registry.pop(str(backup_path), None)
+            if backup_path:
+                self._discard_backup(backup_path)
             raise
     
+    def _create_backup(self, file_path: Path) -> Path:
+        """Copy file into its directory's .backup folder and track it for cleanup"""
+        backup_dir = file_path.parent / '.backup'
+        backup_dir.mkdir(exist_ok=True)
+        
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        backup_path = backup_dir / f"{file_path.name}.{timestamp}"
+        shutil.copy2(file_path, backup_path)
+        logger.debug(f"Created backup: {backup_path}")
+        
+        # CRITICAL FIX: Register backup for cleanup tracking
+        with self._lock:
+            self._backup_registry[str(backup_path)] = datetime.now()
+        return backup_path
+    
+    def _discard_backup(self, backup_path: Path):
+        """Remove a backup whose compression did not happen"""
+        backup_path.unlink(missing_ok=True)
+        with self._lock:
+            self._backup_registry.pop(str(backup_path), None)
+    
     def safe_compress(self, file_path: Path, idle_seconds: int = 60) -> bool:
         """
         CRITICAL FIX: Safely compress file with concurrency protection
@@ -304,53 +325,74 @@ class SafeCompressor:
             Statistics dictionary
         """
         cutoff_time = time.time() - (age_days * 86400)
-        candidates = []
-        
-        # Find compression candidates
-        for ext in extensions:
-            for file_path in directory.rglob(f"*{ext}"):
-                if file_path.stat().st_mtime < cutoff_time:
-                    # Skip already compressed files
-                    if not file_path.with_suffix(f"{ext}.gz").exists():
-                        candidates.append(file_path)
+        candidates = find_candidates(directory, cutoff_time, extensions)
         
         logger.info(f"Found {len(candidates)} files to compress")
         
-        # Compress with progress bar
-        if HAS_TQDM:
-            iterator = tqdm(candidates, desc="Compressing files")
-        else:
-            iterator = candidates
-            print(f"Compressing {len(candidates)} files...")
+        self.compress_files(candidates, root=directory)
+        return self.stats
+    
+    def compress_files(self, files: List[Path], root: Optional[Path] = None,
+                       idle_seconds: int = 60, backup: bool = True) -> List[Dict]:
+        """
+        Compress a batch of files in parallel with backups and active-file protection
         
-        for i, file_path in enumerate(iterator):
-            try:
-                # Use streaming for large files
-                if file_path.stat().st_size > 100_000_000:  # 100MB
-                    self.compress_streaming(file_path)
-                else:
-                    self.safe_compress(file_path)
-                
-                if not HAS_TQDM and i % 10 == 0:
-                    print(f"Progress: {i+1}/{len(candidates)} files")
-                    
-            except Exception as e:
-                logger.error(f"Failed to compress {file_path}: {e}")
+        Args:
+            files: Files to compress
+            root: Archive root; its first-level directories name zstd dictionary sources
+            idle_seconds: Skip files modified within this many seconds
+            backup: Create a backup of each file before compressing it
+            
+        Returns:
+            Per-file outcome dicts from CompressionEngine.compress_files
+        """
+        ready = []
+        backups = {}
+        for file_path in files:
+            if self._is_file_active(file_path, idle_seconds):
+                logger.info(f"Skipping active file: {file_path}")
+                self.stats['skipped'] += 1
                 continue
+            if backup:
+                try:
+                    backups[str(file_path)] = self._create_backup(file_path)
+                except OSError as e:
+                    logger.error(f"Failed to back up {file_path}: {e}")
+                    self.stats['errors'] += 1
+                    continue
+            ready.append(file_path)
+        
+        if not ready:
+            return []
+        
+        with tqdm(total=len(ready), desc="Compressing files") as progress:
+            outcomes = self.engine.compress_files(
+                ready, root=root, progress_callback=lambda outcome: progress.update(1))
+        
+        for outcome in outcomes:
+            backup_path = backups.get(outcome['path'])
+            if outcome['status'] == 'compressed':
+                self.stats['compressed'] += 1
+                self.stats['bytes_saved'] += outcome['original_size'] - outcome['compressed_size']
+                if backup_path:
+                    self._register_backup_for_cleanup(backup_path)
+                continue
+            
+            if outcome['status'] == 'skipped':
+                logger.info(f"File locked, skipping: {outcome['path']}")
+                self.stats['skipped'] += 1
+            else:
+                logger.error(f"Failed to compress {outcome['path']}: {outcome['error']}")
+                self.stats['errors'] += 1
+            if backup_path:
+                self._discard_backup(backup_path)
         
-        return self.stats
+        return outcomes
     
     def find_compression_candidates(self, directory: Path, age_days: int) -> List[Path]:
         """Find files that would be compressed (for dry-run)"""
         cutoff_time = time.time() - (age_days * 86400)
-        candidates = []
-        
-        for file_path in directory.rglob("*.jsonl"):
-            if file_path.stat().st_mtime < cutoff_time:
-                if not file_path.with_suffix('.jsonl.gz').exists():
-                    candidates.append(file_path)
-        
-        return candidates
+        return find_candidates(directory, cutoff_time, ['.jsonl'])
     
     def _is_file_active(self, file_path: Path, idle_seconds: int) -> bool:
         """Check if file was recently modified"""
@@ -437,12 +479,13 @@ class SafeCompressor:
         
         return stats
     
-    def read_compressed_jsonl(self, file_path: Path) -> Iterator[dict]:
+    def read_compressed_jsonl(self, file_path: Path, start_line: int = 0) -> Iterator[dict]:
         """
         Read compressed JSONL file line by line without full decompression
         
         Args:
             file_path: Path to compressed JSONL file
+            start_line: 0-based line to start at; seeks via the .idx sidecar when present
             
         Yields:
             Parsed JSON objects from each line
@@ -451,8 +494,8 @@ class SafeCompressor:
             raise CompressionError(f"File not found: {file_path}")
         
         try:
-            with gzip.open(file_path, 'rt', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
+            with open_at_line(file_path, start_line) as f:
+                for line_num, line in enumerate(f, start_line + 1):
                     line = line.strip()
                     if not line:
                         continue
@@ -478,20 +521,16 @@ class SafeCompressor:
             'by_extension': {}
         }
         
-        # Count compressed files
-        compressed_files = list(directory.rglob("*.gz"))
-        
-        if compressed_files:
-            ext_stats = {
-                'count': len(compressed_files),
-                'size': sum(f.stat().st_size for f in compressed_files)
-            }
-            stats['by_extension']['.gz'] = ext_stats
-            stats['total_compressed'] += ext_stats['size']
-            stats['file_count'] += ext_stats['count']
+        # Compressed files (.gz and .zst) come from the archive catalog
+        for entry in compressed_files(directory):
+            ext_stats = stats['by_extension'].setdefault(entry['suffix'], {'count': 0, 'size': 0})
+            ext_stats['count'] += 1
+            ext_stats['size'] += entry['size']
+            stats['total_compressed'] += entry['size']
+            stats['file_count'] += 1
+            # Original size is known for files compressed by the engine; else assume 4:1
+            stats['total_original'] += entry['original_size'] or entry['size'] * 4
         
-        # Estimate original size (rough 4:1 ratio)
-        stats['total_original'] = stats['total_compressed'] * 4
         stats['compression_ratio'] = (stats['total_compressed'] / stats['total_original'] 
                                      if stats['total_original'] > 0 else 0)
         
@@ -530,57 +569,6 @@ class SafeCompressor:
             'orphaned_entries_removed': orphan_count,
             'registry_size': len(self._backup_registry)
         }
-    
-    def _verify_compressed_content(self, compressed_path: Path, original_path: Path) -> bool:
-        """
-        CRITICAL: Enhanced verification that compares compressed content with original
-        
-        Args:
-            compressed_path: Path to compressed file
-            original_path: Path to original file for comparison
-            
-        Returns:
-            True if verification successful
-            
-        Raises:
-            CompressionError: If verification fails
-        """
-        try:
-            # Basic compression verification - try to decompress
-            try:
-                with gzip.open(compressed_path, 'rb') as f:
-                    # Read first 1KB to verify decompression works
-                    sample = f.read(1024)
-                    if not sample:
-                        raise CompressionError("Compressed file appears empty after decompression")
-                    # Try to decode as text to catch encoding issues  
-                    sample.decode('utf-8', errors='ignore')
-            except (gzip.BadGzipFile, OSError, EOFError) as e:
-                raise CompressionError(f"Basic compression verification failed: {e}")
-            
-            # Additional checks for two-phase commit
-            if not compressed_path.exists():
-                raise CompressionError(f"Compressed file doesn't exist: {compressed_path}")
-            
-            if compressed_path.stat().st_size == 0:
-                raise CompressionError(f"Compressed file is empty: {compressed_path}")
-            
-            # Optional: Quick size sanity check (compressed should be smaller than original)
-            if original_path.exists():
-                original_size = original_path.stat().st_size
-                compressed_size = compressed_path.stat().st_size
-                
-                # Compressed file should be smaller (unless very small file)
-                if original_size > 1024 and compressed_size >= original_size:
-                    logger.warning(f"Compressed file not smaller than original: {compressed_size} >= {original_size}")
-            
-            logger.debug(f"Compressed content verified: {compressed_path}")
-            return True
-            
-        except CompressionError:
-            raise  # Re-raise compression errors
-        except Exception as e:
-            raise CompressionError(f"Content verification failed: {e}")
 
 # Legacy CompressionManager class for compatibility
 class CompressionManager(SafeCompressor):
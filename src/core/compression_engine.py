@@ -0,0 +1,690 @@
+"""
+Parallel archive compression engine with optional zstd dictionaries
+
+SafeCompressor used to compress archive candidates one at a time with gzip,
+then read each output back in full to verify it. This engine compresses a
+batch of files on a process pool, so one file per core is in flight. Each
+file is read once: the input is hashed and compressed, and every compressed
+chunk is also fed through a streaming decompressor whose output is hashed too.
+When the input is exhausted, the two digests must match, so the round trip
+is verified without a second pass over either file.
+
+Algorithms:
+- gzip (stdlib, always available): level 6, output suffix .gz
+- zstd (optional zstandard package): output suffix .zst, with a dictionary
+  trained per source directory (slack/, calendar/, ...). Archive records are
+  small, repetitive JSON objects, which is where dictionaries help most.
+
+Dictionaries are stored next to the archives as
+<root>/.zstd_dicts/<source>-<dict_id>.zdict and are never rewritten, so
+every .zst file can always find the dictionary its frame header names.
+open_compressed() resolves that dictionary automatically.
+
+Output is framed: every frame_records lines are compressed as an independent
+gzip member or zstd frame, and the frame offsets are written to a sidecar
+index (see seekable_archive.py). Standard readers still see one stream.
+
+References:
+- src/core/seekable_archive.py - frame index and random-access reads
+- src/core/archive_catalog.py - candidates come from, and results go to, the catalog
+- src/core/compression.py - SafeCompressor batch compression
+- src/core/safe_compression.py - SafeCompressor used by tools/manage_archives.py
+- src/core/verification.py - ArchiveVerifier reads .gz/.zst through open_compressed
+"""
+
+import gzip
+import hashlib
+import io
+import logging
+import os
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import islice
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterable, List, Optional
+
+from .archive_catalog import ArchiveCatalog, ArchiveCatalogError, catalog_for
+from .seekable_archive import DEFAULT_FRAME_RECORDS, FrameIndex, index_path_for
+
+try:
+    import zstandard as zstd
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+try:
+    import filelock
+    HAS_FILELOCK = True
+except ImportError:
+    HAS_FILELOCK = False
+
+logger = logging.getLogger(__name__)
+
+ALGORITHM_SUFFIXES = {'gzip': '.gz', 'zstd': '.zst'}
+# zstd is opt-in: it needs zstandard to read back, which not every tool has
+DEFAULT_ALGORITHM = 'gzip'
+COMPRESSED_SUFFIXES = tuple(ALGORITHM_SUFFIXES.values())
+DEFAULT_LEVELS = {'gzip': 6, 'zstd': 3}
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+DICTIONARY_DIRNAME = '.zstd_dicts'
+DICTIONARY_SUFFIX = '.zdict'
+DICTIONARY_SIZE = 112 * 1024
+DICTIONARY_SAMPLE_LINES = 500      # per file
+DICTIONARY_SAMPLE_BYTES = 8 * 1024 * 1024  # per source
+DEFAULT_SOURCE = 'default'
+
+# Dictionaries loaded by readers, keyed by dict_id
+_dictionary_cache: Dict[int, bytes] = {}
+
+
+class CompressionEngineError(Exception):
+    """Raised when the compression engine cannot compress or read a file"""
+    pass
+
+
+def compressed_path_for(file_path: Path, algorithm: str = 'gzip') -> Path:
+    """
+    Path of the compressed output for a file (data.jsonl -> data.jsonl.gz)
+
+    Args:
+        file_path: Uncompressed file
+        algorithm: 'gzip' or 'zstd'
+
+    Returns:
+        Output path with the algorithm's suffix appended
+    """
+    return file_path.with_name(file_path.name + ALGORITHM_SUFFIXES[algorithm])
+
+
+def source_for(file_path: Path, root: Optional[Path]) -> str:
+    """
+    Source name used to pick a dictionary: the first directory under root
+
+    Args:
+        file_path: Archive file
+        root: Archive root directory, or None
+
+    Returns:
+        Source name, or 'default' for files directly under root
+    """
+    if root is None:
+        return DEFAULT_SOURCE
+    try:
+        parts = file_path.relative_to(root).parts
+    except ValueError:
+        return DEFAULT_SOURCE
+    return parts[0] if len(parts) > 1 else DEFAULT_SOURCE
+
+
+def scan_candidates(directory: Path, cutoff_time: float,
+                    extensions: Iterable[str] = ('.jsonl',)) -> List[Path]:
+    """
+    Find uncompressed files older than cutoff_time in a single directory walk
+
+    Hidden directories (.backup, .zstd_dicts) are not descended into. A file
+    is skipped when a .gz or .zst sibling already exists.
+
+    Args:
+        directory: Directory to scan recursively
+        cutoff_time: Only files with mtime before this epoch time qualify
+        extensions: File name suffixes to consider
+
+    Returns:
+        Sorted list of candidate paths
+    """
+    extensions = tuple(extensions)
+    candidates = []
+
+    for dirpath, dirnames, filenames in os.walk(directory):
+        dirnames[:] = [name for name in dirnames if not name.startswith('.')]
+        names = set(filenames)
+        for name in filenames:
+            if not name.endswith(extensions):
+                continue
+            if any(name + suffix in names for suffix in COMPRESSED_SUFFIXES):
+                continue
+            path = Path(dirpath) / name
+            try:
+                if path.stat().st_mtime < cutoff_time:
+                    candidates.append(path)
+            except OSError:
+                continue
+
+    return sorted(candidates)
+
+
+def find_candidates(directory: Path, cutoff_time: float,
+                    extensions: Iterable[str] = ('.jsonl',)) -> List[Path]:
+    """
+    Compression candidates from the archive catalog, walking only as a fallback
+
+    Args:
+        directory: Archive root
+        cutoff_time: Only files with mtime before this epoch time qualify
+        extensions: File name suffixes to consider
+
+    Returns:
+        Sorted list of candidate paths
+    """
+    catalog = catalog_for(directory)
+    if catalog is None:
+        return scan_candidates(directory, cutoff_time, extensions)
+    return catalog.compression_candidates(cutoff_time, extensions)
+
+
+def compressed_files(directory: Path) -> List[Dict[str, Any]]:
+    """
+    Compressed files under a directory with their sizes
+
+    Args:
+        directory: Archive root
+
+    Returns:
+        Dicts with 'path', 'suffix', 'size' and 'original_size' (None when
+        the file was not compressed by a catalog-aware writer)
+    """
+    catalog = catalog_for(directory)
+    if catalog is not None:
+        return [{'path': entry['path'], 'suffix': os.path.splitext(entry['path'])[1],
+                 'size': entry['size'], 'original_size': entry['original_size']}
+                for entry in catalog.files() if entry['compression'] != 'none']
+
+    files = []
+    for file_path in Path(directory).rglob('*'):
+        if file_path.suffix in COMPRESSED_SUFFIXES and file_path.is_file():
+            files.append({'path': str(file_path), 'suffix': file_path.suffix,
+                          'size': file_path.stat().st_size, 'original_size': None})
+    return files
+
+
+def record_outcome(outcome: Dict[str, Any]):
+    """
+    Mirror a successful compression into the archive catalog covering the file
+
+    Files outside any catalogued archive are ignored; catalog failures are
+    logged and left for the next reconcile.
+
+    Args:
+        outcome: Outcome dict from compress_and_replace
+    """
+    if outcome.get('status') != 'compressed':
+        return
+    catalog = ArchiveCatalog.find_for(Path(outcome['path']))
+    if catalog is None:
+        return
+    try:
+        catalog.record_compression(outcome['path'], outcome['output'], outcome['original_size'],
+                                   checksum=outcome.get('checksum'),
+                                   record_count=outcome.get('record_count'))
+    except (ArchiveCatalogError, OSError) as e:
+        logger.warning(f"Could not update archive catalog for {outcome['path']}: {e}")
+
+
+def _new_codec(algorithm: str, level: int, dictionary: Optional[bytes]):
+    """Return (compressor, round-trip decompressor) stream objects"""
+    if algorithm == 'gzip':
+        return (zlib.compressobj(level, zlib.DEFLATED, 31),
+                zlib.decompressobj(31))
+
+    if algorithm == 'zstd':
+        if not HAS_ZSTD:
+            raise CompressionEngineError("zstd requested but zstandard is not installed")
+        dict_data = zstd.ZstdCompressionDict(dictionary) if dictionary else None
+        cctx = zstd.ZstdCompressor(level=level, dict_data=dict_data, write_checksum=True)
+        dctx = zstd.ZstdDecompressor(dict_data=dict_data)
+        return cctx.compressobj(), dctx.decompressobj()
+
+    raise CompressionEngineError(f"Unknown compression algorithm: {algorithm}")
+
+
+def compress_stream(file_path: Path, output_path: Path, algorithm: str = 'gzip',
+                    level: Optional[int] = None, dictionary: Optional[bytes] = None,
+                    chunk_size: int = DEFAULT_CHUNK_SIZE,
+                    frame_records: Optional[int] = None) -> Dict:
+    """
+    Compress one file to output_path, verifying the round trip in the same pass
+
+    Args:
+        file_path: File to compress
+        output_path: Where to write compressed bytes (usually a temp path)
+        algorithm: 'gzip' or 'zstd'
+        level: Compression level (default per algorithm)
+        dictionary: Raw zstd dictionary bytes, zstd only
+        chunk_size: Read size
+        frame_records: Lines per independently compressed frame; None writes
+                       a single frame and no index
+
+    Returns:
+        Dict with original_size, compressed_size, checksum (SHA-256 of input)
+        and index (seekable_archive.FrameIndex, or None when unframed)
+
+    Raises:
+        CompressionEngineError: If the decompressed stream does not match the input
+    """
+    level = DEFAULT_LEVELS.get(algorithm, 0) if level is None else level
+    input_hash = hashlib.sha256()
+    output_hash = hashlib.sha256()
+    original_size = 0
+    roundtrip_size = 0
+    index = None
+    if frame_records:
+        index = FrameIndex(algorithm, frame_records)
+
+    with open(file_path, 'rb') as f_in, open(output_path, 'wb') as f_out:
+        def write_frame(pieces):
+            nonlocal original_size, roundtrip_size
+            compressor, verifier = _new_codec(algorithm, level, dictionary)
+
+            def emit(data: bytes):
+                nonlocal roundtrip_size
+                if not data:
+                    return
+                f_out.write(data)
+                restored = verifier.decompress(data)
+                output_hash.update(restored)
+                roundtrip_size += len(restored)
+
+            for piece in pieces:
+                original_size += len(piece)
+                input_hash.update(piece)
+                emit(compressor.compress(piece))
+            emit(compressor.flush())
+            tail = verifier.flush()
+            output_hash.update(tail)
+            roundtrip_size += len(tail)
+
+        if index is None:
+            write_frame(iter(lambda: f_in.read(chunk_size), b''))
+        else:
+            while lines := list(islice(f_in, frame_records)):
+                offset = f_out.tell()
+                write_frame([b''.join(lines)])
+                index.add_frame(offset, f_out.tell() - offset, lines)
+
+    if roundtrip_size != original_size or output_hash.digest() != input_hash.digest():
+        raise CompressionEngineError(
+            f"Round-trip verification failed for {file_path}: "
+            f"{roundtrip_size} of {original_size} bytes matched")
+
+    return {
+        'original_size': original_size,
+        'compressed_size': output_path.stat().st_size,
+        'checksum': input_hash.hexdigest(),
+        'index': index,
+    }
+
+
+def install_output(temp_path: Path, output_path: Path, index=None):
+    """
+    Move a verified temp file into place and write its frame index
+
+    Any index left from an earlier file at the same path is removed first, so
+    a crash between the two steps leaves an unindexed (sequentially readable)
+    archive rather than one with a wrong index.
+
+    Args:
+        temp_path: Verified compressed temp file
+        output_path: Final archive path
+        index: seekable_archive.FrameIndex for the output, or None
+    """
+    index_path_for(output_path).unlink(missing_ok=True)
+    temp_path.replace(output_path)
+    if index is not None:
+        try:
+            index.save(output_path)
+        except OSError as e:
+            logger.warning(f"Could not write frame index for {output_path}: {e}")
+
+
+def compress_and_replace(file_path: str, algorithm: str = 'gzip', level: Optional[int] = None,
+                         dictionary: Optional[bytes] = None, dictionary_id: Optional[int] = None,
+                         chunk_size: int = DEFAULT_CHUNK_SIZE, frame_records: Optional[int] = None,
+                         lock_timeout: float = 1) -> Dict:
+    """
+    Compress a file atomically and remove the original (process pool worker)
+
+    The compressed output is written to a temp file, verified while it is
+    written, renamed into place and only then is the original deleted.
+    Failures are returned rather than raised so one bad file does not stop a batch.
+
+    Args:
+        file_path: File to compress (str so it pickles cheaply)
+        algorithm: 'gzip' or 'zstd'
+        level: Compression level
+        dictionary: Raw zstd dictionary bytes
+        dictionary_id: Id of that dictionary, reported back in the outcome
+        chunk_size: Read size
+        frame_records: Lines per seekable frame (None for a single frame)
+        lock_timeout: Seconds to wait for the file's lock before skipping it
+
+    Returns:
+        Outcome dict with 'status' of 'compressed', 'skipped' or 'failed'
+    """
+    path = Path(file_path)
+    output_path = compressed_path_for(path, algorithm)
+    temp_path = output_path.with_name(output_path.name + '.tmp')
+    outcome = {'path': str(path), 'output': str(output_path), 'algorithm': algorithm,
+               'dictionary_id': dictionary_id, 'status': 'failed', 'error': None}
+    start_time = time.time()
+
+    lock = filelock.FileLock(f"{path}.lock", timeout=lock_timeout) if HAS_FILELOCK else None
+    try:
+        if lock is not None:
+            lock.acquire()
+    except filelock.Timeout:
+        outcome.update(status='skipped', error='file locked')
+        return outcome
+
+    try:
+        if not path.exists():
+            raise CompressionEngineError(f"File not found: {path}")
+        result = compress_stream(path, temp_path, algorithm, level, dictionary,
+                                 chunk_size, frame_records)
+        index = result.pop('index')
+        outcome.update(result, frames=len(index.frames) if index else 1,
+                       record_count=index.total_lines if index else None)
+        install_output(temp_path, output_path, index)
+        path.unlink()
+        outcome['status'] = 'compressed'
+    except Exception as e:
+        temp_path.unlink(missing_ok=True)
+        outcome['error'] = str(e)
+    finally:
+        if lock is not None:
+            lock.release()
+
+    outcome['duration'] = time.time() - start_time
+    return outcome
+
+
+def train_dictionary(files: List[Path], dict_size: int = DICTIONARY_SIZE,
+                     sample_lines: int = DICTIONARY_SAMPLE_LINES,
+                     max_sample_bytes: int = DICTIONARY_SAMPLE_BYTES):
+    """
+    Train a zstd dictionary from JSONL lines sampled across files
+
+    Args:
+        files: Files from one source
+        dict_size: Target dictionary size in bytes
+        sample_lines: Lines sampled from the start of each file
+        max_sample_bytes: Stop sampling once this many bytes are collected
+
+    Returns:
+        zstandard.ZstdCompressionDict, or None if there is too little data to train on
+    """
+    if not HAS_ZSTD:
+        return None
+
+    samples = []
+    collected = 0
+    for file_path in files:
+        try:
+            with open(file_path, 'rb') as f:
+                for _ in range(sample_lines):
+                    line = f.readline()
+                    if not line:
+                        break
+                    samples.append(line)
+                    collected += len(line)
+        except OSError as e:
+            logger.warning(f"Could not sample {file_path} for dictionary training: {e}")
+        if collected >= max_sample_bytes:
+            break
+
+    try:
+        return zstd.train_dictionary(dict_size, samples)
+    except Exception as e:
+        # zstd refuses to train on too few or too uniform samples
+        logger.info(f"Dictionary training skipped ({len(samples)} samples): {e}")
+        return None
+
+
+def _dictionary_files(dictionary_dir: Path, pattern: str) -> List[Path]:
+    if not dictionary_dir.is_dir():
+        return []
+    return sorted(dictionary_dir.glob(pattern), key=lambda p: p.stat().st_mtime)
+
+
+def find_dictionary(file_path: Path, dict_id: int) -> Optional[bytes]:
+    """
+    Locate the dictionary a .zst file was written with
+
+    Looks in the .zstd_dicts directory of each ancestor of file_path.
+
+    Args:
+        file_path: Compressed file
+        dict_id: Dictionary id from the file's zstd frame header
+
+    Returns:
+        Raw dictionary bytes, or None if no matching dictionary exists
+    """
+    if dict_id in _dictionary_cache:
+        return _dictionary_cache[dict_id]
+
+    for parent in file_path.resolve().parents:
+        matches = _dictionary_files(parent / DICTIONARY_DIRNAME, f"*-{dict_id}{DICTIONARY_SUFFIX}")
+        if matches:
+            data = matches[-1].read_bytes()
+            _dictionary_cache[dict_id] = data
+            return data
+    return None
+
+
+def zstd_decompressor(file_path: Path, header: bytes):
+    """
+    Build a ZstdDecompressor for a .zst file, loading the dictionary its frame names
+
+    Args:
+        file_path: Compressed file (used to locate .zstd_dicts)
+        header: At least the first 18 bytes of a frame in that file
+
+    Returns:
+        zstandard.ZstdDecompressor
+    """
+    if not HAS_ZSTD:
+        raise CompressionEngineError(f"Cannot read {file_path}: zstandard is not installed")
+    dict_id = zstd.get_frame_parameters(header).dict_id
+    dict_data = None
+    if dict_id:
+        dictionary = find_dictionary(file_path, dict_id)
+        if dictionary is None:
+            raise CompressionEngineError(f"Dictionary {dict_id} for {file_path} not found")
+        dict_data = zstd.ZstdCompressionDict(dictionary)
+    return zstd.ZstdDecompressor(dict_data=dict_data)
+
+
+def open_compressed(file_path: Path, mode: str = 'rb', encoding: str = 'utf-8',
+                    offset: int = 0, fileobj: Optional[BinaryIO] = None, **kwargs):
+    """
+    Open a .gz, .zst or plain file for reading
+
+    .zst files written with a trained dictionary are decoded with it. Files
+    made of several independent frames (see seekable_archive) are read across
+    frames, and offset may point at any frame boundary to start reading there.
+
+    Args:
+        file_path: File to open
+        mode: 'rb' or 'rt' ('r' means 'rt')
+        encoding: Text encoding for text mode
+        offset: Byte offset of a frame boundary in the file to start from
+        fileobj: Already open binary stream of file_path to read instead of
+                 opening it (file_path still picks the codec and dictionary).
+                 Compressed readers leave it open; a plain text wrapper closes it
+
+    Returns:
+        File object; a context manager like open()
+    """
+    file_path = Path(file_path)
+    text = 'b' not in mode
+    if 'r' not in mode:
+        raise ValueError("open_compressed only supports read modes")
+
+    if file_path.suffix == '.gz' and not offset and fileobj is None:
+        return gzip.open(file_path, 'rt' if text else 'rb',
+                         encoding=encoding if text else None)
+
+    if file_path.suffix in COMPRESSED_SUFFIXES:
+        raw = open(file_path, 'rb') if fileobj is None else fileobj
+        try:
+            raw.seek(offset)
+            if file_path.suffix == '.gz':
+                binary = gzip.GzipFile(fileobj=raw, mode='rb')
+                if fileobj is None:
+                    binary.myfileobj = raw  # closed together with the GzipFile
+            else:
+                dctx = zstd_decompressor(file_path, raw.read(18))
+                raw.seek(offset)
+                binary = io.BufferedReader(
+                    dctx.stream_reader(raw, closefd=fileobj is None, read_across_frames=True))
+        except Exception:
+            if fileobj is None:
+                raw.close()
+            raise
+        return io.TextIOWrapper(binary, encoding=encoding) if text else binary
+
+    if fileobj is not None:
+        fileobj.seek(offset)
+        return io.TextIOWrapper(fileobj, encoding=encoding) if text else fileobj
+    return open(file_path, 'r' if text else 'rb', encoding=encoding if text else None)
+
+
+class CompressionEngine:
+    """
+    Compress batches of archive files in parallel
+
+    Features:
+    - Process pool with one file per worker (inline when max_workers is 1)
+    - Single-pass compression with streaming round-trip verification
+    - Per-source zstd dictionaries, trained once and reused
+    - Atomic temp file + rename; the original is removed only after success
+    - Seekable output: frames of frame_records lines plus a .idx sidecar
+    """
+
+    def __init__(self, algorithm: Optional[str] = None, level: Optional[int] = None,
+                 max_workers: Optional[int] = None, use_dictionaries: bool = True,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 frame_records: Optional[int] = DEFAULT_FRAME_RECORDS):
+        """
+        Initialize compression engine
+
+        Args:
+            algorithm: 'gzip' or 'zstd' (default: gzip)
+            level: Compression level (default per algorithm)
+            max_workers: Worker processes (default: CPU count)
+            use_dictionaries: Train/use per-source dictionaries for zstd
+            chunk_size: Read size per chunk
+            frame_records: Lines per seekable frame, indexed in a .idx sidecar;
+                           None writes one frame per file and no index
+        """
+        self.algorithm = algorithm or DEFAULT_ALGORITHM
+        if self.algorithm not in ALGORITHM_SUFFIXES:
+            raise CompressionEngineError(f"Unknown compression algorithm: {self.algorithm}")
+        if self.algorithm == 'zstd' and not HAS_ZSTD:
+            raise CompressionEngineError("zstd requested but zstandard is not installed")
+
+        self.level = DEFAULT_LEVELS[self.algorithm] if level is None else level
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.use_dictionaries = use_dictionaries and self.algorithm == 'zstd'
+        self.chunk_size = chunk_size
+        self.frame_records = frame_records
+
+    @property
+    def suffix(self) -> str:
+        """Suffix appended to compressed files"""
+        return ALGORITHM_SUFFIXES[self.algorithm]
+
+    def output_path(self, file_path: Path) -> Path:
+        """Compressed output path for file_path"""
+        return compressed_path_for(file_path, self.algorithm)
+
+    def load_or_train_dictionary(self, root: Path, source: str, files: List[Path]):
+        """
+        Return the newest stored dictionary for a source, training one if none exists
+
+        Args:
+            root: Archive root holding the .zstd_dicts directory
+            source: Source name
+            files: Files of that source to sample when training
+
+        Returns:
+            (dict_id, raw bytes), or (None, None) when no dictionary is available
+        """
+        dictionary_dir = root / DICTIONARY_DIRNAME
+        existing = _dictionary_files(dictionary_dir, f"{source}-*{DICTIONARY_SUFFIX}")
+        if existing:
+            data = existing[-1].read_bytes()
+            return zstd.ZstdCompressionDict(data).dict_id(), data
+
+        trained = train_dictionary(files)
+        if trained is None:
+            return None, None
+
+        dict_id = trained.dict_id()
+        data = trained.as_bytes()
+        dictionary_dir.mkdir(parents=True, exist_ok=True)
+        target = dictionary_dir / f"{source}-{dict_id}{DICTIONARY_SUFFIX}"
+        temp = target.with_name(target.name + '.tmp')
+        temp.write_bytes(data)
+        temp.replace(target)
+        logger.info(f"Trained {len(data):,} byte dictionary {dict_id} for source {source}")
+        return dict_id, data
+
+    def compress_files(self, files: List[Path], root: Optional[Path] = None,
+                       progress_callback: Optional[Callable[[Dict], None]] = None) -> List[Dict]:
+        """
+        Compress files in parallel, replacing each with its compressed output
+
+        Args:
+            files: Files to compress
+            root: Archive root; the first directory below it names the source
+                  used for dictionaries (required for dictionaries)
+            progress_callback: Called with each outcome as it completes
+
+        Returns:
+            Outcome dicts (see compress_and_replace) in completion order
+        """
+        files = [Path(f) for f in files]
+        if not files:
+            return []
+
+        dictionaries: Dict[str, tuple] = {}
+        if self.use_dictionaries and root is not None:
+            by_source: Dict[str, List[Path]] = {}
+            for file_path in files:
+                by_source.setdefault(source_for(file_path, root), []).append(file_path)
+            for source, source_files in by_source.items():
+                dictionaries[source] = self.load_or_train_dictionary(Path(root), source, source_files)
+
+        tasks = []
+        for file_path in files:
+            dict_id, dict_bytes = dictionaries.get(source_for(file_path, root), (None, None))
+            tasks.append((str(file_path), self.algorithm, self.level, dict_bytes, dict_id,
+                          self.chunk_size, self.frame_records))
+
+        outcomes = []
+        workers = min(self.max_workers, len(tasks))
+        if workers <= 1:
+            for task in tasks:
+                outcome = compress_and_replace(*task)
+                record_outcome(outcome)
+                outcomes.append(outcome)
+                if progress_callback:
+                    progress_callback(outcome)
+            return outcomes
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(compress_and_replace, *task): task[0] for task in tasks}
+            for future in as_completed(futures):
+                try:
+                    outcome = future.result()
+                except Exception as e:
+                    # Worker process died; the original file is untouched
+                    outcome = {'path': futures[future], 'status': 'failed', 'error': str(e)}
+                record_outcome(outcome)
+                outcomes.append(outcome)
+                if progress_callback:
+                    progress_callback(outcome)
+
+        return outcomes
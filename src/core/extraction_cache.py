@@ -0,0 +1,281 @@
+"""
+Per-file extraction cache and process-pool extraction fan-out
+
+Parsing DOCX meeting notes and .eml files is CPU-bound and was done one
+file at a time, on every run, for every file found. This module runs the
+extraction of many files on a process pool and keeps each file's result in
+a SQLite cache validated against (size, mtime) and the SHA-256 of the file
+contents:
+
+- size and mtime_ns unchanged: the record is reused without reading the file
+- size unchanged but mtime moved (copy, restore, touch): the file is hashed
+  and the record is reused if the contents still match
+- anything else: the file is extracted again
+
+Only files without a reusable record go to the pool, and only when there
+are at least MIN_FILES_PER_WORKER files per worker; smaller batches are
+extracted inline rather than paying the pool startup. Extraction functions
+must be module-level (picklable) callables taking a file path and
+returning a record or None; failures are reported per file and never
+cached, so they are retried next run.
+
+Records are stored as JSON, with datetimes and other values JSON cannot
+hold as strings. The cache returns the decoded JSON for new extractions
+too, so a record looks the same whether it was reused or not.
+
+Each call names the directory (scope) its files were found in. Stored
+results of that scope whose files are no longer listed are dropped, while
+results from other directories sharing the database are kept.
+
+References:
+- src/core/verification_cache.py - same cache checks for verification verdicts
+- src/orchestrators/pipeline_state.py - PipelineState extends the cache
+- src/collectors/drive_content.py - DriveContentExtractor.extract_drive_content
+
+Usage:
+    from src.core.extraction_cache import ExtractionCache
+    cache = ExtractionCache(data_dir / "extraction_cache.db")
+    extractions = cache.extract_files(docx_files, 'doc', extract_docx_record, scope=notes_dir)
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from itertools import repeat
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from . import json_codec
+from .verification_cache import file_checksum, file_signature
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cache table changes shape
+EXTRACTION_CACHE_VERSION = 3
+
+MIN_FILES_PER_WORKER = 25  # smaller batches are extracted inline
+
+Extract = Callable[[str], Optional[Dict[str, Any]]]
+
+
+@dataclass
+class FileExtraction:
+    """Extraction result of one input file"""
+    file_path: str
+    content_hash: Optional[str]
+    record: Optional[Dict[str, Any]]
+    cached: bool = False
+    error: Optional[str] = None
+
+    @property
+    def record_id(self) -> str:
+        """Stable id for the record: changes when the file path or contents change"""
+        key = f"{self.file_path}\0{self.content_hash}"
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()[:16]
+
+
+def extract_file(file_path: str, extract: Extract) -> FileExtraction:
+    """
+    Hash and extract one file
+
+    Args:
+        file_path: File to extract
+        extract: Extraction function returning a record or None
+
+    Returns:
+        FileExtraction, with the error message if hashing or extraction failed
+    """
+    try:
+        content_hash = file_checksum(Path(file_path))
+        return FileExtraction(file_path, content_hash, extract(file_path))
+    except Exception as e:
+        return FileExtraction(file_path, None, None, error=str(e))
+
+
+def extract_files_parallel(file_paths: List[str], extract: Extract,
+                           max_workers: Optional[int] = None) -> List[FileExtraction]:
+    """
+    Hash and extract files on a process pool
+
+    Args:
+        file_paths: Files to extract
+        extract: Module-level (picklable) extraction function
+        max_workers: Worker processes (defaults to the CPU count)
+
+    Returns:
+        One FileExtraction per file, in input order
+    """
+    workers = min(max_workers or os.cpu_count() or 1, len(file_paths) // MIN_FILES_PER_WORKER)
+    if workers > 1:
+        chunk_size = max(1, len(file_paths) // (workers * 4))
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(extract_file, file_paths, repeat(extract), chunksize=chunk_size))
+        except Exception as e:
+            # Unpicklable extraction function or dead worker
+            logger.warning(f"Parallel extraction failed, extracting inline: {e}")
+
+    return [extract_file(file_path, extract) for file_path in file_paths]
+
+
+class ExtractionCache:
+    """SQLite cache of per-file extraction results"""
+
+    # Tables dropped when the database was written by another version
+    tables = ('extraction_cache',)
+
+    def __init__(self, db_path: Path):
+        """
+        Open (or create) the extraction cache database
+
+        Args:
+            db_path: SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        self._init_database()
+
+    def _schema_version(self) -> int:
+        return EXTRACTION_CACHE_VERSION
+
+    def _init_database(self):
+        """Create tables, resetting state from another version"""
+        with sqlite3.connect(self.db_path) as conn:
+            version = self._schema_version()
+            if conn.execute("PRAGMA user_version").fetchone()[0] != version:
+                for table in self.tables:
+                    conn.execute(f"DROP TABLE IF EXISTS {table}")
+                conn.execute(f"PRAGMA user_version = {version}")
+
+            self._create_tables(conn)
+            conn.commit()
+
+    def _create_tables(self, conn: sqlite3.Connection):
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS extraction_cache (
+                file_path TEXT PRIMARY KEY,
+                file_kind TEXT,
+                scope TEXT,  -- directory the file was found in
+                file_size INTEGER,
+                mtime_ns INTEGER,
+                content_hash TEXT,
+                record TEXT,  -- JSON record, 'null' when the file holds no record
+                updated_at TEXT
+            )
+        """)
+
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_extraction_kind
+            ON extraction_cache(file_kind, scope)
+        """)
+
+    def extract_files(self, file_paths: List[str], file_kind: str, extract: Extract,
+                      max_workers: Optional[int] = None,
+                      scope: Optional[str] = None) -> List[FileExtraction]:
+        """
+        Extract files, reusing the stored results of unchanged files
+
+        Files without a stored result are extracted on a process pool.
+        Stored results of this kind and scope for files not in file_paths
+        are dropped. Failed extractions are not stored, so they are retried
+        next run.
+
+        Args:
+            file_paths: Files to extract
+            file_kind: Kind of file ('email', 'doc'), keeping kinds apart
+            extract: Module-level (picklable) extraction function returning
+                a record or None
+            max_workers: Worker processes (defaults to the CPU count)
+            scope: Directory the files were found in; runs over different
+                directories do not evict each other's results
+
+        Returns:
+            One FileExtraction per file, in input order
+        """
+        scope = os.path.realpath(scope) if scope else ''
+        with sqlite3.connect(self.db_path) as conn:
+            stored = {
+                row[0]: row[1:] for row in conn.execute("""
+                    SELECT file_path, file_size, mtime_ns, content_hash, record, scope
+                    FROM extraction_cache WHERE file_kind = ?
+                """, (file_kind,))
+            }
+
+        extractions: List[Optional[FileExtraction]] = []
+        signatures = {}
+        pending = []
+        updates = []
+        now = datetime.now(timezone.utc).isoformat()
+
+        for file_path in file_paths:
+            try:
+                size, mtime_ns = signatures[file_path] = file_signature(Path(file_path))
+            except OSError as e:
+                extractions.append(FileExtraction(file_path, None, None, error=str(e)))
+                continue
+
+            row = stored.get(file_path)
+            extraction = self._stored_extraction(file_path, row, size, mtime_ns)
+            if extraction and (row[1] != mtime_ns or row[4] != scope):
+                updates.append((file_path, file_kind, scope, size, mtime_ns, row[2], row[3], now))
+            elif not extraction:
+                pending.append((len(extractions), file_path))
+            extractions.append(extraction)
+
+        for (position, file_path), extraction in zip(
+                pending, extract_files_parallel([file_path for _, file_path in pending], extract, max_workers)):
+            extractions[position] = extraction
+            if not extraction.error:
+                size, mtime_ns = signatures[file_path]
+                record_json = json_codec.dumps(extraction.record, default=str)
+                extraction.record = json_codec.loads(record_json)
+                updates.append((file_path, file_kind, scope, size, mtime_ns, extraction.content_hash,
+                                record_json, now))
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany("""
+                INSERT OR REPLACE INTO extraction_cache
+                (file_path, file_kind, scope, file_size, mtime_ns, content_hash, record, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, updates)
+
+            gone = {file_path for file_path, row in stored.items() if row[4] == scope} - set(file_paths)
+            conn.executemany("DELETE FROM extraction_cache WHERE file_path = ?", [(p,) for p in gone])
+            conn.commit()
+
+        reused = sum(1 for extraction in extractions if extraction.cached)
+        logger.info(f"Extracted {len(pending)} {file_kind} files, reused {reused}")
+        return extractions
+
+    def forget(self, file_paths: List[str]):
+        """
+        Drop stored results, so the files are extracted again next run
+
+        Args:
+            file_paths: Files whose results should not be reused
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany("DELETE FROM extraction_cache WHERE file_path = ?", [(p,) for p in file_paths])
+            conn.commit()
+
+    @staticmethod
+    def _stored_extraction(file_path: str, row: Optional[Tuple], size: int,
+                           mtime_ns: int) -> Optional[FileExtraction]:
+        """Stored extraction of a file whose contents are unchanged"""
+        if row is None or row[0] != size:
+            return None
+
+        try:
+            # Touched, copied or restored file: reuse if the contents still match
+            if row[1] != mtime_ns and file_checksum(Path(file_path)) != row[2]:
+                return None
+            record = json_codec.loads(row[3])
+        except Exception as e:
+            logger.warning(f"Not reusing stored extraction of {file_path}: {e}")
+            return None
+
+        return FileExtraction(file_path, row[2], record, cached=True)
@@ -0,0 +1,246 @@
+"""
+Pluggable JSON codec for archive and index hot paths
+
+Per-record JSON encoding and decoding dominates archive writes, search
+indexing, search result decoding and state updates. This module puts one
+codec interface in front of them, backed by the fastest available
+implementation:
+
+- OrjsonCodec when orjson is installed
+- MsgspecCodec when msgspec is installed
+- JSONCodec, the standard library, otherwise
+
+Set AICOS_JSON_CODEC to json, orjson or msgspec to pin an implementation;
+an unavailable choice falls back to auto-selection with a warning.
+
+All codecs produce compact UTF-8 JSON (no spaces, non-ASCII unescaped).
+Anything an accelerator cannot encode or decode is retried with the
+standard library, so malformed input still raises json.JSONDecodeError and
+values orjson cannot encode (datetimes, big integers, non-string keys) get
+the usual TypeError or stdlib output. Known differences: accelerators
+encode NaN/Infinity as null where the standard library writes the
+non-standard NaN literal, and msgspec encodes datetimes and UUIDs natively.
+
+References:
+- src/core/archive_reader.py - decodes archive lines through the codec
+- src/core/archive_writer.py - encodes appended records
+- src/search/database.py - metadata blobs
+- src/core/state.py - state values
+- tests/performance/test_json_codec_benchmark.py - throughput comparison
+"""
+
+import json
+import logging
+import os
+from typing import Any, Callable, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Fast JSON implementations are optional
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import msgspec
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
+
+CODEC_ENV_VAR = 'AICOS_JSON_CODEC'
+BIG_INT = 2 ** 64
+
+Default = Optional[Callable[[Any], Any]]
+
+
+class JSONCodecError(Exception):
+    """Raised when an unknown or unavailable codec is requested"""
+    pass
+
+
+class JSONCodec:
+    """Standard library codec, and the interface every codec implements"""
+
+    name = 'json'
+
+    def dumps(self, obj: Any, default: Default = None) -> str:
+        """
+        Encode to compact JSON text
+
+        Args:
+            obj: Value to encode
+            default: Called for objects the codec cannot encode natively
+
+        Returns:
+            JSON string
+
+        Raises:
+            TypeError / ValueError: If the value is not serializable
+        """
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':'), default=default)
+
+    def dumps_bytes(self, obj: Any, default: Default = None) -> bytes:
+        """Encode to compact UTF-8 JSON bytes"""
+        return self.dumps(obj, default).encode('utf-8')
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Decode JSON text or UTF-8 bytes
+
+        Raises:
+            json.JSONDecodeError / UnicodeDecodeError: If the input is malformed
+        """
+        return json.loads(data)
+
+
+_stdlib = JSONCodec()
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    orjson-backed codec
+
+    orjson releases before 3.9 decode integers beyond 64 bits as floats
+    instead of rejecting them; with those, decoding stays on the standard
+    library and only encoding is accelerated.
+    """
+
+    name = 'orjson'
+
+    def __init__(self):
+        try:
+            value = orjson.loads(f'[{BIG_INT}]')[0]
+            self.exact_loads = type(value) is int
+        except orjson.JSONDecodeError:
+            self.exact_loads = True
+
+    def dumps_bytes(self, obj: Any, default: Default = None) -> bytes:
+        try:
+            # Datetimes and dataclasses go through default, as with the stdlib
+            return orjson.dumps(obj, default=default,
+                                option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS)
+        except orjson.JSONEncodeError:
+            return _stdlib.dumps_bytes(obj, default)
+
+    def dumps(self, obj: Any, default: Default = None) -> str:
+        return self.dumps_bytes(obj, default).decode('utf-8')
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        if not self.exact_loads:
+            return json.loads(data)
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Let the stdlib decide, so edge cases and error messages match
+            return json.loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """msgspec-backed codec"""
+
+    name = 'msgspec'
+
+    def __init__(self):
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps_bytes(self, obj: Any, default: Default = None) -> bytes:
+        if default is not None:
+            return msgspec.json.encode(obj, enc_hook=default)
+        try:
+            return self._encoder.encode(obj)
+        except (TypeError, msgspec.EncodeError):
+            return _stdlib.dumps_bytes(obj)
+
+    def dumps(self, obj: Any, default: Default = None) -> str:
+        return self.dumps_bytes(obj, default).decode('utf-8')
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except msgspec.DecodeError:
+            return json.loads(data)
+
+
+CODECS: Dict[str, Callable[[], JSONCodec]] = {'json': JSONCodec}
+if HAS_ORJSON:
+    CODECS['orjson'] = OrjsonCodec
+if HAS_MSGSPEC:
+    CODECS['msgspec'] = MsgspecCodec
+
+_codec: Optional[JSONCodec] = None
+
+
+def create_codec(name: str) -> JSONCodec:
+    """
+    Instantiate a codec by name
+
+    Args:
+        name: json, orjson or msgspec
+
+    Returns:
+        Codec instance
+
+    Raises:
+        JSONCodecError: If the codec is unknown or not installed
+    """
+    factory = CODECS.get(name)
+    if factory is None:
+        raise JSONCodecError(f"JSON codec '{name}' is not available")
+    return factory()
+
+
+def _select_codec() -> JSONCodec:
+    requested = os.getenv(CODEC_ENV_VAR, '').strip().lower()
+    if requested:
+        try:
+            return create_codec(requested)
+        except JSONCodecError as e:
+            logger.warning(f"{e}; selecting automatically")
+
+    for name in ('orjson', 'msgspec'):
+        if name in CODECS:
+            return create_codec(name)
+    return _stdlib
+
+
+def get_codec() -> JSONCodec:
+    """Process-wide codec, selected on first use"""
+    global _codec
+    if _codec is None:
+        _codec = _select_codec()
+        logger.debug(f"Using {_codec.name} JSON codec")
+    return _codec
+
+
+def set_codec(codec: Union[str, JSONCodec, None]) -> JSONCodec:
+    """
+    Replace the process-wide codec
+
+    Args:
+        codec: Codec instance, codec name, or None to re-run auto-selection
+
+    Returns:
+        The codec now in use
+    """
+    global _codec
+    if codec is None:
+        _codec = _select_codec()
+    elif isinstance(codec, str):
+        _codec = create_codec(codec)
+    else:
+        _codec = codec
+    return _codec
+
+
+def dumps(obj: Any, default: Default = None) -> str:
+    """Encode with the process-wide codec"""
+    return get_codec().dumps(obj, default)
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode with the process-wide codec"""
+    return get_codec().loads(data)
+
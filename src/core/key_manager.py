@@ -2,6 +2,13 @@
 """
 Encrypted Key Manager - AES-256 encrypted credential storage
 Replaces plaintext JSON files with secure encrypted storage
+
+Deriving a Fernet key runs PBKDF2-HMAC-SHA256 with 100,000 iterations
+(~100ms of CPU). Derived keys are kept in a small in-process cache keyed by
+the per-key salt, so only the first lookup of each credential pays for the
+derivation. Entries expire after DERIVED_KEY_TTL seconds. The cache is
+dropped whenever the master key file changes. clear_key_cache() overwrites
+the cached key bytes before releasing them.
 """
 
 import os
@@ -9,8 +16,11 @@ import json
 import sqlite3
 import getpass
 import hashlib
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any, Tuple
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
@@ -22,8 +32,72 @@ except ImportError:
     # Fallback if file_security not available
     file_security = None
 
+KDF_ITERATIONS = 100000
+DERIVED_KEY_CACHE_SIZE = 32
+DERIVED_KEY_TTL = 900  # seconds a derived key stays cached
+
+
+class DerivedKeyCache:
+    """
+    Bounded, expiring cache of derived Fernet keys keyed by salt
+    
+    Keys are held in bytearrays so they can be overwritten on eviction and
+    clear(). Fernet instances built from them keep their own immutable
+    copies, which Python cannot wipe, so this limits rather than eliminates
+    key material left in memory.
+    """
+    
+    def __init__(self, max_entries: int = DERIVED_KEY_CACHE_SIZE, ttl: float = DERIVED_KEY_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: 'OrderedDict[bytes, Tuple[bytearray, float]]' = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _zeroize(buffer: bytearray):
+        buffer[:] = bytes(len(buffer))
+    
+    def get(self, salt: bytes) -> Optional[bytes]:
+        """Cached key for a salt, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(salt)
+            if entry is None:
+                return None
+            key, expires_at = entry
+            if time.monotonic() >= expires_at:
+                self._zeroize(key)
+                del self._entries[salt]
+                return None
+            self._entries.move_to_end(salt)
+            return bytes(key)
+    
+    def put(self, salt: bytes, key: bytes):
+        """Cache a derived key, evicting the least recently used beyond max_entries"""
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            previous = self._entries.pop(salt, None)
+            if previous is not None:
+                self._zeroize(previous[0])
+            self._entries[salt] = (bytearray(key), time.monotonic() + self.ttl)
+            while len(self._entries) > self.max_entries:
+                _, (evicted, _) = self._entries.popitem(last=False)
+                self._zeroize(evicted)
+    
+    def clear(self):
+        """Overwrite and drop every cached key"""
+        with self._lock:
+            for key, _ in self._entries.values():
+                self._zeroize(key)
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class EncryptedKeyManager:
-    def __init__(self, storage_path: str = None):
+    def __init__(self, storage_path: str = None, key_cache_size: int = DERIVED_KEY_CACHE_SIZE,
+                 key_cache_ttl: float = DERIVED_KEY_TTL):
         self.storage_path = storage_path or os.path.join(
             os.path.dirname(__file__), 'encrypted_keys.db'
         )
@@ -31,6 +105,8 @@ class EncryptedKeyManager:
             os.path.dirname(__file__), '.master_key'
         )
         self._cipher_suite = None
+        self._key_cache = DerivedKeyCache(key_cache_size, key_cache_ttl)
+        self._master_key_signature = None
         
         # Validate or create secure file structure
         self._ensure_secure_setup()
@@ -163,6 +239,14 @@ class EncryptedKeyManager:
             print("💡 In production, this should be user-provided password")
             return password_hash
     
+    def _current_master_key_signature(self) -> Optional[Tuple[int, int, int]]:
+        """(inode, size, mtime_ns) of the master key file, or None if it is missing"""
+        try:
+            stat = os.stat(self.master_key_path)
+        except OSError:
+            return None
+        return stat.st_ino, stat.st_size, stat.st_mtime_ns
+    
     def _get_cipher_suite(self, salt: bytes = None) -> Fernet:
         """Get or create cipher suite for encryption/decryption with per-key salt"""
         # Always create new cipher suite with provided salt for per-key encryption
@@ -170,19 +254,35 @@ class EncryptedKeyManager:
             # Generate a new random salt for new keys
             salt = os.urandom(32)
         
-        master_password = self._get_master_password()
+        # Keys derived from a replaced master key must never be reused
+        signature = self._current_master_key_signature()
+        if signature != self._master_key_signature:
+            self._key_cache.clear()
+            self._master_key_signature = signature
         
-        # Derive key from master password using the provided salt
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=100000,
-        )
+        key = self._key_cache.get(salt)
+        if key is None:
+            master_password = self._get_master_password()
+            
+            # Derive key from master password using the provided salt
+            kdf = PBKDF2HMAC(
+                algorithm=hashes.SHA256(),
+                length=32,
+                salt=salt,
+                iterations=KDF_ITERATIONS,
+            )
+            
+            key = base64.urlsafe_b64encode(kdf.derive(master_password.encode()))
+            # The master key file may have just been created
+            self._master_key_signature = self._current_master_key_signature()
+            self._key_cache.put(salt, key)
         
-        key = base64.urlsafe_b64encode(kdf.derive(master_password.encode()))
         return Fernet(key), salt
     
+    def clear_key_cache(self):
+        """Zeroize and drop all cached derived keys"""
+        self._key_cache.clear()
+    
     def store_key(self, key_id: str, data: Dict[str, Any], key_type: str = "api_key", metadata: Optional[Dict] = None) -> bool:
         """Store encrypted credentials with per-key random salt"""
         try:
@@ -245,6 +345,22 @@ class EncryptedKeyManager:
             print(f"❌ Failed to store encrypted key {key_id}: {e}")
             return False
     
+    def _decrypt(self, key_id: str, encrypted_data: bytes, stored_salt: Optional[bytes]) -> Dict[str, Any]:
+        """Decrypt a stored credential with its salt"""
+        # Handle backward compatibility for keys without salt
+        if stored_salt is None:
+            print(f"⚠️ Key {key_id} uses legacy encryption (no salt) - consider re-storing for security")
+            # Use old hardcoded salt for backward compatibility
+            legacy_salt = b'ai_chief_of_staff_salt'
+            cipher_suite, _ = self._get_cipher_suite(legacy_salt)
+        else:
+            # Use stored salt
+            cipher_suite, _ = self._get_cipher_suite(stored_salt)
+        
+        # Decrypt the data
+        decrypted_data = cipher_suite.decrypt(encrypted_data)
+        return json.loads(decrypted_data.decode())
+    
     def retrieve_key(self, key_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve and decrypt credentials using stored salt"""
         try:
@@ -261,20 +377,7 @@ class EncryptedKeyManager:
                 return None
             
             encrypted_data, stored_salt = result
-            
-            # Handle backward compatibility for keys without salt
-            if stored_salt is None:
-                print(f"⚠️ Key {key_id} uses legacy encryption (no salt) - consider re-storing for security")
-                # Use old hardcoded salt for backward compatibility
-                legacy_salt = b'ai_chief_of_staff_salt'
-                cipher_suite, _ = self._get_cipher_suite(legacy_salt)
-            else:
-                # Use stored salt
-                cipher_suite, _ = self._get_cipher_suite(stored_salt)
-            
-            # Decrypt the data
-            decrypted_data = cipher_suite.decrypt(encrypted_data)
-            data = json.loads(decrypted_data.decode())
+            data = self._decrypt(key_id, encrypted_data, stored_salt)
             
             # Log the access
             timestamp = datetime.now().isoformat()
@@ -292,6 +395,58 @@ class EncryptedKeyManager:
             print(f"❌ Failed to retrieve key {key_id}: {e}")
             return None
     
+    def retrieve_keys(self, key_ids: Iterable[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Retrieve and decrypt several credentials with one database round trip
+        
+        Args:
+            key_ids: Key IDs to fetch
+            
+        Returns:
+            Dict of key_id to decrypted data, or None for keys that are
+            missing or fail to decrypt
+        """
+        key_ids = list(dict.fromkeys(key_ids))
+        results: Dict[str, Optional[Dict[str, Any]]] = {key_id: None for key_id in key_ids}
+        if not key_ids:
+            return results
+        
+        try:
+            conn = sqlite3.connect(self.storage_path)
+            try:
+                placeholders = ','.join('?' * len(key_ids))
+                rows = conn.execute(f'''
+                    SELECT key_id, encrypted_data, salt FROM encrypted_keys WHERE key_id IN ({placeholders})
+                ''', key_ids).fetchall()
+                
+                retrieved: List[str] = []
+                for key_id, encrypted_data, stored_salt in rows:
+                    try:
+                        results[key_id] = self._decrypt(key_id, encrypted_data, stored_salt)
+                        retrieved.append(key_id)
+                    except Exception as e:
+                        print(f"❌ Failed to retrieve key {key_id}: {e}")
+                
+                found = {row[0] for row in rows}
+                for key_id in key_ids:
+                    if key_id not in found:
+                        print(f"❌ Key not found: {key_id}")
+                
+                # Log the accesses
+                timestamp = datetime.now().isoformat()
+                user = getpass.getuser()
+                conn.executemany('''
+                    INSERT INTO access_log (key_id, action, timestamp, user)
+                    VALUES (?, ?, ?, ?)
+                ''', [(key_id, 'RETRIEVE', timestamp, user) for key_id in retrieved])
+                conn.commit()
+            finally:
+                conn.close()
+        except Exception as e:
+            print(f"❌ Failed to retrieve keys {', '.join(key_ids)}: {e}")
+        
+        return results
+    
     def list_keys(self) -> list:
         """List all stored key IDs with metadata"""
         try:
@@ -0,0 +1,91 @@
+"""
+Deferred module imports for CLI entry points and the Slack bot
+
+Every tool under tools/ used to import its whole dependency graph at the top
+of the file: pyarrow for columnar export, requests and googleapiclient via
+the collectors, cryptography via the auth manager. A `--help` or a single
+`search` paid for all of it, and so did every CLIWrapper subprocess.
+
+lazy_import() returns a module object that is only executed on first
+attribute access, so an entry point can keep its module-level names while a
+subcommand that never touches them never pays their import cost:
+
+    columnar_export = lazy_import('src.search.columnar_export')
+    ...
+    columnar_export.export_columnar(db, output_dir)   # imported here
+
+Parent packages are imported eagerly (importlib needs them to locate the
+module), so keep package __init__ files light. Names used in `except`
+clauses are resolved only when an exception actually reaches the clause.
+
+References:
+- tools/search_cli.py, tools/find_slots.py, tools/manage_archives.py
+- src/bot/slack_bot.py
+- tests/unit/test_import_time.py - per-command import-time budget
+"""
+
+import importlib
+import importlib.util
+import logging
+import sys
+from types import ModuleType
+
+logger = logging.getLogger(__name__)
+
+
+class LazyImportError(ImportError):
+    """Raised when a lazily imported module cannot be located"""
+    pass
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Import a module on first attribute access
+
+    Args:
+        name: Absolute dotted module name
+
+    Returns:
+        The module itself if already imported, otherwise a lazy module that
+        executes on first attribute access
+
+    Raises:
+        LazyImportError: If the module cannot be found. Errors raised while
+            executing the module surface on first attribute access.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise LazyImportError(f"No module named '{name}'")
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+
+    parent, _, child = name.rpartition('.')
+    if parent:
+        # Mirror a normal import so `import a.b` style access keeps working
+        setattr(sys.modules[parent], child, module)
+    return module
+
+
+def is_loaded(name: str) -> bool:
+    """
+    Check whether a module has actually been executed
+
+    Args:
+        name: Absolute dotted module name
+
+    Returns:
+        False if the module is absent or still a pending lazy module
+    """
+    module = sys.modules.get(name)
+    if module is None:
+        return False
+    # LazyLoader swaps the module class back to ModuleType once it executes
+    return not isinstance(module, importlib.util._LazyModule)
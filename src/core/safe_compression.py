@@ -20,11 +20,9 @@ Enhanced Features:
 References: CLAUDE.md commandments about production quality code
 """
 
-import gzip
 import shutil
 import tempfile
 import json
-import hashlib
 import time
 import threading
 from pathlib import Path
@@ -85,6 +83,12 @@ except ImportError:
     
     tqdm = MockTqdm
 
+from .compression_engine import (
+    CompressionEngine, compress_stream, compressed_files, compressed_path_for,
+    find_candidates, install_output, record_outcome
+)
+from .seekable_archive import open_at_line
+
 logger = logging.getLogger(__name__)
 
 
@@ -198,9 +202,20 @@ class SafeCompressor:
     2. Real backup cleanup implementation
     3. tqdm dependency handled with fallback
     4. Fixed atomic operation flaw with proper two-phase commit
+    
+    Batches (compress_old_files, compress_files) run on a process pool via
+    CompressionEngine, with gzip or zstd plus per-source dictionaries.
     """
     
-    def __init__(self, backup_days: int = 7, chunk_size: int = 1024*1024):
+    def __init__(self, backup_days: int = 7, chunk_size: int = 1024*1024,
+                 algorithm: str = 'gzip', max_workers: Optional[int] = None):
+        """
+        Args:
+            backup_days: Days to keep backups
+            chunk_size: Read size for streaming compression
+            algorithm: 'gzip' or 'zstd' (zstd requires zstandard)
+            max_workers: Worker processes for batch compression (default: CPU count)
+        """
         self.backup_days = backup_days
         self.chunk_size = chunk_size
         self.backup_manager = BackupManager(backup_days)
@@ -213,8 +228,10 @@ class SafeCompressor:
             'backups_created': 0
         }
         
-        self.extension = '.gz'
-        self.algorithm = 'gzip'
+        self.engine = CompressionEngine(algorithm, max_workers=max_workers,
+                                        chunk_size=chunk_size)
+        self.algorithm = self.engine.algorithm
+        self.extension = self.engine.suffix
     
     def compress_file_atomic(self, file_path: Path) -> bool:
         """
@@ -234,27 +251,20 @@ class SafeCompressor:
             logger.error(f"File not found: {file_path}")
             return False
             
-        temp_path = file_path.with_suffix('.tmp.gz')
-        gz_path = file_path.with_suffix('.jsonl.gz')
+        gz_path = compressed_path_for(file_path, self.algorithm)
+        temp_path = gz_path.with_name(gz_path.name + '.tmp')
         
         try:
-            # Phase 1: Compress to temporary file and verify
-            original_size = file_path.stat().st_size
-            original_checksum = self._calculate_checksum(file_path)
-            
-            with open(file_path, 'rb') as f_in:
-                with gzip.open(temp_path, 'wb', compresslevel=6) as f_out:
-                    shutil.copyfileobj(f_in, f_out, length=self.chunk_size)
-            
-            compressed_size = temp_path.stat().st_size
-            
-            # Verify compression integrity by decompressing and checking
-            if not self._verify_compressed_integrity(temp_path, original_checksum):
-                temp_path.unlink()
-                raise CompressionError("Compression integrity verification failed")
+            # Phase 1: Compress to temporary file; the input checksum and the
+            # decompressed round trip are compared in the same streaming pass
+            result = compress_stream(file_path, temp_path, self.algorithm,
+                                     self.engine.level, chunk_size=self.chunk_size,
+                                     frame_records=self.engine.frame_records)
+            original_size = result['original_size']
+            compressed_size = result['compressed_size']
             
             # Phase 2: Atomic rename and cleanup (only after successful verification)
-            temp_path.rename(gz_path)
+            install_output(temp_path, gz_path, result['index'])
             
             # Critical Fix 4: Only delete original AFTER successful rename and verification
             try:
@@ -266,6 +276,9 @@ class SafeCompressor:
             # Update stats
             self.stats['compressed'] += 1
             self.stats['bytes_saved'] += original_size - compressed_size
+            record_outcome({'status': 'compressed', 'path': str(file_path), 'output': str(gz_path),
+                            'original_size': original_size, 'checksum': result['checksum'],
+                            'record_count': result['index'].total_lines if result['index'] else None})
             
             logger.info(f"Compressed {file_path.name}: "
                        f"{original_size:,} → {compressed_size:,} bytes "
@@ -291,21 +304,9 @@ class SafeCompressor:
         Returns:
             True if compressed successfully
         """
-        # Create backup directory and file
-        backup_dir = file_path.parent / '.backup'
-        backup_dir.mkdir(exist_ok=True)
-        
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        backup_path = backup_dir / f"{file_path.name}.{timestamp}"
-        
+        backup_path = None
         try:
-            # Create backup
-            shutil.copy2(file_path, backup_path)
-            self.stats['backups_created'] += 1
-            logger.debug(f"Created backup: {backup_path}")
-            
-            # Critical Fix 2: Schedule real cleanup (not fake logging)
-            self.backup_manager.schedule_cleanup(backup_path)
+            backup_path = self._create_backup(file_path)
             
             # Perform atomic compression
             result = self.compress_file_atomic(file_path)
@@ -319,11 +320,26 @@ class SafeCompressor:
             
         except Exception as e:
             # Clean up backup if it was created
-            if backup_path.exists():
+            if backup_path and backup_path.exists():
                 backup_path.unlink()
                 self.stats['backups_created'] -= 1
             raise CompressionError(f"Backup and compression failed: {e}")
     
+    def _create_backup(self, file_path: Path) -> Path:
+        """Copy file into its directory's .backup folder and schedule its cleanup"""
+        backup_dir = file_path.parent / '.backup'
+        backup_dir.mkdir(exist_ok=True)
+        
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        backup_path = backup_dir / f"{file_path.name}.{timestamp}"
+        shutil.copy2(file_path, backup_path)
+        self.stats['backups_created'] += 1
+        logger.debug(f"Created backup: {backup_path}")
+        
+        # Critical Fix 2: Schedule real cleanup (not fake logging)
+        self.backup_manager.schedule_cleanup(backup_path)
+        return backup_path
+    
     def safe_compress(self, file_path: Path, idle_seconds: int = 60) -> bool:
         """
         Safely compress file with concurrency protection
@@ -371,38 +387,14 @@ class SafeCompressor:
             Statistics dictionary
         """
         cutoff_time = time.time() - (age_days * 86400)
-        candidates = []
-        
-        # Find compression candidates
-        for ext in extensions:
-            for file_path in directory.rglob(f"*{ext}"):
-                try:
-                    if file_path.stat().st_mtime < cutoff_time:
-                        # Skip already compressed files
-                        if not file_path.with_suffix(f"{ext}.gz").exists():
-                            candidates.append(file_path)
-                except OSError:
-                    continue
+        candidates = find_candidates(directory, cutoff_time, extensions)
         
         logger.info(f"Found {len(candidates)} files to compress")
         
         if not candidates:
             return self.stats
         
-        # Critical Fix 3: Use tqdm with fallback
-        progress_bar = tqdm(candidates, desc="Compressing files") if HAS_TQDM else candidates
-        
-        # Compress with progress indication
-        for file_path in progress_bar:
-            try:
-                # Use streaming for large files (>100MB)
-                if file_path.stat().st_size > 100_000_000:
-                    self._compress_streaming(file_path)
-                else:
-                    self.safe_compress(file_path)
-            except Exception as e:
-                logger.error(f"Failed to compress {file_path}: {e}")
-                continue
+        self.compress_files(candidates, root=directory)
         
         # Execute any pending backup cleanups
         cleaned = self.backup_manager.execute_pending_cleanups()
@@ -411,98 +403,67 @@ class SafeCompressor:
         
         return self.stats
     
-    def find_compression_candidates(self, directory: Path, age_days: int) -> List[Path]:
-        """Find files that would be compressed (for dry-run)"""
-        cutoff_time = time.time() - (age_days * 86400)
-        candidates = []
-        
-        for file_path in directory.rglob("*.jsonl"):
-            try:
-                if file_path.stat().st_mtime < cutoff_time:
-                    if not file_path.with_suffix('.jsonl.gz').exists():
-                        candidates.append(file_path)
-            except OSError:
-                continue
-        
-        return candidates
-    
-    def _compress_streaming(self, file_path: Path) -> bool:
-        """
-        Compress large file with streaming (memory-efficient)
-        Enhanced with proper progress indication
+    def compress_files(self, files: List[Path], root: Optional[Path] = None,
+                       idle_seconds: int = 60, backup: bool = True) -> List[Dict]:
         """
-        temp_path = file_path.with_suffix('.tmp.gz')
-        gz_path = file_path.with_suffix('.jsonl.gz')
-        
-        try:
-            file_size = file_path.stat().st_size
-            
-            with open(file_path, 'rb') as f_in:
-                with gzip.open(temp_path, 'wb', compresslevel=6) as f_out:
-                    # Enhanced progress indication
-                    if HAS_TQDM:
-                        with tqdm(total=file_size, unit='B', unit_scale=True,
-                                 desc=f"Compressing {file_path.name}") as pbar:
-                            while chunk := f_in.read(self.chunk_size):
-                                f_out.write(chunk)
-                                pbar.update(len(chunk))
-                    else:
-                        # Fallback: simple progress indication
-                        bytes_processed = 0
-                        while chunk := f_in.read(self.chunk_size):
-                            f_out.write(chunk)
-                            bytes_processed += len(chunk)
-                            if bytes_processed % (10 * 1024 * 1024) == 0:  # Every 10MB
-                                percent = (bytes_processed / file_size) * 100
-                                logger.info(f"Compressing {file_path.name}: {percent:.1f}% complete")
-            
-            # Atomic rename after success
-            temp_path.rename(gz_path)
-            file_path.unlink()
-            
-            self.stats['compressed'] += 1
-            return True
-            
-        except Exception as e:
-            if temp_path.exists():
-                temp_path.unlink()
-            raise CompressionError(f"Streaming compression failed: {e}")
-    
-    def _verify_compressed_integrity(self, compressed_path: Path, original_checksum: str) -> bool:
-        """
-        Verify compressed file integrity by decompressing and checking checksum
+        Compress a batch of files in parallel with backups and active-file protection
         
         Args:
-            compressed_path: Path to compressed file
-            original_checksum: Expected checksum of original content
+            files: Files to compress
+            root: Archive root; its first-level directories name zstd dictionary sources
+            idle_seconds: Skip files modified within this many seconds
+            backup: Create a backup of each file before compressing it
             
         Returns:
-            True if integrity check passes
+            Per-file outcome dicts from CompressionEngine.compress_files
         """
-        try:
-            # Decompress and calculate checksum
-            hasher = hashlib.sha256()
-            
-            with gzip.open(compressed_path, 'rb') as f:
-                while chunk := f.read(self.chunk_size):
-                    hasher.update(chunk)
-            
-            decompressed_checksum = hasher.hexdigest()
-            return decompressed_checksum == original_checksum
-            
-        except Exception as e:
-            logger.error(f"Integrity verification failed: {e}")
-            return False
-    
-    def _calculate_checksum(self, file_path: Path) -> str:
-        """Calculate SHA-256 checksum of file"""
-        hasher = hashlib.sha256()
+        ready = []
+        backups = {}
+        for file_path in files:
+            if self._is_file_active(file_path, idle_seconds):
+                logger.info(f"Skipping active file: {file_path}")
+                self.stats['skipped'] += 1
+                continue
+            if backup:
+                try:
+                    backups[str(file_path)] = self._create_backup(file_path)
+                except OSError as e:
+                    logger.error(f"Failed to back up {file_path}: {e}")
+                    self.stats['errors'] += 1
+                    continue
+            ready.append(file_path)
         
-        with open(file_path, 'rb') as f:
-            while chunk := f.read(self.chunk_size):
-                hasher.update(chunk)
+        if not ready:
+            return []
+        
+        # Critical Fix 3: Use tqdm with fallback
+        with tqdm(total=len(ready), desc="Compressing files") as progress:
+            outcomes = self.engine.compress_files(
+                ready, root=root, progress_callback=lambda outcome: progress.update(1))
+        
+        for outcome in outcomes:
+            backup_path = backups.get(outcome['path'])
+            if outcome['status'] == 'compressed':
+                self.stats['compressed'] += 1
+                self.stats['bytes_saved'] += outcome['original_size'] - outcome['compressed_size']
+                continue
+            
+            if outcome['status'] == 'skipped':
+                logger.info(f"File locked, skipping: {outcome['path']}")
+                self.stats['skipped'] += 1
+            else:
+                logger.error(f"Failed to compress {outcome['path']}: {outcome['error']}")
+                self.stats['errors'] += 1
+            if backup_path and backup_path.exists():
+                backup_path.unlink()
+                self.stats['backups_created'] -= 1
         
-        return hasher.hexdigest()
+        return outcomes
+    
+    def find_compression_candidates(self, directory: Path, age_days: int) -> List[Path]:
+        """Find files that would be compressed (for dry-run)"""
+        cutoff_time = time.time() - (age_days * 86400)
+        return find_candidates(directory, cutoff_time, ['.jsonl'])
     
     def _is_file_active(self, file_path: Path, idle_seconds: int) -> bool:
         """Check if file was recently modified"""
@@ -512,12 +473,13 @@ class SafeCompressor:
         except:
             return True  # Assume active if can't check
     
-    def read_compressed_jsonl(self, file_path: Path) -> Iterator[dict]:
+    def read_compressed_jsonl(self, file_path: Path, start_line: int = 0) -> Iterator[dict]:
         """
         Read compressed JSONL file line by line
         
         Args:
             file_path: Path to compressed JSONL file
+            start_line: 0-based line to start at; seeks via the .idx sidecar when present
             
         Yields:
             Parsed JSON objects from each line
@@ -526,8 +488,8 @@ class SafeCompressor:
             raise CompressionError(f"File not found: {file_path}")
         
         try:
-            with gzip.open(file_path, 'rt', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
+            with open_at_line(file_path, start_line) as f:
+                for line_num, line in enumerate(f, start_line + 1):
                     line = line.strip()
                     if not line:
                         continue
@@ -555,21 +517,26 @@ class SafeCompressor:
             'by_extension': {}
         }
         
-        # Count compressed files
-        compressed_files = list(directory.rglob("*.gz"))
+        # Compressed files (.gz and .zst) come from the archive catalog
+        entries = compressed_files(directory)
         
-        if compressed_files:
-            total_compressed_size = sum(f.stat().st_size for f in compressed_files)
-            # Estimate original size (4:1 ratio)
-            estimated_original_size = total_compressed_size * 4
+        if entries:
+            total_compressed_size = sum(entry['size'] for entry in entries)
+            # Original size is known for files compressed by the engine; else assume 4:1
+            original_size = sum(entry['original_size'] or entry['size'] * 4 for entry in entries)
             
             stats['total_compressed'] = total_compressed_size
-            stats['total_original'] = estimated_original_size
-            stats['file_count'] = len(compressed_files)
-            stats['space_saved'] = estimated_original_size - total_compressed_size
+            stats['total_original'] = original_size
+            stats['file_count'] = len(entries)
+            stats['space_saved'] = original_size - total_compressed_size
+            
+            if original_size > 0:
+                stats['compression_ratio'] = 1 - (total_compressed_size / original_size)
             
-            if estimated_original_size > 0:
-                stats['compression_ratio'] = 1 - (total_compressed_size / estimated_original_size)
+            for entry in entries:
+                ext_stats = stats['by_extension'].setdefault(entry['suffix'], {'count': 0, 'size': 0})
+                ext_stats['count'] += 1
+                ext_stats['size'] += entry['size']
         
         return stats
 
@@ -0,0 +1,430 @@
+"""
+Seekable block-compressed JSONL archives with a sidecar frame index
+
+A compressed daily archive used to be one gzip stream, so reaching record
+N meant decompressing every byte before it. CompressionEngine now writes
+archives as a sequence of independently compressed frames of
+frame_records lines each (BGZF-style gzip members, or zstd frames). Any
+gzip or zstd reader still sees one continuous file, so existing readers
+keep working unchanged.
+
+Next to each archive it writes a small JSON index, <archive>.idx, that
+maps line numbers and record timestamps to frame byte offsets:
+
+    {"version": 1, "algorithm": "gzip", "frame_records": 1000,
+     "compressed_size": 48213,
+     "frames": [[offset, length, first_line, line_count, min_ts, max_ts], ...]}
+
+Line numbers are 0-based and count every line, including blank ones, so they
+match the resume_from_line used by ArchiveVerifier. Timestamps are epoch
+seconds, or null for frames that have no parseable record timestamps.
+
+Readers call SeekableArchive or open_at_line. These seek to the frame
+holding a line or time range and decompress only from there. If the index
+is missing or stale (its compressed_size no longer matches the file), they
+fall back to a sequential read.
+
+References:
+- src/core/compression_engine.py - writes frames and the index in one pass
+- src/core/verification.py - verify_jsonl_file(resume_from_line=...) seeks
+- src/search/indexer.py - resumes partially indexed archives by line
+"""
+
+import bisect
+import io
+import json
+import logging
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+INDEX_SUFFIX = '.idx'
+INDEX_VERSION = 1
+DEFAULT_FRAME_RECORDS = 1000
+
+# Record fields checked, in order, for a record timestamp
+TIMESTAMP_FIELDS = ('timestamp', 'ts', 'created_at', 'date')
+
+
+class SeekableArchiveError(Exception):
+    """Raised when a seekable archive or its index cannot be read"""
+    pass
+
+
+def index_path_for(archive_path: Path) -> Path:
+    """Sidecar index path for an archive (data.jsonl.gz -> data.jsonl.gz.idx)"""
+    archive_path = Path(archive_path)
+    return archive_path.with_name(archive_path.name + INDEX_SUFFIX)
+
+
+def to_epoch(value: Any) -> Optional[float]:
+    """
+    Normalize a timestamp value to epoch seconds
+
+    Args:
+        value: Epoch number or numeric string (Slack ts), ISO 8601 string,
+               or datetime; naive values are taken as UTC
+
+    Returns:
+        Epoch seconds, or None if value is not a recognizable timestamp
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, datetime):
+        moment = value
+    elif isinstance(value, str):
+        text = value.strip()
+        if not text:
+            return None
+        try:
+            return float(text)
+        except ValueError:
+            pass
+        try:
+            moment = datetime.fromisoformat(text.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    else:
+        return None
+
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+def record_timestamp(line: Union[bytes, str]) -> Optional[float]:
+    """
+    Extract a record's timestamp from one JSONL line
+
+    Checks the top-level timestamp/ts/created_at/date fields, then a
+    calendar event's start.dateTime or start.date.
+
+    Args:
+        line: Raw JSONL line
+
+    Returns:
+        Epoch seconds, or None for blank/invalid lines or records without a timestamp
+    """
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(record, dict):
+        return None
+
+    for key in TIMESTAMP_FIELDS:
+        epoch = to_epoch(record.get(key))
+        if epoch is not None:
+            return epoch
+
+    start = record.get('start')
+    if isinstance(start, dict):
+        return to_epoch(start.get('dateTime') or start.get('date'))
+    return None
+
+
+@dataclass
+class Frame:
+    """One independently compressed block of lines"""
+    offset: int
+    length: int
+    first_line: int
+    line_count: int
+    min_ts: Optional[float] = None
+    max_ts: Optional[float] = None
+
+    def overlaps(self, start: Optional[float], end: Optional[float]) -> bool:
+        """True if this frame may hold records timestamped within [start, end]"""
+        if self.min_ts is None:
+            return False
+        if start is not None and self.max_ts < start:
+            return False
+        if end is not None and self.min_ts > end:
+            return False
+        return True
+
+
+@dataclass
+class FrameIndex:
+    """Sidecar index of frame offsets, line ranges and timestamp ranges"""
+    algorithm: str
+    frame_records: int
+    compressed_size: int = 0
+    frames: List[Frame] = field(default_factory=list)
+
+    @property
+    def total_lines(self) -> int:
+        """Number of lines in the archive"""
+        if not self.frames:
+            return 0
+        last = self.frames[-1]
+        return last.first_line + last.line_count
+
+    def add_frame(self, offset: int, length: int, lines: List[bytes]):
+        """
+        Append a frame covering the given lines
+
+        Args:
+            offset: Byte offset of the frame in the compressed file
+            length: Compressed length of the frame
+            lines: Raw lines stored in the frame (used for the timestamp range)
+        """
+        timestamps = [ts for ts in map(record_timestamp, lines) if ts is not None]
+        self.frames.append(Frame(
+            offset=offset,
+            length=length,
+            first_line=self.total_lines,
+            line_count=len(lines),
+            min_ts=min(timestamps) if timestamps else None,
+            max_ts=max(timestamps) if timestamps else None,
+        ))
+        self.compressed_size = offset + length
+
+    def frame_for_line(self, line_number: int) -> Optional[Frame]:
+        """Return the frame holding a 0-based line number, or None past the end"""
+        if line_number < 0 or line_number >= self.total_lines:
+            return None
+        starts = [frame.first_line for frame in self.frames]
+        return self.frames[bisect.bisect_right(starts, line_number) - 1]
+
+    def frames_for_time_range(self, start: Any = None, end: Any = None) -> List[Frame]:
+        """
+        Frames that may hold records timestamped within [start, end]
+
+        Args:
+            start: Range start (epoch, ISO string or datetime), None for open
+            end: Range end, None for open
+
+        Returns:
+            Matching frames in file order
+        """
+        start_epoch, end_epoch = to_epoch(start), to_epoch(end)
+        return [frame for frame in self.frames if frame.overlaps(start_epoch, end_epoch)]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'version': INDEX_VERSION,
+            'algorithm': self.algorithm,
+            'frame_records': self.frame_records,
+            'compressed_size': self.compressed_size,
+            'frames': [[f.offset, f.length, f.first_line, f.line_count, f.min_ts, f.max_ts]
+                       for f in self.frames],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'FrameIndex':
+        if data.get('version') != INDEX_VERSION:
+            raise SeekableArchiveError(f"Unsupported index version: {data.get('version')}")
+        return cls(
+            algorithm=data['algorithm'],
+            frame_records=data['frame_records'],
+            compressed_size=data['compressed_size'],
+            frames=[Frame(*entry) for entry in data['frames']],
+        )
+
+    def save(self, archive_path: Path):
+        """Write the index next to archive_path (atomic temp file + rename)"""
+        index_path = index_path_for(archive_path)
+        temp_path = index_path.with_name(index_path.name + '.tmp')
+        with open(temp_path, 'w') as f:
+            json.dump(self.to_dict(), f, separators=(',', ':'))
+        temp_path.replace(index_path)
+
+    @classmethod
+    def load(cls, archive_path: Path) -> Optional['FrameIndex']:
+        """
+        Load the index for an archive if it exists and still matches the file
+
+        Args:
+            archive_path: Compressed archive
+
+        Returns:
+            FrameIndex, or None when missing, unreadable or stale
+        """
+        index_path = index_path_for(archive_path)
+        try:
+            with open(index_path) as f:
+                index = cls.from_dict(json.load(f))
+            if index.compressed_size != Path(archive_path).stat().st_size:
+                logger.warning(f"Ignoring stale index {index_path}")
+                return None
+            return index
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError, SeekableArchiveError) as e:
+            logger.warning(f"Ignoring unreadable index {index_path}: {e}")
+            return None
+
+
+class SeekableArchive:
+    """
+    Random access to a frame-indexed .jsonl.gz / .jsonl.zst archive
+
+    Features:
+    - Point lookup of a line decompresses a single frame
+    - Scans from line N start at the frame holding N
+    - Time range scans skip frames outside the range
+    - Plain and unindexed files fall back to sequential reading
+    """
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: Archive path (.jsonl, .jsonl.gz or .jsonl.zst)
+        """
+        self.path = Path(path)
+        self._index: Optional[FrameIndex] = None
+        self._index_loaded = False
+
+    @property
+    def index(self) -> Optional[FrameIndex]:
+        """The archive's FrameIndex, or None if it has no usable index"""
+        if not self._index_loaded:
+            self._index = FrameIndex.load(self.path) if self.path.suffix in ('.gz', '.zst') else None
+            self._index_loaded = True
+        return self._index
+
+    def read_frame(self, frame: Frame) -> bytes:
+        """
+        Decompress a single frame
+
+        Args:
+            frame: Frame from this archive's index
+
+        Returns:
+            The frame's uncompressed bytes
+        """
+        with open(self.path, 'rb') as f:
+            f.seek(frame.offset)
+            data = f.read(frame.length)
+
+        if self.path.suffix == '.gz':
+            return zlib.decompress(data, 31)
+
+        from .compression_engine import zstd_decompressor
+        return zstd_decompressor(self.path, data[:18]).decompressobj().decompress(data)
+
+    def read_line(self, line_number: int) -> Optional[str]:
+        """
+        Return one line (without its newline) by 0-based line number
+
+        Args:
+            line_number: Line to read
+
+        Returns:
+            The line, or None if the archive is shorter
+        """
+        index = self.index
+        if index is None:
+            for number, line in self.iter_lines(line_number):
+                return line
+            return None
+
+        frame = index.frame_for_line(line_number)
+        if frame is None:
+            return None
+        lines = self.read_frame(frame).decode('utf-8').split('\n')
+        return lines[line_number - frame.first_line]
+
+    def iter_lines(self, start_line: int = 0) -> Iterator[Tuple[int, str]]:
+        """
+        Yield (line_number, line) from start_line to the end of the archive
+
+        Args:
+            start_line: First 0-based line to yield
+
+        Yields:
+            Tuples of line number and line text without the trailing newline
+        """
+        with open_at_line(self.path, start_line, index=self.index) as f:
+            for number, line in enumerate(f, start_line):
+                yield number, line.rstrip('\n')
+
+    def iter_lines_between(self, start: Any = None, end: Any = None) -> Iterator[Tuple[int, str]]:
+        """
+        Yield (line_number, line) for records timestamped within [start, end]
+
+        Frames whose timestamp range misses the window are never decompressed.
+        Without an index every line is read and filtered.
+
+        Args:
+            start: Range start (epoch, ISO string or datetime), None for open
+            end: Range end, None for open
+
+        Yields:
+            Tuples of line number and line text for matching records
+        """
+        start_epoch, end_epoch = to_epoch(start), to_epoch(end)
+
+        def in_range(line: str) -> bool:
+            ts = record_timestamp(line)
+            if ts is None:
+                return False
+            return ((start_epoch is None or ts >= start_epoch) and
+                    (end_epoch is None or ts <= end_epoch))
+
+        index = self.index
+        if index is None:
+            for number, line in self.iter_lines():
+                if in_range(line):
+                    yield number, line
+            return
+
+        for frame in index.frames_for_time_range(start_epoch, end_epoch):
+            lines = self.read_frame(frame).decode('utf-8').split('\n')
+            for offset, line in enumerate(lines[:frame.line_count]):
+                if in_range(line):
+                    yield frame.first_line + offset, line
+
+
+def open_at_line(path: Path, line_number: int = 0, encoding: str = 'utf-8',
+                 index: Optional[FrameIndex] = None):
+    """
+    Open an archive in text mode positioned at a 0-based line number
+
+    Compressed archives with an index start decompressing at the frame that
+    holds the line; everything else is read from the start and skipped.
+
+    Args:
+        path: Archive (.jsonl, .gz or .zst)
+        line_number: Line the returned file's next read starts at
+        encoding: Text encoding
+        index: Preloaded FrameIndex (loaded from the sidecar when None)
+
+    Returns:
+        Text file object; a context manager like open()
+    """
+    from .compression_engine import open_compressed
+
+    path = Path(path)
+    skip = max(0, line_number)
+    offset = 0
+
+    if skip and path.suffix in ('.gz', '.zst'):
+        index = index or FrameIndex.load(path)
+        if index is not None:
+            frame = index.frame_for_line(skip)
+            if frame is None:
+                # Past the end: position after the last frame
+                offset, skip = index.compressed_size, 0
+            else:
+                offset, skip = frame.offset, skip - frame.first_line
+
+    if offset and offset >= path.stat().st_size:
+        return io.StringIO('')
+
+    f = open_compressed(path, 'rt', encoding=encoding, offset=offset)
+    try:
+        for _ in range(skip):
+            if not f.readline():
+                break
+    except Exception:
+        f.close()
+        raise
+    return f
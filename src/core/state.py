@@ -2,17 +2,35 @@
 """
 SQLite-based state management for AI Chief of Staff
 Provides safe concurrent access with better performance and reliability than file-based state
+
+Write-behind mode (StateManager(write_behind=True)) is for hot writers such
+as collectors updating cursors once per page. set_state only updates an
+in-memory cache. Pending updates are coalesced per key and flushed in a
+single INSERT ... ON CONFLICT batch when flush_threshold keys are pending,
+every flush_interval seconds from a background thread shared by all
+write-behind managers, on close() and at interpreter exit. Reads of known
+keys are served from the cache; missing keys are looked up again on every
+read, so keys flushed by another instance become visible. Updates made after
+the last flush are lost if the process is killed, and history keeps one
+entry per key per flush rather than one per set_state call.
+
+history_limit caps the state_history rows kept per key in either mode.
 """
 
+import atexit
 import sqlite3
 import json
 import logging
 import threading
+import time
+import weakref
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from contextlib import contextmanager
 
+from . import json_codec
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,6 +39,80 @@ class StateError(Exception):
     pass
 
 
+DEFAULT_FLUSH_INTERVAL = 5.0  # seconds between background flushes
+DEFAULT_FLUSH_THRESHOLD = 100  # pending keys that trigger an immediate flush
+SQLITE_MAX_PARAMS = 500  # keys per IN (...) lookup
+
+_DELETED = object()  # pending-delete marker in the write-behind buffer
+
+
+class _Flusher:
+    """
+    Single daemon thread flushing every open write-behind StateManager
+    
+    Managers are held weakly, so one that is dropped without close() can
+    still be garbage collected. The thread exits once no managers remain and
+    is restarted by the next register().
+    """
+    
+    def __init__(self):
+        self._managers: 'weakref.WeakSet[StateManager]' = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def register(self, manager: 'StateManager') -> None:
+        with self._lock:
+            self._managers.add(manager)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="state-flusher", daemon=True)
+                self._thread.start()
+        self._wakeup.set()  # Re-plan in case this manager is due sooner
+    
+    def unregister(self, manager: 'StateManager') -> None:
+        with self._lock:
+            self._managers.discard(manager)
+        self._wakeup.set()
+    
+    def managers(self) -> List['StateManager']:
+        with self._lock:
+            return list(self._managers)
+    
+    def flush_all(self) -> None:
+        """Flush every registered manager (run at interpreter exit)"""
+        for manager in self.managers():
+            try:
+                manager.flush()
+            except StateError as e:
+                logger.error(f"Failed to flush state at exit: {e}")
+    
+    def _run(self):
+        while True:
+            self._wakeup.clear()
+            with self._lock:
+                if not self._managers:
+                    self._thread = None
+                    return
+                managers = list(self._managers)
+            
+            now = time.monotonic()
+            for manager in managers:
+                if manager._next_flush <= now:
+                    manager._next_flush = now + manager.flush_interval
+                    try:
+                        manager.flush()
+                    except StateError:
+                        pass  # Already logged; the batch is retried on the next tick
+            
+            timeout = min(manager._next_flush for manager in managers) - time.monotonic()
+            del managers, manager  # Don't keep dropped managers alive while waiting
+            self._wakeup.wait(max(timeout, 0.0))
+
+
+_flusher = _Flusher()
+atexit.register(_flusher.flush_all)
+
+
 class StateManager:
     """
     SQLite-based state manager with proper concurrency control
@@ -30,12 +122,25 @@ class StateManager:
     - Thread-safe operations
     - Atomic transactions
     - Automatic schema migration
-    - State history tracking
+    - State history tracking with optional per-key retention
+    - Optional write-behind batching with an in-memory read cache
     - Backup and recovery capabilities
     """
     
-    def __init__(self, db_path: Optional[Path] = None):
-        """Initialize StateManager with SQLite database"""
+    def __init__(self, db_path: Optional[Path] = None, write_behind: bool = False,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+                 flush_threshold: int = DEFAULT_FLUSH_THRESHOLD,
+                 history_limit: Optional[int] = None):
+        """
+        Initialize StateManager with SQLite database
+        
+        Args:
+            db_path: Database file (defaults to <state_dir>/state.db)
+            write_behind: Buffer writes in memory and flush them in batches
+            flush_interval: Seconds between background flushes (write-behind only)
+            flush_threshold: Pending keys that trigger an immediate flush (write-behind only)
+            history_limit: History rows kept per key (None keeps everything, 0 disables history)
+        """
         if db_path is None:
             try:
                 from src.core.config import get_config
@@ -50,9 +155,27 @@ class StateManager:
         
         self.db_path = db_path
         self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
         self._init_database()
         
-        logger.info(f"StateManager initialized with SQLite: {db_path}")
+        self.write_behind = write_behind
+        self.flush_interval = flush_interval
+        self.flush_threshold = max(1, flush_threshold)
+        self.history_limit = history_limit
+        
+        # Write-behind state: serialized values by key (_DELETED for deletes)
+        self._lock = threading.RLock()
+        self._flush_lock = threading.Lock()
+        self._cache: Dict[str, Any] = {}
+        self._pending: Dict[str, Any] = {}
+        self._next_flush = time.monotonic() + flush_interval
+        
+        if write_behind:
+            _flusher.register(self)
+        
+        logger.info(f"StateManager initialized with SQLite: {db_path}"
+                    f"{' (write-behind)' if write_behind else ''}")
     
     def _get_connection(self) -> sqlite3.Connection:
         """Get thread-local database connection"""
@@ -69,6 +192,8 @@ class StateManager:
             conn.execute("PRAGMA temp_store=MEMORY")
             
             self._local.connection = conn
+            with self._connections_lock:
+                self._connections.append(conn)
         
         return self._local.connection
     
@@ -116,6 +241,61 @@ class StateManager:
             logger.error(f"Transaction failed: {e}")
             raise StateError(f"Transaction failed: {e}")
     
+    @staticmethod
+    def _serialize(value: Any) -> str:
+        """Serialize a state value to JSON"""
+        if isinstance(value, (dict, list, bool, int, float, str, type(None))):
+            return json_codec.dumps(value, default=str)
+        return json_codec.dumps(str(value))
+    
+    @staticmethod
+    def _deserialize(key: str, json_value: str) -> Any:
+        """Parse a stored JSON value, returning the raw text if it is invalid"""
+        try:
+            return json_codec.loads(json_value)
+        except json.JSONDecodeError:
+            logger.warning(f"Invalid JSON in state key '{key}', returning raw value")
+            return json_value
+    
+    def _read_value(self, key: str) -> Optional[str]:
+        """Stored JSON for a key straight from the database"""
+        row = self._get_connection().execute(
+            "SELECT value FROM state WHERE key = ?",
+            (key,)
+        ).fetchone()
+        return None if row is None else row[0]
+    
+    def _cached_value(self, key: str) -> Any:
+        """
+        Cached JSON for a key, loading it on a miss (_DELETED when absent); call with _lock held
+        
+        Absent keys are not cached, so a later read picks up a value another
+        instance has flushed since.
+        """
+        json_value = self._cache.get(key)
+        if json_value is None:
+            stored = self._read_value(key)
+            if stored is None:
+                return _DELETED
+            self._cache[key] = json_value = stored
+        return json_value
+    
+    def _record_history(self, conn: sqlite3.Connection, entries: List[Tuple[str, str, str, str]]):
+        """Append (key, value, operation, timestamp) history rows and apply retention"""
+        if self.history_limit == 0 or not entries:
+            return
+        conn.executemany("""
+            INSERT INTO state_history (key, value, operation, timestamp)
+            VALUES (?, ?, ?, ?)
+        """, entries)
+        if self.history_limit is not None:
+            conn.executemany("""
+                DELETE FROM state_history
+                WHERE key = ? AND id NOT IN (
+                    SELECT id FROM state_history WHERE key = ? ORDER BY id DESC LIMIT ?
+                )
+            """, [(key, key, self.history_limit) for key in {entry[0] for entry in entries}])
+    
     def get_state(self, key: str, default: Any = None) -> Any:
         """
         Get state value for key
@@ -128,22 +308,18 @@ class StateManager:
             State value or default
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.execute(
-                "SELECT value FROM state WHERE key = ?",
-                (key,)
-            )
-            row = cursor.fetchone()
-            
-            if row is None:
-                return default
+            if self.write_behind:
+                with self._lock:
+                    json_value = self._cached_value(key)
+                if json_value is _DELETED:
+                    return default
+            else:
+                json_value = self._read_value(key)
+                if json_value is None:
+                    return default
             
             # Parse JSON value
-            try:
-                return json.loads(row[0])
-            except json.JSONDecodeError:
-                logger.warning(f"Invalid JSON in state key '{key}', returning raw value")
-                return row[0]
+            return self._deserialize(key, json_value)
                 
         except Exception as e:
             logger.error(f"Failed to get state '{key}': {e}")
@@ -153,16 +329,26 @@ class StateManager:
         """
         Set state value for key
         
+        In write-behind mode the value is visible to get_state immediately
+        and reaches the database on the next flush.
+        
         Args:
             key: State key
             value: Value to store (will be JSON serialized)
         """
         try:
             # Serialize value to JSON
-            if isinstance(value, (dict, list, bool, int, float, str, type(None))):
-                json_value = json.dumps(value, default=str)
-            else:
-                json_value = json.dumps(str(value))
+            json_value = self._serialize(value)
+            
+            if self.write_behind:
+                with self._lock:
+                    self._cache[key] = json_value
+                    self._pending[key] = json_value
+                    flush_now = len(self._pending) >= self.flush_threshold
+                if flush_now:
+                    self.flush()
+                logger.debug(f"State buffered: {key} = {value}")
+                return
             
             timestamp = datetime.now().isoformat()
             
@@ -188,10 +374,7 @@ class StateManager:
                     operation = "INSERT"
                 
                 # Record in history
-                conn.execute("""
-                    INSERT INTO state_history (key, value, operation, timestamp)
-                    VALUES (?, ?, ?, ?)
-                """, (key, json_value, operation, timestamp))
+                self._record_history(conn, [(key, json_value, operation, timestamp)])
             
             logger.debug(f"State updated: {key} = {value}")
             
@@ -210,6 +393,15 @@ class StateManager:
             True if key existed and was deleted
         """
         try:
+            if self.write_behind:
+                with self._lock:
+                    if self._cached_value(key) is _DELETED:
+                        return False
+                    self._cache[key] = _DELETED
+                    self._pending[key] = _DELETED
+                logger.debug(f"State delete buffered: {key}")
+                return True
+            
             timestamp = datetime.now().isoformat()
             
             with self.transaction() as conn:
@@ -224,10 +416,7 @@ class StateManager:
                 conn.execute("DELETE FROM state WHERE key = ?", (key,))
                 
                 # Record in history
-                conn.execute("""
-                    INSERT INTO state_history (key, value, operation, timestamp)
-                    VALUES (?, ?, ?, ?)
-                """, (key, row[0], "DELETE", timestamp))
+                self._record_history(conn, [(key, row[0], "DELETE", timestamp)])
             
             logger.debug(f"State deleted: {key}")
             return True
@@ -236,6 +425,75 @@ class StateManager:
             logger.error(f"Failed to delete state '{key}': {e}")
             raise StateError(f"Failed to delete state '{key}': {e}")
     
+    def flush(self) -> int:
+        """
+        Write buffered write-behind updates to the database in one transaction
+        
+        Returns:
+            Number of keys written
+            
+        Raises:
+            StateError: If the batch could not be written; it stays buffered
+        """
+        if not self.write_behind:
+            return 0
+        
+        # One flush at a time, so batches reach the database in order
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+            if not batch:
+                return 0
+            
+            try:
+                self._write_batch(batch)
+            except Exception as e:
+                with self._lock:
+                    # Keep anything newer that arrived while we were writing
+                    for key, json_value in batch.items():
+                        self._pending.setdefault(key, json_value)
+                logger.error(f"Failed to flush {len(batch)} state updates: {e}")
+                raise StateError(f"Failed to flush state: {e}")
+            
+            with self._lock:
+                # Flushed deletes are absent keys now; stop caching them
+                for key, json_value in batch.items():
+                    if json_value is _DELETED and key not in self._pending:
+                        self._cache.pop(key, None)
+            
+            logger.debug(f"Flushed {len(batch)} state updates")
+            return len(batch)
+    
+    def _write_batch(self, batch: Dict[str, Any]):
+        """Apply coalesced updates with one upsert batch plus history"""
+        timestamp = datetime.now().isoformat()
+        keys = list(batch)
+        
+        with self.transaction() as conn:
+            existing = {}
+            for start in range(0, len(keys), SQLITE_MAX_PARAMS):
+                chunk = keys[start:start + SQLITE_MAX_PARAMS]
+                placeholders = ','.join('?' * len(chunk))
+                existing.update(conn.execute(
+                    f"SELECT key, value FROM state WHERE key IN ({placeholders})", chunk).fetchall())
+            
+            upserts = [(key, json_value, timestamp, timestamp)
+                       for key, json_value in batch.items() if json_value is not _DELETED]
+            deletes = [key for key, json_value in batch.items()
+                       if json_value is _DELETED and key in existing]
+            
+            conn.executemany("""
+                INSERT INTO state (key, value, updated_at, created_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at
+            """, upserts)
+            conn.executemany("DELETE FROM state WHERE key = ?", [(key,) for key in deletes])
+            
+            history = [(key, json_value, "UPDATE" if key in existing else "INSERT", timestamp)
+                       for key, json_value, _, _ in upserts]
+            history.extend((key, existing[key], "DELETE", timestamp) for key in deletes)
+            self._record_history(conn, history)
+    
     def get_all_state(self) -> Dict[str, Any]:
         """
         Get all state as dictionary
@@ -244,13 +502,14 @@ class StateManager:
             Dictionary of all state key-value pairs
         """
         try:
+            self.flush()
             conn = self._get_connection()
             cursor = conn.execute("SELECT key, value FROM state")
             
             result = {}
             for key, value in cursor.fetchall():
                 try:
-                    result[key] = json.loads(value)
+                    result[key] = json_codec.loads(value)
                 except json.JSONDecodeError:
                     result[key] = value
             
@@ -263,20 +522,21 @@ class StateManager:
     def clear_all_state(self) -> None:
         """Clear all state (dangerous operation)"""
         try:
+            self.flush()
             timestamp = datetime.now().isoformat()
             
             with self.transaction() as conn:
                 # Record all deletes in history
                 cursor = conn.execute("SELECT key, value FROM state")
-                for key, value in cursor.fetchall():
-                    conn.execute("""
-                        INSERT INTO state_history (key, value, operation, timestamp)
-                        VALUES (?, ?, ?, ?)
-                    """, (key, value, "CLEAR", timestamp))
+                self._record_history(conn, [(key, value, "CLEAR", timestamp)
+                                            for key, value in cursor.fetchall()])
                 
                 # Clear all state
                 conn.execute("DELETE FROM state")
             
+            with self._lock:
+                self._cache.clear()
+            
             logger.warning("All state cleared")
             
         except Exception as e:
@@ -295,6 +555,7 @@ class StateManager:
             List of history entries (newest first)
         """
         try:
+            self.flush()
             conn = self._get_connection()
             cursor = conn.execute("""
                 SELECT value, operation, timestamp 
@@ -307,7 +568,7 @@ class StateManager:
             history = []
             for value, operation, timestamp in cursor.fetchall():
                 try:
-                    parsed_value = json.loads(value)
+                    parsed_value = json_codec.loads(value)
                 except json.JSONDecodeError:
                     parsed_value = value
                 
@@ -338,6 +599,8 @@ class StateManager:
             backup_path = self.db_path.parent / f"state_backup_{timestamp}.db"
         
         try:
+            self.flush()
+            
             # Use SQLite backup API
             source = self._get_connection()
             backup_conn = sqlite3.connect(str(backup_path))
@@ -372,7 +635,9 @@ class StateManager:
                 'state_count': state_count,
                 'history_count': history_count,
                 'db_size_mb': db_size / 1024**2,
-                'db_path': str(self.db_path)
+                'db_path': str(self.db_path),
+                'write_behind': self.write_behind,
+                'pending_writes': len(self._pending)
             }
             
         except Exception as e:
@@ -380,10 +645,17 @@ class StateManager:
             return {'error': str(e)}
     
     def close(self):
-        """Close database connections"""
-        if hasattr(self._local, 'connection'):
-            self._local.connection.close()
-            del self._local.connection
+        """Flush buffered writes, leave the background flusher and close all database connections"""
+        if self.write_behind:
+            _flusher.unregister(self)
+        self.flush()
+        
+        # Waits out a flush the background thread may still be running
+        with self._flush_lock, self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+            self._local = threading.local()
 
 
 # Global state manager instance
@@ -25,9 +25,13 @@ import os
 import time
 from datetime import datetime, date, timedelta
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple, Iterator
+from typing import BinaryIO, Dict, List, Any, Optional, Tuple, Iterator
 from dataclasses import dataclass, asdict
 
+from .archive_catalog import catalog_for
+from .seekable_archive import open_at_line
+from .verification_cache import CACHE_FILENAME, VerificationCache, verify_files_parallel
+
 # Critical fix #3: Proper tqdm import with fallback
 try:
     from tqdm import tqdm
@@ -415,13 +419,17 @@ class ArchiveVerifier:
             compression_detected=compression_detected
         )
     
-    def verify_jsonl_file(self, file_path: Path, resume_from_line: int = 0) -> Dict:
+    def verify_jsonl_file(self, file_path: Path, resume_from_line: int = 0,
+                          fileobj: Optional[BinaryIO] = None) -> Dict:
         """
         Verify JSONL file with progress tracking and schema validation
         
         Args:
             file_path: Path to JSONL file (compressed or uncompressed)
             resume_from_line: Line number to resume from (for checkpoint recovery)
+            fileobj: Open binary stream of file_path to read instead of opening
+                     the path; the file is then read exactly once (no line
+                     count pre-pass for the progress bar)
             
         Returns:
             Dict with verification results and statistics
@@ -437,15 +445,19 @@ class ArchiveVerifier:
             # Handle both compressed and uncompressed files
             opener = self._get_file_opener(file_path)
             
-            with opener(file_path, 'rt', encoding='utf-8') as f:
-                # Skip lines if resuming
-                if resume_from_line > 0:
-                    for _ in range(resume_from_line):
-                        next(f, None)
-                    line_count = resume_from_line
-                
+            if fileobj is not None:
+                from .compression_engine import open_compressed
+                stream = open_compressed(file_path, 'rt', fileobj=fileobj)
+            elif resume_from_line > 0:
+                # Seek to the frame holding the line when the archive has a .idx sidecar
+                stream = open_at_line(file_path, resume_from_line)
+                line_count = resume_from_line
+            else:
+                stream = opener(file_path, 'rt', encoding='utf-8')
+            
+            with stream as f:
                 # Get total lines for progress (expensive but informative)
-                if HAS_TQDM and resume_from_line == 0:
+                if HAS_TQDM and resume_from_line == 0 and fileobj is None:
                     total_lines = sum(1 for _ in opener(file_path, 'rt', encoding='utf-8'))
                     progress_bar = tqdm(total=total_lines, desc=f"Verifying {file_path.name}")
                 else:
@@ -506,13 +518,28 @@ class ArchiveVerifier:
             'compression_detected': file_path.suffix in ['.gz', '.zst']
         }
     
-    def verify_directory(self, directory: Path, resume: bool = True) -> Dict:
+    def verify_directory(self, directory: Path, resume: bool = True,
+                         max_workers: Optional[int] = None, use_cache: bool = True,
+                         report_path: Optional[Path] = None) -> Dict:
         """
         Verify all archive files in directory with resume capability
         
+        Files are verified on a process pool. Verdicts are cached in
+        <directory>/.verification_cache.json keyed by (path, size, mtime,
+        checksum), so unchanged historical files are not read again.
+        
+        Pool workers do not write line-level checkpoints. An interrupted run
+        resumes per file through the verdict cache; a line-level checkpoint
+        (written by in-process verify_jsonl_file calls) is still honoured for
+        the file it names.
+        
         Args:
             directory: Directory containing archive files
-            resume: Whether to resume from checkpoint
+            resume: Whether to resume from a line-level checkpoint
+            max_workers: Worker processes (defaults to the CPU count)
+            use_cache: Reuse verdicts for files unchanged since the last run
+            report_path: Optional JSONL file that receives each error as soon
+                         as its file finishes verifying
             
         Returns:
             Dict with comprehensive verification statistics
@@ -529,11 +556,15 @@ class ArchiveVerifier:
             start_from_line = checkpoint.get('line_number', 0)
             logger.info(f"Resuming verification from {start_from_file}:{start_from_line}")
         
-        # Find all archive files (both compressed and uncompressed)
-        patterns = ['*.jsonl', '*.jsonl.gz', '*.jsonl.zst']
-        files = []
-        for pattern in patterns:
-            files.extend(directory.rglob(pattern))
+        # Find all archive files (both compressed and uncompressed) in the catalog
+        catalog = catalog_for(directory)
+        if catalog is not None:
+            files = [Path(entry['path']) for entry in catalog.files(kind='data')]
+        else:
+            patterns = ['*.jsonl', '*.jsonl.gz', '*.jsonl.zst']
+            files = []
+            for pattern in patterns:
+                files.extend(directory.rglob(pattern))
         
         # Sort for consistent ordering
         files.sort()
@@ -550,38 +581,56 @@ class ArchiveVerifier:
                 logger.info(f"Found checkpoint file at index {start_idx}")
             except StopIteration:
                 logger.warning(f"Checkpoint file {start_from_file} not found, starting from beginning")
-                start_from_line = 0
-        
-        # Verify each file with progress tracking
-        total_files = len(files)
-        
-        for i, file_path in enumerate(files, 1):
-            resume_line = start_from_line if i == 1 and start_from_file else 0
+                start_from_file = None
+        
+        cache = VerificationCache(directory / CACHE_FILENAME) if use_cache else None
+        self.stats['files_cached'] = 0
+        report = open(report_path, 'w', encoding='utf-8') if report_path else None
+        
+        def _record(file_path: Path, result: Dict, cached: bool, in_process: bool = False):
+            self.stats['files_checked'] += 1
+            if not in_process:
+                # Worker and cached results never touched self.stats
+                self.stats['records_verified'] += result.get('lines_processed', 0)
+            if cached:
+                self.stats['files_cached'] += 1
             
-            logger.info(f"Verifying file {i}/{total_files}: {file_path.name}")
-            
-            try:
-                result = self.verify_jsonl_file(file_path, resume_from_line=resume_line)
-                
-                self.stats['files_checked'] += 1
-                
-                if result['errors']:
-                    self.stats['errors'].extend(result['errors'])
-                    logger.warning(f"Found {len(result['errors'])} errors in {file_path}")
-                else:
-                    logger.info(f"✓ File verified successfully: {result['valid_records']} valid records")
-                
-            except Exception as e:
-                error_info = {
-                    'file': str(file_path),
-                    'error': f"Verification failed: {str(e)}",
-                    'source_type': 'unknown'
-                }
-                self.stats['errors'].append(error_info)
-                logger.error(f"Failed to verify {file_path}: {e}")
+            errors = result.get('errors', [])
+            if errors:
+                errors = [e if isinstance(e, dict) else {'file': str(file_path), 'error': e,
+                                                         'source_type': 'unknown'}
+                          for e in errors]
+                self.stats['errors'].extend(errors)
+                logger.warning(f"Found {len(errors)} errors in {file_path}")
+                if report:
+                    for error in errors:
+                        report.write(json.dumps({'file': str(file_path), **error}) + '\n')
+                    report.flush()
+            else:
+                logger.info(f"✓ File verified successfully: {result.get('valid_records', 0)} valid records")
+        
+        try:
+            # A partially verified checkpoint file finishes in-process and is not cached
+            if start_from_file and start_from_line > 0:
+                file_path = files.pop(0)
+                logger.info(f"Verifying file {file_path.name} from line {start_from_line}")
+                try:
+                    result = self.verify_jsonl_file(file_path, resume_from_line=start_from_line)
+                except Exception as e:
+                    result = {'errors': [f"Verification failed: {e}"]}
+                _record(file_path, result, False, in_process=True)
             
-            # Reset line counter after first file
-            start_from_line = 0
+            with tqdm(total=len(files), desc="Verifying archives") as progress_bar:
+                for file_path, result, cached in verify_files_parallel(
+                        files, _verify_file_task, cache=cache, max_workers=max_workers):
+                    _record(file_path, result, cached)
+                    progress_bar.update(1)
+        finally:
+            if report:
+                report.close()
+        
+        if cache is not None:
+            logger.info(f"Reused cached verdicts for {self.stats['files_cached']} unchanged files")
         
         # Calculate final statistics
         elapsed_time = time.time() - start_time
@@ -628,23 +677,12 @@ class ArchiveVerifier:
         if file_path.suffix == '.gz':
             return gzip.open
         elif file_path.suffix == '.zst':
-            try:
-                import zstandard as zstd
-                # Create a wrapper that matches gzip.open interface
-                class ZstdOpen:
-                    def __init__(self):
-                        self.dctx = zstd.ZstdDecompressor()
-                    
-                    def __call__(self, file_path, mode='rb', **kwargs):
-                        if 'r' in mode:
-                            return self.dctx.stream_reader(open(file_path, 'rb'))
-                        else:
-                            raise ValueError("Only read mode supported for zstd")
-                
-                return ZstdOpen()
-            except ImportError:
+            from .compression_engine import HAS_ZSTD, open_compressed
+            if not HAS_ZSTD:
                 logger.warning("zstandard library not available, cannot read .zst files")
                 raise VerificationError("Cannot read .zst files: zstandard library not installed")
+            # Resolves the per-source dictionary named in the frame header
+            return open_compressed
         else:
             return open
     
@@ -795,6 +833,9 @@ class ArchiveVerifier:
             file_path: Current file being verified
             line_num: Current line number
         """
+        if self.checkpoint_file is None:
+            return
+        
         checkpoint = {
             'last_file': str(file_path),
             'line_number': line_num,
@@ -1000,4 +1041,16 @@ class ArchiveVerifier:
         if not recommendations:
             recommendations.append("All archives verified successfully. No issues detected.")
         
-        return recommendations
\ No newline at end of file
+        return recommendations
+
+
+def _verify_file_task(file_path: Path, fileobj: BinaryIO) -> Dict:
+    """
+    Process-pool entry point: verify one archive file read from fileobj
+
+    Workers do not write checkpoints; the parent's verdict cache records
+    progress per file instead.
+    """
+    verifier = ArchiveVerifier()
+    verifier.checkpoint_file = None
+    return verifier.verify_jsonl_file(Path(file_path), fileobj=fileobj)
@@ -0,0 +1,351 @@
+"""
+Per-file verification verdict cache and process-pool verification fan-out
+
+Full archive verification used to re-read and re-validate every historical
+file on every run, one file at a time. Archive files are immutable once
+their day is over, so a verdict only needs recomputing when the file
+changes. This module keeps verdicts in a JSON cache keyed by path and
+validated against (size, mtime, checksum):
+
+- size and mtime_ns unchanged: the verdict is reused without reading the file
+- size unchanged but mtime moved (copy, restore, touch): the raw-byte
+  SHA-256 is recomputed and the verdict is reused if it still matches
+- anything else: the file is verified again
+
+verify_files_parallel() verifies the remaining files on a process pool and
+yields each verdict as it completes, so callers can stream errors into a
+report instead of collecting them at the end. Tasks read the file through a
+HashingReader, so the checksum is taken in the same pass as verification.
+The cache is saved periodically, so an interrupted run keeps the verdicts it
+already has.
+
+References:
+- src/core/verification.py - ArchiveVerifier.verify_directory
+- tools/verify_archive.py - ArchiveVerifier.verify_files_batch
+- src/core/compression_engine.py - same process-pool pattern for compression
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILENAME = '.verification_cache.json'
+CACHE_VERSION = 1
+CHECKSUM_CHUNK_SIZE = 1024 * 1024
+MAX_CACHED_ERRORS = 100
+SAVE_INTERVAL = 50  # verdicts between cache saves
+
+
+class VerificationCacheError(Exception):
+    """Raised when the verification cache cannot be written"""
+    pass
+
+
+def file_signature(file_path: Path) -> Tuple[int, int]:
+    """
+    Return the (size, mtime_ns) pair used as the cheap cache check
+
+    Args:
+        file_path: File to stat
+
+    Returns:
+        Tuple of size in bytes and modification time in nanoseconds
+    """
+    stat = os.stat(file_path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def file_checksum(file_path: Path) -> str:
+    """
+    SHA-256 of the raw (still compressed) file bytes
+
+    Args:
+        file_path: File to hash
+
+    Returns:
+        Hex digest
+    """
+    hasher = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        while chunk := f.read(CHECKSUM_CHUNK_SIZE):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+class HashingReader(io.RawIOBase):
+    """
+    Raw reader that SHA-256 hashes a file's bytes as they are consumed
+
+    Bytes are hashed once, in file order, however the consumer reads or
+    seeks (a decoder peeking at a header and rewinding is fine). Whatever the
+    consumer left unread is hashed on hexdigest() or close().
+    """
+
+    def __init__(self, raw: BinaryIO):
+        self._raw = raw
+        self._hasher = hashlib.sha256()
+        self._hashed = 0  # bytes [0, _hashed) are in the digest
+        self._digest: Optional[str] = None
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return self._raw.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._raw.tell()
+
+    def readinto(self, buffer) -> int:
+        position = self._raw.tell()
+        if position > self._hashed:
+            # Skipped ahead: hash the gap first so the digest stays in order
+            self._raw.seek(self._hashed)
+            self._hash_until(position)
+        count = self._raw.readinto(buffer)
+        if count and position + count > self._hashed:
+            self._hasher.update(memoryview(buffer)[self._hashed - position:count])
+            self._hashed = position + count
+        return count
+
+    def _hash_until(self, end: Optional[int] = None):
+        while end is None or self._hashed < end:
+            size = CHECKSUM_CHUNK_SIZE if end is None else min(CHECKSUM_CHUNK_SIZE, end - self._hashed)
+            chunk = self._raw.read(size)
+            if not chunk:
+                break
+            self._hasher.update(chunk)
+            self._hashed += len(chunk)
+
+    def hexdigest(self) -> str:
+        """SHA-256 of the whole file, reading whatever was not consumed yet"""
+        if self._digest is None:
+            self._raw.seek(self._hashed)
+            self._hash_until()
+            self._digest = self._hasher.hexdigest()
+        return self._digest
+
+    def close(self):
+        if not self.closed:
+            self.hexdigest()
+            self._raw.close()
+        super().close()
+
+
+class VerificationCache:
+    """
+    JSON-backed map of file path to its last verification verdict
+
+    Entries store size, mtime_ns, checksum and the verdict dict. Verdict
+    error lists are truncated to MAX_CACHED_ERRORS so a badly corrupted
+    file cannot bloat the cache.
+    """
+
+    def __init__(self, cache_path: Path):
+        """
+        Initialize cache, loading existing entries if present
+
+        Args:
+            cache_path: JSON file holding the cache
+        """
+        self.cache_path = Path(cache_path)
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        if not self.cache_path.exists():
+            return
+        try:
+            with open(self.cache_path, 'r') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable verification cache {self.cache_path}: {e}")
+            return
+        if data.get('version') != CACHE_VERSION:
+            logger.info(f"Discarding verification cache with version {data.get('version')}")
+            return
+        self.entries = data.get('entries', {})
+
+    @staticmethod
+    def _key(file_path: Path) -> str:
+        return str(Path(file_path).resolve())
+
+    def lookup(self, file_path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached verdict if the file is unchanged
+
+        Args:
+            file_path: File to look up
+
+        Returns:
+            Cached verdict dict, or None if missing or the file changed
+        """
+        entry = self.entries.get(self._key(file_path))
+        if entry is None:
+            return None
+
+        try:
+            size, mtime_ns = file_signature(file_path)
+        except OSError:
+            return None
+        if size != entry['size']:
+            return None
+        if mtime_ns != entry['mtime_ns']:
+            # Same size, new mtime: trust the content hash, not the timestamp
+            try:
+                if file_checksum(file_path) != entry['checksum']:
+                    return None
+            except OSError:
+                return None
+            entry['mtime_ns'] = mtime_ns
+            self._dirty = True
+        return entry['verdict']
+
+    def store(self, file_path: Path, verdict: Dict[str, Any], size: int, mtime_ns: int,
+              checksum: str):
+        """
+        Record a verdict for the file contents described by size/mtime/checksum
+
+        Args:
+            file_path: Verified file
+            verdict: Verification result dict (must be JSON serializable)
+            size: File size when verification started
+            mtime_ns: File mtime when verification started
+            checksum: Raw-byte SHA-256 when verification started
+        """
+        verdict = dict(verdict)
+        if isinstance(verdict.get('errors'), list) and len(verdict['errors']) > MAX_CACHED_ERRORS:
+            verdict['errors'] = verdict['errors'][:MAX_CACHED_ERRORS]
+        self.entries[self._key(file_path)] = {
+            'size': size,
+            'mtime_ns': mtime_ns,
+            'checksum': checksum,
+            'verdict': verdict
+        }
+        self._dirty = True
+
+    def save(self):
+        """Atomically write the cache if anything changed"""
+        if not self._dirty:
+            return
+        temp_path = self.cache_path.with_suffix('.tmp')
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, 'w') as f:
+                json.dump({'version': CACHE_VERSION, 'entries': self.entries}, f)
+            temp_path.replace(self.cache_path)
+            self._dirty = False
+        except (OSError, TypeError) as e:
+            temp_path.unlink(missing_ok=True)
+            raise VerificationCacheError(f"Failed to save verification cache: {e}")
+
+
+def run_verification_task(task: Callable[[Path, BinaryIO], Dict],
+                          file_path: str) -> Tuple[Dict, int, int, str]:
+    """
+    Verify one file and capture the signature the verdict belongs to
+
+    The task reads the file from the stream it is given, which hashes the
+    raw bytes on the way, so each file is read once. The signature is taken
+    before the task starts, so a file modified during verification never
+    matches its cache entry.
+
+    Args:
+        task: Module-level callable taking (path, binary stream positioned at
+              the start of the file) and returning a verdict dict
+        file_path: File to verify
+
+    Returns:
+        Tuple of (verdict, size, mtime_ns, checksum)
+    """
+    path = Path(file_path)
+    size, mtime_ns = file_signature(path)
+    reader = HashingReader(open(path, 'rb'))
+    with io.BufferedReader(reader, CHECKSUM_CHUNK_SIZE) as source:
+        verdict = task(path, source)
+    return verdict, size, mtime_ns, reader.hexdigest()
+
+
+def verify_files_parallel(files: Iterable[Path], task: Callable[[Path], Dict],
+                          cache: Optional[VerificationCache] = None,
+                          max_workers: Optional[int] = None) -> Iterator[Tuple[Path, Dict, bool]]:
+    """
+    Verify files on a process pool, reusing cached verdicts for unchanged files
+
+    Args:
+        files: Files to verify
+        task: Module-level (picklable) callable returning a verdict for
+              (path, binary stream); see run_verification_task
+        cache: Verdict cache; None verifies every file
+        max_workers: Worker processes (defaults to the CPU count)
+
+    Yields:
+        (file_path, verdict, cached) tuples; cache hits first, then verified
+        files in completion order
+    """
+    pending = []
+    hits = 0
+    for file_path in files:
+        file_path = Path(file_path)
+        verdict = cache.lookup(file_path) if cache is not None else None
+        if verdict is not None:
+            hits += 1
+            yield file_path, verdict, True
+        else:
+            pending.append(file_path)
+
+    if cache is not None:
+        logger.info(f"{hits} files unchanged since last verification, {len(pending)} to verify")
+
+    def _outcomes():
+        workers = min(max_workers or os.cpu_count() or 1, len(pending))
+        if workers <= 1:
+            for file_path in pending:
+                try:
+                    yield file_path, run_verification_task(task, str(file_path))
+                except OSError as e:
+                    yield file_path, e
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(run_verification_task, task, str(file_path)): file_path
+                       for file_path in pending}
+            for future in as_completed(futures):
+                try:
+                    yield futures[future], future.result()
+                except Exception as e:
+                    # Unreadable file or dead worker
+                    yield futures[future], e
+
+    completed = 0
+    try:
+        for file_path, outcome in _outcomes():
+            if isinstance(outcome, Exception):
+                # Failures are reported but never cached
+                yield file_path, {'file': str(file_path), 'errors': [f"Verification failed: {outcome}"]}, False
+                continue
+
+            verdict, size, mtime_ns, checksum = outcome
+            if cache is not None:
+                cache.store(file_path, verdict, size, mtime_ns, checksum)
+                completed += 1
+                if completed % SAVE_INTERVAL == 0:
+                    cache.save()
+            yield file_path, verdict, False
+    finally:
+        if cache is not None:
+            try:
+                cache.save()
+            except VerificationCacheError as e:
+                logger.warning(str(e))
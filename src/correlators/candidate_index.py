@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Candidate Index - Blocking stage for meeting correlation
+
+Scoring every email against every Google Doc makes correlation quadratic in
+the size of the notes directory. This module indexes the doc records once
+per run (from their RecordFeatures) so each email is only scored against
+docs it could plausibly match:
+
+- Time index: doc meeting times sorted for bisect lookups within the
+  temporal matcher's max_time_diff window
+- Participant index: doc participant names -> docs. An email participant is
+  compared once against the distinct names, not against every doc
+- Title index: title keywords -> docs, plus distinct normalized titles for
+  the string similarity check
+
+The candidate set for an email is the union of the three lookups, returned
+in the original doc order. It contains every doc that any matcher can
+accept, so each matcher picks the same best doc as on the full list and
+correlation results do not change.
+
+Usage:
+    from src.correlators.candidate_index import CandidateIndex
+    index = CandidateIndex(doc_features, features, temporal_matcher.max_time_diff)
+    positions = index.candidates(email_features)
+"""
+
+import logging
+from bisect import bisect_left, bisect_right
+from datetime import timedelta
+from difflib import SequenceMatcher
+from typing import Dict, List, Set
+
+from .features import FeatureExtractor, NameFeatures, RecordFeatures, TitleFeatures
+
+logger = logging.getLogger(__name__)
+
+# Participants only match when some pair of names reaches the similarity
+# used by ParticipantMatcher.overlap_features
+NAME_SIMILARITY_FLOOR = 0.6
+
+# Titles without a common keyword score at most 0.4 * s + 0.3 * (0.3 * s + 0.2)
+# in ContentMatcher.calculate_content_confidence (s is the string similarity,
+# 0.2 the meeting type bonus), which reaches the 0.4 match level only when
+# s >= (0.4 - 0.06) / 0.49
+TITLE_SIMILARITY_FLOOR = (0.4 - 0.3 * 0.2) / (0.4 + 0.3 * 0.3)
+
+
+class CandidateIndex:
+    """Time, participant and title indexes over doc features"""
+
+    def __init__(self, doc_features: List[RecordFeatures], features: FeatureExtractor,
+                 max_time_diff: timedelta):
+        """
+        Build the indexes for one correlation run
+
+        Args:
+            doc_features: Features of the Google Doc records to index
+            features: Feature cache of the run, used for name similarities
+            max_time_diff: Largest time difference the temporal matcher accepts
+        """
+        self.features = features
+        self.max_time_diff = max_time_diff
+
+        timed = []
+        self.participant_index: Dict[str, Set[int]] = {}
+        self.participant_names: Dict[str, NameFeatures] = {}
+        self.keyword_index: Dict[str, Set[int]] = {}
+        self.title_index: Dict[str, Set[int]] = {}
+
+        for position, doc in enumerate(doc_features):
+            if doc.time:
+                timed.append((doc.time.timestamp(), position))
+
+            for name in doc.names:
+                self.participant_index.setdefault(name.name, set()).add(position)
+                self.participant_names[name.name] = name
+
+            if doc.title:
+                title = doc.title_features
+                self.title_index.setdefault(title.normalized, set()).add(position)
+                for keyword in title.keywords:
+                    self.keyword_index.setdefault(keyword, set()).add(position)
+
+        timed.sort()
+        self.doc_times = [timestamp for timestamp, _ in timed]
+        self.doc_time_positions = [position for _, position in timed]
+
+        # Emails repeat names and titles, so lookups are memoized per run
+        self._name_cache: Dict[str, Set[int]] = {}
+        self._title_cache: Dict[str, Set[int]] = {}
+
+    def _time_candidates(self, email: RecordFeatures) -> List[int]:
+        """Docs within the temporal matcher's window of the email time"""
+        if not email.time:
+            return []
+
+        timestamp = email.time.timestamp()
+        window = self.max_time_diff.total_seconds()
+        low = bisect_left(self.doc_times, timestamp - window)
+        high = bisect_right(self.doc_times, timestamp + window)
+        return self.doc_time_positions[low:high]
+
+    def _name_candidates(self, name: NameFeatures) -> Set[int]:
+        """Docs with a participant similar enough to match the name"""
+        if name.name not in self._name_cache:
+            positions = set()
+            for doc_name, doc_positions in self.participant_index.items():
+                score = self.features.name_similarity(name, self.participant_names[doc_name])
+                if score >= NAME_SIMILARITY_FLOOR:
+                    positions.update(doc_positions)
+            self._name_cache[name.name] = positions
+        return self._name_cache[name.name]
+
+    def _title_candidates(self, title: TitleFeatures) -> Set[int]:
+        """Docs sharing a keyword with the title or with a similar title"""
+        normalized = title.normalized
+        if normalized not in self._title_cache:
+            positions = set()
+            for keyword in title.keywords:
+                positions.update(self.keyword_index.get(keyword, ()))
+
+            for doc_title, doc_positions in self.title_index.items():
+                # Same argument order as SimilarityScorer.string_similarity_features;
+                # the length bound is SequenceMatcher.real_quick_ratio
+                lengths = len(normalized) + len(doc_title)
+                if 2 * min(len(normalized), len(doc_title)) < TITLE_SIMILARITY_FLOOR * lengths:
+                    continue
+                matcher = SequenceMatcher(None, normalized, doc_title)
+                if (matcher.quick_ratio() >= TITLE_SIMILARITY_FLOOR and
+                        matcher.ratio() >= TITLE_SIMILARITY_FLOOR):
+                    positions.update(doc_positions)
+            self._title_cache[normalized] = positions
+        return self._title_cache[normalized]
+
+    def candidates(self, email: RecordFeatures) -> List[int]:
+        """
+        Get the docs an email should be scored against
+
+        Args:
+            email: Features of the email record
+
+        Returns:
+            Positions of the candidate docs, in their original order
+        """
+        positions = set(self._time_candidates(email))
+
+        for name in email.names:
+            positions.update(self._name_candidates(name))
+
+        if email.title:
+            positions.update(self._title_candidates(email.title_features))
+
+        return sorted(positions)
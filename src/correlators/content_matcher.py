@@ -29,6 +29,8 @@ from enum import Enum
 from difflib import SequenceMatcher
 from collections import Counter
 
+from .features import FeatureExtractor, RecordFeatures, TitleFeatures
+
 logger = logging.getLogger(__name__)
 
 
@@ -223,15 +225,19 @@ class SimilarityScorer:
         self.text_normalizer = TextNormalizer()
         self.keyword_extractor = KeywordExtractor()
     
+    def title_features(self, text: str) -> TitleFeatures:
+        """Normalize a title once into the forms the similarity scores compare"""
+        return TitleFeatures(
+            text=text,
+            normalized=self.text_normalizer.normalize_text(text),
+            keywords=frozenset(self.text_normalizer.extract_keywords(text)),
+            weighted_keywords=self.keyword_extractor.extract_weighted_keywords(text),
+            meeting_type=self.text_normalizer.extract_meeting_type(text)
+        )
+    
     def string_similarity(self, text1: str, text2: str) -> float:
         """Basic string similarity using sequence matching"""
-        if not text1 or not text2:
-            return 0.0
-        
-        norm1 = self.text_normalizer.normalize_text(text1)
-        norm2 = self.text_normalizer.normalize_text(text2)
-        
-        return SequenceMatcher(None, norm1, norm2).ratio()
+        return self.string_similarity_features(self.title_features(text1), self.title_features(text2))
     
     def keyword_similarity(self, text1: str, text2: str) -> Tuple[float, List[str]]:
         """Keyword-based similarity with matched terms"""
@@ -239,8 +245,37 @@ class SimilarityScorer:
     
     def weighted_keyword_similarity(self, text1: str, text2: str) -> float:
         """Weighted keyword similarity considering term importance"""
-        weights1 = self.keyword_extractor.extract_weighted_keywords(text1)
-        weights2 = self.keyword_extractor.extract_weighted_keywords(text2)
+        return self.weighted_keyword_similarity_features(self.title_features(text1), self.title_features(text2))
+    
+    def semantic_similarity(self, text1: str, text2: str) -> float:
+        """Semantic similarity considering meeting context"""
+        return self.semantic_similarity_features(self.title_features(text1), self.title_features(text2))
+    
+    def string_similarity_features(self, title1: TitleFeatures, title2: TitleFeatures) -> float:
+        """string_similarity of two precomputed titles"""
+        if not title1.text or not title2.text:
+            return 0.0
+        
+        return SequenceMatcher(None, title1.normalized, title2.normalized).ratio()
+    
+    def keyword_similarity_features(self, title1: TitleFeatures, title2: TitleFeatures) -> Tuple[float, List[str]]:
+        """keyword_similarity of two precomputed titles (Jaccard of the keyword sets)"""
+        keywords1 = title1.keywords
+        keywords2 = title2.keywords
+        
+        if not keywords1 or not keywords2:
+            return 0.0, []
+        
+        intersection = keywords1.intersection(keywords2)
+        union = keywords1.union(keywords2)
+        
+        overlap_score = len(intersection) / len(union) if union else 0.0
+        return overlap_score, list(intersection)
+    
+    def weighted_keyword_similarity_features(self, title1: TitleFeatures, title2: TitleFeatures) -> float:
+        """weighted_keyword_similarity of two precomputed titles"""
+        weights1 = title1.weighted_keywords
+        weights2 = title2.weighted_keywords
         
         if not weights1 or not weights2:
             return 0.0
@@ -259,18 +294,23 @@ class SimilarityScorer:
         
         return (common_weight * 2) / total_weight if total_weight > 0 else 0.0
     
-    def semantic_similarity(self, text1: str, text2: str) -> float:
-        """Semantic similarity considering meeting context"""
-        # Extract meeting types
-        meeting_type1 = self.text_normalizer.extract_meeting_type(text1)
-        meeting_type2 = self.text_normalizer.extract_meeting_type(text2)
+    def semantic_similarity_features(self, title1: TitleFeatures, title2: TitleFeatures) -> float:
+        """semantic_similarity of two precomputed titles"""
+        return self.title_scores(title1, title2)[3]
+    
+    def title_scores(self, title1: TitleFeatures, title2: TitleFeatures) -> Tuple[float, float, List[str], float]:
+        """
+        All similarity scores of two precomputed titles in one pass
         
-        meeting_type_bonus = 0.2 if meeting_type1 and meeting_type1 == meeting_type2 else 0.0
+        Returns:
+            Tuple of (string_similarity, keyword_overlap, matched_keywords, semantic_similarity)
+        """
+        meeting_type_bonus = 0.2 if title1.meeting_type and title1.meeting_type == title2.meeting_type else 0.0
         
         # Base similarity scores
-        string_sim = self.string_similarity(text1, text2)
-        keyword_sim, _ = self.keyword_similarity(text1, text2)
-        weighted_sim = self.weighted_keyword_similarity(text1, text2)
+        string_sim = self.string_similarity_features(title1, title2)
+        keyword_sim, matched_keywords = self.keyword_similarity_features(title1, title2)
+        weighted_sim = self.weighted_keyword_similarity_features(title1, title2)
         
         # Combine scores with weights
         semantic_score = (
@@ -280,7 +320,7 @@ class SimilarityScorer:
             meeting_type_bonus
         )
         
-        return min(semantic_score, 1.0)  # Cap at 1.0
+        return string_sim, keyword_sim, matched_keywords, min(semantic_score, 1.0)  # Cap at 1.0
 
 
 class ContentMatcher:
@@ -365,23 +405,43 @@ class ContentMatcher:
         Returns:
             Best content match or None if no suitable match found
         """
-        email_title = self.extract_email_title(email_record)
+        features = FeatureExtractor(content_matcher=self)
+        return self.match_features(features.email(email_record),
+                                   [features.doc(doc_record) for doc_record in doc_candidates])
+    
+    def match_features(self, email_features: RecordFeatures, doc_features: List[RecordFeatures],
+                       title_scores=None) -> Optional[ContentMatch]:
+        """
+        Find best content match from precomputed record features
+        
+        Args:
+            email_features: Features of the email record
+            doc_features: Features of the Google Doc candidates
+            title_scores: Title scoring function (default: SimilarityScorer.title_scores)
+            
+        Returns:
+            Best content match or None if no suitable match found
+        """
+        email_title = email_features.title
         if not email_title:
-            self.logger.debug(f"No email title found for: {email_record.get('id', 'unknown')}")
+            self.logger.debug(f"No email title found for: {email_features.record_id}")
             return None
         
+        email_tf = email_features.title_features
+        title_scores = title_scores or self.similarity_scorer.title_scores
         best_match = None
         best_confidence = 0.0
         
-        for doc_record in doc_candidates:
-            doc_title = self.extract_doc_title(doc_record)
+        for doc in doc_features:
+            doc_title = doc.title
             if not doc_title:
                 continue
+            doc_tf = doc.title_features
             
             # Calculate various similarity scores
-            title_similarity = self.similarity_scorer.string_similarity(email_title, doc_title)
-            keyword_overlap, matched_keywords = self.similarity_scorer.keyword_similarity(email_title, doc_title)
-            semantic_similarity = self.similarity_scorer.semantic_similarity(email_title, doc_title)
+            title_similarity, keyword_overlap, matched_keywords, semantic_similarity = title_scores(
+                email_tf, doc_tf
+            )
             
             confidence = self.calculate_content_confidence(
                 title_similarity, keyword_overlap, semantic_similarity
@@ -391,19 +451,19 @@ class ContentMatcher:
                 match_signals = {
                     'email_title': email_title,
                     'doc_title': doc_title,
-                    'email_title_normalized': self.text_normalizer.normalize_text(email_title),
-                    'doc_title_normalized': self.text_normalizer.normalize_text(doc_title),
+                    'email_title_normalized': email_tf.normalized,
+                    'doc_title_normalized': doc_tf.normalized,
                     'title_similarity': title_similarity,
                     'keyword_overlap': keyword_overlap,
                     'semantic_similarity': semantic_similarity,
                     'matched_keywords': matched_keywords,
-                    'email_meeting_type': self.text_normalizer.extract_meeting_type(email_title),
-                    'doc_meeting_type': self.text_normalizer.extract_meeting_type(doc_title)
+                    'email_meeting_type': email_tf.meeting_type,
+                    'doc_meeting_type': doc_tf.meeting_type
                 }
                 
                 best_match = ContentMatch(
-                    email_id=email_record.get('id', 'unknown'),
-                    doc_id=doc_record.get('id', 'unknown'),
+                    email_id=email_features.record_id,
+                    doc_id=doc.record_id,
                     confidence=confidence,
                     title_similarity=title_similarity,
                     keyword_overlap=keyword_overlap,
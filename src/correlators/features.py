@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Correlation Features - Precomputed matcher inputs for email and doc records
+
+The matchers compare every email with many docs. Extracting times,
+participants and titles, normalizing names and splitting titles into
+keywords only depends on one record, so it is done once per record and
+kept on small slotted objects the matchers score from.
+
+Architecture:
+- NameFeatures: Normalized name, first/last name and words of a participant
+- TitleFeatures: Normalized title, keywords, weighted keywords, meeting type
+- RecordFeatures: Time, participants and title of one email or doc record,
+  with a fingerprint for reusing matches across runs
+- FeatureExtractor: Builds record features through the matchers, memoizing
+  names, titles and name/title similarities for one correlation run
+
+Usage:
+    from src.correlators.features import FeatureExtractor
+    features = FeatureExtractor(temporal_matcher, participant_matcher, content_matcher)
+    email_features = features.email(email_record)
+    doc_features = [features.doc(doc) for doc in doc_records]
+"""
+
+import hashlib
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class NameFeatures:
+    """Normalized forms of a participant name"""
+
+    __slots__ = ('name', 'normalized', 'first', 'last', 'words')
+
+    def __init__(self, name: str, normalized: str, first: str, last: str, words: FrozenSet[str]):
+        self.name = name
+        self.normalized = normalized
+        self.first = first
+        self.last = last
+        self.words = words
+
+
+class TitleFeatures:
+    """Normalized forms of a meeting title"""
+
+    __slots__ = ('text', 'normalized', 'keywords', 'weighted_keywords', 'meeting_type')
+
+    def __init__(self, text: str, normalized: str, keywords: FrozenSet[str],
+                 weighted_keywords: Dict[str, float], meeting_type: Optional[str]):
+        self.text = text
+        self.normalized = normalized
+        self.keywords = keywords
+        self.weighted_keywords = weighted_keywords
+        self.meeting_type = meeting_type
+
+
+class RecordFeatures:
+    """Matcher inputs extracted from one email or doc record"""
+
+    __slots__ = ('record_id', 'time', 'time_source', 'participants', 'names', 'title', 'title_features')
+
+    def __init__(self, record_id: str, time: Optional[datetime] = None, time_source: Optional[str] = None,
+                 participants: Optional[List[str]] = None, names: Optional[List[NameFeatures]] = None,
+                 title: str = "", title_features: Optional[TitleFeatures] = None):
+        self.record_id = record_id
+        self.time = time
+        self.time_source = time_source
+        self.participants = participants or []
+        self.names = names or []
+        self.title = title
+        self.title_features = title_features
+
+    def fingerprint(self) -> str:
+        """
+        Digest of everything the matchers read from the record
+
+        Records with the same fingerprint score the same against any docs,
+        so a stored match can be reused while the fingerprint is unchanged.
+        """
+        key = [self.record_id, self.time.isoformat() if self.time else None,
+               self.time_source, self.participants, self.title]
+        return hashlib.sha1(json.dumps(key, default=str).encode('utf-8')).hexdigest()
+
+
+class FeatureExtractor:
+    """Per-run cache of record features
+
+    Matchers left as None are skipped: their features stay empty.
+    """
+
+    def __init__(self, temporal_matcher=None, participant_matcher=None, content_matcher=None):
+        """
+        Initialize feature extractor
+
+        Args:
+            temporal_matcher: TemporalMatcher providing record times
+            participant_matcher: ParticipantMatcher providing participants and name similarity
+            content_matcher: ContentMatcher providing titles and keywords
+        """
+        self.temporal_matcher = temporal_matcher
+        self.participant_matcher = participant_matcher
+        self.content_matcher = content_matcher
+
+        self._names: Dict[str, NameFeatures] = {}
+        self._titles: Dict[str, TitleFeatures] = {}
+        self._name_scores: Dict[Tuple[str, str], float] = {}
+        self._title_scores: Dict[Tuple[str, str], Tuple[float, float, List[str], float]] = {}
+
+    def name(self, name: str) -> NameFeatures:
+        """Features of a participant name"""
+        features = self._names.get(name)
+        if features is None:
+            normalizer = self.participant_matcher.name_similarity.normalizer
+            features = self._names[name] = normalizer.name_features(name)
+        return features
+
+    def title(self, text: str) -> TitleFeatures:
+        """Features of a meeting title"""
+        features = self._titles.get(text)
+        if features is None:
+            scorer = self.content_matcher.similarity_scorer
+            features = self._titles[text] = scorer.title_features(text)
+        return features
+
+    def name_similarity(self, name1: NameFeatures, name2: NameFeatures) -> float:
+        """NameSimilarity score of two names, computed once per pair"""
+        key = (name1.name, name2.name)
+        score = self._name_scores.get(key)
+        if score is None:
+            similarity = self.participant_matcher.name_similarity
+            score = self._name_scores[key] = similarity.similarity_features(name1, name2)
+        return score
+
+    def title_scores(self, title1: TitleFeatures, title2: TitleFeatures) -> Tuple[float, float, List[str], float]:
+        """SimilarityScorer.title_scores of two titles, computed once per pair"""
+        key = (title1.text, title2.text)
+        scores = self._title_scores.get(key)
+        if scores is None:
+            scores = self._title_scores[key] = self.content_matcher.similarity_scorer.title_scores(title1, title2)
+        string_sim, keyword_sim, matched_keywords, semantic_sim = scores
+        return string_sim, keyword_sim, list(matched_keywords), semantic_sim
+
+    def email(self, email_record: Dict[str, Any]) -> RecordFeatures:
+        """Features of an email record"""
+        features = RecordFeatures(email_record.get('id', 'unknown'))
+
+        if self.temporal_matcher:
+            features.time = self.temporal_matcher.extract_email_time(email_record)
+            if features.time:
+                features.time_source = self.temporal_matcher._get_email_time_source(email_record)
+
+        if self.participant_matcher:
+            features.participants = self.participant_matcher.extract_email_participants(email_record)
+            features.names = [self.name(name) for name in features.participants]
+
+        if self.content_matcher:
+            features.title = self.content_matcher.extract_email_title(email_record)
+            if features.title:
+                features.title_features = self.title(features.title)
+
+        return features
+
+    def doc(self, doc_record: Dict[str, Any]) -> RecordFeatures:
+        """Features of a Google Doc record"""
+        features = RecordFeatures(doc_record.get('id', 'unknown'))
+
+        if self.temporal_matcher:
+            features.time = self.temporal_matcher.extract_doc_time(doc_record)
+            if features.time:
+                features.time_source = self.temporal_matcher._get_doc_time_source(doc_record)
+
+        if self.participant_matcher:
+            features.participants = self.participant_matcher.extract_doc_participants(doc_record)
+            features.names = [self.name(name) for name in features.participants]
+
+        if self.content_matcher:
+            features.title = self.content_matcher.extract_doc_title(doc_record)
+            if features.title:
+                features.title_features = self.title(features.title)
+
+        return features
@@ -20,10 +20,12 @@ Usage:
 """
 
 import logging
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from enum import Enum
 
 from .correlation_models import (
@@ -33,9 +35,22 @@ from .correlation_models import (
 from .temporal_matcher import TemporalMatcher, TemporalMatch
 from .participant_matcher import ParticipantMatcher, ParticipantMatch  
 from .content_matcher import ContentMatcher, ContentMatch
+from .candidate_index import CandidateIndex
+from .features import FeatureExtractor, RecordFeatures
 
 logger = logging.getLogger(__name__)
 
+# Each scoring worker gets at least this many emails; smaller runs are scored
+# inline since starting a process pool costs more than it saves
+MIN_EMAILS_PER_WORKER = 100
+
+# Best temporal, participant and content match of an email
+IndividualMatches = Tuple[Optional[TemporalMatch], Optional[ParticipantMatch], Optional[ContentMatch]]
+
+# Stored correlation states from other versions are ignored; bump when
+# matcher scoring changes
+CORRELATION_STATE_VERSION = 1
+
 
 class CorrelationStrategy(Enum):
     """Different correlation strategies"""
@@ -88,6 +103,7 @@ class CorrelationResults:
     orphaned_docs: List[OrphanedRecord]
     correlation_metrics: CorrelationMetrics
     processing_time: float
+    correlation_state: Optional[Dict[str, Any]] = None  # see MeetingCorrelator.match_emails_incremental
     
     def get_summary(self) -> Dict[str, Any]:
         """Get summary statistics"""
@@ -107,7 +123,9 @@ class MeetingCorrelator:
     def __init__(self, 
                  strategy: CorrelationStrategy = CorrelationStrategy.COMPOSITE,
                  min_confidence_threshold: float = 0.6,
-                 orphan_timeout_days: int = 7):
+                 orphan_timeout_days: int = 7,
+                 use_candidate_index: bool = True,
+                 max_workers: Optional[int] = None):
         """
         Initialize meeting correlator
         
@@ -115,10 +133,16 @@ class MeetingCorrelator:
             strategy: Correlation strategy to use
             min_confidence_threshold: Minimum confidence for valid correlation
             orphan_timeout_days: Days to wait before marking records as orphaned
+            use_candidate_index: Score each email only against docs sharing a time
+                window, participant or title keyword (see CandidateIndex) instead
+                of against every doc
+            max_workers: Worker processes for scoring emails (default: CPU count)
         """
         self.strategy = strategy
         self.min_confidence_threshold = min_confidence_threshold
         self.orphan_timeout_days = orphan_timeout_days
+        self.use_candidate_index = use_candidate_index
+        self.max_workers = max_workers or os.cpu_count() or 1
         
         # Initialize individual matchers
         self.temporal_matcher = TemporalMatcher()
@@ -148,11 +172,72 @@ class MeetingCorrelator:
         Returns:
             Best composite match or None
         """
-        # Run all individual matchers
-        temporal_match = self.temporal_matcher.find_temporal_match(email_record, doc_candidates)
-        participant_match = self.participant_matcher.find_participant_match(email_record, doc_candidates)
-        content_match = self.content_matcher.find_content_match(email_record, doc_candidates)
+        features = self.feature_extractor()
+        return self.find_composite_match_features(
+            features.email(email_record), [features.doc(doc) for doc in doc_candidates], features
+        )
+    
+    def feature_extractor(self) -> FeatureExtractor:
+        """Create a feature cache for one correlation run"""
+        return FeatureExtractor(self.temporal_matcher, self.participant_matcher, self.content_matcher)
+    
+    def find_composite_match_features(self, email_features: RecordFeatures,
+                                      doc_features: List[RecordFeatures],
+                                      features: Optional[FeatureExtractor] = None) -> Optional[CompositeMatchResult]:
+        """
+        Find best composite match from precomputed record features
+        
+        Args:
+            email_features: Features of the email record
+            doc_features: Features of the Google Doc candidates
+            features: Feature cache of the run, reused for name and title similarities
+            
+        Returns:
+            Best composite match or None
+        """
+        return self.combine_matches(
+            email_features, *self.find_individual_matches(email_features, doc_features, features)
+        )
+    
+    def find_individual_matches(self, email_features: RecordFeatures,
+                                doc_features: List[RecordFeatures],
+                                features: Optional[FeatureExtractor] = None) -> IndividualMatches:
+        """
+        Run the temporal, participant and content matchers
+        
+        Args:
+            email_features: Features of the email record
+            doc_features: Features of the Google Doc candidates
+            features: Feature cache of the run, reused for name and title similarities
+            
+        Returns:
+            Best temporal, participant and content match, each None if no doc matched
+        """
+        name_similarity = features.name_similarity if features else None
+        title_scores = features.title_scores if features else None
         
+        return (
+            self.temporal_matcher.match_features(email_features, doc_features),
+            self.participant_matcher.match_features(email_features, doc_features, name_similarity),
+            self.content_matcher.match_features(email_features, doc_features, title_scores)
+        )
+    
+    def combine_matches(self, email_features: RecordFeatures,
+                        temporal_match: Optional[TemporalMatch],
+                        participant_match: Optional[ParticipantMatch],
+                        content_match: Optional[ContentMatch]) -> Optional[CompositeMatchResult]:
+        """
+        Combine the individual matches into the best composite match
+        
+        Args:
+            email_features: Features of the email record
+            temporal_match: Best temporal match
+            participant_match: Best participant match
+            content_match: Best content match
+            
+        Returns:
+            Best composite match or None
+        """
         # Create candidate matches map
         doc_matches = {}
         
@@ -221,7 +306,7 @@ class MeetingCorrelator:
                 }
                 
                 best_composite_match = CompositeMatchResult(
-                    email_id=email_record.get('id', 'unknown'),
+                    email_id=email_features.record_id,
                     doc_id=doc_id,
                     overall_confidence=composite_score,
                     match_type=match_type,
@@ -249,14 +334,178 @@ class MeetingCorrelator:
             created_at=datetime.now(timezone.utc)
         )
     
+    def score_emails(self, email_features: List[RecordFeatures], doc_features: List[RecordFeatures],
+                     candidate_index: Optional[CandidateIndex] = None,
+                     features: Optional[FeatureExtractor] = None) -> List[Optional[CompositeMatchResult]]:
+        """
+        Find the best composite match of every email, on a process pool for large runs
+        
+        Args:
+            email_features: Features of the email records
+            doc_features: Features of all Google Doc records
+            candidate_index: Index limiting the docs scored per email (None scores all docs)
+            features: Feature cache of the run
+            
+        Returns:
+            Best composite match or None for each email, in input order
+        """
+        matches = self.match_emails(email_features, doc_features, candidate_index, features)
+        return [self.combine_matches(email, *email_matches) for email, email_matches in zip(email_features, matches)]
+    
+    def match_emails(self, email_features: List[RecordFeatures], doc_features: List[RecordFeatures],
+                     candidate_index: Optional[CandidateIndex] = None,
+                     features: Optional[FeatureExtractor] = None) -> List[IndividualMatches]:
+        """
+        Run the individual matchers for every email, on a process pool for large runs
+        
+        Args:
+            email_features: Features of the email records
+            doc_features: Features of all Google Doc records
+            candidate_index: Index limiting the docs scored per email (None scores all docs)
+            features: Feature cache of the run
+            
+        Returns:
+            Individual matches of each email, in input order
+        """
+        workers = min(self.max_workers, len(email_features) // MIN_EMAILS_PER_WORKER)
+        if workers > 1:
+            # Workers inherit the docs and index through initargs; only emails
+            # and results cross the process boundary per task
+            chunk_size = -(-len(email_features) // (workers * 4))
+            chunks = [email_features[i:i + chunk_size] for i in range(0, len(email_features), chunk_size)]
+            try:
+                with ProcessPoolExecutor(max_workers=workers, initializer=_init_scoring_worker,
+                                         initargs=(self, doc_features, candidate_index, features)) as executor:
+                    return [matches for chunk in executor.map(_match_chunk, chunks) for matches in chunk]
+            except Exception as e:
+                self.logger.warning(f"Parallel scoring failed, scoring inline: {e}")
+        
+        return [self._match_email(email, doc_features, candidate_index, features) for email in email_features]
+    
+    def match_emails_incremental(self, email_features: List[RecordFeatures], doc_features: List[RecordFeatures],
+                                 candidate_index: Optional[CandidateIndex] = None,
+                                 features: Optional[FeatureExtractor] = None,
+                                 previous_state: Optional[Dict[str, Any]] = None
+                                 ) -> Tuple[List[IndividualMatches], Dict[str, Any]]:
+        """
+        Run the individual matchers for every email, reusing a previous run's matches
+        
+        Each matcher keeps the first doc with the highest confidence, and a
+        composite match only combines those docs. So an email whose features
+        are unchanged keeps its stored matches while none of its matched docs
+        were removed or changed; it is only scored against the docs added
+        since the previous run, and a new doc replaces a stored match when it
+        scores higher (or the same, earlier in doc order). Other emails are
+        scored against all docs.
+        
+        Args:
+            email_features: Features of the email records
+            doc_features: Features of all Google Doc records
+            candidate_index: Index limiting the docs scored per email (None scores all docs)
+            features: Feature cache of the run
+            previous_state: correlation_state of the previous run's results
+            
+        Returns:
+            Tuple of the individual matches of each email, and the correlation
+            state to pass to the next run
+        """
+        doc_fingerprints = [doc.fingerprint() for doc in doc_features]
+        positions = {doc.record_id: position for position, doc in enumerate(doc_features)}
+        unique_ids = len(positions) == len(doc_features)
+        config = self._correlation_config()
+        
+        previous_emails = {}
+        removed = set()
+        new_positions = list(range(len(doc_features)))
+        
+        # Stored matches name their docs by id, and ties are broken by doc
+        # order, so reuse needs unique doc ids and the previous docs in the
+        # same relative order
+        if previous_state and previous_state.get('config') == config and unique_ids:
+            previous_docs = previous_state.get('docs', [])
+            current, previous = set(doc_fingerprints), set(previous_docs)
+            if ([fp for fp in doc_fingerprints if fp in previous] ==
+                    [fp for fp in previous_docs if fp in current]):
+                previous_emails = previous_state.get('emails', {})
+                removed = previous - current
+                new_positions = [position for position, fp in enumerate(doc_fingerprints) if fp not in previous]
+        
+        email_fingerprints = [email.fingerprint() for email in email_features]
+        matches: List[Optional[IndividualMatches]] = [None] * len(email_features)
+        pending, updated = [], []
+        
+        for i in range(len(email_features)):
+            entry = previous_emails.get(email_fingerprints[i])
+            if entry is None or not removed.isdisjoint(fp for fp in entry['docs'] if fp):
+                pending.append(i)
+            else:
+                matches[i] = _matches_from_state(entry)
+                if new_positions:
+                    updated.append(i)
+        
+        if previous_state:
+            self.logger.info(f"Reusing stored matches of {len(email_features) - len(pending)} emails, "
+                             f"scoring {len(pending)} emails against all docs and {len(updated)} "
+                             f"against {len(new_positions)} new docs")
+        
+        if updated:
+            new_docs = [doc_features[position] for position in new_positions]
+            new_index = None
+            if candidate_index is not None:
+                new_index = CandidateIndex(new_docs, features, self.temporal_matcher.max_time_diff)
+            
+            new_matches = self.match_emails([email_features[i] for i in updated], new_docs, new_index, features)
+            for i, email_new_matches in zip(updated, new_matches):
+                matches[i] = tuple(_better_match(stored, new, positions)
+                                   for stored, new in zip(matches[i], email_new_matches))
+        
+        all_matches = self.match_emails([email_features[i] for i in pending], doc_features, candidate_index, features)
+        for i, email_matches in zip(pending, all_matches):
+            matches[i] = email_matches
+        
+        emails_state = {}
+        if unique_ids:
+            emails_state = {
+                fp: _matches_to_state(email_matches, doc_fingerprints, positions)
+                for fp, email_matches in zip(email_fingerprints, matches)
+            }
+        
+        state = {
+            'config': config,
+            'docs': doc_fingerprints,
+            'emails': emails_state
+        }
+        return matches, state
+    
+    def _correlation_config(self) -> Dict[str, Any]:
+        """Settings a stored correlation state must have been computed with"""
+        return {
+            'version': CORRELATION_STATE_VERSION,
+            'strategy': self.strategy.value,
+            'min_confidence_threshold': self.min_confidence_threshold,
+            'max_time_diff': self.temporal_matcher.max_time_diff.total_seconds(),
+            'use_candidate_index': self.use_candidate_index
+        }
+    
+    def _match_email(self, email_features: RecordFeatures, doc_features: List[RecordFeatures],
+                     candidate_index: Optional[CandidateIndex],
+                     features: Optional[FeatureExtractor]) -> IndividualMatches:
+        """Individual matches of one email against its candidate docs"""
+        if candidate_index is not None:
+            doc_features = [doc_features[position] for position in candidate_index.candidates(email_features)]
+        return self.find_individual_matches(email_features, doc_features, features)
+    
     def correlate_meetings(self, email_records: List[Dict[str, Any]], 
-                         doc_records: List[Dict[str, Any]]) -> CorrelationResults:
+                         doc_records: List[Dict[str, Any]],
+                         previous_state: Optional[Dict[str, Any]] = None) -> CorrelationResults:
         """
         Main correlation method - correlate all emails with documents
         
         Args:
             email_records: List of email records from Phase 1
             doc_records: List of Google Doc records from Phase 2
+            previous_state: correlation_state of a previous run to reuse matches
+                from ({} to start tracking state). None skips state tracking
             
         Returns:
             Complete correlation results with metrics
@@ -272,19 +521,41 @@ class MeetingCorrelator:
         matched_doc_ids = set()
         correlation_attempts = []
         
-        # Find correlations
+        # First doc record for each id, for resolving match results
+        docs_by_id = {}
+        for doc in doc_records:
+            docs_by_id.setdefault(doc.get('id'), doc)
+        
         for email_record in email_records:
             email_id = email_record.get('id', f"email_{hash(str(email_record)) % 10000}")
             email_record['id'] = email_id  # Ensure ID is set
-            
-            composite_match = self.find_composite_match(email_record, doc_records)
+        
+        # Extract matcher features once per record
+        features = self.feature_extractor()
+        email_features = [features.email(email_record) for email_record in email_records]
+        doc_features = [features.doc(doc_record) for doc_record in doc_records]
+        
+        candidate_index = None
+        if self.use_candidate_index:
+            candidate_index = CandidateIndex(doc_features, features, self.temporal_matcher.max_time_diff)
+        
+        correlation_state = None
+        if previous_state is None:
+            composite_matches = self.score_emails(email_features, doc_features, candidate_index, features)
+        else:
+            individual_matches, correlation_state = self.match_emails_incremental(
+                email_features, doc_features, candidate_index, features, previous_state
+            )
+            composite_matches = [self.combine_matches(email, *email_matches)
+                                 for email, email_matches in zip(email_features, individual_matches)]
+        
+        # Find correlations
+        for email_record, composite_match in zip(email_records, composite_matches):
+            email_id = email_record['id']
             
             if composite_match:
                 # Find corresponding doc record
-                doc_record = next(
-                    (doc for doc in doc_records if doc.get('id') == composite_match.doc_id),
-                    None
-                )
+                doc_record = docs_by_id.get(composite_match.doc_id)
                 
                 if doc_record and composite_match.doc_id not in matched_doc_ids:
                     # Create correlation
@@ -313,6 +584,10 @@ class MeetingCorrelator:
         orphaned_emails = []
         orphaned_docs = []
         
+        attempts_by_email = {}
+        for attempt in correlation_attempts:
+            attempts_by_email.setdefault(attempt['email_id'], []).append(attempt)
+        
         for email_record in email_records:
             email_id = email_record.get('id')
             if email_id not in matched_email_ids:
@@ -320,10 +595,7 @@ class MeetingCorrelator:
                     record_id=email_id,
                     record_type='email',
                     original_record=email_record,
-                    correlation_attempts=[
-                        attempt for attempt in correlation_attempts 
-                        if attempt['email_id'] == email_id
-                    ],
+                    correlation_attempts=attempts_by_email.get(email_id, []),
                     orphaned_at=datetime.now(timezone.utc),
                     created_at=datetime.now(timezone.utc)
                 )
@@ -387,7 +659,8 @@ class MeetingCorrelator:
             orphaned_emails=orphaned_emails,
             orphaned_docs=orphaned_docs,
             correlation_metrics=metrics,
-            processing_time=processing_time
+            processing_time=processing_time,
+            correlation_state=correlation_state
         )
     
     def extract_structured_content(self, correlated_meetings: List[CorrelatedMeeting]) -> None:
@@ -410,6 +683,51 @@ class MeetingCorrelator:
             self.logger.warning("StructuredExtractor not available, skipping content extraction")
 
 
+# Process pool state: set once per worker by _init_scoring_worker
+_scoring_state = None
+
+
+def _init_scoring_worker(correlator, doc_features, candidate_index, features):
+    """Keep the run's docs, index and feature cache in the worker"""
+    global _scoring_state
+    _scoring_state = (correlator, doc_features, candidate_index, features)
+
+
+def _match_chunk(email_features: List[RecordFeatures]) -> List[IndividualMatches]:
+    """Match a chunk of emails in a worker process"""
+    correlator, doc_features, candidate_index, features = _scoring_state
+    return [correlator._match_email(email, doc_features, candidate_index, features) for email in email_features]
+
+
+_MATCH_CLASSES = (TemporalMatch, ParticipantMatch, ContentMatch)
+
+
+def _better_match(stored, new, positions: Dict[str, int]):
+    """Winner of a stored match and the best match among new docs, as one matcher scan would pick it"""
+    if new is None:
+        return stored
+    if stored is None or new.confidence > stored.confidence:
+        return new
+    if new.confidence == stored.confidence and positions[new.doc_id] < positions[stored.doc_id]:
+        return new
+    return stored
+
+
+def _matches_to_state(matches: IndividualMatches, doc_fingerprints: List[str],
+                      positions: Dict[str, int]) -> Dict[str, Any]:
+    """JSON-serializable correlation state entry of one email"""
+    return {
+        'docs': [doc_fingerprints[positions[match.doc_id]] if match else None for match in matches],
+        'matches': [asdict(match) if match else None for match in matches]
+    }
+
+
+def _matches_from_state(entry: Dict[str, Any]) -> IndividualMatches:
+    """Individual matches stored by _matches_to_state"""
+    return tuple(match_class(**data) if data else None
+                 for match_class, data in zip(_MATCH_CLASSES, entry['matches']))
+
+
 # Example usage and testing
 if __name__ == "__main__":
     # Configure logging
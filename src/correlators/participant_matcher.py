@@ -28,6 +28,8 @@ from dataclasses import dataclass
 from enum import Enum
 from difflib import SequenceMatcher
 
+from .features import FeatureExtractor, NameFeatures, RecordFeatures
+
 logger = logging.getLogger(__name__)
 
 
@@ -157,6 +159,18 @@ class NameNormalizer:
         
         parts = normalized.split()
         return parts[-1] if len(parts) > 1 else ""
+    
+    def name_features(self, name: str) -> NameFeatures:
+        """Normalize a name once into the forms NameSimilarity compares"""
+        normalized = self.normalize_name(name)
+        parts = normalized.split()
+        return NameFeatures(
+            name=name,
+            normalized=normalized,
+            first=parts[0] if parts else "",
+            last=parts[-1] if len(parts) > 1 else "",
+            words=frozenset(parts)
+        )
 
 
 class NameSimilarity:
@@ -170,9 +184,16 @@ class NameSimilarity:
         if not name1 or not name2:
             return 0.0
         
-        # Normalize both names
-        norm1 = self.normalizer.normalize_name(name1)
-        norm2 = self.normalizer.normalize_name(name2)
+        return self.similarity_features(self.normalizer.name_features(name1),
+                                        self.normalizer.name_features(name2))
+    
+    def similarity_features(self, name1: NameFeatures, name2: NameFeatures) -> float:
+        """Calculate similarity score between two normalized names (0.0-1.0)"""
+        if not name1.name or not name2.name:
+            return 0.0
+        
+        norm1 = name1.normalized
+        norm2 = name2.normalized
         
         if norm1 == norm2:
             return 1.0
@@ -184,20 +205,16 @@ class NameSimilarity:
         scores.append(SequenceMatcher(None, norm1, norm2).ratio())
         
         # 2. First name matching
-        first1 = self.normalizer.extract_first_name(name1)
-        first2 = self.normalizer.extract_first_name(name2)
-        if first1 and first2:
-            scores.append(SequenceMatcher(None, first1, first2).ratio())
+        if name1.first and name2.first:
+            scores.append(SequenceMatcher(None, name1.first, name2.first).ratio())
         
         # 3. Last name matching (if available)
-        last1 = self.normalizer.extract_last_name(name1)
-        last2 = self.normalizer.extract_last_name(name2)
-        if last1 and last2:
-            scores.append(SequenceMatcher(None, last1, last2).ratio())
+        if name1.last and name2.last:
+            scores.append(SequenceMatcher(None, name1.last, name2.last).ratio())
         
         # 4. Partial matching (any word in name1 matches any word in name2)
-        words1 = set(norm1.split())
-        words2 = set(norm2.split())
+        words1 = name1.words
+        words2 = name2.words
         if words1 and words2:
             intersection = words1.intersection(words2)
             union = words1.union(words2)
@@ -315,6 +332,27 @@ class ParticipantMatcher:
         Returns:
             Tuple of (overlap_percentage, matched_pairs, email_only, doc_only)
         """
+        normalizer = self.name_similarity.normalizer
+        return self.overlap_features([normalizer.name_features(name) for name in email_participants],
+                                     [normalizer.name_features(name) for name in doc_participants])
+    
+    def overlap_features(self, email_names: List[NameFeatures], doc_names: List[NameFeatures],
+                         similarity=None) -> Tuple[float, List[Dict[str, str]], List[str], List[str]]:
+        """
+        Calculate overlap percentage between normalized participant lists
+        
+        Args:
+            email_names: Email participant name features
+            doc_names: Doc participant name features
+            similarity: Name similarity function (default: NameSimilarity.similarity_features)
+            
+        Returns:
+            Tuple of (overlap_percentage, matched_pairs, email_only, doc_only)
+        """
+        similarity = similarity or self.name_similarity.similarity_features
+        email_participants = [name.name for name in email_names]
+        doc_participants = [name.name for name in doc_names]
+        
         if not email_participants and not doc_participants:
             return 0.0, [], [], []
         
@@ -325,22 +363,25 @@ class ParticipantMatcher:
         email_matched = set()
         doc_matched = set()
         
-        # Find matches using fuzzy name matching
-        for i, email_participant in enumerate(email_participants):
-            best_match = self.name_similarity.find_best_name_match(
-                email_participant, doc_participants, min_similarity=0.6
-            )
+        # Find matches using fuzzy name matching (as NameSimilarity.find_best_name_match)
+        for i, email_name in enumerate(email_names):
+            best_match = None
+            best_score = 0.0
+            for doc_name in doc_names:
+                score = similarity(email_name, doc_name)
+                if score >= 0.6 and score > best_score:
+                    best_match = doc_name.name
+                    best_score = score
             
             if best_match:
-                doc_participant, similarity = best_match
-                doc_index = doc_participants.index(doc_participant)
+                doc_index = doc_participants.index(best_match)
                 
                 # Avoid duplicate matches
                 if i not in email_matched and doc_index not in doc_matched:
                     matched_pairs.append({
-                        'email_participant': email_participant,
-                        'doc_participant': doc_participant, 
-                        'similarity': similarity
+                        'email_participant': email_name.name,
+                        'doc_participant': best_match, 
+                        'similarity': best_score
                     })
                     email_matched.add(i)
                     doc_matched.add(doc_index)
@@ -383,21 +424,38 @@ class ParticipantMatcher:
         Returns:
             Best participant match or None if no suitable match found
         """
-        email_participants = self.extract_email_participants(email_record)
+        features = FeatureExtractor(participant_matcher=self)
+        return self.match_features(features.email(email_record),
+                                   [features.doc(doc_record) for doc_record in doc_candidates])
+    
+    def match_features(self, email_features: RecordFeatures, doc_features: List[RecordFeatures],
+                       similarity=None) -> Optional[ParticipantMatch]:
+        """
+        Find best participant match from precomputed record features
+        
+        Args:
+            email_features: Features of the email record
+            doc_features: Features of the Google Doc candidates
+            similarity: Name similarity function (default: NameSimilarity.similarity_features)
+            
+        Returns:
+            Best participant match or None if no suitable match found
+        """
+        email_participants = email_features.participants
         if not email_participants:
-            self.logger.debug(f"No email participants found for: {email_record.get('title', 'unknown')}")
+            self.logger.debug(f"No email participants found for: {email_features.record_id}")
             return None
         
         best_match = None
         best_confidence = 0.0
         
-        for doc_record in doc_candidates:
-            doc_participants = self.extract_doc_participants(doc_record)
+        for doc in doc_features:
+            doc_participants = doc.participants
             if not doc_participants:
                 continue
             
-            overlap_percentage, matched_pairs, email_only, doc_only = self.calculate_participant_overlap(
-                email_participants, doc_participants
+            overlap_percentage, matched_pairs, email_only, doc_only = self.overlap_features(
+                email_features.names, doc.names, similarity
             )
             
             confidence = self.calculate_participant_confidence(overlap_percentage)
@@ -413,8 +471,8 @@ class ParticipantMatcher:
                 }
                 
                 best_match = ParticipantMatch(
-                    email_id=email_record.get('id', 'unknown'),
-                    doc_id=doc_record.get('id', 'unknown'), 
+                    email_id=email_features.record_id,
+                    doc_id=doc.record_id, 
                     confidence=confidence,
                     overlap_percentage=overlap_percentage,
                     matched_participants=matched_pairs,
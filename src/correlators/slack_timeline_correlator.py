@@ -3,11 +3,17 @@
 Slack Timeline Correlator - Phase 5B Enhancement
 Extends the Phase 3 correlator to integrate Slack conversation timelines with meeting records.
 Provides temporal and contextual correlation between meetings and Slack discussions.
+
+Slack conversations are indexed once per run (SlackTimelineIndex): messages
+are sorted by timestamp per channel so a meeting's pre/post and scheduling
+windows are bisect slices, and an inverted index maps participants to the
+channels they posted in.
 """
 
 import logging
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Any, Tuple, Set
+from typing import Dict, List, Optional, Any, Tuple, Set, Union
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -52,6 +58,112 @@ class EnhancedCorrelatedMeeting(CorrelatedMeeting):
     meeting_coordination_score: float = 0.0
 
 
+class SlackTimelineIndex:
+    """
+    Slack conversations sorted by timestamp per channel, with a
+    participant -> channels inverted index
+
+    Participants are keyed by Slack user ID and, when a users list is given,
+    by the lowercased email, real name, display name and username of each
+    user, so meeting attendees can be resolved to the channels they posted in.
+    """
+
+    # fromtimestamp() rounds to microseconds; window bounds are widened by
+    # this much and re-checked on the datetimes so slices match the filter
+    _BOUND_SLACK = 1e-6
+
+    def __init__(self,
+                 slack_conversations: Dict[str, List[Dict[str, Any]]],
+                 slack_users: Optional[List[Dict[str, Any]]] = None):
+        """
+        Build the index for one correlation run
+
+        Args:
+            slack_conversations: Channel ID -> list of Slack messages
+            slack_users: Optional Slack users (users.list format) used to
+                resolve emails and names to user IDs
+        """
+        self.conversations = slack_conversations
+        self.channel_ids = list(slack_conversations)
+        self._channel_order = {channel_id: i for i, channel_id in enumerate(self.channel_ids)}
+
+        # channel -> (sorted timestamps, original positions in ts order)
+        self._timelines: Dict[str, Tuple[List[float], List[int]]] = {}
+        self.participant_channels: Dict[str, Set[str]] = {}
+
+        for channel_id, messages in slack_conversations.items():
+            timestamps = [float(msg.get('ts', 0)) for msg in messages]
+            order = sorted(range(len(messages)), key=timestamps.__getitem__)
+            self._timelines[channel_id] = ([timestamps[i] for i in order], order)
+
+            for msg in messages:
+                if msg.get('user'):
+                    self.participant_channels.setdefault(msg['user'], set()).add(channel_id)
+
+        self.user_aliases: Dict[str, str] = {}
+        for user in slack_users or []:
+            user_id = user.get('id')
+            if not user_id:
+                continue
+            profile = user.get('profile', {})
+            for alias in (profile.get('email'), user.get('real_name'), profile.get('real_name'),
+                          profile.get('display_name'), user.get('name')):
+                if alias:
+                    self.user_aliases.setdefault(alias.lower(), user_id)
+
+    def window(self, channel_id: str, start_time: datetime, end_time: datetime) -> List[Dict[str, Any]]:
+        """
+        Get the messages of a channel posted within [start_time, end_time]
+
+        Args:
+            channel_id: Slack channel ID
+            start_time: Window start (inclusive)
+            end_time: Window end (inclusive)
+
+        Returns:
+            Messages in the window, in their original order
+        """
+        timestamps, order = self._timelines.get(channel_id, ([], []))
+        low = bisect_left(timestamps, start_time.timestamp() - self._BOUND_SLACK)
+        high = bisect_right(timestamps, end_time.timestamp() + self._BOUND_SLACK)
+        if low >= high:
+            return []
+
+        messages = self.conversations[channel_id]
+        window = []
+        for position in sorted(order[low:high]):
+            msg_time = datetime.fromtimestamp(float(messages[position].get('ts', 0)), tz=timezone.utc)
+            if start_time <= msg_time <= end_time:
+                window.append(messages[position])
+        return window
+
+    def channels_for(self, participants: List[str]) -> List[str]:
+        """
+        Get the channels to search for a meeting's participants
+
+        Args:
+            participants: Meeting participants (Slack user IDs, emails or names)
+
+        Returns:
+            Channels any resolved participant posted in, in the original
+            channel order. All channels when no participant resolves to a
+            Slack user, since unmapped meetings would otherwise find nothing.
+        """
+        channels: Set[str] = set()
+        for participant in participants:
+            user_id = participant
+            if participant not in self.participant_channels:
+                user_id = self.user_aliases.get(str(participant).lower(), participant)
+            channels.update(self.participant_channels.get(user_id, ()))
+
+        if not channels:
+            return self.channel_ids
+        return sorted(channels, key=self._channel_order.__getitem__)
+
+
+SlackConversations = Union[Dict[str, List[Dict[str, Any]]], SlackTimelineIndex]
+
+
 class SlackTimelineCorrelator(MeetingCorrelator):
     """
     Enhanced correlator that integrates Slack conversation timelines
@@ -77,16 +189,23 @@ class SlackTimelineCorrelator(MeetingCorrelator):
     
     def correlate_with_slack_timeline(self, 
                                      correlated_meetings: List[CorrelatedMeeting],
-                                     slack_conversations: Dict[str, List[Dict[str, Any]]]) -> List[EnhancedCorrelatedMeeting]:
+                                     slack_conversations: SlackConversations,
+                                     slack_users: Optional[List[Dict[str, Any]]] = None) -> List[EnhancedCorrelatedMeeting]:
         """
         Enhance existing correlated meetings with Slack timeline context
+
+        Args:
+            correlated_meetings: Meetings from Phase 3 correlation
+            slack_conversations: Channel ID -> messages, or a prebuilt SlackTimelineIndex
+            slack_users: Optional Slack users for resolving participants to user IDs
         """
         enhanced_meetings = []
         
         print(f"🔗 Enhancing {len(correlated_meetings)} meetings with Slack timeline context")
         
+        timeline_index = self._timeline_index(slack_conversations, slack_users)
         for meeting in correlated_meetings:
-            enhanced = self._enhance_meeting_with_slack(meeting, slack_conversations)
+            enhanced = self._enhance_meeting_with_slack(meeting, timeline_index)
             enhanced_meetings.append(enhanced)
         
         print(f"✅ Enhanced {len(enhanced_meetings)} meetings with Slack context")
@@ -96,17 +215,21 @@ class SlackTimelineCorrelator(MeetingCorrelator):
     def find_slack_meeting_discussions(self, 
                                      meeting_time: datetime,
                                      participants: List[str],
-                                     slack_conversations: Dict[str, List[Dict[str, Any]]]) -> List[SlackTimelineContext]:
+                                     slack_conversations: SlackConversations) -> List[SlackTimelineContext]:
         """
         Find Slack discussions related to a specific meeting
         """
         timeline_contexts = []
+        timeline_index = self._timeline_index(slack_conversations)
         
         # Calculate search windows
         pre_window_start = meeting_time - timedelta(hours=self.pre_meeting_window_hours)
         post_window_end = meeting_time + timedelta(hours=self.post_meeting_window_hours)
         
-        for channel_id, messages in slack_conversations.items():
+        for channel_id in timeline_index.channels_for(participants):
+            messages = timeline_index.window(channel_id, pre_window_start, post_window_end)
+            if not messages:
+                continue
             context = self._analyze_channel_for_meeting(
                 channel_id, messages, meeting_time, participants, 
                 pre_window_start, post_window_end
@@ -123,16 +246,18 @@ class SlackTimelineCorrelator(MeetingCorrelator):
     def identify_scheduling_conversations(self,
                                         meeting_time: datetime,
                                         participants: List[str],
-                                        slack_conversations: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+                                        slack_conversations: SlackConversations) -> List[Dict[str, Any]]:
         """
         Identify Slack conversations that were used to schedule the meeting
         """
         scheduling_messages = []
+        timeline_index = self._timeline_index(slack_conversations)
         
         # Look for scheduling discussions in the weeks before the meeting
         scheduling_window_start = meeting_time - timedelta(hours=self.scheduling_window_hours)
         
-        for channel_id, messages in slack_conversations.items():
+        for channel_id in timeline_index.channels_for(participants):
+            messages = timeline_index.window(channel_id, scheduling_window_start, meeting_time)
             channel_scheduling = self._find_scheduling_messages(
                 messages, scheduling_window_start, meeting_time, participants
             )
@@ -146,9 +271,19 @@ class SlackTimelineCorrelator(MeetingCorrelator):
         
         return scheduling_messages
     
+    def _timeline_index(self,
+                        slack_conversations: SlackConversations,
+                        slack_users: Optional[List[Dict[str, Any]]] = None) -> SlackTimelineIndex:
+        """
+        Get the timeline index for the conversations, building it if needed
+        """
+        if isinstance(slack_conversations, SlackTimelineIndex):
+            return slack_conversations
+        return SlackTimelineIndex(slack_conversations, slack_users)
+    
     def _enhance_meeting_with_slack(self, 
                                    meeting: CorrelatedMeeting,
-                                   slack_conversations: Dict[str, List[Dict[str, Any]]]) -> EnhancedCorrelatedMeeting:
+                                   slack_conversations: SlackConversations) -> EnhancedCorrelatedMeeting:
         """
         Enhance a single meeting with Slack timeline context
         """
@@ -28,6 +28,8 @@ from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+from .features import FeatureExtractor, RecordFeatures
+
 try:
     import pytz
     PYTZ_AVAILABLE = True
@@ -256,16 +258,32 @@ class TemporalMatcher:
         Returns:
             Best temporal match or None if no suitable match found
         """
-        email_time = self.extract_email_time(email_record)
+        features = FeatureExtractor(temporal_matcher=self)
+        return self.match_features(features.email(email_record),
+                                   [features.doc(doc_record) for doc_record in doc_candidates])
+    
+    def match_features(self, email_features: RecordFeatures,
+                       doc_features: List[RecordFeatures]) -> Optional[TemporalMatch]:
+        """
+        Find best temporal match from precomputed record features
+        
+        Args:
+            email_features: Features of the email record
+            doc_features: Features of the Google Doc candidates
+            
+        Returns:
+            Best temporal match or None if no suitable match found
+        """
+        email_time = email_features.time
         if not email_time:
-            self.logger.debug(f"No email time found for: {email_record.get('title', 'unknown')}")
+            self.logger.debug(f"No email time found for: {email_features.record_id}")
             return None
         
         best_match = None
         best_confidence = 0.0
         
-        for doc_record in doc_candidates:
-            doc_time = self.extract_doc_time(doc_record)
+        for doc in doc_features:
+            doc_time = doc.time
             if not doc_time:
                 continue
             
@@ -283,13 +301,13 @@ class TemporalMatcher:
                     'doc_time': doc_time.isoformat(), 
                     'time_difference': time_diff.total_seconds(),
                     'time_diff_minutes': time_diff.total_seconds() / 60,
-                    'email_time_source': self._get_email_time_source(email_record),
-                    'doc_time_source': self._get_doc_time_source(doc_record)
+                    'email_time_source': email_features.time_source,
+                    'doc_time_source': doc.time_source
                 }
                 
                 best_match = TemporalMatch(
-                    email_id=email_record.get('id', 'unknown'),
-                    doc_id=doc_record.get('id', 'unknown'),
+                    email_id=email_features.record_id,
+                    doc_id=doc.record_id,
                     confidence=confidence,
                     time_difference_minutes=abs(time_diff.total_seconds()) / 60,
                     match_signals=match_signals
@@ -518,6 +518,29 @@ def is_meeting_notes_docx(filename: str) -> bool:
     return False
 
 
+# Extractor reused by every extract_docx_content call in a process
+_process_extractor: Optional[DocxContentExtractor] = None
+
+
+def extract_docx_content(file_path: str) -> ExtractedDocument:
+    """
+    Extract a DOCX file with this process's shared extractor
+
+    Module-level so it can run in extraction worker processes (see
+    src/core/extraction_cache.py); patterns are compiled once per process.
+
+    Args:
+        file_path: Path to the .docx file
+
+    Returns:
+        ExtractedDocument with content and metadata
+    """
+    global _process_extractor
+    if _process_extractor is None:
+        _process_extractor = DocxContentExtractor(preserve_structure=True)
+    return _process_extractor.extract_content(file_path)
+
+
 # Standalone execution for testing
 if __name__ == "__main__":
     import sys
@@ -5,10 +5,13 @@ Transforms natural language queries into structured search parameters
 
 from .query_engine import QueryEngine, QueryIntent, ParsedQuery
 from .query_parser import NLQueryParser
+from .query_planner import QueryPlanner, QueryPlan
 
 __all__ = [
     'QueryEngine',
     'QueryIntent', 
     'ParsedQuery',
-    'NLQueryParser'
+    'NLQueryParser',
+    'QueryPlanner',
+    'QueryPlan'
 ]
\ No newline at end of file
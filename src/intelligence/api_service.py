@@ -4,8 +4,10 @@ Provides REST API endpoints for natural language queries and context building
 
 References:
 - src/intelligence/query_engine.py - Natural language query parsing and intent recognition
+- src/intelligence/query_planner.py - Access path selection and execution for parsed queries
 - src/intelligence/result_aggregator.py - Multi-source result aggregation with intelligence
 - src/search/database.py - SQLite FTS5 search database interface
+- src/search/fanout.py - Concurrent per-source search with merged top-k
 - tasks_C.md lines 1264-1643 - Detailed API service specification
 """
 
@@ -20,8 +22,12 @@ import asyncio
 from contextlib import asynccontextmanager
 
 from src.intelligence.query_engine import QueryEngine
+from src.intelligence.query_planner import QueryPlanner
 from src.intelligence.result_aggregator import ResultAggregator
+from src.queries.person_queries import PersonResolver
 from src.search.database import SearchDatabase
+from src.search.fanout import FanOutSearcher
+from src.search.pagination import InvalidCursorError
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -31,13 +37,14 @@ logger = logging.getLogger(__name__)
 query_engine: Optional[QueryEngine] = None
 aggregator: Optional[ResultAggregator] = None
 search_db: Optional[SearchDatabase] = None
+person_resolver: Optional[PersonResolver] = None
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifespan with proper initialization and cleanup"""
     # Startup
-    global query_engine, aggregator, search_db
+    global query_engine, aggregator, search_db, person_resolver
     
     logger.info("Initializing AI Chief of Staff API...")
     
@@ -46,6 +53,7 @@ async def lifespan(app: FastAPI):
         search_db = SearchDatabase()
         query_engine = QueryEngine()
         aggregator = ResultAggregator()
+        person_resolver = PersonResolver()
         
         logger.info("API initialized successfully")
         yield
@@ -88,6 +96,8 @@ class SearchRequest(BaseModel):
     person_filter: Optional[str] = Field(None, example="alice")
     max_results: int = Field(10, ge=1, le=100, description="Maximum number of results")
     user_id: Optional[str] = Field(None, example="user123", description="User identifier for personalization")
+    cursor: Optional[str] = Field(None, max_length=512, description="Continuation token from metadata.next_cursor of a previous page")
+    explain: bool = Field(False, description="Include the chosen execution plan in metadata.explain")
 
 
 class ContextRequest(BaseModel):
@@ -174,16 +184,17 @@ async def search(
         if request.person_filter:
             parsed_query.person_filter = request.person_filter
         
-        # Convert parsed query to search parameters
-        search_params = {
-            'query': ' '.join(parsed_query.keywords),
-            'source': parsed_query.sources[0] if len(parsed_query.sources) == 1 else None,
-            'date_range': _convert_time_filter(parsed_query.time_filter),
-            'limit': request.max_results
-        }
+        # Route to the cheapest access path (FTS, author/date indexes, rollups)
+        planner = QueryPlanner(db, person_resolver=person_resolver)
+        plan = planner.plan(
+            parsed_query,
+            limit=request.max_results,
+            date_range=_convert_time_filter(parsed_query.time_filter)
+        )
         
-        # Execute search with intelligent parameters
-        raw_results = db.search(**search_params)
+        # Execute plan with intelligent parameters (keyset paged)
+        page = planner.execute(plan, cursor=request.cursor)
+        raw_results = page['results']
         
         # Aggregate results with multi-source intelligence
         source_results = {'mixed': raw_results}  # Simplified for single search
@@ -197,26 +208,34 @@ async def search(
             request.user_id
         )
         
+        metadata = {
+            "total_sources": aggregated.total_sources,
+            "duplicates_removed": aggregated.duplicates_removed,
+            "confidence_score": aggregated.confidence_score,
+            "key_people": aggregated.key_people,
+            "key_topics": aggregated.key_topics,
+            "next_cursor": page['next_cursor']
+        }
+        if request.explain:
+            metadata["explain"] = plan.explain()
+        
         return SearchResponse(
             results=aggregated.results,
-            metadata={
-                "total_sources": aggregated.total_sources,
-                "duplicates_removed": aggregated.duplicates_removed,
-                "confidence_score": aggregated.confidence_score,
-                "key_people": aggregated.key_people,
-                "key_topics": aggregated.key_topics
-            },
+            metadata=metadata,
             query_info={
                 "original_query": request.query,
                 "parsed_intent": parsed_query.intent.value,
                 "keywords": parsed_query.keywords,
                 "sources_searched": parsed_query.sources,
                 "time_filter": parsed_query.time_filter,
-                "confidence": parsed_query.confidence
+                "confidence": parsed_query.confidence,
+                "plan": plan.strategy
             },
             timestamp=datetime.now().isoformat()
         )
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {str(e)}")
     except Exception as e:
         logger.error(f"Search error: {e}")
         raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
@@ -236,20 +255,16 @@ async def build_context(
     including timelines, key people, and commitment extraction.
     """
     try:
-        # Search for topic across multiple sources
+        # Search for topic across sources concurrently, keeping the merged top 50
         sources = request.sources or ["slack", "calendar", "drive"]
-        all_results = {}
-        
-        for source in sources:
-            search_params = {
-                'query': request.topic,
-                'source': source,
-                'date_range': _convert_time_filter(request.time_range),
-                'limit': 20  # Get more results for better context building
-            }
-            results = db.search(**search_params)
-            if results:
-                all_results[source] = results
+        fanout = FanOutSearcher(db).search(
+            query=request.topic,
+            sources=sources,
+            date_range=_convert_time_filter(request.time_range),
+            k=50,
+            per_source_limit=20  # Get more results for better context building
+        )
+        all_results = {source: results for source, results in fanout.by_source.items() if results}
         
         # Aggregate with full intelligence processing
         aggregated = agg.aggregate(all_results, request.topic, 50)
@@ -27,6 +27,7 @@ from dataclasses import dataclass, asdict
 from enum import Enum
 
 from ..search.database import SearchDatabase
+from ..search.fanout import FanOutSearcher
 from ..core.config import get_config
 
 logger = logging.getLogger(__name__)
@@ -164,27 +165,25 @@ class CommitmentExtractor:
         start_date = end_date - timedelta(days=days_back)
         date_range = (start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
         
-        # Get content from each source
+        # Get content from every source concurrently (extraction needs all rows, so no early exit)
         target_sources = sources or ['slack', 'drive', 'calendar']
+        per_source_limit = 1000
+        fanout = FanOutSearcher(self.search_db, early_exit_score=None).search(
+            # Broad terms likely to match most content when no query is given
+            query=query or "the OR and OR to OR of",
+            sources=target_sources,
+            date_range=date_range,
+            k=per_source_limit * len(target_sources),
+            per_source_limit=per_source_limit
+        )
         
         for source in target_sources:
+            if source in fanout.failed_sources:
+                logger.error(f"Error processing source {source}: {fanout.failed_sources[source]}")
+                continue
+            
             try:
-                # Search for content in this source
-                if query:
-                    search_results = self.search_db.search(
-                        query=query,
-                        source=source,
-                        date_range=date_range,
-                        limit=1000
-                    )
-                else:
-                    # Get all recent content from this source using a broad query
-                    search_results = self.search_db.search(
-                        query="the OR and OR to OR of",  # Broad terms likely to match most content
-                        source=source,
-                        date_range=date_range,
-                        limit=1000
-                    )
+                search_results = fanout.by_source.get(source, [])
                 
                 logger.info(f"Processing {len(search_results)} records from {source}")
                 sources_processed.append(source)
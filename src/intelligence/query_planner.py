@@ -0,0 +1,569 @@
+"""
+Execution planner for parsed natural language queries
+Chooses the cheapest access path for a ParsedQuery instead of always running
+one broad FTS scan
+
+Access paths:
+- fts: FTS5 MATCH ordered by bm25 rank, filters applied to the joined rows
+- fts_filtered: FTS5 MATCH restricted to rowids from a selective B-tree index
+  (person author index or date index), probed per rowid instead of walking
+  the whole doclist
+- person_index: (author, date, id) expression indexes, newest first; calendar
+  attendees are matched through the FTS index, which holds attendee emails
+- time_index: idx_messages_date range scan, newest first
+- rollup: aggregate GROUP BY source/date query over messages for statistics
+  intents (computed per query, not a precomputed rollup table)
+
+Person filters apply only to identifiers: emails and Slack user IDs given
+directly or resolved from a name through PersonResolver. Indexed records
+rarely carry a name (Slack keeps the user ID under 'user'), so a name that
+does not resolve stays an FTS term instead of becoming a filter.
+
+Selectivity is estimated with capped COUNT(*) probes so planning cost stays
+bounded no matter how large the index is. Queries over several sources run
+as concurrent per-source subqueries on separate pooled connections and are
+merged by their sort key; pages continue with keyset cursors.
+
+References:
+- src/intelligence/query_engine.py - ParsedQuery / QueryIntent
+- src/intelligence/api_service.py - /api/v1/search executes plans
+- src/search/database.py - schema, author expression indexes, pooled connections
+- src/search/pagination.py - keyset continuation tokens
+- src/queries/person_queries.py - PersonResolver maps names to emails and Slack IDs
+"""
+
+import heapq
+import json
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from .query_engine import ParsedQuery, QueryIntent
+from ..queries.person_queries import PersonResolver
+from ..search.database import AUTHOR_EMAIL_EXPR, AUTHOR_EXPR, USER_EXPR
+from ..search.pagination import encode_cursor, decode_cursor, query_fingerprint
+
+logger = logging.getLogger(__name__)
+
+STRATEGY_FTS = 'fts'
+STRATEGY_FTS_FILTERED = 'fts_filtered'
+STRATEGY_PERSON = 'person_index'
+STRATEGY_TIME = 'time_index'
+STRATEGY_ROLLUP = 'rollup'
+
+# Rank-ordered strategies page on (rank, id) ascending, the rest on (date, id) descending
+RANKED_STRATEGIES = (STRATEGY_FTS, STRATEGY_FTS_FILTERED)
+
+# Metadata fields identifying a record's person, each with a (field, date, id) index
+PERSON_EXPRS = (AUTHOR_EMAIL_EXPR, AUTHOR_EXPR, USER_EXPR)
+
+# Slack user IDs ("U024BE7LH") are identifiers even without a roster entry
+SLACK_ID_PATTERN = re.compile(r'^[UW][A-Z0-9]{6,}$')
+
+# Words the time filter already expresses; requiring them in FTS would drop matches
+TIME_WORDS = {
+    'today', 'yesterday', 'tomorrow', 'last', 'this', 'past', 'next', 'week', 'weeks',
+    'month', 'months', 'day', 'days', 'recent', 'recently'
+}
+
+
+@dataclass
+class QueryPlan:
+    """Chosen execution strategy for a parsed query"""
+    strategy: str
+    sources: List[str] = field(default_factory=list)
+    fts_query: Optional[str] = None
+    date_range: Optional[Tuple[str, str]] = None
+    person_identifiers: List[str] = field(default_factory=list)
+    driver: Optional[str] = None
+    limit: int = 10
+    estimates: Dict[str, Optional[int]] = field(default_factory=dict)
+    reason: str = ""
+
+    @property
+    def fingerprint(self) -> str:
+        """Fingerprint that binds continuation cursors to this plan"""
+        return query_fingerprint('plan', self.strategy, self.fts_query, self.sources,
+                                 self.date_range, self.person_identifiers)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable representation for API metadata"""
+        return {
+            'strategy': self.strategy,
+            'driver': self.driver,
+            'sources': self.sources,
+            'fts_query': self.fts_query,
+            'date_range': list(self.date_range) if self.date_range else None,
+            'person_identifiers': self.person_identifiers,
+            'estimates': self.estimates,
+            'reason': self.reason
+        }
+
+    def explain(self) -> List[str]:
+        """EXPLAIN-style description of the plan, one step per line"""
+        lines = [f"PLAN {self.strategy}" + (f" (driver: {self.driver})" if self.driver else "")]
+        subqueries = self.sources or ['*']
+        if len(subqueries) > 1:
+            lines.append(f"  FAN-OUT {len(subqueries)} subqueries, MERGE BY "
+                         + ("rank, id" if self.strategy in RANKED_STRATEGIES else "date DESC, id DESC"))
+        for source in subqueries:
+            lines.append(f"  SUBQUERY source={source}")
+            if self.strategy == STRATEGY_ROLLUP:
+                lines.append("    AGGREGATE messages GROUP BY source, date")
+            elif self.strategy == STRATEGY_TIME:
+                lines.append(f"    SEARCH messages USING INDEX idx_messages_date "
+                             f"(date BETWEEN {self.date_range[0]} AND {self.date_range[1]})"
+                             if self.date_range else
+                             "    SCAN messages USING INDEX idx_messages_date (newest first)")
+            elif self.strategy == STRATEGY_PERSON:
+                lines.append("    SEARCH messages USING INDEX idx_messages_author_email_date")
+                lines.append("    SEARCH messages USING INDEX idx_messages_author_date")
+                lines.append("    SEARCH messages USING INDEX idx_messages_user_date")
+                if source in ('calendar', '*') and self._attendee_terms():
+                    lines.append("    SEARCH messages_fts attendees MATCH " + self._attendee_terms())
+            else:
+                if self.strategy == STRATEGY_FTS_FILTERED:
+                    index = ('idx_messages_date' if self.driver == 'date'
+                             else 'idx_messages_author_email_date, idx_messages_author_date, '
+                                  'idx_messages_user_date')
+                    lines.append(f"    ROWIDS FROM messages USING INDEX {index}")
+                    lines.append(f"    PROBE messages_fts MATCH {self.fts_query} PER ROWID")
+                else:
+                    lines.append(f"    SCAN messages_fts MATCH {self.fts_query}")
+                lines.append("    ORDER BY rank, id")
+        for name, estimate in self.estimates.items():
+            lines.append(f"  ESTIMATE {name}: {'unknown' if estimate is None else estimate}")
+        if self.reason:
+            lines.append(f"  REASON {self.reason}")
+        return lines
+
+    def _attendee_terms(self) -> Optional[str]:
+        emails = [p for p in self.person_identifiers if '@' in p]
+        if not emails:
+            return None
+        return ' OR '.join(_quote_fts(email) for email in emails)
+
+
+def _quote_fts(term: str) -> str:
+    """Quote a term as an FTS5 string so punctuation is never parsed as syntax"""
+    return '"' + term.replace('"', '""') + '"'
+
+
+class QueryPlanner:
+    """
+    Cost-based planner and executor for ParsedQuery objects
+
+    Features:
+    - Intent-aware routing (statistics to rollups, person activity to author indexes)
+    - Capped selectivity probes for FTS, person and date-range predicates
+    - Concurrent per-source subqueries merged by sort key
+    - Keyset cursors bound to the chosen plan
+    """
+
+    def __init__(self, db, selectivity_ratio: float = 0.1, estimate_cap: int = 5000,
+                 max_workers: Optional[int] = None, person_resolver: Optional[PersonResolver] = None):
+        """
+        Initialize planner
+
+        Args:
+            db: SearchDatabase providing pooled connections
+            selectivity_ratio: Drive FTS from a B-tree index when that index is
+                               estimated to return at most this fraction of the FTS rows
+            estimate_cap: Upper bound on rows counted by each selectivity probe
+            max_workers: Threads for per-source subqueries (default: db pool size)
+            person_resolver: Resolves person names to emails and Slack IDs; without
+                             it only emails and Slack IDs are used as person filters
+        """
+        self.db = db
+        self.person_resolver = person_resolver
+        self.selectivity_ratio = selectivity_ratio
+        self.estimate_cap = estimate_cap
+        self.max_workers = max_workers or getattr(db, 'pool_size', 3)
+
+    # Planning
+
+    def plan(self, parsed: ParsedQuery, limit: int = 10,
+             date_range: Optional[Tuple[str, str]] = None) -> QueryPlan:
+        """
+        Choose an execution plan for a parsed query
+
+        Args:
+            parsed: Output of QueryEngine.parse_query (with request overrides applied)
+            limit: Results per page
+            date_range: (start_date, end_date) resolved from parsed.time_filter
+
+        Returns:
+            QueryPlan with strategy, estimates and reason
+        """
+        sources = list(dict.fromkeys(parsed.sources or []))
+        person_identifiers = self._person_identifiers(parsed)
+        # An unresolved name stays a search term; a resolved one is answered by the filter
+        person_words = self._person_names(parsed) + person_identifiers if person_identifiers else []
+        fts_query = self.build_fts_query(parsed, date_range is not None, person_words)
+        plan = QueryPlan(strategy=STRATEGY_FTS, sources=sources, fts_query=fts_query,
+                         date_range=date_range, person_identifiers=person_identifiers,
+                         limit=limit)
+
+        if parsed.intent == QueryIntent.SHOW_STATISTICS:
+            plan.strategy = STRATEGY_ROLLUP
+            plan.fts_query = None
+            plan.reason = "statistics intent answered from per-day rollups"
+            return plan
+
+        if person_identifiers:
+            plan.estimates['person_index'] = self._estimate_person(person_identifiers, date_range)
+        if date_range:
+            plan.estimates['time_index'] = self._estimate_time(date_range)
+
+        if not fts_query:
+            if person_identifiers:
+                plan.strategy = STRATEGY_PERSON
+                plan.reason = "no search terms; person filter served by author indexes"
+            else:
+                plan.strategy = STRATEGY_TIME
+                plan.reason = ("no search terms; date range served by date index" if date_range
+                               else "no search terms; newest records from date index")
+            return plan
+
+        fts_estimate = self._estimate_fts(fts_query)
+        plan.estimates['fts'] = fts_estimate
+
+        # Pick the most selective B-tree index as a rowid driver if it is much
+        # narrower than the FTS doclist; otherwise let FTS drive and filter rows
+        candidates = [(estimate, name) for name, estimate in plan.estimates.items()
+                      if name != 'fts' and estimate is not None]
+        if candidates and fts_estimate:
+            estimate, name = min(candidates)
+            if estimate <= fts_estimate * self.selectivity_ratio:
+                plan.strategy = STRATEGY_FTS_FILTERED
+                plan.driver = 'person' if name == 'person_index' else 'date'
+                plan.reason = (f"{name} (~{estimate} rows) is more selective than "
+                               f"FTS (~{fts_estimate} rows)")
+                return plan
+
+        plan.reason = (f"FTS (~{fts_estimate} rows) drives; filters applied to matches"
+                       if fts_estimate else "FTS has no matches; cheapest path")
+        return plan
+
+    def build_fts_query(self, parsed: ParsedQuery, has_time_filter: bool = False,
+                        person_words: Optional[List[str]] = None) -> Optional[str]:
+        """
+        Build an FTS5 expression from parsed keywords
+
+        Multi-word keywords are split into terms, duplicates are dropped, and
+        words already expressed by the time or person filter are removed so
+        they are answered by indexes rather than required in the text.
+
+        Args:
+            parsed: Parsed query
+            has_time_filter: Whether a date range filter applies
+            person_words: Names and identifiers of a resolved person filter
+
+        Returns:
+            Quoted, implicitly AND-ed FTS5 query, or None if no terms remain
+        """
+        excluded = set(TIME_WORDS) if has_time_filter else set()
+        for words in person_words or []:
+            excluded.update(words.lower().split())
+
+        terms = []
+        for keyword in parsed.keywords or []:
+            for word in str(keyword).split():
+                word = word.strip().lower()
+                if word and word not in excluded and word not in terms:
+                    terms.append(word)
+
+        if not terms:
+            return None
+        return ' '.join(_quote_fts(term) for term in terms)
+
+    @staticmethod
+    def _person_names(parsed: ParsedQuery) -> List[str]:
+        names = []
+        for name in [parsed.person_filter] + list(parsed.person_variants or []):
+            if isinstance(name, str) and name.strip() and name.strip() not in names:
+                names.append(name.strip())
+        return names
+
+    def _person_identifiers(self, parsed: ParsedQuery) -> List[str]:
+        """
+        Emails and Slack IDs the person filter stands for
+
+        The filter itself counts when it already is an email or Slack ID.
+        Otherwise the first of the filter and its variants that PersonResolver
+        knows supplies the person's email and Slack ID.
+
+        Returns:
+            Identifiers to filter on, empty if the person is not resolved
+        """
+        names = self._person_names(parsed)
+        identifiers = [name for name in names[:1] if '@' in name or SLACK_ID_PATTERN.match(name)]
+
+        if self.person_resolver:
+            for name in names:
+                person_ids = self.person_resolver.get_cross_system_ids(name)
+                if person_ids:
+                    identifiers.extend(person_ids[key] for key in ('email', 'slack_id')
+                                       if person_ids.get(key) and person_ids[key] not in identifiers)
+                    break
+
+        return identifiers
+
+    # Selectivity probes (each counts at most estimate_cap rows)
+
+    def _capped_count(self, sql: str, params: List[Any]) -> Optional[int]:
+        try:
+            with self.db.connection() as conn:
+                row = conn.execute(
+                    f"SELECT COUNT(*) FROM ({sql} LIMIT ?)", params + [self.estimate_cap]
+                ).fetchone()
+            return row[0]
+        except Exception as e:
+            logger.warning(f"Selectivity probe failed: {e}")
+            return None
+
+    def _estimate_fts(self, fts_query: str) -> Optional[int]:
+        return self._capped_count(
+            "SELECT 1 FROM messages_fts WHERE messages_fts MATCH ?", [fts_query])
+
+    def _estimate_time(self, date_range: Tuple[str, str]) -> Optional[int]:
+        return self._capped_count(
+            "SELECT 1 FROM messages WHERE date BETWEEN ? AND ?", list(date_range))
+
+    def _estimate_person(self, identifiers: List[str],
+                         date_range: Optional[Tuple[str, str]]) -> Optional[int]:
+        sql, params = self._person_rowid_sql(identifiers, date_range)
+        return self._capped_count(sql, params)
+
+    def _person_rowid_sql(self, identifiers: List[str],
+                          date_range: Optional[Tuple[str, str]]) -> Tuple[str, List[Any]]:
+        """Rowids authored by any identifier, one branch per person index"""
+        placeholders = ', '.join('?' for _ in identifiers)
+        date_sql = " AND date BETWEEN ? AND ?" if date_range else ""
+        branches = []
+        params: List[Any] = []
+        for expr in PERSON_EXPRS:
+            branches.append(f"SELECT id FROM messages WHERE {expr} IN ({placeholders}){date_sql}")
+            params.extend(identifiers)
+            if date_range:
+                params.extend(date_range)
+        return " UNION ".join(branches), params
+
+    # Execution
+
+    def execute(self, plan: QueryPlan, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Run a plan and return one page of results
+
+        Args:
+            plan: Plan from plan()
+            cursor: Continuation token from a previous page of the same plan
+
+        Returns:
+            Dict with 'results' (search() result shape) and 'next_cursor'
+
+        Raises:
+            InvalidCursorError: If cursor is malformed or was issued for another plan
+        """
+        if plan.strategy == STRATEGY_ROLLUP:
+            return {'results': self._run_rollup(plan), 'next_cursor': None}
+
+        after = decode_cursor(cursor, plan.fingerprint, key_length=2) if cursor else None
+        subqueries = plan.sources or [None]
+        fetch = plan.limit + 1
+
+        if len(subqueries) == 1:
+            per_source = [self._run_subquery(plan, subqueries[0], after, fetch)]
+        else:
+            workers = max(1, min(self.max_workers, len(subqueries)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                per_source = list(executor.map(
+                    lambda source: self._run_subquery(plan, source, after, fetch), subqueries))
+
+        # Each subquery is already sorted by the plan's key, so merging is a heap walk
+        if plan.strategy in RANKED_STRATEGIES:
+            merged = heapq.merge(*per_source, key=lambda row: (row[5], row[0]))
+        else:
+            merged = heapq.merge(*per_source, key=lambda row: (row[3], row[0]), reverse=True)
+
+        rows = []
+        seen_ids = set()
+        for row in merged:
+            if row[0] in seen_ids:
+                continue
+            seen_ids.add(row[0])
+            rows.append(row)
+            if len(rows) > plan.limit:
+                break
+
+        has_more = len(rows) > plan.limit
+        rows = rows[:plan.limit]
+
+        next_cursor = None
+        if has_more and rows:
+            last = rows[-1]
+            key = [last[5], last[0]] if plan.strategy in RANKED_STRATEGIES else [last[3], last[0]]
+            next_cursor = encode_cursor(key, plan.fingerprint)
+
+        return {'results': [self._row_to_result(row) for row in rows], 'next_cursor': next_cursor}
+
+    def _run_subquery(self, plan: QueryPlan, source: Optional[str],
+                      after: Optional[List[Any]], fetch: int) -> List[tuple]:
+        """Rows (id, content, source, date, metadata, rank) for one source, in plan order"""
+        if plan.strategy in RANKED_STRATEGIES:
+            sql, params = self._fts_sql(plan, source, after, fetch)
+        elif plan.strategy == STRATEGY_PERSON:
+            sql, params = self._person_sql(plan, source, after, fetch)
+        else:
+            sql, params = self._time_sql(plan, source, after, fetch)
+
+        with self.db.connection() as conn:
+            return conn.execute(sql, params).fetchall()
+
+    def _fts_sql(self, plan: QueryPlan, source: Optional[str], after: Optional[List[Any]],
+                 fetch: int) -> Tuple[str, List[Any]]:
+        where = ["messages_fts MATCH ?"]
+        params: List[Any] = [plan.fts_query]
+
+        if plan.strategy == STRATEGY_FTS_FILTERED and plan.driver == 'person':
+            rowid_sql, rowid_params = self._person_rowid_sql(plan.person_identifiers,
+                                                             plan.date_range)
+            where.append(f"fts.rowid IN ({rowid_sql})")
+            params.extend(rowid_params)
+        elif plan.strategy == STRATEGY_FTS_FILTERED:
+            where.append("fts.rowid IN (SELECT id FROM messages WHERE date BETWEEN ? AND ?)")
+            params.extend(plan.date_range)
+
+        if plan.person_identifiers and plan.driver != 'person':
+            rowid_sql, rowid_params = self._person_rowid_sql(plan.person_identifiers, None)
+            where.append(f"m.id IN ({rowid_sql})")
+            params.extend(rowid_params)
+        if source:
+            where.append("m.source = ?")
+            params.append(source)
+        if plan.date_range:
+            where.append("m.date BETWEEN ? AND ?")
+            params.extend(plan.date_range)
+        if after:
+            where.append("(fts.rank > ? OR (fts.rank = ? AND m.id > ?))")
+            params.extend([after[0], after[0], after[1]])
+
+        sql = f"""
+            SELECT m.id, m.content, m.source, m.date, m.metadata, fts.rank
+            FROM messages_fts fts
+            JOIN messages m ON m.id = fts.rowid
+            WHERE {' AND '.join(where)}
+            ORDER BY fts.rank, m.id LIMIT ?
+        """
+        params.append(fetch)
+        return sql, params
+
+    def _chronological_filters(self, plan: QueryPlan, source: Optional[str],
+                               after: Optional[List[Any]], prefix: str = "") -> Tuple[str, List[Any]]:
+        clauses = []
+        params: List[Any] = []
+        if source:
+            clauses.append(f"{prefix}source = ?")
+            params.append(source)
+        if plan.date_range:
+            clauses.append(f"{prefix}date BETWEEN ? AND ?")
+            params.extend(plan.date_range)
+        if after:
+            clauses.append(f"({prefix}date < ? OR ({prefix}date = ? AND {prefix}id < ?))")
+            params.extend([after[0], after[0], after[1]])
+        return ''.join(f" AND {clause}" for clause in clauses), params
+
+    def _person_sql(self, plan: QueryPlan, source: Optional[str], after: Optional[List[Any]],
+                    fetch: int) -> Tuple[str, List[Any]]:
+        filters, filter_params = self._chronological_filters(plan, source, after)
+        placeholders = ', '.join('?' for _ in plan.person_identifiers)
+        branch = """
+            SELECT * FROM (
+                SELECT id, content, source, date, metadata, NULL AS rank
+                FROM messages
+                WHERE {expr} IN ({placeholders}){filters}
+                ORDER BY date DESC, id DESC LIMIT ?
+            )
+        """
+        branches = []
+        params: List[Any] = []
+        for expr in PERSON_EXPRS:
+            branches.append(branch.format(expr=expr, placeholders=placeholders, filters=filters))
+            params.extend(plan.person_identifiers)
+            params.extend(filter_params)
+            params.append(fetch)
+
+        # Calendar attendees are not authors; their emails are in the FTS content
+        attendee_terms = plan._attendee_terms()
+        if attendee_terms and source in (None, 'calendar'):
+            fts_filters, fts_params = self._chronological_filters(plan, None, after, prefix="m.")
+            branches.append(f"""
+                SELECT * FROM (
+                    SELECT m.id, m.content, m.source, m.date, m.metadata, NULL AS rank
+                    FROM messages_fts fts
+                    JOIN messages m ON m.id = fts.rowid
+                    WHERE messages_fts MATCH ? AND m.source = 'calendar'{fts_filters}
+                    ORDER BY m.date DESC, m.id DESC LIMIT ?
+                )
+            """)
+            params.append(attendee_terms)
+            params.extend(fts_params)
+            params.append(fetch)
+
+        sql = " UNION ".join(branches) + " ORDER BY date DESC, id DESC LIMIT ?"
+        params.append(fetch)
+        return sql, params
+
+    def _time_sql(self, plan: QueryPlan, source: Optional[str], after: Optional[List[Any]],
+                  fetch: int) -> Tuple[str, List[Any]]:
+        filters, params = self._chronological_filters(plan, source, after)
+        sql = f"""
+            SELECT id, content, source, date, metadata, NULL AS rank
+            FROM messages INDEXED BY idx_messages_date
+            WHERE 1 = 1{filters}
+            ORDER BY date DESC, id DESC LIMIT ?
+        """
+        params.append(fetch)
+        return sql, params
+
+    def _run_rollup(self, plan: QueryPlan) -> List[Dict[str, Any]]:
+        where = []
+        params: List[Any] = []
+        if plan.sources:
+            where.append(f"source IN ({', '.join('?' for _ in plan.sources)})")
+            params.extend(plan.sources)
+        if plan.date_range:
+            where.append("date BETWEEN ? AND ?")
+            params.extend(plan.date_range)
+        where_sql = ("WHERE " + " AND ".join(where)) if where else ""
+
+        with self.db.connection() as conn:
+            rows = conn.execute(f"""
+                SELECT source, date, COUNT(*) FROM messages {where_sql}
+                GROUP BY source, date ORDER BY date DESC, source LIMIT ?
+            """, params + [plan.limit]).fetchall()
+
+        return [{
+            'content': f"{count} {source} records on {date}",
+            'source': source,
+            'date': date,
+            'metadata': {'record_count': count},
+            'relevance_score': None
+        } for source, date, count in rows]
+
+    @staticmethod
+    def _row_to_result(row: tuple) -> Dict[str, Any]:
+        _, content, source, date, metadata_json, rank = row
+        try:
+            metadata = json.loads(metadata_json) if metadata_json else {}
+        except json.JSONDecodeError:
+            metadata = {}
+        return {
+            'content': content,
+            'source': source,
+            'date': date,
+            'metadata': metadata,
+            'relevance_score': rank
+        }
@@ -11,7 +11,9 @@ This is the main orchestration engine that coordinates all four phases:
 
 Architecture:
 - MeetingPipeline: Main orchestration engine
-- PipelineState: Manages processing state and recovery
+- PipelineState: Caches per-file extractions and correlation state so
+  incremental runs only process new or changed files; new or changed files
+  are extracted on a process pool
 - OutputGenerator: Creates unified reports and dashboards
 - ProgressTracker: Real-time progress reporting
 
@@ -32,12 +34,14 @@ from enum import Enum
 
 # Phase imports
 try:
-    from ..collectors.email_collector import EmailCollector
-    from ..collectors.drive_collector import DriveCollector
+    from ..collectors.email_collector import EmailCollector, parse_eml
+    from ..collectors.drive_collector import DriveCollector, extract_docx_archive_record
     from ..correlators.meeting_correlator import MeetingCorrelator
     from ..correlators.correlation_models import CorrelationStatus, MatchType
     from ..queries.structured import StructuredExtractor
     from ..core.archive_writer import ArchiveWriter
+    from ..core.extraction_cache import extract_files_parallel
+    from .pipeline_state import PipelineState
     IMPORTS_AVAILABLE = True
 except ImportError as e:
     logging.warning(f"Could not import some components: {e}")
@@ -185,13 +189,22 @@ class ProgressTracker:
         self.logger.error(f"❌ {error}")
 
 
+def parse_email_record(file_path: str) -> Optional[Dict[str, Any]]:
+    """Parse one .eml file into an email record (module-level for extraction workers)"""
+    parsed_email = parse_eml(file_path)
+    return dict(parsed_email.__dict__) if parsed_email else None
+
+
 class MeetingPipeline:
     """Main orchestration engine for meeting notes processing"""
     
     def __init__(self, 
                  correlation_strategy = None,
                  min_correlation_confidence: float = 0.6,
-                 output_directory: Optional[str] = None):
+                 output_directory: Optional[str] = None,
+                 incremental: bool = True,
+                 state_path: Optional[str] = None,
+                 max_workers: Optional[int] = None):
         """
         Initialize meeting pipeline
         
@@ -199,9 +212,16 @@ class MeetingPipeline:
             correlation_strategy: Strategy for Phase 3 correlation
             min_correlation_confidence: Minimum confidence for correlations
             output_directory: Directory for output files (default: data/processed)
+            incremental: Reuse extractions of unchanged files and matches of
+                unchanged emails from previous runs
+            state_path: Pipeline state database (default: pipeline_state.db
+                in the output directory)
+            max_workers: Worker processes for extracting files (defaults to
+                the CPU count)
         """
         self.correlation_strategy = correlation_strategy
         self.min_correlation_confidence = min_correlation_confidence
+        self.max_workers = max_workers or os.cpu_count() or 1
         
         # Setup output directory
         if output_directory:
@@ -219,6 +239,11 @@ class MeetingPipeline:
         
         # Initialize components
         self._initialize_components()
+        
+        self.state = None
+        if incremental:
+            self.state = PipelineState(Path(state_path) if state_path else
+                                       self.output_directory / "pipeline_state.db")
     
     def _initialize_components(self):
         """Initialize pipeline components"""
@@ -251,13 +276,9 @@ class MeetingPipeline:
             if email_files:
                 # Process emails
                 try:
-                    result = self.email_collector.collect_from_directory(directory)
-                    email_records = result.email_records if hasattr(result, 'email_records') else []
-                    
-                    self.progress_tracker.update_progress(f"Successfully processed emails", result.emails_processed)
-                    
-                    if result.errors:
-                        errors.extend(result.errors)
+                    email_records = self._extract_records(email_files, 'email', parse_email_record, errors,
+                                                          scope=directory)
+                    self.progress_tracker.update_progress(f"Successfully processed emails", len(email_records))
                         
                 except Exception as e:
                     error_msg = f"Email processing failed: {e}"
@@ -308,17 +329,18 @@ class MeetingPipeline:
             
             # Process DOCX files
             try:
-                result = self.drive_collector.collect_local_docx_files(directory)
-                
-                self.progress_tracker.update_progress(f"Found DOCX files", result['files_found'])
-                self.progress_tracker.update_progress(f"Successfully processed", result['successful_extractions'])
+                if not self.drive_collector.docx_extractor:
+                    raise RuntimeError("DOCX extractor not available")
                 
-                # Convert to list format expected by correlation
-                doc_records = result.get('extracted_documents', [])
+                # Sorted like the email files, so doc order is stable across runs
+                docx_files = sorted(self.drive_collector.docx_extractor.detect_meeting_notes_docx(directory))
+                self.progress_tracker.update_progress(f"Found DOCX files", len(docx_files))
                 
-                if result['failed_extractions'] > 0:
-                    error_msg = f"{result['failed_extractions']} DOCX files failed processing"
-                    errors.append(error_msg)
+                doc_records = self._extract_records(
+                    docx_files, 'doc', extract_docx_archive_record, errors,
+                    archive=self.drive_collector.archive_docx_records, scope=directory
+                )
+                self.progress_tracker.update_progress(f"Successfully processed", len(doc_records))
                     
             except Exception as e:
                 error_msg = f"DOCX processing failed: {e}"
@@ -357,8 +379,54 @@ class MeetingPipeline:
                 data=[]
             )
     
+    def _extract_records(self, file_paths: List[str], file_kind: str, extract,
+                         errors: List[str], archive=None,
+                         scope: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Extract a record from each file, reusing cached extractions of unchanged files
+        
+        Args:
+            file_paths: Files to extract
+            file_kind: 'email' or 'doc', also the record id prefix
+            extract: Module-level function extracting one file into a record
+                (or None), run on a process pool
+            errors: List collecting per-file extraction errors
+            archive: Optional function archiving the newly extracted records
+                in one batch
+            scope: Directory the files were found in, so cached extractions
+                of other directories sharing the state are kept
+            
+        Returns:
+            Extracted records with ids stable across runs
+        """
+        if self.state:
+            extractions = self.state.extract_files(file_paths, file_kind, extract, self.max_workers,
+                                                   scope=scope)
+            reused = sum(1 for extraction in extractions if extraction.cached)
+            self.progress_tracker.update_progress(f"Reused cached extractions", reused)
+        else:
+            extractions = extract_files_parallel(file_paths, extract, self.max_workers)
+        
+        records = []
+        for extraction in extractions:
+            if extraction.error:
+                error_msg = f"Failed to process {os.path.basename(extraction.file_path)}: {extraction.error}"
+                errors.append(error_msg)
+                self.logger.warning(error_msg)
+            elif extraction.record is not None:
+                extraction.record.setdefault('id', f"{file_kind}_{extraction.record_id}")
+                records.append(extraction.record)
+        
+        # Cached records were archived when they were first extracted
+        if archive:
+            archive([extraction.record for extraction in extractions
+                     if extraction.record is not None and not extraction.cached])
+        
+        return records
+    
     def _execute_phase_3(self, email_records: List[Dict[str, Any]], 
-                        doc_records: List[Dict[str, Any]]) -> PhaseResult:
+                        doc_records: List[Dict[str, Any]],
+                        directory: Optional[str] = None) -> PhaseResult:
         """Execute Phase 3: Meeting-Email Correlation"""
         phase = PipelinePhase.CORRELATION
         start_time = datetime.now(timezone.utc)
@@ -368,8 +436,15 @@ class MeetingPipeline:
         try:
             self.progress_tracker.start_phase(phase, f"- Correlating {len(email_records)} emails with {len(doc_records)} docs")
             
-            # Run correlation
-            correlation_results = self.correlator.correlate_meetings(email_records, doc_records)
+            # Run correlation, reusing matches of the previous run on this directory
+            previous_state = None
+            if self.state and directory:
+                previous_state = self.state.load_correlation_state(directory)
+            
+            correlation_results = self.correlator.correlate_meetings(email_records, doc_records, previous_state)
+            
+            if previous_state is not None and correlation_results.correlation_state is not None:
+                self.state.save_correlation_state(directory, correlation_results.correlation_state)
             
             self.progress_tracker.update_progress(f"Successful correlations", len(correlation_results.correlated_meetings))
             self.progress_tracker.update_progress(f"Orphaned emails", len(correlation_results.orphaned_emails))
@@ -560,7 +635,7 @@ class MeetingPipeline:
             # Phase 3: Correlation (only if we have data)
             correlation_results = None
             if email_records or doc_records:
-                phase3_result = self._execute_phase_3(email_records, doc_records)
+                phase3_result = self._execute_phase_3(email_records, doc_records, directory)
                 phase_results.append(phase3_result)
                 correlation_results = phase3_result.data
             else:
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Pipeline State - Incremental processing state for the meeting pipeline
+
+Re-extracting every email and DOCX file and re-correlating every meeting
+makes daily pipeline runs scale with the whole notes history. This module
+keeps what a run computed so the next run only redoes new or changed work:
+
+- Extraction results per input file, validated against (size, mtime) and
+  the SHA-256 of the file contents. An unchanged file reuses its record
+  without being parsed; a touched or copied file with the same contents is
+  only hashed.
+- The correlation state of each processed directory (see
+  MeetingCorrelator.match_emails_incremental), so unchanged emails keep
+  their matches and are only scored against new docs.
+
+State lives in a SQLite database next to the pipeline output. Databases
+written by another PIPELINE_STATE_VERSION are reset.
+
+Architecture:
+- ExtractionCache (src/core/extraction_cache.py): Per-file extraction
+  results and the process-pool extraction of changed files
+- PipelineState: Extraction cache plus the correlation state of each
+  processed directory
+
+Usage:
+    from src.orchestrators.pipeline_state import PipelineState
+    state = PipelineState(output_directory / "pipeline_state.db")
+    extractions = state.extract_files(email_files, 'email', parse_email_record)
+    previous = state.load_correlation_state(directory)
+"""
+
+import json
+import logging
+import os
+import sqlite3
+from datetime import datetime, timezone
+from typing import Any, Dict
+
+from ..core.extraction_cache import ExtractionCache
+
+logger = logging.getLogger(__name__)
+
+# Bump when extraction records or correlation state change shape
+PIPELINE_STATE_VERSION = 3
+
+
+class PipelineState(ExtractionCache):
+    """SQLite store for per-file extraction results and correlation state"""
+
+    tables = ('extraction_cache', 'correlation_state')
+
+    def _schema_version(self) -> int:
+        return PIPELINE_STATE_VERSION
+
+    def _create_tables(self, conn: sqlite3.Connection):
+        super()._create_tables(conn)
+
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS correlation_state (
+                directory TEXT PRIMARY KEY,
+                state TEXT,  -- JSON
+                updated_at TEXT
+            )
+        """)
+
+    def load_correlation_state(self, directory: str) -> Dict[str, Any]:
+        """
+        Get the correlation state stored for a directory
+
+        Args:
+            directory: Processed directory
+
+        Returns:
+            Stored correlation state, or {} if there is none
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute("SELECT state FROM correlation_state WHERE directory = ?",
+                               (self._directory_key(directory),)).fetchone()
+
+        if not row:
+            return {}
+        try:
+            return json.loads(row[0])
+        except ValueError as e:
+            logger.warning(f"Ignoring unreadable correlation state for {directory}: {e}")
+            return {}
+
+    def save_correlation_state(self, directory: str, state: Dict[str, Any]):
+        """
+        Store the correlation state of a directory
+
+        Args:
+            directory: Processed directory
+            state: correlation_state of the run's correlation results
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO correlation_state (directory, state, updated_at)
+                VALUES (?, ?, ?)
+            """, (self._directory_key(directory), json.dumps(state), datetime.now(timezone.utc).isoformat()))
+            conn.commit()
+
+    @staticmethod
+    def _directory_key(directory: str) -> str:
+        return os.path.realpath(directory)
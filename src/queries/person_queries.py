@@ -24,6 +24,8 @@ from datetime import datetime, date, timedelta
 from collections import defaultdict, Counter
 
 from .time_utils import parse_time_expression, TimeParsingError
+from ..search.database import AUTHOR_EMAIL_EXPR, AUTHOR_EXPR
+from ..search.pagination import encode_cursor, decode_cursor, query_fingerprint
 
 logger = logging.getLogger(__name__)
 
@@ -91,7 +93,10 @@ class PersonResolver:
             from ..collectors.employee_collector import EmployeeCollector
             
             collector = EmployeeCollector()
-            employee_data = collector.collect()
+            try:
+                employee_data = collector.collect()
+            finally:
+                collector.close()
             self.load_employee_data(employee_data)
             
         except ImportError:
@@ -329,11 +334,15 @@ class PersonQueryEngine:
         Args:
             person_identifier: Email, Slack ID, or name
             limit: Maximum number of messages to return
-            offset: Number of messages to skip
+            offset: Number of messages to skip (prefer get_message_page cursors
+                    for deep paging - offsets re-scan every skipped row)
             
         Returns:
             List of message records
         """
+        if offset <= 0:
+            return self.get_message_page(person_identifier, limit=limit)['messages']
+        
         try:
             person_ids = self.person_resolver.get_cross_system_ids(person_identifier)
             if not person_ids:
@@ -341,44 +350,122 @@ class PersonQueryEngine:
             
             conn = self._get_connection()
             
-            # Query messages with person attribution
-            query = """
+            # Legacy offset paging, kept for callers that still pass offset
+            query = f"""
                 SELECT id, content, source, date, metadata
                 FROM messages
-                WHERE json_extract(metadata, '$.author_email') = ? 
-                   OR json_extract(metadata, '$.author') = ?
-                ORDER BY date DESC
+                WHERE {AUTHOR_EMAIL_EXPR} = ? 
+                   OR {AUTHOR_EXPR} = ?
+                ORDER BY date DESC, id DESC
                 LIMIT ? OFFSET ?
             """
             
             params = (person_ids['email'], person_ids['slack_id'], limit, offset)
             cursor = conn.execute(query, params)
             
-            messages = []
-            for row in cursor:
-                message = {
-                    'id': row['id'],
-                    'content': row['content'],
-                    'source': row['source'],
-                    'date': row['date'],
-                    'timestamp': row['date']  # Compatibility alias
-                }
-                
-                # Parse metadata
-                if row['metadata']:
-                    try:
-                        message['metadata'] = json.loads(row['metadata'])
-                    except (json.JSONDecodeError, TypeError):
-                        message['metadata'] = row['metadata']
-                
-                messages.append(message)
-            
-            return messages
+            return [self._row_to_message(row) for row in cursor]
             
         except Exception as e:
             logger.error(f"Error retrieving messages for person: {str(e)}")
             return []
     
+    def get_message_page(self, person_identifier: str, limit: int = 50,
+                         cursor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Retrieve one page of message history using keyset pagination
+        
+        Pages are ordered by (date, id) descending. Each author column is read
+        through its own (author, date, id) index with a bounded LIMIT and the
+        two branches are merged, so every page costs the same no matter how far
+        into a person's history it is.
+        
+        Args:
+            person_identifier: Email, Slack ID, or name
+            limit: Maximum number of messages per page
+            cursor: Continuation token from a previous page, None for the first page
+            
+        Returns:
+            Dict with 'messages' and 'next_cursor' (None when history is exhausted)
+            
+        Raises:
+            InvalidCursorError: If cursor is malformed or was issued for another person
+        """
+        empty_page = {'messages': [], 'next_cursor': None}
+        
+        person_ids = self.person_resolver.get_cross_system_ids(person_identifier)
+        if not person_ids:
+            return empty_page
+        
+        fingerprint = query_fingerprint('person_messages', person_ids['email'], person_ids['slack_id'])
+        after = decode_cursor(cursor, fingerprint, key_length=2) if cursor else None
+        
+        try:
+            conn = self._get_connection()
+            
+            keyset_sql = ""
+            keyset_params: tuple = ()
+            if after:
+                last_date, last_id = after
+                keyset_sql = "AND (date < ? OR (date = ? AND id < ?))"
+                keyset_params = (last_date, last_date, last_id)
+            
+            branch = """
+                SELECT * FROM (
+                    SELECT id, content, source, date, metadata
+                    FROM messages
+                    WHERE {author_expr} = ? {keyset}
+                    ORDER BY date DESC, id DESC
+                    LIMIT ?
+                )
+            """
+            query = (
+                branch.format(author_expr=AUTHOR_EMAIL_EXPR, keyset=keyset_sql)
+                + " UNION "
+                + branch.format(author_expr=AUTHOR_EXPR, keyset=keyset_sql)
+                + " ORDER BY date DESC, id DESC LIMIT ?"
+            )
+            
+            # Fetch one extra row to know whether another page exists
+            fetch = limit + 1
+            params = (
+                (person_ids['email'],) + keyset_params + (fetch,)
+                + (person_ids['slack_id'],) + keyset_params + (fetch,)
+                + (fetch,)
+            )
+            rows = conn.execute(query, params).fetchall()
+            
+            messages = [self._row_to_message(row) for row in rows[:limit]]
+            
+            next_cursor = None
+            if len(rows) > limit and messages:
+                last = messages[-1]
+                next_cursor = encode_cursor([last['date'], last['id']], fingerprint)
+            
+            return {'messages': messages, 'next_cursor': next_cursor}
+            
+        except Exception as e:
+            logger.error(f"Error retrieving messages for person: {str(e)}")
+            return empty_page
+    
+    def _row_to_message(self, row: sqlite3.Row) -> Dict[str, Any]:
+        """Convert a messages row into a message record"""
+        message = {
+            'id': row['id'],
+            'content': row['content'],
+            'source': row['source'],
+            'date': row['date'],
+            'timestamp': row['date']  # Compatibility alias
+        }
+        
+        # Parse metadata
+        if row['metadata']:
+            try:
+                message['metadata'] = json.loads(row['metadata'])
+            except (json.JSONDecodeError, TypeError):
+                message['metadata'] = row['metadata']
+        
+        return message
+    
     def get_meetings_for_person(self, person_identifier: str, time_expression: str) -> List[Dict[str, Any]]:
         """
         Get meetings attended by person in time period
@@ -2,6 +2,12 @@
 Calendar Availability Engine - Timezone-Aware Free Slot Finding
 CRITICAL FIX: All datetime objects are timezone-aware using pytz
 
+Common availability across many people and days is computed on a
+BusyMatrix: one boolean bucket per minute (or coarser resolution) of
+each person's working day, built once from normalized events, ANDed
+across attendees and scanned for free runs. Without NumPy the engine
+falls back to per-calendar slot lists and pairwise intersection.
+
 References:
 - src/core/compression.py - Atomic operation patterns for data safety
 - tests/fixtures/mock_calendar_data.py - Calendar event structure
@@ -11,10 +17,19 @@ References:
 import pytz
 import logging
 from datetime import datetime, timedelta, time
-from typing import List, Dict, Any, Optional, Tuple, Union
+from typing import List, Dict, Any, Optional, Sequence, Tuple, Union
 from dataclasses import dataclass
 import warnings
 
+from ..core.lazy_import import LazyImportError, lazy_import
+
+try:
+    # Deferred: CLI entry points import this module before parsing arguments
+    np = lazy_import('numpy')
+    HAS_NUMPY = True
+except LazyImportError:
+    HAS_NUMPY = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -55,6 +70,192 @@ class FreeSlot:
             'duration_hours': self.duration_hours,
             'timezone': self.timezone
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'FreeSlot':
+        """Rebuild a slot from to_dict() output, in its own timezone"""
+        target_tz = pytz.timezone(data['timezone'])
+        return cls(
+            start=datetime.fromisoformat(data['start']).astimezone(target_tz),
+            end=datetime.fromisoformat(data['end']).astimezone(target_tz),
+            duration_minutes=data['duration_minutes'],
+            timezone=data['timezone']
+        )
+
+
+class BusyMatrix:
+    """
+    Busy time of several people across several working days
+
+    Busy intervals are clipped to each day's working window once, at
+    construction. Queries rasterize them into a (people, days, buckets)
+    boolean matrix per buffer size, AND the free buckets across the
+    requested people and report runs long enough for the meeting.
+
+    Intervals are widened to whole buckets, so sub-bucket edges only ever
+    shrink a slot. Empty intervals block time only through their buffer.
+    """
+
+    def __init__(
+        self,
+        busy_intervals: Sequence[Sequence[Tuple[float, float]]],
+        dates: Sequence[object],
+        working_hours: Tuple[int, int] = (9, 17),
+        timezone: str = 'UTC',
+        resolution_minutes: int = 1
+    ):
+        """
+        Clip busy intervals to the working day of each date
+
+        Args:
+            busy_intervals: Per person, (start, end) POSIX timestamps in seconds
+            dates: Days to cover (date objects)
+            working_hours: (start_hour, end_hour) in the given timezone
+            timezone: Timezone of working hours and of returned slots
+            resolution_minutes: Bucket size in minutes
+        """
+        if not HAS_NUMPY:
+            raise ImportError("numpy is required for BusyMatrix")
+        if resolution_minutes < 1:
+            raise ValueError("resolution_minutes must be at least 1")
+        try:
+            self.target_tz = pytz.timezone(timezone)
+        except pytz.exceptions.UnknownTimeZoneError:
+            raise ValueError(f"Invalid timezone: {timezone}")
+
+        self.dates = sorted(set(dates))
+        self.people = len(busy_intervals)
+        self.resolution_minutes = resolution_minutes
+        self._bucket_seconds = resolution_minutes * 60
+
+        # Day windows as POSIX seconds; DST days may be an hour longer or shorter
+        self._day_starts = np.array([
+            self.target_tz.localize(datetime.combine(day, time(working_hours[0]))).timestamp()
+            for day in self.dates
+        ], dtype=np.float64).reshape(-1)
+        day_ends = np.array([
+            self.target_tz.localize(datetime.combine(day, time(working_hours[1]))).timestamp()
+            for day in self.dates
+        ], dtype=np.float64).reshape(-1)
+        self._day_buckets = np.maximum(
+            (day_ends - self._day_starts) // self._bucket_seconds, 0).astype(np.int64)
+        self.buckets = int(self._day_buckets.max()) if self.dates else 0
+
+        person_ids, day_ids, starts, ends = [], [], [], []
+        for person, intervals in enumerate(busy_intervals):
+            if not len(intervals):
+                continue
+            spans = np.asarray(intervals, dtype=np.float64).reshape(-1, 2)
+            spans = spans[spans[:, 1] >= spans[:, 0]]
+
+            # Days whose window overlaps each interval: day_end > start and day_start < end
+            first = np.searchsorted(day_ends, spans[:, 0], side='right')
+            last = np.searchsorted(self._day_starts, spans[:, 1], side='left') - 1
+            counts = np.maximum(last - first + 1, 0)
+            if not counts.any():
+                continue
+
+            rows = np.repeat(np.arange(len(spans)), counts)
+            days = np.repeat(first, counts) + (
+                np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts))
+            origin = self._day_starts[days]
+            person_ids.append(np.full(len(rows), person, dtype=np.int64))
+            day_ids.append(days)
+            starts.append(np.maximum(spans[rows, 0], origin) - origin)
+            ends.append(np.minimum(spans[rows, 1], day_ends[days]) - origin)
+
+        def _concat(parts, dtype):
+            return np.concatenate(parts) if parts else np.empty(0, dtype=dtype)
+
+        # Offsets in seconds from the start of the clipped interval's working day
+        self._person_ids = _concat(person_ids, np.int64)
+        self._day_ids = _concat(day_ids, np.int64)
+        self._starts = _concat(starts, np.float64)
+        self._ends = _concat(ends, np.float64)
+        self._busy_cache: Dict[int, Any] = {}
+
+    def busy(self, buffer_minutes: int = 0) -> 'np.ndarray':
+        """
+        Busy buckets for every person and day
+
+        Args:
+            buffer_minutes: Time kept free before and after each busy interval
+
+        Returns:
+            Boolean array of shape (people, days, buckets); buckets past the
+            end of a short (DST) day are marked busy
+        """
+        cached = self._busy_cache.get(buffer_minutes)
+        if cached is not None:
+            return cached
+
+        buckets = self.buckets
+        buffer_seconds = buffer_minutes * 60
+        limits = self._day_buckets[self._day_ids]
+        first = np.clip(np.floor((self._starts - buffer_seconds) / self._bucket_seconds),
+                        0, limits).astype(np.int64)
+        last = np.clip(np.ceil((self._ends + buffer_seconds) / self._bucket_seconds),
+                       0, limits).astype(np.int64)
+        keep = last > first
+
+        # Difference array: +1 where an interval starts, -1 where it ends
+        marks = np.zeros((self.people, len(self.dates), buckets + 1), dtype=np.int32)
+        np.add.at(marks, (self._person_ids[keep], self._day_ids[keep], first[keep]), 1)
+        np.add.at(marks, (self._person_ids[keep], self._day_ids[keep], last[keep]), -1)
+        busy = np.cumsum(marks, axis=2)[:, :, :buckets] > 0
+        busy |= np.arange(buckets) >= self._day_buckets[:, None]
+
+        self._busy_cache[buffer_minutes] = busy
+        return busy
+
+    def common_slots(
+        self,
+        duration_minutes: int,
+        buffer_minutes: int = 0,
+        people: Optional[Sequence[int]] = None
+    ) -> List[FreeSlot]:
+        """
+        Find slots where all requested people are free
+
+        Args:
+            duration_minutes: Minimum slot duration required
+            buffer_minutes: Buffer time required around existing meetings
+            people: Indices into busy_intervals (default: everyone)
+
+        Returns:
+            Free slots in chronological order
+        """
+        if not self.dates or not self.buckets:
+            return []
+
+        busy = self.busy(buffer_minutes)
+        if people is not None:
+            busy = busy[list(people)]
+        free = ~busy.any(axis=0)
+
+        # Run-length scan: +1/-1 edges of each day's free runs, padded so runs close
+        padded = np.zeros((len(self.dates), self.buckets + 2), dtype=np.int8)
+        padded[:, 1:-1] = free
+        edges = np.diff(padded, axis=1)
+        run_days, run_starts = np.nonzero(edges == 1)
+        _, run_ends = np.nonzero(edges == -1)
+        lengths = (run_ends - run_starts) * self.resolution_minutes
+        wanted = lengths >= max(duration_minutes, 1)
+
+        timezone = str(self.target_tz)
+        slots = []
+        for day, start, end, minutes in zip(run_days[wanted], run_starts[wanted],
+                                            run_ends[wanted], lengths[wanted]):
+            origin = self._day_starts[day]
+            slots.append(FreeSlot(
+                start=datetime.fromtimestamp(origin + start * self._bucket_seconds,
+                                             pytz.UTC).astimezone(self.target_tz),
+                end=datetime.fromtimestamp(origin + end * self._bucket_seconds,
+                                           pytz.UTC).astimezone(self.target_tz),
+                duration_minutes=int(minutes),
+                timezone=timezone
+            ))
+        return slots
 
 
 class AvailabilityEngine:
@@ -152,7 +353,8 @@ class AvailabilityEngine:
         duration_minutes: int,
         working_hours: Tuple[int, int] = (9, 17),
         timezone: str = 'UTC',
-        date: Optional[object] = None
+        date: Optional[object] = None,
+        buffer_minutes: int = 0
     ) -> List[FreeSlot]:
         """
         Find time slots that are free across ALL calendars
@@ -164,6 +366,7 @@ class AvailabilityEngine:
             working_hours: (start_hour, end_hour) in specified timezone
             timezone: Target timezone for results
             date: Target date (date object)
+            buffer_minutes: Buffer time required between meetings
             
         Returns:
             List of commonly available time slots
@@ -171,6 +374,113 @@ class AvailabilityEngine:
         if not calendars:
             return []
         
+        if date is None:
+            date = datetime.now(self._target_timezone(timezone)).date()
+        
+        return self.find_common_slots_in_range(
+            calendars=calendars,
+            duration_minutes=duration_minutes,
+            start_date=date,
+            end_date=date,
+            working_hours=working_hours,
+            timezone=timezone,
+            buffer_minutes=buffer_minutes
+        )
+    
+    def find_common_slots_in_range(
+        self,
+        calendars: List[List[Dict[str, Any]]],
+        duration_minutes: int,
+        start_date: object,
+        end_date: object,
+        working_hours: Tuple[int, int] = (9, 17),
+        timezone: str = 'UTC',
+        buffer_minutes: int = 0
+    ) -> List[FreeSlot]:
+        """
+        Find time slots that are free across ALL calendars on every day of a range
+        
+        Events are normalized once for the whole range; each day is then a
+        row of the busy matrix rather than another pass over the calendars.
+        
+        Args:
+            calendars: List of calendar event lists
+            duration_minutes: Minimum slot duration required
+            start_date: First day to search (date object)
+            end_date: Last day to search, inclusive (date object)
+            working_hours: (start_hour, end_hour) in specified timezone
+            timezone: Target timezone for results
+            buffer_minutes: Buffer time required between meetings
+            
+        Returns:
+            Commonly available time slots in chronological order
+        """
+        if not calendars:
+            return []
+        
+        self._target_timezone(timezone)
+        dates = [start_date + timedelta(days=offset)
+                 for offset in range((end_date - start_date).days + 1)]
+        
+        if HAS_NUMPY:
+            matrix = self.build_busy_matrix(calendars, dates, working_hours, timezone)
+            common_slots = matrix.common_slots(duration_minutes, buffer_minutes)
+        else:
+            common_slots = []
+            for day in dates:
+                common_slots.extend(self._find_common_slots_pairwise(
+                    calendars, duration_minutes, working_hours, timezone, day, buffer_minutes))
+        
+        self.logger.info(f"Found {len(common_slots)} common slots across {len(calendars)} calendars "
+                         f"and {len(dates)} days")
+        return common_slots
+    
+    def build_busy_matrix(
+        self,
+        calendars: List[List[Dict[str, Any]]],
+        dates: Sequence[object],
+        working_hours: Tuple[int, int] = (9, 17),
+        timezone: str = 'UTC',
+        resolution_minutes: int = 1
+    ) -> BusyMatrix:
+        """
+        Normalize every calendar once into a BusyMatrix for repeated queries
+        
+        Args:
+            calendars: List of calendar event lists, one per person
+            dates: Days to cover (date objects)
+            working_hours: (start_hour, end_hour) in specified timezone
+            timezone: Target timezone for working hours and results
+            resolution_minutes: Bucket size in minutes
+            
+        Returns:
+            BusyMatrix with one row per calendar
+        """
+        busy_intervals = []
+        for calendar in calendars:
+            intervals = []
+            for event in calendar:
+                normalized_event = self._normalize_event_to_timezone(event, timezone)
+                if not normalized_event:
+                    continue
+                start = normalized_event.get('start')
+                end = normalized_event.get('end')
+                if isinstance(start, datetime) and isinstance(end, datetime):
+                    intervals.append((start.timestamp(), end.timestamp()))
+            busy_intervals.append(intervals)
+        
+        return BusyMatrix(busy_intervals, dates, working_hours, timezone, resolution_minutes)
+    
+    def _find_common_slots_pairwise(
+        self,
+        calendars: List[List[Dict[str, Any]]],
+        duration_minutes: int,
+        working_hours: Tuple[int, int],
+        timezone: str,
+        date: object,
+        buffer_minutes: int = 0
+    ) -> List[FreeSlot]:
+        """Intersect per-calendar free slot lists (fallback without NumPy)"""
         # Get free slots for each calendar individually
         calendar_slots = []
         for calendar in calendars:
@@ -179,7 +489,8 @@ class AvailabilityEngine:
                 duration_minutes=duration_minutes,
                 working_hours=working_hours,
                 date=date,
-                timezone=timezone
+                timezone=timezone,
+                buffer_minutes=buffer_minutes
             )
             calendar_slots.append(slots)
         
@@ -193,13 +504,17 @@ class AvailabilityEngine:
             common_slots = self._intersect_slot_lists(common_slots, other_slots)
         
         # Filter by minimum duration requirement
-        common_slots = [
+        return [
             slot for slot in common_slots 
             if slot.duration_minutes >= duration_minutes
         ]
-        
-        self.logger.info(f"Found {len(common_slots)} common slots across {len(calendars)} calendars")
-        return common_slots
+    
+    def _target_timezone(self, timezone: str):
+        """Resolve a timezone name, raising ValueError for unknown names"""
+        try:
+            return pytz.timezone(timezone)
+        except pytz.exceptions.UnknownTimeZoneError:
+            raise ValueError(f"Invalid timezone: {timezone}")
     
     def detect_timezone_conflict(
         self, 
@@ -0,0 +1,668 @@
+"""
+Persisted per-person busy-interval index for scheduling queries
+
+Scheduling queries used to start from raw event dicts: parse every JSONL
+record of the latest calendar collection, normalize each start and end
+through pytz, filter by date. The busy index does that work once per
+collected file and stores the result as flat NumPy arrays that queries
+memory-map:
+
+    people.npy          sorted attendee emails (bytes)
+    offsets.npy         per person, slice bounds into intervals.npy
+    intervals.npy       (start, end, event) per person, sorted by start;
+                        event indexes event_ids.npy
+    busy_offsets.npy    per person, slice bounds into busy.npy
+    busy.npy            (start, end) per person, overlapping and touching
+                        intervals merged
+    event_ids.npy       unique event ids (bytes)
+
+Times are POSIX seconds (UTC), start rounded down and end rounded up. The
+index also keeps the per-record table it was built from (records.npy,
+record_people*.npy) so that an update only re-parses collection files
+whose size or mtime changed; everything else is array arithmetic.
+
+An event makes its non-declined attendees busy, or the calendar owner when
+it has no attendee list. Cancelled events and events marked free
+(transparency "transparent") are skipped. All-day events have no time zone
+of their own; they are anchored at midnight in the index's timezone.
+
+The index lives in <calendar_dir>/.busy_index/. Each update writes a new
+generation directory and then switches manifest.json to it, so readers
+holding the previous generation's maps are never disturbed.
+
+References:
+- src/scheduling/calendar_data.py - latest collection directory and signature
+- src/scheduling/availability.py - BusyMatrix consumes the merged blocks
+- src/cli/interfaces.py - get_availability_engine() serves AvailabilityEngineImpl
+- src/collectors/calendar_collector.py - updates the index after each collection
+- src/core/archive_catalog.py - hidden per-root index pattern
+"""
+
+import json
+import logging
+import os
+import shutil
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pytz
+
+from ..core.archive_reader import read_jsonl
+from .availability import AvailabilityEngine, BusyMatrix
+from .calendar_data import latest_collection_dir
+
+logger = logging.getLogger(__name__)
+
+INDEX_DIRNAME = '.busy_index'
+DEFAULT_CALENDAR_DIR = Path(__file__).parent.parent.parent / 'data' / 'raw' / 'calendar'
+DEFAULT_SEARCH_DAYS = 7
+INDEX_VERSION = 1
+MANIFEST_FILENAME = 'manifest.json'
+
+INTERVAL_DTYPE = np.dtype([('start', '<i8'), ('end', '<i8'), ('event', '<i4')])
+BUSY_DTYPE = np.dtype([('start', '<i8'), ('end', '<i8')])
+RECORD_DTYPE = np.dtype([('start', '<i8'), ('end', '<i8'), ('source', '<i4')])
+
+# Per-person time shift that keeps every person's intervals apart in one sorted array
+_PERSON_SPAN = 1 << 34
+
+_ARRAYS = ('people', 'offsets', 'intervals', 'busy_offsets', 'busy', 'event_ids',
+           'records', 'record_ids', 'record_people_offsets', 'record_people')
+
+
+class BusyIndexError(Exception):
+    """Raised when the busy-interval index cannot be read or written"""
+    pass
+
+
+def index_dir_for(calendar_dir: Path) -> Path:
+    """Busy index directory for a calendar collection root"""
+    return Path(calendar_dir) / INDEX_DIRNAME
+
+
+def _collection_sources(calendar_dir: Path) -> Dict[str, Tuple[int, int]]:
+    """(size, mtime_ns) of each JSONL file in the latest collection, keyed by relative path"""
+    if not calendar_dir.is_dir():
+        return {}
+    latest_dir = latest_collection_dir(calendar_dir)
+    if latest_dir is None:
+        return {}
+    sources = {}
+    for jsonl_file in sorted(latest_dir.glob('*.jsonl')):
+        stat = jsonl_file.stat()
+        sources[f"{latest_dir.name}/{jsonl_file.name}"] = (stat.st_size, stat.st_mtime_ns)
+    return sources
+
+
+def _event_people(event: Dict[str, Any], calendar_id: Optional[str]) -> List[str]:
+    """Emails an event makes busy"""
+    attendees = event.get('attendees')
+    if isinstance(attendees, list) and attendees:
+        people = []
+        for attendee in attendees:
+            if isinstance(attendee, dict):
+                email = attendee.get('email')
+                if attendee.get('responseStatus') == 'declined':
+                    continue
+            else:
+                email = attendee
+            if isinstance(email, str) and email.strip():
+                people.append(email.strip().lower())
+        return people
+
+    owner = calendar_id or event.get('calendar_id')
+    if isinstance(owner, str) and '@' in owner:
+        return [owner.strip().lower()]
+    return []
+
+
+class _RecordTable:
+    """Busy records parsed from collection files, before grouping by person"""
+
+    def __init__(self):
+        self.records = np.empty(0, dtype=RECORD_DTYPE)
+        self.ids = np.empty(0, dtype='S1')
+        self.people_offsets = np.zeros(1, dtype=np.int64)
+        self.people = np.empty(0, dtype='S1')  # email per (record, person) pair
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray]) -> '_RecordTable':
+        table = cls()
+        table.records = np.asarray(arrays['records'])
+        table.ids = np.asarray(arrays['record_ids'])
+        table.people_offsets = np.asarray(arrays['record_people_offsets'])
+        table.people = np.asarray(arrays['people'])[np.asarray(arrays['record_people'])]
+        return table
+
+    @classmethod
+    def from_rows(cls, rows: List[Tuple[int, int, int, str, List[str]]]) -> '_RecordTable':
+        table = cls()
+        if rows:
+            table.records = np.array([(start, end, source) for start, end, source, _, _ in rows],
+                                     dtype=RECORD_DTYPE)
+            table.ids = np.array([event_id.encode('utf-8') for _, _, _, event_id, _ in rows])
+            counts = np.array([len(people) for *_, people in rows], dtype=np.int64)
+            table.people_offsets = np.concatenate(([0], np.cumsum(counts)))
+            emails = [email.encode('utf-8') for *_, people in rows for email in people]
+            table.people = np.array(emails) if emails else np.empty(0, dtype='S1')
+        return table
+
+    def select(self, keep: np.ndarray, source_map: np.ndarray) -> '_RecordTable':
+        """Rows where keep is set, with source indexes renumbered through source_map"""
+        table = _RecordTable()
+        table.records = self.records[keep].copy()
+        table.records['source'] = source_map[table.records['source']]
+        table.ids = self.ids[keep]
+        counts = np.diff(self.people_offsets)
+        table.people_offsets = np.concatenate(([0], np.cumsum(counts[keep])))
+        table.people = self.people[np.repeat(keep, counts)]
+        return table
+
+    @staticmethod
+    def concat(tables: Iterable['_RecordTable']) -> '_RecordTable':
+        tables = list(tables)
+        table = _RecordTable()
+        table.records = np.concatenate([t.records for t in tables])
+        table.ids = np.concatenate([t.ids for t in tables])
+        table.people = np.concatenate([t.people for t in tables])
+        counts = np.concatenate([np.diff(t.people_offsets) for t in tables])
+        table.people_offsets = np.concatenate(([0], np.cumsum(counts)))
+        return table
+
+
+class BusyIntervalIndex:
+    """
+    Memory-mapped busy intervals per attendee email
+
+    Features:
+    - Merged busy blocks per person for availability search
+    - Per-person (start, end, event_id) intervals for conflict checks
+    - Incremental refresh that re-parses only changed collection files
+    """
+
+    def __init__(self, calendar_dir: Path, manifest: Dict[str, Any], arrays: Dict[str, np.ndarray]):
+        """
+        Wrap loaded index arrays (use open() or load())
+
+        Args:
+            calendar_dir: Calendar collection root the index covers
+            manifest: Parsed manifest.json
+            arrays: Index arrays by name
+        """
+        self.calendar_dir = Path(calendar_dir)
+        self.manifest = manifest
+        self.timezone = manifest.get('timezone', 'UTC')
+        self._arrays = arrays
+        self._people = arrays['people']
+        self._offsets = arrays['offsets']
+        self._intervals = arrays['intervals']
+        self._busy_offsets = arrays['busy_offsets']
+        self._busy = arrays['busy']
+        self._event_ids = arrays['event_ids']
+
+    @classmethod
+    def open(cls, calendar_dir: Path, refresh: bool = True,
+             timezone: str = 'UTC') -> 'BusyIntervalIndex':
+        """
+        Open the index for a calendar collection root
+
+        Args:
+            calendar_dir: data/raw/calendar style directory
+            refresh: Bring the index up to date with the latest collection first
+            timezone: Timezone anchoring all-day events when (re)building
+
+        Returns:
+            BusyIntervalIndex backed by memory-mapped arrays
+        """
+        calendar_dir = Path(calendar_dir)
+        if refresh:
+            try:
+                update_busy_index(calendar_dir, timezone=timezone)
+            except BusyIndexError as e:
+                logger.warning(f"Using existing busy index: {e}")
+        index = cls.load(calendar_dir)
+        if index is None:
+            return cls(calendar_dir, {'version': INDEX_VERSION, 'timezone': timezone, 'sources': {}},
+                       _empty_arrays())
+        return index
+
+    @classmethod
+    def load(cls, calendar_dir: Path, mmap_mode: Optional[str] = 'r') -> Optional['BusyIntervalIndex']:
+        """
+        Load the current index generation without refreshing it
+
+        Args:
+            calendar_dir: data/raw/calendar style directory
+            mmap_mode: numpy mmap mode, or None to read arrays into memory
+
+        Returns:
+            BusyIntervalIndex, or None if no usable index exists
+        """
+        index_dir = index_dir_for(calendar_dir)
+        manifest = _read_manifest(index_dir)
+        if manifest is None:
+            return None
+        generation_dir = index_dir / manifest['generation']
+        try:
+            arrays = {name: np.load(generation_dir / f"{name}.npy", mmap_mode=mmap_mode,
+                                    allow_pickle=False)
+                      for name in _ARRAYS}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Busy index at {generation_dir} is unreadable: {e}")
+            return None
+        return cls(calendar_dir, manifest, arrays)
+
+    @property
+    def people(self) -> List[str]:
+        """Indexed attendee emails, sorted"""
+        return [email.decode('utf-8') for email in self._people]
+
+    def __len__(self) -> int:
+        return len(self._people)
+
+    def __contains__(self, email: str) -> bool:
+        return self._person(email) is not None
+
+    def _person(self, email: str) -> Optional[int]:
+        key = email.strip().lower().encode('utf-8')
+        position = int(np.searchsorted(self._people, key))
+        if position < len(self._people) and self._people[position] == key:
+            return position
+        return None
+
+    def busy(self, email: str, start: Optional[float] = None,
+             end: Optional[float] = None) -> np.ndarray:
+        """
+        Merged busy blocks of one person that overlap [start, end)
+
+        Args:
+            email: Attendee email (case-insensitive)
+            start: Range start, POSIX seconds (default: unbounded)
+            end: Range end, POSIX seconds (default: unbounded)
+
+        Returns:
+            int64 array of shape (k, 2) with block start and end in POSIX seconds
+        """
+        person = self._person(email)
+        if person is None:
+            return np.empty((0, 2), dtype=np.int64)
+        blocks = self._busy[self._busy_offsets[person]:self._busy_offsets[person + 1]]
+        # Merged blocks are disjoint, so both starts and ends are sorted
+        first = 0 if start is None else int(np.searchsorted(blocks['end'], start, side='right'))
+        last = len(blocks) if end is None else int(np.searchsorted(blocks['start'], end, side='left'))
+        blocks = blocks[first:max(first, last)]
+        return np.column_stack((blocks['start'], blocks['end'])).astype(np.int64)
+
+    def busy_intervals(self, emails: Iterable[str], start: Optional[float] = None,
+                       end: Optional[float] = None) -> List[np.ndarray]:
+        """
+        Merged busy blocks for several people, in BusyMatrix input form
+
+        Args:
+            emails: Attendee emails
+            start: Range start, POSIX seconds (default: unbounded)
+            end: Range end, POSIX seconds (default: unbounded)
+
+        Returns:
+            One (k, 2) array per email, in the given order
+        """
+        return [self.busy(email, start, end) for email in emails]
+
+    def events(self, email: str, start: Optional[float] = None,
+               end: Optional[float] = None) -> List[Tuple[int, int, str]]:
+        """
+        Events of one person that overlap [start, end)
+
+        Args:
+            email: Attendee email (case-insensitive)
+            start: Range start, POSIX seconds (default: unbounded)
+            end: Range end, POSIX seconds (default: unbounded)
+
+        Returns:
+            (start, end, event_id) tuples ordered by start
+        """
+        person = self._person(email)
+        if person is None:
+            return []
+        intervals = self._intervals[self._offsets[person]:self._offsets[person + 1]]
+        if end is not None:
+            intervals = intervals[:int(np.searchsorted(intervals['start'], end, side='left'))]
+        if start is not None:
+            intervals = intervals[intervals['end'] > start]
+        return [(int(s), int(e), self._event_ids[ref].decode('utf-8'))
+                for s, e, ref in zip(intervals['start'], intervals['end'], intervals['event'])]
+
+
+def update_busy_index(calendar_dir: Path, timezone: str = 'UTC') -> bool:
+    """
+    Bring the busy index up to date with the latest calendar collection
+
+    Only files added or changed since the last update are parsed; records
+    from unchanged files are carried over from the stored record table.
+
+    Args:
+        calendar_dir: data/raw/calendar style directory
+        timezone: Timezone anchoring all-day events; changing it rebuilds
+
+    Returns:
+        True if a new index generation was written
+
+    Raises:
+        BusyIndexError: If the index cannot be written
+    """
+    calendar_dir = Path(calendar_dir)
+    index_dir = index_dir_for(calendar_dir)
+    sources = _collection_sources(calendar_dir)
+
+    previous = BusyIntervalIndex.load(calendar_dir, mmap_mode=None)
+    if previous is not None and previous.manifest.get('timezone') != timezone:
+        previous = None
+    old_sources = previous.manifest.get('sources', {}) if previous else {}
+    if previous is not None and old_sources == {name: list(sig) for name, sig in sources.items()}:
+        return False
+
+    # Carry over records from unchanged files, renumbering their source index
+    names = list(sources)
+    position = {name: i for i, name in enumerate(names)}
+    tables = []
+    carried = set()
+    if previous is not None:
+        old_names = list(old_sources)
+        carried = {name for name in old_names
+                   if name in sources and list(sources[name]) == old_sources[name]}
+        source_map = np.array([position.get(name, -1) for name in old_names], dtype=np.int32)
+        unchanged = np.array([name in carried for name in old_names], dtype=bool)
+        table = _RecordTable.from_arrays(previous._arrays)
+        tables.append(table.select(unchanged[table.records['source']], source_map))
+
+    changed = [name for name in names if name not in carried]
+    tables.append(_RecordTable.from_rows(_parse_sources(calendar_dir, changed, position, timezone)))
+
+    arrays = _build_arrays(_RecordTable.concat(tables))
+    manifest = {
+        'version': INDEX_VERSION,
+        'timezone': timezone,
+        'sources': {name: list(sig) for name, sig in sources.items()},
+        'people': int(len(arrays['people'])),
+        'intervals': int(len(arrays['intervals'])),
+        'updated_at': datetime.now().isoformat(),
+    }
+    _write_generation(index_dir, manifest, arrays)
+    logger.info(f"Busy index updated: {len(changed)} of {len(names)} files parsed, "
+                f"{manifest['people']} people, {manifest['intervals']} intervals")
+    return True
+
+
+def _parse_sources(calendar_dir: Path, names: List[str], position: Dict[str, int],
+                   timezone: str) -> List[Tuple[int, int, int, str, List[str]]]:
+    """Busy records (start, end, source, event_id, people) from collection files"""
+    engine = AvailabilityEngine()
+    rows = []
+    for name in names:
+        source = position[name]
+        try:
+            for _, record in read_jsonl(calendar_dir / name):
+                if not isinstance(record, dict):
+                    continue
+                event = record.get('event', record)
+                if not isinstance(event, dict) or not event:
+                    continue
+                if event.get('status') == 'cancelled' or event.get('transparency') == 'transparent':
+                    continue
+                people = _event_people(event, record.get('calendar_id'))
+                if not people:
+                    continue
+                normalized = engine._normalize_event_to_timezone(event, timezone)
+                if not normalized:
+                    continue
+                start, end = normalized.get('start'), normalized.get('end')
+                if not isinstance(start, datetime) or not isinstance(end, datetime) or end < start:
+                    continue
+                start_ts, end_ts = start.timestamp(), end.timestamp()
+                rows.append((int(np.floor(start_ts)), int(np.ceil(end_ts)), source,
+                             str(event.get('id') or f"{name}:{len(rows)}"), sorted(set(people))))
+        except OSError as e:
+            logger.warning(f"Skipping unreadable calendar file {name}: {e}")
+    return rows
+
+
+def _build_arrays(table: _RecordTable) -> Dict[str, np.ndarray]:
+    """Group a record table into per-person sorted and merged interval arrays"""
+    arrays = {
+        'records': table.records,
+        'record_ids': table.ids,
+        'record_people_offsets': table.people_offsets,
+    }
+    if not len(table.people):
+        empty = _empty_arrays()
+        empty.update(arrays)
+        empty['record_people'] = np.empty(0, dtype=np.int32)
+        return empty
+
+    people, record_people = np.unique(table.people, return_inverse=True)
+    event_ids, record_events = np.unique(table.ids, return_inverse=True)
+    arrays['people'] = people
+    arrays['event_ids'] = event_ids
+    arrays['record_people'] = record_people.astype(np.int32)
+
+    # One row per (person, event); the same event collected from several calendars counts once
+    counts = np.diff(table.people_offsets)
+    pair_records = np.repeat(np.arange(len(table.records)), counts)
+    pair_people = record_people.astype(np.int64)
+    pair_events = record_events[pair_records].astype(np.int64)
+    _, first = np.unique(pair_people * len(event_ids) + pair_events, return_index=True)
+    pair_people, pair_events, pair_records = pair_people[first], pair_events[first], pair_records[first]
+
+    starts = table.records['start'][pair_records]
+    ends = table.records['end'][pair_records]
+    order = np.lexsort((ends, starts, pair_people))
+    pair_people, pair_events, starts, ends = (
+        pair_people[order], pair_events[order], starts[order], ends[order])
+
+    intervals = np.empty(len(order), dtype=INTERVAL_DTYPE)
+    intervals['start'], intervals['end'], intervals['event'] = starts, ends, pair_events
+    arrays['intervals'] = intervals
+    arrays['offsets'] = np.searchsorted(pair_people, np.arange(len(people) + 1)).astype(np.int64)
+
+    # Merge per person: shifting each person into its own time band lets one
+    # running maximum of end times find every block boundary
+    shift = pair_people * _PERSON_SPAN
+    shifted_ends = np.maximum.accumulate(ends + shift)
+    new_block = np.ones(len(starts), dtype=bool)
+    new_block[1:] = (starts[1:] + shift[1:]) > shifted_ends[:-1]
+    block_starts = np.flatnonzero(new_block)
+    block_ends = np.append(block_starts[1:], len(starts)) - 1
+
+    busy = np.empty(len(block_starts), dtype=BUSY_DTYPE)
+    busy['start'] = starts[block_starts]
+    busy['end'] = shifted_ends[block_ends] - shift[block_starts]
+    arrays['busy'] = busy
+    arrays['busy_offsets'] = np.searchsorted(
+        pair_people[block_starts], np.arange(len(people) + 1)).astype(np.int64)
+    return arrays
+
+
+def _empty_arrays() -> Dict[str, np.ndarray]:
+    return {
+        'people': np.empty(0, dtype='S1'),
+        'offsets': np.zeros(1, dtype=np.int64),
+        'intervals': np.empty(0, dtype=INTERVAL_DTYPE),
+        'busy_offsets': np.zeros(1, dtype=np.int64),
+        'busy': np.empty(0, dtype=BUSY_DTYPE),
+        'event_ids': np.empty(0, dtype='S1'),
+        'records': np.empty(0, dtype=RECORD_DTYPE),
+        'record_ids': np.empty(0, dtype='S1'),
+        'record_people_offsets': np.zeros(1, dtype=np.int64),
+        'record_people': np.empty(0, dtype=np.int32),
+    }
+
+
+def _read_manifest(index_dir: Path) -> Optional[Dict[str, Any]]:
+    manifest_path = index_dir / MANIFEST_FILENAME
+    try:
+        with open(manifest_path, 'r') as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable busy index manifest {manifest_path}: {e}")
+        return None
+    if manifest.get('version') != INDEX_VERSION or 'generation' not in manifest:
+        return None
+    return manifest
+
+
+def _write_generation(index_dir: Path, manifest: Dict[str, Any], arrays: Dict[str, np.ndarray]):
+    """Write arrays to a new generation directory and switch the manifest to it"""
+    generation = f"gen-{os.getpid()}-{datetime.now().strftime('%Y%m%d%H%M%S%f')}"
+    generation_dir = index_dir / generation
+    try:
+        generation_dir.mkdir(parents=True)
+        for name in _ARRAYS:
+            np.save(generation_dir / f"{name}.npy", arrays[name], allow_pickle=False)
+
+        manifest = dict(manifest, generation=generation)
+        temp_manifest = index_dir / f"{MANIFEST_FILENAME}.{generation}.tmp"
+        with open(temp_manifest, 'w') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(temp_manifest, index_dir / MANIFEST_FILENAME)
+    except OSError as e:
+        shutil.rmtree(generation_dir, ignore_errors=True)
+        raise BusyIndexError(f"Cannot write busy index to {index_dir}: {e}")
+
+    # Open maps of older generations stay valid after their files are unlinked
+    for old_dir in index_dir.glob('gen-*'):
+        if old_dir.name != generation and old_dir.is_dir():
+            shutil.rmtree(old_dir, ignore_errors=True)
+
+
+class AvailabilityEngineImpl:
+    """
+    Availability engine for the query CLI, answered from the busy index
+
+    Implements the AvailabilityEngine interface of src/cli/interfaces.py.
+    """
+
+    def __init__(self, calendar_dir: Optional[Path] = None, timezone: str = 'UTC',
+                 working_hours: Tuple[int, int] = (9, 17)):
+        """
+        Args:
+            calendar_dir: Calendar collection root (default: data/raw/calendar)
+            timezone: Default timezone for working hours and results
+            working_hours: Default (start_hour, end_hour)
+        """
+        self.calendar_dir = Path(calendar_dir) if calendar_dir else DEFAULT_CALENDAR_DIR
+        self.timezone = timezone
+        self.working_hours = working_hours
+        self._index: Optional[BusyIntervalIndex] = None
+
+    @property
+    def index(self) -> BusyIntervalIndex:
+        """Busy index, refreshed from the latest collection on first use"""
+        if self._index is None:
+            self._index = BusyIntervalIndex.open(self.calendar_dir)
+        return self._index
+
+    def find_free_slots(self, attendees: List[str], duration: int,
+                        date_range: Optional[tuple] = None, **kwargs) -> Dict[str, Any]:
+        """
+        Find slots where every attendee is free
+
+        Args:
+            attendees: List of attendee email addresses
+            duration: Meeting duration in minutes
+            date_range: Optional (start_date, end_date) tuple of dates or
+                        YYYY-MM-DD strings (default: the next 7 days)
+            **kwargs: timezone, working_hours, buffer_minutes
+
+        Returns:
+            Dictionary with available slots and metadata
+        """
+        timezone = kwargs.get('timezone', self.timezone)
+        working_hours = kwargs.get('working_hours', self.working_hours)
+        buffer_minutes = kwargs.get('buffer_minutes', 0)
+
+        if date_range:
+            start_date, end_date = (_as_date(value) for value in date_range)
+        else:
+            start_date = datetime.now(pytz.timezone(timezone)).date()
+            end_date = start_date + timedelta(days=DEFAULT_SEARCH_DAYS - 1)
+        dates = [start_date + timedelta(days=offset)
+                 for offset in range((end_date - start_date).days + 1)]
+
+        # Working days never extend past these bounds, whatever the timezone
+        window_start = datetime.combine(start_date, datetime.min.time(), pytz.UTC) - timedelta(days=1)
+        window_end = datetime.combine(end_date, datetime.min.time(), pytz.UTC) + timedelta(days=2)
+        index = self.index
+        matrix = BusyMatrix(
+            index.busy_intervals(attendees, window_start.timestamp(), window_end.timestamp()),
+            dates, working_hours, timezone)
+        slots = matrix.common_slots(duration, buffer_minutes)
+
+        return {
+            'available_slots': [dict(slot.to_dict(), confidence=1.0) for slot in slots],
+            'attendees': attendees,
+            'duration_minutes': duration,
+            'search_range': (start_date.isoformat(), end_date.isoformat()),
+            'unknown_attendees': [email for email in attendees if email not in index],
+            'metadata': {'engine': 'AvailabilityEngineImpl', 'source': 'busy_index',
+                         'timezone': timezone, 'indexed_people': len(index)}
+        }
+
+    def check_conflicts(self, attendees: List[str], start_time: str,
+                        duration: int, **kwargs) -> Dict[str, Any]:
+        """
+        Check attendees' indexed events against a proposed meeting
+
+        Args:
+            attendees: List of attendee email addresses
+            start_time: Proposed start (ISO format or YYYY-MM-DD HH:MM); times
+                        without an offset are in the timezone kwarg
+            duration: Duration in minutes
+            **kwargs: timezone
+
+        Returns:
+            Dictionary with conflict details and metadata
+        """
+        target_tz = pytz.timezone(kwargs.get('timezone', self.timezone))
+        try:
+            start = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
+        except ValueError:
+            raise ValueError(f"Invalid start time: {start_time}")
+        start = target_tz.localize(start) if start.tzinfo is None else start.astimezone(target_tz)
+        end = start + timedelta(minutes=duration)
+
+        conflict_details = []
+        for attendee in attendees:
+            for event_start, event_end, event_id in self.index.events(
+                    attendee, start.timestamp(), end.timestamp()):
+                conflict_start = datetime.fromtimestamp(event_start, target_tz)
+                conflict_end = datetime.fromtimestamp(event_end, target_tz)
+                conflict_details.append({
+                    'attendee': attendee,
+                    'event_id': event_id,
+                    'conflict_time': f"{conflict_start.isoformat()} - {conflict_end.isoformat()}"
+                })
+
+        conflicted = sorted({detail['attendee'] for detail in conflict_details})
+        return {
+            'conflicts_found': bool(conflict_details),
+            'conflict_details': conflict_details,
+            'attendees': attendees,
+            'proposed_time': start_time,
+            'duration_minutes': duration,
+            'details': (f"Conflicts for {', '.join(conflicted)}" if conflicted
+                        else 'No conflicts detected'),
+            'metadata': {'engine': 'AvailabilityEngineImpl', 'source': 'busy_index',
+                         'timezone': str(target_tz)}
+        }
+
+
+def _as_date(value: Union[str, date, datetime]) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(value, '%Y-%m-%d').date()
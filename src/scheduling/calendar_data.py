@@ -0,0 +1,178 @@
+"""
+Loading collected calendar events for scheduling tools
+
+The calendar collector writes one directory per collection date under
+data/raw/calendar/, each holding JSONL files of {"event": {...}} records.
+Scheduling tools only look at the most recent collection. slot and conflict
+queries over a snapshot live here too, so the query daemon can answer them
+from its cached snapshot and send back only the result.
+
+References:
+- tools/find_slots.py - CalendarCLI.load_calendar_data
+- src/cli/query_daemon.py - caches snapshots between CLI invocations
+- src/collectors/calendar_collector.py - Calendar data format
+"""
+
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .availability import AvailabilityEngine, FreeSlot
+from .conflicts import ConflictDetector
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CalendarSnapshot:
+    """Events from the most recent calendar collection"""
+    exists: bool
+    source: Optional[str] = None
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        return {'exists': self.exists, 'source': self.source,
+                'events': self.events, 'warnings': self.warnings}
+
+    def summary(self) -> Dict[str, Any]:
+        """Snapshot metadata without the events, sent alongside query results"""
+        return {'exists': self.exists, 'source': self.source,
+                'event_count': len(self.events), 'warnings': self.warnings}
+
+
+def latest_collection_dir(calendar_dir: Path) -> Optional[Path]:
+    """
+    Find the most recent collection directory
+
+    Args:
+        calendar_dir: data/raw/calendar style directory of dated subdirectories
+
+    Returns:
+        Newest subdirectory by name, or None if there is none
+    """
+    date_dirs = [d for d in calendar_dir.iterdir() if d.is_dir()]
+    return max(date_dirs, key=lambda d: d.name) if date_dirs else None
+
+
+def snapshot_signature(calendar_dir: Path) -> Optional[Tuple]:
+    """
+    Cheap change signature for the latest collection
+
+    Args:
+        calendar_dir: data/raw/calendar style directory
+
+    Returns:
+        (directory, ((file, size, mtime_ns), ...)) or None if there is no data
+    """
+    if not calendar_dir.is_dir():
+        return None
+    latest_dir = latest_collection_dir(calendar_dir)
+    if latest_dir is None:
+        return None
+    files = []
+    for jsonl_file in sorted(latest_dir.glob("*.jsonl")):
+        stat = jsonl_file.stat()
+        files.append((jsonl_file.name, stat.st_size, stat.st_mtime_ns))
+    return str(latest_dir), tuple(files)
+
+
+def load_latest_calendar_events(calendar_dir: Path) -> CalendarSnapshot:
+    """
+    Read every event from the most recent calendar collection
+
+    Unreadable files are skipped and reported in the snapshot's warnings.
+
+    Args:
+        calendar_dir: data/raw/calendar style directory
+
+    Returns:
+        CalendarSnapshot (exists is False when calendar_dir is missing)
+    """
+    if not calendar_dir.exists():
+        return CalendarSnapshot(exists=False)
+
+    latest_dir = latest_collection_dir(calendar_dir)
+    if latest_dir is None:
+        return CalendarSnapshot(exists=True)
+
+    snapshot = CalendarSnapshot(exists=True, source=str(latest_dir))
+    for jsonl_file in latest_dir.glob("*.jsonl"):
+        try:
+            with open(jsonl_file, 'r') as f:
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        event = record.get('event', {})
+                        if event:
+                            snapshot.events.append(event)
+        except Exception as e:
+            snapshot.warnings.append(f"Error reading {jsonl_file}: {e}")
+    return snapshot
+
+
+def find_slots_in_events(
+    events: List[Dict[str, Any]],
+    duration_minutes: int,
+    start_date: date,
+    days: int = 1,
+    working_hours: Tuple[int, int] = (9, 17),
+    timezone: str = 'UTC',
+    buffer_minutes: int = 0
+) -> List[FreeSlot]:
+    """
+    Free slots around a single calendar's events
+
+    Args:
+        events: Calendar events (one calendar)
+        duration_minutes: Minimum slot length
+        start_date: First day to search
+        days: Number of days to search starting at start_date
+        working_hours: (start_hour, end_hour) in the target timezone
+        timezone: Timezone for results
+        buffer_minutes: Buffer kept around each event
+
+    Returns:
+        List of FreeSlot in timezone
+    """
+    engine = AvailabilityEngine()
+    calendars = [events]
+    if days > 1:
+        return engine.find_common_slots_in_range(
+            calendars=calendars,
+            duration_minutes=duration_minutes,
+            start_date=start_date,
+            end_date=start_date + timedelta(days=days - 1),
+            working_hours=working_hours,
+            timezone=timezone,
+            buffer_minutes=buffer_minutes
+        )
+    return engine.find_free_slots(
+        calendars=calendars,
+        duration_minutes=duration_minutes,
+        working_hours=working_hours,
+        date=start_date,
+        timezone=timezone,
+        buffer_minutes=buffer_minutes
+    )
+
+
+def detect_conflicts_in_events(events: List[Dict[str, Any]], timezone: str = 'UTC') -> List[Dict[str, Any]]:
+    """
+    Scheduling conflicts between events, including resource conflicts
+
+    Args:
+        events: Calendar events
+        timezone: Timezone for conflict detection
+
+    Returns:
+        List of Conflict.to_dict() results
+    """
+    conflicts = ConflictDetector().detect_all_conflicts(
+        events=events, timezone=timezone, include_resource_conflicts=True
+    )
+    return [conflict.to_dict() for conflict in conflicts]
@@ -2,19 +2,29 @@
 Calendar Conflict Detection System - Timezone-Aware Meeting Overlap Detection
 CRITICAL: All datetime operations use timezone-aware objects
 
+Each event is normalized once into a (start, end) interval and a sweep line
+over intervals sorted by start reports overlapping pairs in
+O((n + k) log n) for n events and k overlaps, instead of comparing every
+pair. Attendee conflicts sweep each attendee's events and resource
+conflicts each room's events separately, so a busy organization only pays
+for overlaps that share a person or a room.
+
 References:
 - src/scheduling/availability.py - Timezone normalization patterns
 - src/core/compression.py - Error handling patterns
 """
 
+import heapq
 import pytz
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Set, Tuple
+from typing import Dict, Any, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+Interval = Tuple[datetime, datetime]
+
 
 @dataclass
 class Conflict:
@@ -42,6 +52,75 @@ class Conflict:
         }
 
 
+def find_overlapping_pairs(
+    intervals: Sequence[Optional[Interval]],
+    indices: Optional[Iterable[int]] = None
+) -> List[Tuple[int, int]]:
+    """
+    Find every pair of intervals that overlap, with a sweep line
+
+    Two intervals overlap when start1 < end2 and start2 < end1, the same
+    test as ConflictDetector.has_conflict.
+
+    Args:
+        intervals: (start, end) per event, None for events without valid times
+        indices: Restrict the sweep to these positions (default: all)
+
+    Returns:
+        Sorted (i, j) position pairs with i < j
+    """
+    if indices is None:
+        indices = range(len(intervals))
+
+    ordered = []
+    inverted = []  # end before start: the sweep invariant does not hold
+    for index in indices:
+        interval = intervals[index]
+        if interval is None:
+            continue
+        if interval[1] < interval[0]:
+            inverted.append(index)
+        else:
+            ordered.append((interval[0], index))
+    ordered.sort()
+
+    pairs = []
+    active: Dict[int, Interval] = {}
+    ends: List[Tuple[datetime, int]] = []
+    for start, index in ordered:
+        # Retire intervals that end at or before this start
+        while ends and ends[0][0] <= start:
+            del active[heapq.heappop(ends)[1]]
+
+        end = intervals[index][1]
+        for other, (other_start, _) in active.items():
+            # other_start <= start < other_end already; only an empty
+            # interval starting at other_start can still miss
+            if other_start < end:
+                pairs.append((other, index) if other < index else (index, other))
+
+        active[index] = intervals[index]
+        heapq.heappush(ends, (end, index))
+
+    for position, index in enumerate(inverted):
+        start, end = intervals[index]
+        for other in [i for _, i in ordered] + inverted[position + 1:]:
+            other_start, other_end = intervals[other]
+            if start < other_end and other_start < end:
+                pairs.append((other, index) if other < index else (index, other))
+
+    pairs.sort()
+    return pairs
+
+
+class _EventProfile(NamedTuple):
+    """Per-event values conflict classification reads, computed once"""
+    attendees: Set[str]
+    location: str
+    duration: Optional[int]
+    important: bool
+
+
 class ConflictDetector:
     """
     CRITICAL FIX: Timezone-aware meeting conflict detection system
@@ -158,30 +237,31 @@ class ConflictDetector:
         conflicts = []
         attendee_conflicts = {}  # attendee -> list of conflicting events
         
-        # Normalize all events first
-        normalized_events = []
-        for event in events:
-            norm_event = self._normalize_event_to_timezone(event, timezone)
-            if norm_event:
-                normalized_events.append((event, norm_event))  # Keep both original and normalized
-        
-        # Check each pair of events for conflicts
-        for i in range(len(normalized_events)):
-            for j in range(i + 1, len(normalized_events)):
-                orig_event1, norm_event1 = normalized_events[i]
-                orig_event2, norm_event2 = normalized_events[j]
-                
-                if self.has_conflict(norm_event1, norm_event2, timezone):
-                    # Find common attendees
-                    attendees1 = set(self._extract_attendee_emails(orig_event1))
-                    attendees2 = set(self._extract_attendee_emails(orig_event2))
-                    common_attendees = attendees1.intersection(attendees2)
-                    
-                    # Record conflicts for each common attendee
-                    for attendee in common_attendees:
-                        if attendee not in attendee_conflicts:
-                            attendee_conflicts[attendee] = []
-                        attendee_conflicts[attendee].extend([orig_event1, orig_event2])
+        # Normalize every event and build its attendee set once
+        intervals = self._event_intervals(events, timezone)
+        attendee_sets = [
+            set(self._extract_attendee_emails(event)) if intervals[index] else set()
+            for index, event in enumerate(events)
+        ]
+        
+        # Sweep each attendee's own events; a pair sharing several
+        # attendees is found once per attendee
+        events_by_attendee = {}
+        for index, attendees in enumerate(attendee_sets):
+            for attendee in attendees:
+                events_by_attendee.setdefault(attendee, []).append(index)
+        
+        conflicting_pairs = set()
+        for indices in events_by_attendee.values():
+            if len(indices) > 1:
+                conflicting_pairs.update(find_overlapping_pairs(intervals, indices))
+        
+        # Record conflicts for each common attendee, in event order
+        for i, j in sorted(conflicting_pairs):
+            for attendee in attendee_sets[i].intersection(attendee_sets[j]):
+                if attendee not in attendee_conflicts:
+                    attendee_conflicts[attendee] = []
+                attendee_conflicts[attendee].extend([events[i], events[j]])
         
         # Convert to conflict format
         for attendee, conflicted_events in attendee_conflicts.items():
@@ -223,43 +303,35 @@ class ConflictDetector:
         """
         all_conflicts = []
         
-        # Normalize all events first for consistent processing
-        normalized_events = []
-        for event in events:
-            norm_event = self._normalize_event_to_timezone(event, timezone)
-            if norm_event:
-                normalized_events.append((event, norm_event))
-        
-        # Check all event pairs for time conflicts
-        for i in range(len(normalized_events)):
-            for j in range(i + 1, len(normalized_events)):
-                orig_event1, norm_event1 = normalized_events[i]
-                orig_event2, norm_event2 = normalized_events[j]
-                
-                if self.has_conflict(norm_event1, norm_event2, timezone):
-                    overlap_mins = self.overlap_minutes(norm_event1, norm_event2, timezone)
-                    
-                    # Determine conflict type and severity
-                    conflict_type, severity = self._classify_conflict(orig_event1, orig_event2, overlap_mins)
-                    
-                    # Find affected attendees
-                    attendees1 = set(self._extract_attendee_emails(orig_event1))
-                    attendees2 = set(self._extract_attendee_emails(orig_event2))
-                    affected = list(attendees1.intersection(attendees2))
-                    
-                    conflict = Conflict(
-                        event1=orig_event1,
-                        event2=orig_event2,
-                        overlap_minutes=overlap_mins,
-                        conflict_type=conflict_type,
-                        severity=severity,
-                        affected_attendees=affected
-                    )
-                    all_conflicts.append(conflict)
+        # Normalize all events once for consistent processing
+        intervals = self._event_intervals(events, timezone)
+        profiles: Dict[int, _EventProfile] = {}
+        
+        for i, j in find_overlapping_pairs(intervals):
+            overlap_mins = self._interval_overlap_minutes(intervals[i], intervals[j])
+            
+            for index in (i, j):
+                if index not in profiles:
+                    profiles[index] = self._profile_event(events[index])
+            
+            # Determine conflict type and severity
+            conflict_type, severity = self._classify_profiles(profiles[i], profiles[j], overlap_mins)
+            
+            # Find affected attendees
+            affected = list(profiles[i].attendees.intersection(profiles[j].attendees))
+            
+            all_conflicts.append(Conflict(
+                event1=events[i],
+                event2=events[j],
+                overlap_minutes=overlap_mins,
+                conflict_type=conflict_type,
+                severity=severity,
+                affected_attendees=affected
+            ))
         
         # Add resource conflicts if requested
         if include_resource_conflicts:
-            resource_conflicts = self._detect_resource_conflicts(events, timezone)
+            resource_conflicts = self._detect_resource_conflicts(events, timezone, intervals)
             all_conflicts.extend(resource_conflicts)
         
         # Sort by severity (highest first)
@@ -268,6 +340,38 @@ class ConflictDetector:
         self.logger.info(f"Detected {len(all_conflicts)} total conflicts")
         return all_conflicts
     
+    def _event_intervals(
+        self, 
+        events: List[Dict[str, Any]], 
+        timezone: str
+    ) -> List[Optional[Interval]]:
+        """
+        Normalize each event to a (start, end) interval in the target timezone
+        
+        Args:
+            events: Events to normalize
+            timezone: Target timezone string
+            
+        Returns:
+            Interval per event, None where has_conflict would never match
+        """
+        intervals = []
+        for event in events:
+            norm_event = self._normalize_event_to_timezone(event, timezone)
+            start = norm_event.get('start') if norm_event else None
+            end = norm_event.get('end') if norm_event else None
+            intervals.append((start, end) if start and end else None)
+        return intervals
+    
+    @staticmethod
+    def _interval_overlap_minutes(interval1: Interval, interval2: Interval) -> int:
+        """Overlap of two conflicting intervals in whole minutes, as overlap_minutes()"""
+        overlap_start = max(interval1[0], interval2[0])
+        overlap_end = min(interval1[1], interval2[1])
+        if overlap_start >= overlap_end:
+            return 0  # only reachable with an inverted interval
+        return int((overlap_end - overlap_start).total_seconds() / 60)
+    
     def _normalize_event_to_timezone(
         self, 
         event: Dict[str, Any], 
@@ -411,13 +515,30 @@ class ConflictDetector:
         Returns:
             (conflict_type, severity_score)
         """
+        return self._classify_profiles(self._profile_event(event1), self._profile_event(event2),
+                                       overlap_minutes)
+    
+    def _profile_event(self, event: Dict[str, Any]) -> _EventProfile:
+        """Compute the per-event inputs of _classify_profiles"""
+        return _EventProfile(
+            attendees=set(self._extract_attendee_emails(event)),
+            location=event.get('location', '').lower(),
+            duration=self._get_event_duration_minutes(event),
+            important=self._is_important_event(event)
+        )
+    
+    def _classify_profiles(
+        self, 
+        profile1: _EventProfile, 
+        profile2: _EventProfile, 
+        overlap_minutes: int
+    ) -> Tuple[str, float]:
+        """_classify_conflict on precomputed event profiles"""
         # Determine conflict type
-        attendees1 = set(self._extract_attendee_emails(event1))
-        attendees2 = set(self._extract_attendee_emails(event2))
-        common_attendees = attendees1.intersection(attendees2)
+        common_attendees = profile1.attendees.intersection(profile2.attendees)
         
-        location1 = event1.get('location', '').lower()
-        location2 = event2.get('location', '').lower()
+        location1 = profile1.location
+        location2 = profile2.location
         
         if common_attendees and location1 == location2 and location1:
             conflict_type = "person_and_resource"
@@ -440,15 +561,15 @@ class ConflictDetector:
             severity = min(severity + 0.3, 1.0)
         
         # Increase severity for complete overlaps
-        duration1 = self._get_event_duration_minutes(event1)
-        duration2 = self._get_event_duration_minutes(event2)
+        duration1 = profile1.duration
+        duration2 = profile2.duration
         if duration1 and duration2:
             max_duration = max(duration1, duration2)
             if overlap_minutes >= max_duration * 0.8:  # 80%+ overlap
                 severity = min(severity + 0.2, 1.0)
         
         # Increase severity for important meetings
-        if self._is_important_event(event1) or self._is_important_event(event2):
+        if profile1.important or profile2.important:
             severity = min(severity + 0.1, 1.0)
         
         return conflict_type, severity
@@ -456,7 +577,8 @@ class ConflictDetector:
     def _detect_resource_conflicts(
         self, 
         events: List[Dict[str, Any]],
-        timezone: str = 'UTC'
+        timezone: str = 'UTC',
+        intervals: Optional[List[Optional[Interval]]] = None
     ) -> List[Conflict]:
         """
         Detect conflicts for shared resources (rooms, equipment)
@@ -464,43 +586,39 @@ class ConflictDetector:
         Args:
             events: List of events to check
             timezone: Reference timezone
+            intervals: Precomputed _event_intervals(events, timezone), if available
             
         Returns:
             List of resource conflicts
         """
         resource_conflicts = []
+        if intervals is None:
+            intervals = self._event_intervals(events, timezone)
         
         # Group events by resource/location
         resources = {}
-        for event in events:
+        for index, event in enumerate(events):
             location = event.get('location', '').strip().lower()
             if location and not self._is_virtual_location(location):
                 if location not in resources:
                     resources[location] = []
-                resources[location].append(event)
+                resources[location].append(index)
         
-        # Check for conflicts within each resource group
-        for resource, resource_events in resources.items():
-            if len(resource_events) < 2:
+        # Sweep each resource group
+        for resource, indices in resources.items():
+            if len(indices) < 2:
                 continue
             
-            # Check all pairs in this resource group
-            for i in range(len(resource_events)):
-                for j in range(i + 1, len(resource_events)):
-                    event1, event2 = resource_events[i], resource_events[j]
-                    
-                    if self.has_conflict(event1, event2, timezone):
-                        overlap_mins = self.overlap_minutes(event1, event2, timezone)
-                        
-                        conflict = Conflict(
-                            event1=event1,
-                            event2=event2,
-                            overlap_minutes=overlap_mins,
-                            conflict_type="resource_double_booking",
-                            severity=0.7,  # Resource conflicts are generally serious
-                            affected_attendees=[]  # No specific attendees affected
-                        )
-                        resource_conflicts.append(conflict)
+            for i, j in find_overlapping_pairs(intervals, indices):
+                conflict = Conflict(
+                    event1=events[i],
+                    event2=events[j],
+                    overlap_minutes=self._interval_overlap_minutes(intervals[i], intervals[j]),
+                    conflict_type="resource_double_booking",
+                    severity=0.7,  # Resource conflicts are generally serious
+                    affected_attendees=[]  # No specific attendees affected
+                )
+                resource_conflicts.append(conflict)
         
         return resource_conflicts
     
@@ -0,0 +1,427 @@
+"""
+Columnar Parquet snapshot of the search index for analytics
+
+Writes the indexed messages, calendar events, calendar attendees and daily
+rollups as Hive-partitioned Parquet so DuckDB / Arrow can scan compressed
+columns with predicate pushdown instead of re-parsing raw JSONL archives:
+
+    <output>/messages/source=slack/month=2025-08/part-000000000001.parquet
+    <output>/calendar_events/month=2025-08/part-000000000001.parquet
+    <output>/calendar_attendees/month=2025-08/part-000000000001.parquet
+    <output>/daily_rollups/source=slack/month=2025-08/rollup.parquet
+
+Rows stream out of SQLite with fetchmany and are flushed to per-partition
+ParquetWriters in row groups, so memory is bounded by the row group size.
+A watermark (highest exported message id) is kept in the search_metadata
+table per output directory; reruns only read rows above it and add new part
+files. Rollups of the months touched by a run are recomputed in SQL and
+replace the previous rollup file for that partition.
+
+pyarrow is an optional dependency - only this export requires it.
+
+References:
+- src/search/database.py - iter_records(after_id=...) and search_metadata
+- src/search/export.py - row-oriented NDJSON/CSV export
+- tools/search_cli.py - `export-columnar` subcommand
+- experiments/ryan_time_analysis/analytics/*/setup_duckdb.py - consumers
+"""
+
+import json
+import logging
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+logger = logging.getLogger(__name__)
+
+WATERMARK_KEY_PREFIX = 'columnar_export_watermark:'
+DEFAULT_ROW_GROUP_SIZE = 50000
+UNKNOWN_MONTH = 'unknown'
+TABLES = ('messages', 'calendar_events', 'calendar_attendees', 'daily_rollups')
+
+
+class ColumnarExportError(Exception):
+    """Raised when a columnar export cannot be produced"""
+    pass
+
+
+def _schemas() -> Dict[str, Any]:
+    """Arrow schemas per table (built lazily so the module imports without pyarrow)"""
+    return {
+        'messages': pa.schema([
+            ('id', pa.int64()),
+            ('source', pa.string()),
+            ('date', pa.string()),
+            ('content', pa.string()),
+            ('metadata', pa.string()),
+        ]),
+        'calendar_events': pa.schema([
+            ('message_id', pa.int64()),
+            ('event_id', pa.string()),
+            ('date', pa.string()),
+            ('summary', pa.string()),
+            ('start_time', pa.string()),
+            ('end_time', pa.string()),
+            ('all_day', pa.bool_()),
+            ('duration_minutes', pa.float64()),
+            ('organizer_email', pa.string()),
+            ('status', pa.string()),
+            ('location', pa.string()),
+            ('attendee_count', pa.int32()),
+        ]),
+        'calendar_attendees': pa.schema([
+            ('message_id', pa.int64()),
+            ('event_id', pa.string()),
+            ('date', pa.string()),
+            ('email', pa.string()),
+            ('display_name', pa.string()),
+            ('response_status', pa.string()),
+            ('is_organizer', pa.bool_()),
+            ('is_optional', pa.bool_()),
+        ]),
+        'daily_rollups': pa.schema([
+            ('source', pa.string()),
+            ('date', pa.string()),
+            ('record_count', pa.int64()),
+            ('content_chars', pa.int64()),
+        ]),
+    }
+
+
+def partition_month(date_value: Optional[str]) -> str:
+    """
+    Map a YYYY-MM-DD date to its YYYY-MM partition value
+
+    Args:
+        date_value: Date string as stored in messages.date
+
+    Returns:
+        'YYYY-MM', or 'unknown' for missing/malformed dates
+    """
+    if date_value and len(date_value) >= 7 and date_value[4] == '-':
+        month = date_value[:7]
+        if month[:4].isdigit() and month[5:7].isdigit():
+            return month
+    return UNKNOWN_MONTH
+
+
+def _event_time(value: Any) -> Tuple[Optional[str], bool]:
+    """Extract (iso_time, all_day) from a Google Calendar start/end value"""
+    if isinstance(value, dict):
+        if value.get('dateTime'):
+            return value['dateTime'], False
+        if value.get('date'):
+            return value['date'], True
+        return None, False
+    if isinstance(value, str) and value:
+        return value, 'T' not in value
+    return None, False
+
+
+def _duration_minutes(start: Optional[str], end: Optional[str]) -> Optional[float]:
+    """Event length in minutes, or None if either bound does not parse"""
+    if not start or not end:
+        return None
+    try:
+        start_dt = datetime.fromisoformat(start.replace('Z', '+00:00'))
+        end_dt = datetime.fromisoformat(end.replace('Z', '+00:00'))
+        return (end_dt - start_dt).total_seconds() / 60.0
+    except (ValueError, TypeError):
+        return None
+
+
+def flatten_calendar_event(message_id: int, date: str,
+                           record: Dict[str, Any]) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Flatten an indexed calendar record into event and attendee rows
+
+    Args:
+        message_id: messages.id of the indexed record
+        date: messages.date of the indexed record
+        record: Decoded calendar event metadata
+
+    Returns:
+        Tuple of (event_row, attendee_rows) keyed by the table field names
+    """
+    event_id = str(record.get('id') or record.get('event_id') or '') or None
+    start_time, all_day = _event_time(record.get('start'))
+    end_time, _ = _event_time(record.get('end'))
+
+    organizer = record.get('organizer')
+    organizer_email = organizer.get('email') if isinstance(organizer, dict) else organizer
+
+    attendees = record.get('attendees')
+    attendee_rows = []
+    if isinstance(attendees, list):
+        for attendee in attendees:
+            if isinstance(attendee, dict):
+                email = attendee.get('email')
+                attendee_rows.append({
+                    'message_id': message_id,
+                    'event_id': event_id,
+                    'date': date,
+                    'email': email,
+                    'display_name': attendee.get('displayName'),
+                    'response_status': attendee.get('responseStatus'),
+                    'is_organizer': bool(attendee.get('organizer')) or
+                                    (email is not None and email == organizer_email),
+                    'is_optional': bool(attendee.get('optional')),
+                })
+            elif isinstance(attendee, str):
+                attendee_rows.append({
+                    'message_id': message_id,
+                    'event_id': event_id,
+                    'date': date,
+                    'email': attendee,
+                    'display_name': None,
+                    'response_status': None,
+                    'is_organizer': attendee == organizer_email,
+                    'is_optional': False,
+                })
+
+    event_row = {
+        'message_id': message_id,
+        'event_id': event_id,
+        'date': date,
+        'summary': record.get('summary') or record.get('title'),
+        'start_time': start_time,
+        'end_time': end_time,
+        'all_day': all_day,
+        'duration_minutes': _duration_minutes(start_time, end_time),
+        'organizer_email': organizer_email if isinstance(organizer_email, str) else None,
+        'status': record.get('status'),
+        'location': record.get('location'),
+        'attendee_count': len(attendee_rows),
+    }
+    return event_row, attendee_rows
+
+
+class _PartitionedParquetWriter:
+    """
+    Buffers rows per (table, partition) and flushes them as Parquet row groups
+
+    Files are written under a temporary name and only renamed into place by
+    commit(), so an interrupted run never leaves half-written parts behind.
+    """
+
+    def __init__(self, output_dir: Path, part_name: str, row_group_size: int,
+                 compression: str):
+        self.output_dir = output_dir
+        self.part_name = part_name
+        self.row_group_size = row_group_size
+        self.compression = compression
+        self.schemas = _schemas()
+        self._buffers: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], List[Dict[str, Any]]] = {}
+        self._writers: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], Any] = {}
+        self._paths: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], Path] = {}
+        self.rows_written: Dict[str, int] = {}
+
+    def _partition_dir(self, table: str, partition: Tuple[Tuple[str, str], ...]) -> Path:
+        path = self.output_dir / table
+        for name, value in partition:
+            path = path / f"{name}={value}"
+        return path
+
+    def add(self, table: str, partition: Tuple[Tuple[str, str], ...], row: Dict[str, Any]):
+        key = (table, partition)
+        buffer = self._buffers.setdefault(key, [])
+        buffer.append(row)
+        if len(buffer) >= self.row_group_size:
+            self._flush(key)
+
+    def _flush(self, key):
+        buffer = self._buffers.get(key)
+        if not buffer:
+            return
+        table, partition = key
+        schema = self.schemas[table]
+        writer = self._writers.get(key)
+        if writer is None:
+            final_path = self._partition_dir(table, partition) / self.part_name
+            final_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = final_path.with_name(final_path.name + '.tmp')
+            writer = pq.ParquetWriter(str(tmp_path), schema, compression=self.compression)
+            self._writers[key] = writer
+            self._paths[key] = final_path
+        columns = {name: [row[name] for row in buffer] for name in schema.names}
+        writer.write_table(pa.Table.from_pydict(columns, schema=schema))
+        self.rows_written[table] = self.rows_written.get(table, 0) + len(buffer)
+        self._buffers[key] = []
+
+    def commit(self) -> List[Path]:
+        """Flush all buffers, close writers and move parts into place"""
+        for key in list(self._buffers):
+            self._flush(key)
+        written = []
+        for key, writer in self._writers.items():
+            writer.close()
+            final_path = self._paths[key]
+            os.replace(final_path.with_name(final_path.name + '.tmp'), final_path)
+            written.append(final_path)
+        self._writers.clear()
+        return written
+
+    def abort(self):
+        """Close writers and remove temporary files"""
+        for key, writer in self._writers.items():
+            try:
+                writer.close()
+            except Exception:
+                pass
+            final_path = self._paths[key]
+            final_path.with_name(final_path.name + '.tmp').unlink(missing_ok=True)
+        self._writers.clear()
+
+
+def watermark_key(output_dir: str) -> str:
+    """search_metadata key holding the watermark for an output directory"""
+    return WATERMARK_KEY_PREFIX + str(Path(output_dir).resolve())
+
+
+def get_watermark(db, output_dir: str) -> int:
+    """
+    Highest message id already exported to output_dir
+
+    Returns:
+        Message id, or 0 if nothing has been exported there yet
+    """
+    value = db.get_metadata_value(watermark_key(output_dir))
+    if not value:
+        return 0
+    try:
+        return int(json.loads(value).get('last_id', 0))
+    except (ValueError, AttributeError, TypeError):
+        logger.warning(f"Ignoring unreadable columnar export watermark: {value!r}")
+        return 0
+
+
+def _write_rollups(db, output_dir: Path, months: Dict[str, set], compression: str) -> int:
+    """Recompute daily rollups for each (source, month) touched by this run"""
+    schema = _schemas()['daily_rollups']
+    files = 0
+    with db.connection() as conn:
+        for source, source_months in months.items():
+            for month in sorted(source_months):
+                if month == UNKNOWN_MONTH:
+                    continue
+                rows = conn.execute("""
+                    SELECT date, COUNT(*), COALESCE(SUM(LENGTH(content)), 0)
+                    FROM messages
+                    WHERE source = ? AND date >= ? AND date < ?
+                    GROUP BY date ORDER BY date
+                """, (source, f"{month}-01", f"{month}-32")).fetchall()
+                table = pa.Table.from_pydict({
+                    'source': [source] * len(rows),
+                    'date': [row[0] for row in rows],
+                    'record_count': [row[1] for row in rows],
+                    'content_chars': [row[2] for row in rows],
+                }, schema=schema)
+                path = output_dir / 'daily_rollups' / f"source={source}" / f"month={month}"
+                path.mkdir(parents=True, exist_ok=True)
+                tmp_path = path / 'rollup.parquet.tmp'
+                pq.write_table(table, str(tmp_path), compression=compression)
+                os.replace(tmp_path, path / 'rollup.parquet')
+                files += 1
+    return files
+
+
+def export_columnar(db, output_dir: str, full: bool = False, batch_size: int = 1000,
+                    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+                    compression: str = 'zstd',
+                    progress_callback: Optional[Callable[[int], None]] = None,
+                    progress_interval: int = 10000) -> Dict[str, Any]:
+    """
+    Snapshot the search index into partitioned Parquet under output_dir
+
+    Args:
+        db: SearchDatabase instance
+        output_dir: Root directory of the Parquet dataset
+        full: Ignore the stored watermark, drop the existing dataset tables
+              and export every row again
+        batch_size: Rows fetched from SQLite per round trip
+        row_group_size: Rows buffered per partition before a row group is written
+        compression: Parquet codec (zstd, snappy, gzip, none)
+        progress_callback: Called with the number of messages read so far
+
+    Returns:
+        Summary with previous/new watermark, row counts per table and files written
+
+    Raises:
+        ColumnarExportError: If pyarrow is missing or the export fails
+    """
+    if not HAS_PYARROW:
+        raise ColumnarExportError(
+            "Columnar export requires pyarrow (pip install pyarrow)")
+
+    root = Path(output_dir)
+    previous_watermark = 0 if full else get_watermark(db, output_dir)
+    if full:
+        for table in TABLES:
+            shutil.rmtree(root / table, ignore_errors=True)
+    part_name = f"part-{previous_watermark + 1:012d}.parquet"
+    writer = _PartitionedParquetWriter(root, part_name, row_group_size, compression)
+
+    last_id = previous_watermark
+    read = 0
+    touched_months: Dict[str, set] = {}
+
+    try:
+        for row_id, content, source, date, metadata_json in db.iter_records(
+                batch_size=batch_size, after_id=previous_watermark):
+            month = partition_month(date)
+            touched_months.setdefault(source, set()).add(month)
+            writer.add('messages', (('source', source), ('month', month)), {
+                'id': row_id, 'source': source, 'date': date,
+                'content': content, 'metadata': metadata_json,
+            })
+
+            if source == 'calendar' and metadata_json:
+                try:
+                    record = json.loads(metadata_json)
+                except ValueError:
+                    record = None
+                if isinstance(record, dict):
+                    event_row, attendee_rows = flatten_calendar_event(row_id, date, record)
+                    writer.add('calendar_events', (('month', month),), event_row)
+                    for attendee_row in attendee_rows:
+                        writer.add('calendar_attendees', (('month', month),), attendee_row)
+
+            last_id = max(last_id, row_id)
+            read += 1
+            if progress_callback and read % progress_interval == 0:
+                progress_callback(read)
+
+        files = writer.commit()
+        rollup_files = _write_rollups(db, root, touched_months, compression) if read else 0
+    except ColumnarExportError:
+        writer.abort()
+        raise
+    except Exception as e:
+        writer.abort()
+        raise ColumnarExportError(f"Columnar export to {output_dir} failed: {str(e)}")
+
+    if progress_callback and read % progress_interval:
+        progress_callback(read)
+
+    if last_id != previous_watermark or full:
+        db.set_metadata_value(watermark_key(output_dir), json.dumps({
+            'last_id': last_id,
+            'exported_at': datetime.now().isoformat(),
+        }))
+
+    return {
+        'output_dir': str(root),
+        'previous_watermark': previous_watermark,
+        'watermark': last_id,
+        'rows': dict(writer.rows_written),
+        'files_written': len(files) + rollup_files,
+    }
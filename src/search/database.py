@@ -25,8 +25,18 @@ from contextlib import contextmanager
 from queue import Queue, Empty
 from datetime import datetime
 
+from ..core import json_codec
+from .pagination import encode_cursor, decode_cursor, query_fingerprint
+
 logger = logging.getLogger(__name__)
 
+# Author lookups guarded by json_valid so malformed metadata never breaks inserts.
+# Queries must use these exact expressions for SQLite to pick the indexes.
+AUTHOR_EMAIL_EXPR = "(CASE WHEN json_valid(metadata) THEN json_extract(metadata, '$.author_email') END)"
+AUTHOR_EXPR = "(CASE WHEN json_valid(metadata) THEN json_extract(metadata, '$.author') END)"
+# Slack records keep the sender's user ID under 'user' and have no author field
+USER_EXPR = "(CASE WHEN json_valid(metadata) THEN json_extract(metadata, '$.user') END)"
+
 class DatabaseError(Exception):
     """Raised when database operations fail"""
     pass
@@ -44,7 +54,7 @@ class SearchDatabase:
     - Enhanced error recovery with individual record handling
     """
     
-    CURRENT_SCHEMA_VERSION = 2  # Incremented due to schema fixes
+    CURRENT_SCHEMA_VERSION = 4  # v4: Slack user ID expression index for person filters
     
     def __init__(self, db_path: str = "search.db", pool_size: int = 3):
         """
@@ -176,6 +186,7 @@ class SearchDatabase:
         conn.execute("CREATE INDEX IF NOT EXISTS idx_messages_source ON messages(source)")
         conn.execute("CREATE INDEX IF NOT EXISTS idx_messages_date ON messages(date)")
         conn.execute("CREATE INDEX IF NOT EXISTS idx_messages_created_at ON messages(created_at)")  # CRITICAL MISSING INDEX
+        self._create_author_indexes(conn)
         
         logger.info("Created initial search database schema with all critical fixes applied")
     
@@ -198,11 +209,29 @@ class SearchDatabase:
             # Add missing critical index
             conn.execute("CREATE INDEX IF NOT EXISTS idx_messages_created_at ON messages(created_at)")
             
-            # Update schema version
-            conn.execute(f"PRAGMA user_version = {self.CURRENT_SCHEMA_VERSION}")
+        if from_version < 4:
+            logger.info("Migrating to schema version 4: Adding author and Slack user history indexes")
+            self._create_author_indexes(conn)
+        
+        # Update schema version
+        conn.execute(f"PRAGMA user_version = {self.CURRENT_SCHEMA_VERSION}")
             
         logger.info(f"Schema migration completed to version {self.CURRENT_SCHEMA_VERSION}")
     
+    def _create_author_indexes(self, conn: sqlite3.Connection):
+        """
+        Expression indexes backing keyset pagination of per-person history
+        
+        Each index is ordered (author, date, id) so a page of a person's messages
+        is a bounded index range scan regardless of how deep the page is.
+        """
+        conn.execute(f"CREATE INDEX IF NOT EXISTS idx_messages_author_email_date "
+                     f"ON messages({AUTHOR_EMAIL_EXPR}, date, id)")
+        conn.execute(f"CREATE INDEX IF NOT EXISTS idx_messages_author_date "
+                     f"ON messages({AUTHOR_EXPR}, date, id)")
+        conn.execute(f"CREATE INDEX IF NOT EXISTS idx_messages_user_date "
+                     f"ON messages({USER_EXPR}, date, id)")
+    
     def _register_cleanup(self):
         """Register cleanup handlers for proper connection cleanup"""
         if not self._cleanup_registered:
@@ -450,7 +479,7 @@ class SearchDatabase:
                                 source,
                                 record.get('created_at', record.get('timestamp', '')),
                                 self._extract_date(record),
-                                json.dumps(record)
+                                json_codec.dumps(record)
                             ))
                             
                             indexed += 1
@@ -548,10 +577,38 @@ class SearchDatabase:
         Returns:
             List of matching records with relevance scores
         """
+        return self.search_page(query, source=source, date_range=date_range, limit=limit)['results']
+    
+    def search_page(self, query: str, source: str = None, date_range: tuple = None,
+                    limit: int = 100, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Search one page of results with keyset continuation
+        
+        Results are ordered by (rank, rowid); the returned cursor encodes the
+        last pair so the next page starts with a range predicate instead of an
+        OFFSET that re-ranks and discards every earlier row.
+        
+        Args:
+            query: Search query string
+            source: Filter by source type
+            date_range: Tuple of (start_date, end_date)
+            limit: Maximum results per page
+            cursor: Continuation token from a previous page, None for the first page
+            
+        Returns:
+            Dict with 'results' (same shape as search()) and 'next_cursor'
+            (None when there are no more results)
+            
+        Raises:
+            InvalidCursorError: If cursor is malformed or belongs to another query
+        """
+        fingerprint = query_fingerprint('search', query, source, date_range)
+        after = decode_cursor(cursor, fingerprint, key_length=2) if cursor else None
+        
         with self.connection() as conn:
             # Build query using proper joins (FIXED: no recursion issues)
             sql_parts = ["""
-                SELECT m.content, m.source, m.date, m.metadata, fts.rank
+                SELECT m.id, m.content, m.source, m.date, m.metadata, fts.rank
                 FROM messages m
                 JOIN messages_fts fts ON m.id = fts.rowid
             """]
@@ -573,22 +630,31 @@ class SearchDatabase:
                 where_parts.append("m.date BETWEEN ? AND ?")
                 params.extend([start_date, end_date])
             
+            # Keyset continuation: strictly after the last (rank, rowid) seen
+            if after:
+                last_rank, last_id = after
+                where_parts.append("(fts.rank > ? OR (fts.rank = ? AND m.id > ?))")
+                params.extend([last_rank, last_rank, last_id])
+            
             # Combine query
             if where_parts:
                 sql_parts.append("WHERE " + " AND ".join(where_parts))
             
-            sql_parts.append("ORDER BY fts.rank LIMIT ?")
-            params.append(limit)
+            # Fetch one extra row to know whether another page exists
+            sql_parts.append("ORDER BY fts.rank, m.id LIMIT ?")
+            params.append(limit + 1)
             
             sql = " ".join(sql_parts)
             
-            cursor = conn.execute(sql, params)
+            cursor_rows = conn.execute(sql, params).fetchall()
+            has_more = len(cursor_rows) > limit
+            rows = cursor_rows[:limit]
             results = []
             
-            for row in cursor.fetchall():
-                content, source_val, date, metadata_json, rank = row
+            for row in rows:
+                _, content, source_val, date, metadata_json, rank = row
                 try:
-                    metadata = json.loads(metadata_json) if metadata_json else {}
+                    metadata = json_codec.loads(metadata_json) if metadata_json else {}
                 except json.JSONDecodeError:
                     metadata = {}
                 
@@ -600,8 +666,87 @@ class SearchDatabase:
                     'relevance_score': rank
                 })
             
+            next_cursor = None
+            if has_more and rows:
+                last_row = rows[-1]
+                next_cursor = encode_cursor([last_row[5], last_row[0]], fingerprint)
+            
             self._stats['queries_executed'] += 1
-            return results
+            return {'results': results, 'next_cursor': next_cursor}
+    
+    def iter_records(self, query: Optional[str] = None, source: str = None,
+                     date_range: tuple = None, batch_size: int = 1000,
+                     after_id: Optional[int] = None) -> Generator[tuple, None, None]:
+        """
+        Stream raw message rows for export without materializing the result set
+        
+        Rows are pulled from the SQLite cursor with fetchmany, so memory stays
+        bounded by batch_size regardless of how many rows match. Metadata is
+        yielded as the stored JSON text so writers can pass it through
+        without a decode/encode round trip.
+        
+        Args:
+            query: Optional FTS5 query; None streams every matching row
+            source: Filter by source type
+            date_range: Tuple of (start_date, end_date)
+            batch_size: Rows fetched from SQLite per round trip
+            after_id: Only stream rows with id greater than this (incremental exports)
+            
+        Yields:
+            (id, content, source, date, metadata_json) tuples in (date, id) order
+        """
+        sql_parts = ["SELECT m.id, m.content, m.source, m.date, m.metadata FROM messages m"]
+        params = []
+        where_parts = []
+        
+        if query:
+            sql_parts.append("JOIN messages_fts fts ON m.id = fts.rowid")
+            where_parts.append("messages_fts MATCH ?")
+            params.append(query)
+        
+        if source:
+            where_parts.append("m.source = ?")
+            params.append(source)
+        
+        if date_range:
+            start_date, end_date = date_range
+            where_parts.append("m.date BETWEEN ? AND ?")
+            params.extend([start_date, end_date])
+        
+        if after_id is not None:
+            where_parts.append("m.id > ?")
+            params.append(after_id)
+        
+        if where_parts:
+            sql_parts.append("WHERE " + " AND ".join(where_parts))
+        
+        sql_parts.append("ORDER BY m.date, m.id")
+        
+        with self.connection() as conn:
+            cursor = conn.execute(" ".join(sql_parts), params)
+            self._stats['queries_executed'] += 1
+            try:
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield from rows
+            finally:
+                cursor.close()
+    
+    def get_metadata_value(self, key: str) -> Optional[str]:
+        """Read a value from the search_metadata key/value table"""
+        with self.connection() as conn:
+            row = conn.execute("SELECT value FROM search_metadata WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+    
+    def set_metadata_value(self, key: str, value: str):
+        """Insert or replace a value in the search_metadata key/value table"""
+        with self.transaction() as conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO search_metadata (key, value, updated_at)
+                VALUES (?, ?, ?)
+            """, (key, value, datetime.now().isoformat()))
     
     def get_stats(self) -> Dict[str, Any]:
         """Get database statistics"""
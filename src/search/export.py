@@ -0,0 +1,181 @@
+"""
+Streaming export of indexed records to NDJSON or CSV
+
+Exports pull rows from SearchDatabase.iter_records (SQLite fetchmany) and
+write them one at a time, so memory use is constant regardless of how many
+rows a time range covers and the first bytes reach the consumer immediately.
+Output can go to stdout or a file, optionally gzip-compressed, for loading
+into offline analysis tools such as DuckDB (read_json_auto / read_csv_auto).
+
+References:
+- src/search/database.py - SearchDatabase.iter_records row source
+- tools/search_cli.py - `export` subcommand
+- tools/query_facts.py - `export` command with natural language time ranges
+"""
+
+import csv
+import gzip
+import io
+import json
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional, TextIO, Tuple
+
+from ..core import json_codec
+
+EXPORT_FORMATS = ('ndjson', 'csv')
+CSV_FIELDS = ['id', 'source', 'date', 'content', 'metadata']
+DEFAULT_PROGRESS_INTERVAL = 10000
+
+
+class ExportError(Exception):
+    """Raised when an export cannot be written"""
+    pass
+
+
+@contextmanager
+def open_export_output(output_path: Optional[str] = None,
+                       compress: bool = False) -> Iterator[TextIO]:
+    """
+    Open the export destination as a text stream
+
+    Args:
+        output_path: File path, or None / '-' for stdout
+        compress: Gzip the output (a .gz suffix is not added automatically)
+
+    Yields:
+        Text stream to write export lines to
+    """
+    to_stdout = output_path in (None, '-')
+
+    try:
+        if to_stdout and compress:
+            gz = gzip.GzipFile(fileobj=sys.stdout.buffer, mode='wb')
+            stream = io.TextIOWrapper(gz, encoding='utf-8', newline='')
+            try:
+                yield stream
+            finally:
+                stream.flush()
+                stream.detach()
+                gz.close()
+                sys.stdout.buffer.flush()
+        elif to_stdout:
+            yield sys.stdout
+            sys.stdout.flush()
+        else:
+            path = Path(output_path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if compress:
+                with gzip.open(path, 'wt', encoding='utf-8', newline='') as stream:
+                    yield stream
+            else:
+                with open(path, 'w', encoding='utf-8', newline='') as stream:
+                    yield stream
+    except OSError as e:
+        raise ExportError(f"Failed to write export to {output_path or 'stdout'}: {str(e)}")
+
+
+def _is_json(text: str) -> bool:
+    """True when text is a well-formed JSON document"""
+    try:
+        json_codec.loads(text)
+    except ValueError:
+        return False
+    return True
+
+
+def _ndjson_line(row: Tuple) -> str:
+    """Serialize a message row as one NDJSON line"""
+    row_id, content, source, date, metadata_json = row
+
+    # Stored metadata is already JSON text; splice it in once it parses, so a
+    # corrupt value is exported as a string rather than breaking the line
+    if metadata_json and metadata_json[:1] in ('{', '[') and _is_json(metadata_json):
+        metadata_text = metadata_json
+    elif metadata_json:
+        metadata_text = json.dumps(metadata_json, ensure_ascii=False)
+    else:
+        metadata_text = 'null'
+
+    head = json.dumps({'id': row_id, 'source': source, 'date': date, 'content': content},
+                      ensure_ascii=False)
+    return f'{head[:-1]}, "metadata": {metadata_text}}}\n'
+
+
+def write_records(rows: Iterable[Tuple], stream: TextIO, output_format: str = 'ndjson',
+                  progress_callback: Optional[Callable[[int, float], None]] = None,
+                  progress_interval: int = DEFAULT_PROGRESS_INTERVAL) -> int:
+    """
+    Write message rows incrementally in the requested format
+
+    Args:
+        rows: (id, content, source, date, metadata_json) tuples, typically from
+              SearchDatabase.iter_records
+        stream: Destination text stream
+        output_format: 'ndjson' or 'csv'
+        progress_callback: Called as (rows_written, rows_per_second) every
+                           progress_interval rows and once at the end
+        progress_interval: Rows between progress callbacks
+
+    Returns:
+        Number of rows written
+    """
+    if output_format not in EXPORT_FORMATS:
+        raise ExportError(f"Unsupported export format: {output_format}")
+
+    start_time = time.time()
+    written = 0
+
+    def report():
+        if progress_callback:
+            elapsed = time.time() - start_time
+            progress_callback(written, written / elapsed if elapsed > 0 else 0.0)
+
+    if output_format == 'csv':
+        writer = csv.writer(stream)
+        writer.writerow(CSV_FIELDS)
+        for row_id, content, source, date, metadata_json in rows:
+            writer.writerow([row_id, source, date, content, metadata_json or ''])
+            written += 1
+            if written % progress_interval == 0:
+                report()
+    else:
+        write = stream.write
+        for row in rows:
+            write(_ndjson_line(row))
+            written += 1
+            if written % progress_interval == 0:
+                report()
+
+    report()
+    return written
+
+
+def export_messages(db, output_path: Optional[str] = None, output_format: str = 'ndjson',
+                    compress: bool = False, query: Optional[str] = None,
+                    source: Optional[str] = None, date_range: Optional[tuple] = None,
+                    batch_size: int = 1000,
+                    progress_callback: Optional[Callable[[int, float], None]] = None) -> int:
+    """
+    Stream indexed messages from a SearchDatabase to a file or stdout
+
+    Args:
+        db: SearchDatabase instance
+        output_path: Destination file, or None / '-' for stdout
+        output_format: 'ndjson' or 'csv'
+        compress: Gzip the output
+        query: Optional FTS5 query to restrict the export
+        source: Optional source filter
+        date_range: Optional (start_date, end_date) tuple of YYYY-MM-DD strings
+        batch_size: Rows fetched from SQLite per round trip
+        progress_callback: Called as (rows_written, rows_per_second)
+
+    Returns:
+        Number of rows exported
+    """
+    rows = db.iter_records(query=query, source=source, date_range=date_range,
+                           batch_size=batch_size)
+    with open_export_output(output_path, compress) as stream:
+        return write_records(rows, stream, output_format, progress_callback)
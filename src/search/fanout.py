@@ -0,0 +1,167 @@
+"""
+Concurrent per-source search with merged top-k ranking
+
+Multi-source callers (context building, commitment extraction) used to issue
+one FTS query per source back to back, so latency was the sum of the
+per-source queries. FanOutSearcher runs the per-source queries concurrently,
+each on its own pooled connection and each bounded to k rows, then merges
+them with a fixed-size heap on normalized scores. Latency approaches that of
+the slowest source, and can be cut short once the heap is full of results
+that already clear an early-exit score.
+
+Scores: FTS5 bm25 rank is negative with lower meaning better. It is mapped
+to s / (1 + s) with s = -rank, giving a 0..1 score where higher is better
+that stays comparable across sources because they share one FTS index.
+
+References:
+- src/search/database.py - SearchDatabase.search and pooled connections
+- src/intelligence/api_service.py - /api/v1/context fans out across sources
+- src/intelligence/commitment_extractor.py - per-source extraction input
+"""
+
+import heapq
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EARLY_EXIT_SCORE = 0.9
+DEFAULT_MAX_WORKERS = 3
+
+
+def normalize_rank(rank: Optional[float]) -> float:
+    """
+    Map an FTS5 bm25 rank (negative, lower is better) to a 0..1 score
+
+    Args:
+        rank: Raw rank from messages_fts, or None
+
+    Returns:
+        Score in [0, 1), higher is better
+    """
+    if rank is None:
+        return 0.0
+    strength = -rank
+    if strength <= 0:
+        return 0.0
+    return strength / (1.0 + strength)
+
+
+@dataclass
+class FanOutResult:
+    """Merged outcome of a fan-out search"""
+    results: List[Dict[str, Any]] = field(default_factory=list)
+    by_source: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+    source_timings: Dict[str, float] = field(default_factory=dict)
+    failed_sources: Dict[str, str] = field(default_factory=dict)
+    early_exit: bool = False
+    duration: float = 0.0
+
+
+class FanOutSearcher:
+    """
+    Run one FTS query per source concurrently and merge the top k
+
+    Features:
+    - One worker per source, each using its own pooled SearchDatabase connection
+    - Per-source LIMIT so no source returns more than it could contribute
+    - Heap-based top-k merge on normalized scores (no full re-sort)
+    - Optional early exit once k results at or above a score threshold exist
+    """
+
+    def __init__(self, db, max_workers: Optional[int] = None,
+                 early_exit_score: Optional[float] = DEFAULT_EARLY_EXIT_SCORE):
+        """
+        Initialize fan-out searcher
+
+        Args:
+            db: SearchDatabase instance
+            max_workers: Concurrent source queries (default: db pool size)
+            early_exit_score: Stop waiting for slower sources once the top k all
+                              score at least this much; None always waits for every source
+        """
+        self.db = db
+        pool_size = getattr(db, 'pool_size', None)
+        self.max_workers = max_workers or (pool_size if isinstance(pool_size, int)
+                                           else DEFAULT_MAX_WORKERS)
+        self.early_exit_score = early_exit_score
+
+    def search(self, query: str, sources: List[str], date_range: Optional[tuple] = None,
+               k: int = 20, per_source_limit: Optional[int] = None) -> FanOutResult:
+        """
+        Search every source concurrently and return the merged top k
+
+        Args:
+            query: FTS5 query
+            sources: Source names to query (one subquery each)
+            date_range: Optional (start_date, end_date) filter
+            k: Number of merged results to return
+            per_source_limit: Rows requested per source (default: k)
+
+        Returns:
+            FanOutResult; each result carries the raw 'rank' and a normalized
+            'relevance_score' (higher is better)
+        """
+        start_time = time.time()
+        outcome = FanOutResult()
+        sources = list(dict.fromkeys(sources))
+        if not sources or k <= 0:
+            return outcome
+
+        limit = per_source_limit or k
+        heap: List[tuple] = []
+
+        def run(source: str):
+            source_start = time.time()
+            results = self.db.search(query=query, source=source,
+                                     date_range=date_range, limit=limit)
+            return results, time.time() - source_start
+
+        workers = max(1, min(self.max_workers, len(sources)))
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            pending = {executor.submit(run, source): (index, source)
+                       for index, source in enumerate(sources)}
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, source = pending.pop(future)
+                    try:
+                        results, elapsed = future.result()
+                    except Exception as e:
+                        logger.error(f"Fan-out search failed for source {source}: {e}")
+                        outcome.failed_sources[source] = str(e)
+                        continue
+
+                    outcome.source_timings[source] = elapsed
+                    for position, result in enumerate(results):
+                        score = normalize_rank(result.get('relevance_score'))
+                        # Ties resolve to earlier sources, then to each source's own order
+                        entry = (score, -index, -position, source, result)
+                        if len(heap) < k:
+                            heapq.heappush(heap, entry)
+                        elif entry[:3] > heap[0][:3]:
+                            heapq.heapreplace(heap, entry)
+
+                if (pending and self.early_exit_score is not None and len(heap) >= k
+                        and heap[0][0] >= self.early_exit_score):
+                    outcome.early_exit = True
+                    logger.debug(f"Fan-out early exit; skipping {len(pending)} slower sources")
+                    break
+        finally:
+            # Slower queries still running are left to finish on their own connections
+            executor.shutdown(wait=not outcome.early_exit, cancel_futures=True)
+
+        for score, _, _, source, result in sorted(heap, key=lambda entry: entry[:3], reverse=True):
+            merged = dict(result)
+            merged['rank'] = result.get('relevance_score')
+            merged['relevance_score'] = score
+            outcome.results.append(merged)
+            outcome.by_source.setdefault(source, []).append(merged)
+
+        outcome.duration = time.time() - start_time
+        return outcome
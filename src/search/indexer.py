@@ -7,7 +7,8 @@ the SearchDatabase with batch processing, streaming, and error handling.
 Key Features:
 - Batch processing of JSONL files (10,000 records per batch by default)
 - Incremental indexing with state persistence 
-- Memory-safe streaming for large archives
+- Memory-safe streaming for large archives, plain or compressed (.gz/.zst)
+- Resume of partially indexed archives by line, seeking via the .idx sidecar
 - Format detection and content extraction
 - Progress reporting and error recovery
 - Thread-safe concurrent processing
@@ -31,9 +32,15 @@ from dataclasses import dataclass, field
 from datetime import datetime
 
 from .database import SearchDatabase, DatabaseError
+from ..core.archive_catalog import ArchiveCatalog, ArchiveCatalogError
+from ..core.archive_reader import read_jsonl
 
 logger = logging.getLogger(__name__)
 
+# search_metadata key prefix for per-file progress of partially indexed archives
+PROGRESS_KEY_PREFIX = 'indexer_progress:'
+ARCHIVE_PATTERNS = ('*.jsonl', '*.jsonl.gz', '*.jsonl.zst')
+
 
 class IndexingError(Exception):
     """Exception raised during archive indexing operations"""
@@ -138,12 +145,17 @@ class ArchiveIndexer:
                 logger.info(f"Skipping unchanged file: {file_path}")
                 return stats
             
+            # Resume after the last batch a previous run committed for this file
+            start_line = self._resume_line(file_path)
+            if start_line:
+                logger.info(f"Resuming {file_path} at line {start_line}")
+            
             # Stream and process file in batches
             processed_count = 0
             error_count = 0
             errors = []
             
-            for batch_num, batch_info in enumerate(self._stream_jsonl_batches(file_path)):
+            for batch_num, batch_info in enumerate(self._stream_jsonl_batches(file_path, start_line)):
                 if isinstance(batch_info, dict) and 'errors' in batch_info:
                     # This batch contains error information from JSON parsing
                     batch = batch_info['records']
@@ -163,6 +175,9 @@ class ArchiveIndexer:
                         self.database.index_records_batch(processed_batch, source)
                         processed_count += len(processed_batch)
                     
+                    if isinstance(batch_info, dict) and 'next_line' in batch_info:
+                        self._save_progress(file_path, batch_info['next_line'])
+                    
                     # Progress callback
                     if progress_callback and batch_num % 10 == 0:  # Update every 10 batches
                         rate = processed_count / max(0.1, (time.time() - stats.start_time.timestamp()))
@@ -185,9 +200,11 @@ class ArchiveIndexer:
             
             # Update file cursor for incremental indexing
             self._update_file_cursor(file_path)
+            self._save_progress(file_path, None)
             
             # Track archive in database
             self._track_archive_in_database(file_path, source, processed_count)
+            self._mark_indexed_in_catalog(file_path)
             
             # Complete stats
             stats.errors = errors
@@ -226,13 +243,15 @@ class ArchiveIndexer:
             except Exception as e:
                 logger.warning(f"Failed to load manifest {manifest_path}: {e}")
         
-        # Find JSONL files to process
-        jsonl_files = list(directory_path.glob("*.jsonl"))
+        # Find JSONL files to process (compressed archives included)
+        jsonl_files = sorted(path for pattern in ARCHIVE_PATTERNS
+                             for path in directory_path.glob(pattern))
         
         if not jsonl_files:
             # Try looking for specific files mentioned in manifest
             if manifest and 'files' in manifest:
-                jsonl_files = [directory_path / f for f in manifest['files'] if f.endswith('.jsonl')]
+                jsonl_files = [directory_path / f for f in manifest['files']
+                               if f.endswith(('.jsonl', '.jsonl.gz', '.jsonl.zst'))]
         
         if not jsonl_files:
             raise IndexingError(f"No JSONL files found in directory: {directory_path}")
@@ -258,64 +277,62 @@ class ArchiveIndexer:
         combined_stats.complete(combined_stats.processed, combined_stats.error_count)
         return combined_stats
     
-    def _stream_jsonl_batches(self, file_path: Path) -> Generator[Dict[str, Any], None, None]:
+    def _stream_jsonl_batches(self, file_path: Path,
+                              start_line: int = 0) -> Generator[Dict[str, Any], None, None]:
         """
         Stream JSONL file in batches for memory efficiency
         
         Args:
-            file_path: Path to JSONL file
+            file_path: Path to JSONL file (.jsonl, .jsonl.gz or .jsonl.zst)
+            start_line: Number of lines to skip; compressed archives with a
+                        .idx sidecar seek straight to the frame holding it
             
         Yields:
-            Dict containing 'records' (list of parsed records) and 'errors' (list of error info)
+            Dict containing 'records' (list of parsed records), 'errors' (list of
+            error info) and 'next_line' (lines consumed so far)
         """
         if not file_path.exists():
             raise IndexingError(f"File not found: {file_path}")
         
         batch = []
         batch_errors = []
-        line_number = 0
+        line_number = start_line
+        
+        def _record_error(error_line: int, preview: str, error: Exception):
+            # Track JSON errors for reporting
+            batch_errors.append({
+                'line_number': error_line,
+                'error': f"Invalid JSON: {str(error)}",
+                'raw_line': preview
+            })
+            logger.warning(f"Invalid JSON at {file_path}:{error_line}: {error}")
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line_number += 1
-                    line = line.strip()
-                    
-                    if not line:  # Skip empty lines
-                        continue
-                    
-                    try:
-                        record = json.loads(line)
-                        record['_line_number'] = line_number  # Track for error reporting
-                        batch.append(record)
-                        
-                    except json.JSONDecodeError as e:
-                        # Track JSON errors for reporting
-                        error_info = {
-                            'line_number': line_number,
-                            'error': f"Invalid JSON: {str(e)}",
-                            'raw_line': line[:100] + '...' if len(line) > 100 else line
-                        }
-                        batch_errors.append(error_info)
-                        logger.warning(f"Invalid JSON at {file_path}:{line_number}: {e}")
-                        continue
-                    
-                    # Yield batch when it reaches size limit
-                    if len(batch) >= self.batch_size:
-                        yield {
-                            'records': batch,
-                            'errors': batch_errors
-                        }
-                        batch = []
-                        batch_errors = []
+            for line_number, record in read_jsonl(file_path, start_line, on_error=_record_error):
+                if not isinstance(record, dict):
+                    _record_error(line_number, str(record)[:100], ValueError("record is not an object"))
+                    continue
+                record['_line_number'] = line_number  # Track for error reporting
+                batch.append(record)
                 
-                # Yield final partial batch
-                if batch or batch_errors:
+                # Yield batch when it reaches size limit
+                if len(batch) >= self.batch_size:
                     yield {
                         'records': batch,
-                        'errors': batch_errors
+                        'errors': batch_errors,
+                        'next_line': line_number
                     }
-                    
+                    batch = []
+                    batch_errors = []
+            
+            # Yield final partial batch
+            if batch or batch_errors:
+                yield {
+                    'records': batch,
+                    'errors': batch_errors,
+                    'next_line': max([line_number] + [e['line_number'] for e in batch_errors])
+                }
+                
         except Exception as e:
             raise IndexingError(f"Failed to stream file: {str(e)}", str(file_path))
     
@@ -511,6 +528,48 @@ class ArchiveIndexer:
             'file_size': file_path.stat().st_size
         }
     
+    def _progress_key(self, file_path: Path) -> str:
+        return PROGRESS_KEY_PREFIX + str(Path(file_path).resolve())
+    
+    def _resume_line(self, file_path: Path) -> int:
+        """
+        Line to resume a partially indexed file from
+        
+        Progress is only trusted while the file's size and mtime are unchanged.
+        
+        Args:
+            file_path: Archive being indexed
+            
+        Returns:
+            Lines already indexed, or 0 to start from the beginning
+        """
+        try:
+            raw = self.database.get_metadata_value(self._progress_key(file_path))
+            if not isinstance(raw, str) or not raw:
+                return 0
+            progress = json.loads(raw)
+            stat = file_path.stat()
+        except Exception as e:
+            logger.debug(f"No resumable progress for {file_path}: {e}")
+            return 0
+        
+        if (progress.get('file_size') != stat.st_size or
+                progress.get('mtime_ns') != stat.st_mtime_ns):
+            return 0
+        return int(progress.get('lines_indexed', 0))
+    
+    def _save_progress(self, file_path: Path, lines_indexed: Optional[int]):
+        """Persist lines committed so far for a file; None clears it on completion"""
+        value = ''
+        try:
+            if lines_indexed is not None:
+                stat = file_path.stat()
+                value = json.dumps({'lines_indexed': lines_indexed, 'file_size': stat.st_size,
+                                    'mtime_ns': stat.st_mtime_ns})
+            self.database.set_metadata_value(self._progress_key(file_path), value)
+        except Exception as e:
+            logger.debug(f"Could not save indexing progress for {file_path}: {e}")
+    
     def get_file_cursor(self, file_path: Path) -> Optional[Dict[str, Any]]:
         """Get cursor information for a file"""
         return self.file_cursors.get(str(file_path))
@@ -534,6 +593,16 @@ class ArchiveIndexer:
         except Exception as e:
             logger.warning(f"Failed to track archive {file_path}: {e}")
     
+    def _mark_indexed_in_catalog(self, file_path: Path):
+        """Record index state in the archive catalog covering the file, if any"""
+        catalog = ArchiveCatalog.find_for(file_path)
+        if catalog is None:
+            return
+        try:
+            catalog.mark_indexed(file_path)
+        except (ArchiveCatalogError, OSError) as e:
+            logger.debug(f"Could not record index state for {file_path}: {e}")
+    
     @staticmethod
     def _calculate_file_checksum(file_path: Path) -> str:
         """
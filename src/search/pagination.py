@@ -0,0 +1,101 @@
+"""
+Opaque continuation tokens for keyset pagination
+
+Search and history listings page with keyset predicates instead of
+LIMIT/OFFSET so that page N costs the same as page 1. The cursor carries the
+sort key of the last row returned plus a fingerprint of the query it belongs
+to, encoded as URL-safe base64 so it can travel through CLI flags, API bodies
+and Slack button values unchanged.
+
+Key shapes:
+- FTS search: (rank, rowid) ascending - rank is bm25, lower is better
+- Chronological history: (date, id) descending
+
+References:
+- src/search/database.py - SearchDatabase.search_page uses (rank, rowid)
+- src/queries/person_queries.py - message history uses (date, id)
+"""
+
+import base64
+import hashlib
+import json
+from typing import Any, List, Optional, Sequence
+
+CURSOR_VERSION = 1
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a continuation token is malformed or used with another query"""
+    pass
+
+
+def query_fingerprint(*parts: Any) -> str:
+    """
+    Build a short stable fingerprint for the parameters a cursor was issued for
+
+    Args:
+        *parts: Query parameters (query text, filters) that define the listing
+
+    Returns:
+        12 character hex digest
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:12]
+
+
+def encode_cursor(key: Sequence[Any], fingerprint: str) -> str:
+    """
+    Encode the sort key of the last returned row into an opaque token
+
+    Args:
+        key: Sort key values of the last row, in ORDER BY order
+        fingerprint: Fingerprint from query_fingerprint()
+
+    Returns:
+        URL-safe token without padding
+    """
+    payload = json.dumps({'v': CURSOR_VERSION, 'k': list(key), 'f': fingerprint},
+                         separators=(',', ':'))
+    token = base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+    return token.rstrip('=')
+
+
+def decode_cursor(token: str, fingerprint: Optional[str] = None,
+                  key_length: Optional[int] = None) -> List[Any]:
+    """
+    Decode a continuation token back into its sort key
+
+    Args:
+        token: Token produced by encode_cursor()
+        fingerprint: Expected query fingerprint; rejects tokens from other queries
+        key_length: Expected number of key components
+
+    Returns:
+        Sort key values of the last row of the previous page
+
+    Raises:
+        InvalidCursorError: If the token cannot be decoded or does not match
+    """
+    if not token or not isinstance(token, str):
+        raise InvalidCursorError("Empty cursor")
+
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+    except (ValueError, UnicodeError) as e:
+        raise InvalidCursorError(f"Malformed cursor: {str(e)}")
+
+    if not isinstance(payload, dict) or payload.get('v') != CURSOR_VERSION:
+        raise InvalidCursorError("Unsupported cursor version")
+
+    key = payload.get('k')
+    if not isinstance(key, list):
+        raise InvalidCursorError("Cursor has no sort key")
+
+    if key_length is not None and len(key) != key_length:
+        raise InvalidCursorError(f"Cursor key has {len(key)} parts, expected {key_length}")
+
+    if fingerprint is not None and payload.get('f') != fingerprint:
+        raise InvalidCursorError("Cursor was issued for a different query")
+
+    return key
@@ -0,0 +1,49 @@
+"""
+Mock meeting email and Google Doc records for testing the correlators.
+Records are generated from a seed - the same seed returns identical records.
+Emails and docs of the same meeting share time, participants and topic, with
+jittered doc times, title variants and missing fields.
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Tuple
+
+# Base timestamp for deterministic data
+BASE_DT = datetime(2025, 6, 2, 9, 0, tzinfo=timezone.utc)
+
+PEOPLE = ['David Smith', 'Charlie Brown', 'Alice Jones', 'Maria Garcia', 'Ben Lee', 'Priya Patel',
+          'Tom Wright', 'Sara Kim']
+TOPICS = ['Roadmap planning', 'Budget review', 'Customer onboarding', 'Hiring sync', 'Launch retro',
+          'Design critique', 'Security audit', 'Standup']
+
+
+def _email_address(name: str) -> str:
+    return name.lower().replace(' ', '.') + '@company.com'
+
+
+def get_mock_meeting_records(seed: int, meetings: int) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Email records and Google Doc records for a number of meetings"""
+    rng = random.Random(seed)
+    emails, docs = [], []
+    for i in range(meetings):
+        start = BASE_DT + timedelta(days=rng.randrange(40), minutes=30 * rng.randrange(16))
+        people = rng.sample(PEOPLE, rng.randrange(2, 4))
+        topic = rng.choice(TOPICS)
+        if rng.random() < 0.8:
+            emails.append({
+                'id': f'email_{i}',
+                'title': f'Invitation: {topic}' if rng.random() < 0.5 else topic,
+                'participants': [_email_address(p) for p in people],
+                'meeting_datetime': start.isoformat() if rng.random() < 0.9 else None,
+            })
+        if rng.random() < 0.8:
+            doc_time = start + timedelta(minutes=rng.choice([1, 3, 10, 25, 45, 300]))
+            first, second = (p.split()[0] for p in people[:2])
+            docs.append({
+                'id': f'doc_{i}',
+                'title': topic + rng.choice([' notes', 's', '']),
+                'filename': f"{first} _ {second} - {topic} - {doc_time:%Y_%m_%d %H_%M} UTC - Notes by Gemini.docx",
+                'meeting_metadata': {'participants': people if rng.random() < 0.5 else []},
+            })
+    return emails, docs
@@ -14,6 +14,8 @@ from datetime import datetime, timedelta
 from fastapi.testclient import TestClient
 from unittest.mock import Mock, patch, MagicMock
 
+from src.intelligence.query_planner import QueryPlan
+
 # Import the FastAPI app (to be created)
 try:
     from src.intelligence.api_service import app
@@ -111,7 +113,8 @@ class TestAPIService:
         """Test basic search functionality"""
         with patch('src.intelligence.api_service.query_engine') as mock_qe, \
              patch('src.intelligence.api_service.aggregator') as mock_agg, \
-             patch('src.intelligence.api_service.search_db') as mock_db:
+             patch('src.intelligence.api_service.search_db') as mock_db, \
+             patch('src.intelligence.api_service.QueryPlanner') as mock_planner_cls:
             
             # Configure mocks
             mock_parsed = Mock()
@@ -122,19 +125,24 @@ class TestAPIService:
             mock_parsed.person_filter = None
             mock_parsed.confidence = 0.8
             mock_qe.parse_query.return_value = mock_parsed
-            
-            mock_db.search.return_value = [
-                {
-                    "content": "Team meeting tomorrow at 2pm", 
-                    "source": "slack",
-                    "date": "2025-08-16",
-                    "metadata": {"user": "alice"},
-                    "relevance_score": 0.9
-                }
-            ]
+            mock_planner = mock_planner_cls.return_value
+            mock_planner.plan.return_value = QueryPlan(strategy='fts')
+            
+            mock_planner.execute.return_value = {
+                "results": [
+                    {
+                        "content": "Team meeting tomorrow at 2pm", 
+                        "source": "slack",
+                        "date": "2025-08-16",
+                        "metadata": {"user": "alice"},
+                        "relevance_score": 0.9
+                    }
+                ],
+                "next_cursor": None
+            }
             
             mock_aggregated = Mock()
-            mock_aggregated.results = mock_db.search.return_value
+            mock_aggregated.results = mock_planner.execute.return_value["results"]
             mock_aggregated.total_sources = 1
             mock_aggregated.duplicates_removed = 0
             mock_aggregated.confidence_score = 0.85
@@ -179,7 +187,8 @@ class TestAPIService:
         """Test search with source and time filters"""
         with patch('src.intelligence.api_service.query_engine') as mock_qe, \
              patch('src.intelligence.api_service.aggregator') as mock_agg, \
-             patch('src.intelligence.api_service.search_db') as mock_db:
+             patch('src.intelligence.api_service.search_db') as mock_db, \
+             patch('src.intelligence.api_service.QueryPlanner') as mock_planner_cls:
             
             # Configure mocks
             mock_parsed = Mock()
@@ -190,8 +199,10 @@ class TestAPIService:
             mock_parsed.person_filter = None
             mock_parsed.confidence = 0.7
             mock_qe.parse_query.return_value = mock_parsed
+            mock_planner = mock_planner_cls.return_value
+            mock_planner.plan.return_value = QueryPlan(strategy='fts')
             
-            mock_db.search.return_value = []
+            mock_planner.execute.return_value = {"results": [], "next_cursor": None}
             mock_aggregated = Mock()
             mock_aggregated.results = []
             mock_aggregated.total_sources = 2
@@ -214,9 +225,37 @@ class TestAPIService:
             
             # Verify filters were applied
             mock_qe.parse_query.assert_called_once()
-            mock_db.search.assert_called_once()
-            search_args = mock_db.search.call_args
-            assert search_args[1]["limit"] == 20
+            mock_planner.plan.assert_called_once()
+            plan_args = mock_planner.plan.call_args
+            assert plan_args[1]["limit"] == 20
+            mock_planner.execute.assert_called_once()
+            assert mock_planner.execute.call_args[1]["cursor"] is None
+
+    def test_search_invalid_cursor(self, client):
+        """Test that a malformed continuation token is rejected with 400"""
+        from src.search.pagination import InvalidCursorError
+
+        with patch('src.intelligence.api_service.query_engine') as mock_qe, \
+             patch('src.intelligence.api_service.aggregator') as mock_agg, \
+             patch('src.intelligence.api_service.search_db') as mock_db, \
+             patch('src.intelligence.api_service.QueryPlanner') as mock_planner_cls:
+
+            mock_parsed = Mock()
+            mock_parsed.keywords = ["test"]
+            mock_parsed.sources = []
+            mock_parsed.time_filter = None
+            mock_qe.parse_query.return_value = mock_parsed
+            mock_planner = mock_planner_cls.return_value
+            mock_planner.plan.return_value = QueryPlan(strategy='fts')
+            mock_planner.execute.side_effect = InvalidCursorError("Malformed cursor")
+
+            response = client.post("/api/v1/search", json={
+                "query": "test",
+                "cursor": "not-a-cursor"
+            })
+
+            assert response.status_code == 400
+            assert "Invalid cursor" in response.json()["detail"]
 
     def test_search_validation_errors(self, client):
         """Test search endpoint validation and service availability"""
@@ -527,6 +566,7 @@ class TestAPIService:
         with patch('src.intelligence.api_service.query_engine') as mock_qe, \
              patch('src.intelligence.api_service.aggregator') as mock_agg, \
              patch('src.intelligence.api_service.search_db') as mock_db, \
+             patch('src.intelligence.api_service.QueryPlanner') as mock_planner_cls, \
              patch('src.intelligence.api_service._log_search_analytics') as mock_log:
             
             # Configure mocks with proper objects
@@ -545,8 +585,10 @@ class TestAPIService:
                 metadata={}
             )
             mock_qe.parse_query.return_value = mock_parsed
+            mock_planner = mock_planner_cls.return_value
+            mock_planner.plan.return_value = QueryPlan(strategy='fts')
             
-            mock_db.search.return_value = []
+            mock_planner.execute.return_value = {"results": [], "next_cursor": None}
             
             # Create proper AggregatedResult mock with all required attributes
             from src.intelligence.result_aggregator import AggregatedResult
@@ -645,7 +687,8 @@ class TestAPIService:
         """Test time filter conversion utility"""
         with patch('src.intelligence.api_service.query_engine') as mock_qe, \
              patch('src.intelligence.api_service.aggregator') as mock_agg, \
-             patch('src.intelligence.api_service.search_db') as mock_db:
+             patch('src.intelligence.api_service.search_db') as mock_db, \
+             patch('src.intelligence.api_service.QueryPlanner') as mock_planner_cls:
             
             mock_parsed = Mock()
             mock_parsed.intent.value = "SEARCH_MESSAGES"
@@ -655,8 +698,10 @@ class TestAPIService:
             mock_parsed.person_filter = None
             mock_parsed.confidence = 0.8
             mock_qe.parse_query.return_value = mock_parsed
+            mock_planner = mock_planner_cls.return_value
+            mock_planner.plan.return_value = QueryPlan(strategy='fts')
             
-            mock_db.search.return_value = []
+            mock_planner.execute.return_value = {"results": [], "next_cursor": None}
             
             # Create proper AggregatedResult mock with all required attributes
             from src.intelligence.result_aggregator import AggregatedResult
@@ -684,10 +729,10 @@ class TestAPIService:
             
             assert response.status_code == 200
             
-            # Verify search was called with date_range parameter
-            mock_db.search.assert_called_once()
-            search_call = mock_db.search.call_args
-            assert "date_range" in search_call[1]
+            # Verify the plan was built with a date_range parameter
+            mock_planner.plan.assert_called_once()
+            plan_call = mock_planner.plan.call_args
+            assert plan_call[1]["date_range"] is not None
 
     def test_request_response_schemas(self, client):
         """Test that request/response follow expected schemas"""
@@ -706,7 +751,8 @@ class TestAPIService:
         
         with patch('src.intelligence.api_service.query_engine') as mock_qe, \
              patch('src.intelligence.api_service.aggregator') as mock_agg, \
-             patch('src.intelligence.api_service.search_db') as mock_db:
+             patch('src.intelligence.api_service.search_db') as mock_db, \
+             patch('src.intelligence.api_service.QueryPlanner') as mock_planner_cls:
             
             # Configure minimal mocks
             mock_parsed = Mock()
@@ -717,8 +763,10 @@ class TestAPIService:
             mock_parsed.person_filter = None
             mock_parsed.confidence = 0.8
             mock_qe.parse_query.return_value = mock_parsed
+            mock_planner = mock_planner_cls.return_value
+            mock_planner.plan.return_value = QueryPlan(strategy='fts')
             
-            mock_db.search.return_value = []
+            mock_planner.execute.return_value = {"results": [], "next_cursor": None}
             mock_aggregated = Mock()
             mock_aggregated.results = []
             mock_aggregated.total_sources = 3
@@ -548,4 +548,43 @@ class TestSearchCLI:
                 try:
                     json.loads(result.output)  # Should be valid JSON
                 except json.JSONDecodeError:
-                    pass  # Allow some malformed output under contention
\ No newline at end of file
+                    pass  # Allow some malformed output under contention    
+    def test_export_command_streams_ndjson(self, runner, temp_db_path, populated_database):
+        """Export writes one JSON object per indexed record"""
+        result = runner.invoke(search_cli, [
+            'export',
+            '--db', str(temp_db_path),
+            '--source', 'slack'
+        ])
+        
+        assert result.exit_code == 0
+        lines = [line for line in result.output.splitlines() if line.strip()]
+        assert len(lines) == populated_database.get_stats()['total_records']
+        
+        records = [json.loads(line) for line in lines]
+        assert all(r['source'] == 'slack' for r in records)
+        assert any('conference room' in r['content'] for r in records)
+        assert all(isinstance(r['metadata'], dict) for r in records)
+    
+    def test_export_command_gzip_csv_file(self, runner, temp_db_path, populated_database, tmp_path):
+        """Export writes gzip-compressed CSV to a file"""
+        import csv
+        import gzip
+        
+        output_path = tmp_path / "export.csv.gz"
+        result = runner.invoke(search_cli, [
+            'export',
+            '--db', str(temp_db_path),
+            '--format', 'csv',
+            '--gzip',
+            '-o', str(output_path)
+        ])
+        
+        total = populated_database.get_stats()['total_records']
+        assert result.exit_code == 0
+        assert f'Exported {total} records' in result.output
+        
+        with gzip.open(output_path, 'rt', newline='') as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == total
+        assert set(rows[0].keys()) == {'id', 'source', 'date', 'content', 'metadata'}
@@ -0,0 +1,63 @@
+"""
+JSON codec throughput benchmark
+
+Compares the standard library codec with every installed accelerator on
+archive-shaped Slack records. These are the operations ArchiveWriter,
+SearchDatabase and the archive reader run once per record.
+"""
+
+import json
+import time
+
+import pytest
+
+from src.core.json_codec import CODECS, create_codec
+
+RECORD_COUNT = 20000
+ROUNDS = 3
+
+
+def _records():
+    return [{
+        'type': 'message', 'ts': f'{1754006400 + i}.000100', 'user': f'U{i % 50:04d}',
+        'channel': f'C{i % 12:04d}', 'channel_name': 'eng-platform',
+        'text': f'Deploy {i} finished, see the dashboard for latency numbers — ok ✅',
+        'reactions': [{'name': 'tada', 'users': ['U0001', 'U0002'], 'count': 2}],
+        'thread_ts': None, 'edited': {'user': 'U0001', 'ts': '1754006500.000200'},
+        'archive_timestamp': '2025-08-01T10:00:00'
+    } for i in range(RECORD_COUNT)]
+
+
+def _best_rate(operation, items):
+    best = float('inf')
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for item in items:
+            operation(item)
+        best = min(best, time.perf_counter() - start)
+    return len(items) / best
+
+
+@pytest.mark.performance
+def test_codec_throughput():
+    """Accelerated codecs must encode archive records faster than the stdlib"""
+    records = _records()
+    lines = [json.dumps(record).encode() for record in records]
+
+    results = {}
+    for name in sorted(CODECS):
+        codec = create_codec(name)
+        results[name] = {
+            'encode': _best_rate(codec.dumps, records),
+            'decode': _best_rate(codec.loads, lines),
+        }
+
+    print("\n=== JSON CODEC THROUGHPUT (records/second) ===")
+    for name, rates in results.items():
+        print(f"{name}: " + ", ".join(f"{op} {rate:,.0f}" for op, rate in rates.items()))
+
+    baseline = results['json']
+    for name, rates in results.items():
+        if name == 'json':
+            continue
+        assert rates['encode'] > baseline['encode'] * 1.5, f"{name} encode not faster than stdlib"
@@ -0,0 +1,199 @@
+"""
+Tests for the SQLite archive catalog and its consumers
+
+References:
+- src/core/archive_catalog.py - ArchiveCatalog, catalog_for
+- src/core/compression_engine.py - find_candidates, record_outcome
+- src/core/archive_stats.py - statistics served from the catalog
+- src/core/archive_writer.py - catalog updates on append
+"""
+
+import json
+import os
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from src.core.archive_catalog import CATALOG_FILENAME, ArchiveCatalog, catalog_for, classify
+from src.core.archive_stats import ArchiveStats
+from src.core.archive_writer import ArchiveWriter
+from src.core.compression_engine import CompressionEngine, find_candidates
+from src.core.verification import ArchiveVerifier
+
+OLD = time.time() - 30 * 86400
+
+
+def _write_day(root, source, day, count=5, age=OLD):
+    path = root / source / f"2025-08-{day:02d}" / "data.jsonl"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        for i in range(count):
+            ts = datetime(2025, 8, day, 10, i, tzinfo=timezone.utc).isoformat()
+            f.write(json.dumps({'timestamp': ts, 'channel': 'C1', 'text': f'message {i}'}) + '\n')
+    os.utime(path, (age, age))
+    return path
+
+
+class TestCatalogBookkeeping:
+    """Test classification, reconcile and writer updates"""
+
+    def test_classify(self):
+        assert classify('data.jsonl.zst') == {'kind': 'data', 'compression': 'zstd'}
+        assert classify('manifest.json') == {'kind': 'manifest', 'compression': 'none'}
+        assert classify('data.jsonl.gz.idx')['kind'] == 'index'
+
+    def test_reconcile_tracks_drift(self, tmp_path):
+        first = _write_day(tmp_path, 'slack', 1)
+        second = _write_day(tmp_path, 'slack', 2)
+        (tmp_path / 'slack' / '2025-08-01' / 'data.jsonl.tmp').write_text('partial')
+        catalog = ArchiveCatalog(tmp_path)
+
+        assert catalog.reconcile() == {'files': 2, 'added': 2, 'updated': 0, 'removed': 0}
+        assert catalog.reconcile()['added'] == 0
+
+        with open(first, 'a') as f:
+            f.write('{}\n')
+        second.unlink()
+        _write_day(tmp_path, 'calendar', 3)
+
+        assert catalog.reconcile() == {'files': 2, 'added': 1, 'updated': 1, 'removed': 1}
+        assert {row['source'] for row in catalog.files()} == {'slack', 'calendar'}
+        assert not any(CATALOG_FILENAME in row['path'] for row in catalog.files())
+
+    def test_archive_writer_records_appends(self, tmp_path):
+        config = Mock()
+        config.archive_dir = tmp_path
+        with patch('src.core.archive_writer.get_config', return_value=config):
+            writer = ArchiveWriter('slack')
+            writer.write_records([{'text': 'a'}, {'text': 'b'}])
+            writer.write_records([{'text': 'c'}])
+
+        catalog = ArchiveCatalog.for_root(tmp_path)
+        data = catalog.files(kind='data')
+        assert len(data) == 1
+        assert data[0]['source'] == 'slack'
+        assert data[0]['record_count'] == 3
+        assert data[0]['size'] == Path(data[0]['path']).stat().st_size
+        assert len(catalog.files(kind='manifest')) == 1
+
+    def test_catalog_sees_files_written_behind_its_back(self, tmp_path):
+        _write_day(tmp_path, 'slack', 1)
+        ArchiveCatalog(tmp_path)
+        catalog = catalog_for(tmp_path)
+        assert len(catalog.files(kind='data')) == 1
+
+        # Settle directory mtimes so only real changes trigger a reconcile
+        for directory in (tmp_path / 'slack', tmp_path / 'slack' / '2025-08-01'):
+            os.utime(directory, (OLD, OLD))
+        catalog.reconcile()
+        assert catalog.ensure_fresh() is False
+
+        (tmp_path / 'slack' / '2025-08-01' / 'b.jsonl').write_text('{}\n')
+        assert len(catalog_for(tmp_path).files(kind='data')) == 2
+
+        _write_day(tmp_path, 'calendar', 2)
+        assert {row['source'] for row in catalog_for(tmp_path).files(kind='data')} == {'slack', 'calendar'}
+
+    def test_readers_never_create_catalogs(self, tmp_path):
+        config = Mock()
+        config.archive_dir = tmp_path
+        with patch('src.core.archive_writer.get_config', return_value=config):
+            ArchiveWriter('slack').write_records([{'text': 'a'}])
+        source_dir = tmp_path / 'slack'
+        other = tmp_path.parent / f"{tmp_path.name}-plain"
+        _write_day(other, 'slack', 1)
+
+        assert catalog_for(source_dir) is None
+        assert catalog_for(other) is None
+        assert find_candidates(other, time.time()) == [other / 'slack' / '2025-08-01' / 'data.jsonl']
+        assert ArchiveStats().calculate(source_dir)['total_files'] == 2
+        verifier = ArchiveVerifier()
+        verifier.checkpoint_file = other / 'checkpoint.json'
+        assert verifier.verify_directory(other, resume=False)['files_checked'] == 1
+
+        # Verification of the root also covers files the writer never saw
+        _write_day(tmp_path, 'slack', 2)
+        verifier = ArchiveVerifier()
+        verifier.checkpoint_file = other / 'checkpoint.json'
+        assert verifier.verify_directory(tmp_path, resume=False)['files_checked'] == 2
+
+        assert list(tmp_path.rglob(CATALOG_FILENAME)) == [tmp_path / CATALOG_FILENAME]
+        assert not list(other.rglob(CATALOG_FILENAME))
+
+
+class TestCatalogQueries:
+    """Test candidate selection, compression hand-off and index state"""
+
+    def test_candidates_skip_recent_and_compressed(self, tmp_path):
+        old = _write_day(tmp_path, 'slack', 1)
+        _write_day(tmp_path, 'slack', 2, age=time.time())
+        done = _write_day(tmp_path, 'slack', 3)
+        done.with_name('data.jsonl.gz').write_bytes(b'')
+        ArchiveCatalog(tmp_path)
+
+        cutoff = time.time() - 7 * 86400
+        assert find_candidates(tmp_path, cutoff) == [old]
+
+        # A stale catalog must not hand out files that changed on disk
+        os.utime(old, None)
+        assert ArchiveCatalog.for_root(tmp_path).compression_candidates(cutoff) == []
+
+    def test_compression_carries_over_record_count_and_index_state(self, tmp_path):
+        path = _write_day(tmp_path, 'slack', 1, count=7)
+        catalog = ArchiveCatalog.for_root(tmp_path, create=True)
+        catalog.reconcile()
+        assert catalog.pending_index() == [path]
+        catalog.mark_indexed(path)
+        assert catalog.pending_index() == []
+
+        engine = CompressionEngine('gzip', max_workers=1, frame_records=3)
+        outcome = engine.compress_files([path], root=tmp_path)[0]
+        assert outcome['status'] == 'compressed'
+
+        rows = {Path(row['path']).name: row for row in catalog.files(source='slack')}
+        assert set(rows) == {'data.jsonl.gz', 'data.jsonl.gz.idx'}
+        compressed = rows['data.jsonl.gz']
+        assert compressed['record_count'] == 7
+        assert compressed['original_size'] == outcome['original_size']
+        assert compressed['frame_indexed'] == 1
+        assert catalog.pending_index() == []
+
+    def test_summary_excludes_index_sidecars(self, tmp_path):
+        path = _write_day(tmp_path, 'slack', 1, count=7)
+        _write_day(tmp_path, 'slack', 2)
+        engine = CompressionEngine('gzip', max_workers=1, frame_records=3)
+        assert engine.compress_files([path], root=tmp_path)[0]['status'] == 'compressed'
+        assert path.with_name('data.jsonl.gz.idx').exists()
+
+        catalog = ArchiveCatalog.for_root(tmp_path, create=True)
+        catalog.reconcile()
+        summary = catalog.summary()
+        assert summary['by_source']['slack']['files'] == 2
+        assert summary['by_source']['slack']['compressed_files'] == 1
+        assert sum(row['files'] for row in summary['by_age'].values()) == 2
+        assert summary['by_type'][('index', 'none')]['files'] == 1
+
+        scanned = ArchiveStats(use_catalog=False).calculate(tmp_path)
+        catalogued = ArchiveStats().calculate(tmp_path)
+        for stats in (scanned, catalogued):
+            assert stats['total_files'] == 2
+            assert stats['by_source']['slack']['files'] == 2
+            assert stats['file_types']['index']['count'] == 1
+
+    def test_archive_stats_from_catalog_match_scan(self, tmp_path):
+        for day in range(1, 4):
+            _write_day(tmp_path, 'slack', day)
+        _write_day(tmp_path, 'calendar', 1, age=time.time())
+        (tmp_path / 'slack' / 'manifest.json').write_text('{}')
+        ArchiveCatalog(tmp_path)
+
+        scanned = ArchiveStats(use_catalog=False).calculate(tmp_path)
+        catalogued = ArchiveStats().calculate(tmp_path)
+
+        assert (tmp_path / CATALOG_FILENAME).exists()
+        for key in ('total_files', 'uncompressed_files', 'compressed_files', 'health_score'):
+            assert catalogued[key] == scanned[key]
+        assert catalogued['by_source']['slack']['files'] == scanned['by_source']['slack']['files']
+        assert {bucket: row['count'] for bucket, row in catalogued['age_distribution'].items()} == \
+               {bucket: row['count'] for bucket, row in scanned['age_distribution'].items()}
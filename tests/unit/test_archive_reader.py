@@ -0,0 +1,100 @@
+"""
+Tests for the shared memory-mapped JSONL reader
+
+References:
+- src/core/archive_reader.py - read_jsonl, iter_lines, LineIndex
+- src/search/indexer.py - _stream_jsonl_batches on top of read_jsonl
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.core import archive_reader
+from src.core.archive_reader import LineIndex, iter_lines, line_index, loads, read_jsonl
+from src.core.compression_engine import CompressionEngine
+
+
+def _write(path, lines, trailing_newline=True):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b'\n'.join(lines) + (b'\n' if trailing_newline else b''))
+    return path
+
+
+class TestReadJsonl:
+    """Test line splitting, decoding and error handling"""
+
+    def test_blank_lines_and_numbering(self, tmp_path):
+        path = _write(tmp_path / "data.jsonl",
+                      [b'{"n": 1}', b'', b'  ', b'{"n": 2}\r', '{"text": "café"}'.encode()],
+                      trailing_newline=False)
+
+        assert list(read_jsonl(path)) == [(1, {'n': 1}), (4, {'n': 2}), (5, {'text': 'café'})]
+
+    def test_malformed_lines_reported(self, tmp_path):
+        path = _write(tmp_path / "data.jsonl", [b'{"n": 1}', b'{"broken": ', b'\xff\xfe', b'{"n": 2}'])
+        errors = []
+
+        records = list(read_jsonl(path, on_error=lambda n, raw, e: errors.append((n, raw))))
+
+        assert [r['n'] for _, r in records] == [1, 2]
+        assert [n for n, _ in errors] == [2, 3]
+        assert errors[0][1] == '{"broken":'
+
+    def test_stdlib_semantics_preserved(self):
+        assert loads(b'{"big": 123456789012345678901234567890}')['big'] == 123456789012345678901234567890
+        assert loads('[NaN]')[0] != loads('[NaN]')[0]
+        with pytest.raises(json.JSONDecodeError):
+            loads(b'{"a": }')
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.jsonl"
+        path.write_bytes(b'')
+
+        assert list(read_jsonl(path)) == []
+        assert line_index(path).line_count == 0
+
+
+class TestLineIndex:
+    """Test offset-indexed skipping and cache invalidation"""
+
+    def test_build(self):
+        index = LineIndex.build(b'a\n\nbc\nd', 7, 0)
+        assert list(index.offsets) == [0, 2, 3, 6]
+        assert index.offset(10) == 7
+
+    def test_start_line_uses_cached_index(self, tmp_path):
+        path = _write(tmp_path / "data.jsonl", [json.dumps({'n': i}).encode() for i in range(50)])
+
+        assert [r['n'] for _, r in read_jsonl(path, start_line=45)] == [45, 46, 47, 48, 49]
+
+        with patch.object(LineIndex, 'build', wraps=LineIndex.build) as build:
+            assert next(read_jsonl(path, start_line=10)) == (11, {'n': 10})
+            build.assert_not_called()
+
+    def test_index_rebuilt_after_append(self, tmp_path):
+        path = _write(tmp_path / "data.jsonl", [b'{"n": 0}', b'{"n": 1}'])
+        assert list(read_jsonl(path, start_line=2)) == []
+
+        with open(path, 'ab') as f:
+            f.write(b'{"n": 2}\n')
+
+        assert list(read_jsonl(path, start_line=2)) == [(3, {'n': 2})]
+
+    def test_index_cache_is_bounded(self, tmp_path):
+        with patch.object(archive_reader, 'LINE_INDEX_CACHE_SIZE', 2):
+            for i in range(4):
+                line_index(_write(tmp_path / f"{i}.jsonl", [b'{}']))
+            assert len(archive_reader._line_indexes) <= 2
+
+
+def test_compressed_archive_lines(tmp_path):
+    lines = [json.dumps({'n': i}) for i in range(30)]
+    path = _write(tmp_path / "slack" / "2025-08-01" / "data.jsonl", [line.encode() for line in lines])
+    engine = CompressionEngine('gzip', max_workers=1, frame_records=8)
+    assert engine.compress_files([path], root=tmp_path)[0]['status'] == 'compressed'
+
+    compressed = engine.output_path(path)
+    assert [line for _, line in iter_lines(compressed, start_line=27)] == lines[27:]
+    assert [r['n'] for _, r in read_jsonl(compressed, start_line=20)] == list(range(20, 30))
@@ -0,0 +1,118 @@
+"""
+Tests for the busy-matrix availability search
+
+The matrix must report the same common slots as intersecting per-calendar
+free slot lists, which find_common_slots used before and still uses
+without NumPy.
+
+References:
+- src/scheduling/availability.py - BusyMatrix, AvailabilityEngine.find_common_slots
+"""
+
+import random
+from datetime import date, datetime, timedelta
+
+import pytest
+import pytz
+
+from src.scheduling import availability
+from src.scheduling.availability import AvailabilityEngine, BusyMatrix
+
+pytestmark = pytest.mark.skipif(not availability.HAS_NUMPY, reason="numpy not installed")
+
+FIRST_DAY = date(2025, 3, 3)  # spans the US DST change on 2025-03-09
+
+
+def _calendar(rng, days):
+    eastern = pytz.timezone('America/New_York')
+    events = []
+    for _ in range(rng.randrange(3 * days)):
+        day = FIRST_DAY + timedelta(days=rng.randrange(days))
+        start = datetime.combine(day, datetime.min.time()) + timedelta(minutes=15 * rng.randrange(20, 80))
+        end = start + timedelta(minutes=rng.choice([15, 30, 45, 60, 90, 180]))
+        style = rng.randrange(4)
+        if style == 0:
+            events.append({'start': start.isoformat() + 'Z', 'end': end.isoformat() + 'Z'})
+        elif style == 1:
+            events.append({'start': {'dateTime': start.isoformat(), 'timeZone': 'America/New_York'},
+                           'end': {'dateTime': end.isoformat(), 'timeZone': 'America/New_York'}})
+        elif style == 2:
+            events.append({'start': eastern.localize(start), 'end': eastern.localize(end)})
+        elif rng.random() < 0.3:
+            events.append({'start': {'date': day.isoformat()},
+                           'end': {'date': (day + timedelta(days=1)).isoformat()}})
+    return events
+
+
+def _pairwise(engine, calendars, duration, working_hours, timezone, days, buffer_minutes):
+    slots = []
+    for offset in range(days):
+        slots.extend(engine._find_common_slots_pairwise(
+            calendars, duration, working_hours, timezone,
+            FIRST_DAY + timedelta(days=offset), buffer_minutes))
+    return [(s.start, s.end, s.duration_minutes) for s in slots]
+
+
+@pytest.mark.parametrize('seed', range(8))
+@pytest.mark.parametrize('timezone', ['UTC', 'America/New_York', 'Asia/Kolkata'])
+def test_matches_pairwise_intersection(seed, timezone):
+    rng = random.Random(seed)
+    days = 10
+    calendars = [_calendar(rng, days) for _ in range(rng.randrange(1, 6))]
+    duration = rng.choice([15, 30, 60])
+    buffer_minutes = rng.choice([0, 0, 10, 15])
+    working_hours = rng.choice([(9, 17), (8, 18), (0, 23)])
+    engine = AvailabilityEngine()
+
+    slots = engine.find_common_slots_in_range(
+        calendars, duration, FIRST_DAY, FIRST_DAY + timedelta(days=days - 1),
+        working_hours=working_hours, timezone=timezone, buffer_minutes=buffer_minutes)
+
+    assert [(s.start, s.end, s.duration_minutes) for s in slots] == _pairwise(
+        engine, calendars, duration, working_hours, timezone, days, buffer_minutes)
+    assert all(s.timezone == timezone and s.start.tzinfo is not None for s in slots)
+
+
+def test_single_day_fallback(monkeypatch):
+    eastern = pytz.timezone('America/New_York')
+    calendars = [
+        [{'start': eastern.localize(datetime(2025, 8, 19, 10)), 'end': eastern.localize(datetime(2025, 8, 19, 11))}],
+        [{'start': '2025-08-19T17:30:00Z', 'end': '2025-08-19T18:30:00Z'}],  # 1:30-2:30pm Eastern
+    ]
+    engine = AvailabilityEngine()
+    kwargs = dict(duration_minutes=60, timezone='America/New_York', date=date(2025, 8, 19), buffer_minutes=15)
+
+    vectorized = engine.find_common_slots(calendars, **kwargs)
+    monkeypatch.setattr(availability, 'HAS_NUMPY', False)
+    assert engine.find_common_slots(calendars, **kwargs) == vectorized
+    assert [(s.start.hour, s.start.minute, s.end.hour, s.end.minute) for s in vectorized] == [
+        (11, 15, 13, 15), (14, 45, 17, 0)]
+
+
+class TestBusyMatrix:
+    """Bucket edges, people subsets and empty intervals"""
+
+    def _ts(self, hour, minute=0, second=0):
+        return datetime(2025, 8, 19, hour, minute, second, tzinfo=pytz.UTC).timestamp()
+
+    def test_people_subset_and_resolution(self):
+        matrix = BusyMatrix(
+            [[(self._ts(10), self._ts(12))], [(self._ts(13, 3), self._ts(13, 7))]],
+            [date(2025, 8, 19)], resolution_minutes=5)
+
+        everyone = [(s.start.hour, s.start.minute, s.duration_minutes) for s in matrix.common_slots(30)]
+        assert everyone == [(9, 0, 60), (12, 0, 60), (13, 10, 230)]
+        assert [s.duration_minutes for s in matrix.common_slots(30, people=[1])] == [240, 230]
+        assert matrix.busy().shape == (2, 1, 96)
+
+    def test_sub_minute_edges_and_empty_intervals(self):
+        matrix = BusyMatrix(
+            [[(self._ts(10, 0, 30), self._ts(10, 59, 30)), (self._ts(15), self._ts(15))]],
+            [date(2025, 8, 19)])
+
+        assert [(s.start.minute, s.end.minute) for s in matrix.common_slots(30)] == [(0, 0), (0, 0)]
+        assert [s.duration_minutes for s in matrix.common_slots(30)] == [60, 420 - 60]
+        assert [s.duration_minutes for s in matrix.common_slots(30, buffer_minutes=10)] == [50, 220, 110]
+
+    def test_no_dates(self):
+        assert BusyMatrix([[]], []).common_slots(30) == []
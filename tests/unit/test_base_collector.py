@@ -510,6 +510,22 @@ class TestStatePersistence:
                 assert isinstance(state, dict), "Should fallback to default state"
 
 
+    def test_close_releases_owned_state_manager(self):
+        """Collectors close the state manager they created, but not an injected one"""
+        if BaseArchiveCollector is None:
+            pytest.skip("BaseArchiveCollector not implemented yet (TDD Red phase)")
+        
+        with patch('src.collectors.base.StateManager') as mock_state_manager:
+            with MockCollector.__bases__[0]('mock', system_config=Mock(),
+                                            archive_writer=Mock()) as collector:
+                assert collector.state_manager is mock_state_manager.return_value
+            mock_state_manager.return_value.close.assert_called_once()
+        
+        injected = MockCollector()
+        injected.close()
+        injected.state_manager.close.assert_not_called()
+
+
 class TestCollectorMetadata:
     """Test collector metadata and configuration."""
     
@@ -9,7 +9,10 @@ from pathlib import Path
 import tempfile
 from unittest.mock import Mock, patch, MagicMock
 
-from src.aggregators.basic_stats import ActivityAnalyzer, MessageStatsCalculator
+import json
+
+from src.aggregators import basic_stats
+from src.aggregators.basic_stats import ActivityAnalyzer, ActivityAnalyzerImpl, MessageStatsCalculator
 
 
 class TestMessageStatistics:
@@ -522,6 +525,152 @@ class TestErrorHandling:
             Path(tmp_db.name).unlink(missing_ok=True)
 
 
+class TestStreamingAggregation:
+    """Test single-pass statistics over streamed records"""
+    
+    MESSAGES = [
+        {'channel': 'general', 'author': 'john@example.com', 'timestamp': '2025-08-19T10:00:00Z'},
+        {'channel': 'product', 'author': 'jane@example.com', 'timestamp': '2025-08-19T14:30:00Z'},
+        {'channel': 'general', 'author': 'jane@example.com', 'timestamp': '2025-08-20T10:15:00Z'},
+        {'channel': 'general', 'author': None, 'timestamp': None},
+        {'author': 'john@example.com', 'timestamp': 'not a timestamp'},
+        None,
+    ]
+    
+    def test_single_pass_over_stream(self):
+        """Volume stats and rankings read a generator once"""
+        calculator = MessageStatsCalculator()
+        reads = []
+        
+        def stream():
+            for msg in self.MESSAGES:
+                reads.append(msg)
+                yield msg
+        
+        stats = calculator.calculate_stats(stream())
+        assert len(reads) == len(self.MESSAGES)
+        assert stats['volume'] == calculator.calculate_volume_stats(list(self.MESSAGES))
+        assert stats['channel_rankings'] == calculator.calculate_channel_rankings(iter(self.MESSAGES[:-1]))
+        
+        volume = stats['volume']
+        assert volume['total_messages'] == 6
+        assert (volume['unique_authors'], volume['channels_active']) == (2, 2)
+        assert volume['by_channel'] == {'general': 3, 'product': 1}
+        assert volume['by_author'] == {'john@example.com': 2, 'jane@example.com': 2}
+        assert volume['avg_messages_per_hour'] == round(6 / 24.25, 2)
+        assert volume['temporal_distribution'] == {'by_hour': {10: 2, 14: 1}, 'peak_hour': 10,
+                                                   'total_hours_active': 2}
+        
+        assert [(r['channel_name'], r['message_count'], r['unique_authors'])
+                for r in stats['channel_rankings']] == [('general', 3, 2), ('product', 1, 1), ('unknown', 1, 1)]
+        # general spans 24.25 hours; product has a single timestamp (one day)
+        assert stats['channel_rankings'][0]['activity_score'] == round(0.03 * 0.5 + 0.2 * 0.3 + 24.25 / 168 * 0.2, 2)
+        assert stats['channel_rankings'][1]['activity_score'] == round(0.01 * 0.5 + 0.1 * 0.3 + 24 / 168 * 0.2, 2)
+    
+    def test_summaries_stream_raw_archives(self, tmp_path):
+        """Daily, weekly and monthly summaries from raw Slack and Calendar files"""
+        slack_dir = tmp_path / 'data' / 'raw' / 'slack' / '2025-08-19'
+        slack_dir.mkdir(parents=True)
+        with open(slack_dir / 'messages_general.jsonl', 'w') as f:
+            for i in range(12):
+                f.write(json.dumps({'channel': f'C{i % 3}', 'user': 'U1' if i % 4 else 'U2',
+                                    'timestamp': f'2025-08-19T{9 + i % 2:02d}:00:00Z'}) + '\n')
+        calendar_dir = tmp_path / 'data' / 'raw' / 'calendar' / '2025-08-20'
+        calendar_dir.mkdir(parents=True)
+        (calendar_dir / 'events_primary.json').write_text(json.dumps({'events': [
+            {'summary': 'Daily standup', 'attendees': [{'email': 'alice@example.com'}],
+             'start': {'dateTime': '2025-08-20T09:00:00Z'}, 'end': {'dateTime': '2025-08-20T09:15:00Z'}},
+            {'summary': 'Roadmap review', 'organizer': {'email': 'bob@example.com'},
+             'start': {'dateTime': '2025-08-20T13:00:00Z'}, 'end': {'dateTime': '2025-08-20T14:00:00Z'}},
+        ]}))
+        analyzer = ActivityAnalyzerImpl(str(tmp_path))
+        
+        day = analyzer.generate_daily_summary('2025-08-19')
+        assert day['slack_activity'] == {'message_count': 12, 'channels_active': ['C0', 'C1', 'C2'],
+                                         'unique_authors': 2, 'peak_activity_hour': 9}
+        assert day['generation_metadata']['data_sources_found'] == ['slack']
+        assert analyzer.generate_daily_summary('2025-08-19', person='U2')['slack_activity']['message_count'] == 3
+        
+        meetings = analyzer.generate_daily_summary('2025-08-20')['calendar_activity']
+        assert meetings == {'meeting_count': 2, 'total_duration_minutes': 75,
+                            'meeting_types': {'standup': 1, 'review': 1}, 'average_duration': 37}
+        assert analyzer.generate_daily_summary('2025-08-20', person='bob')['calendar_activity']['meeting_count'] == 1
+        
+        week = analyzer.generate_weekly_summary('2025-08-18')
+        assert week['summary_stats'] == {'total_messages': 12, 'total_meetings': 2, 'total_meeting_hours': 1,
+                                         'active_days': 2}
+        
+        month = analyzer.generate_monthly_summary('2025-08-01')
+        assert (month['month_end'], month['metadata']['daily_summaries_count']) == ('2025-08-31', 31)
+        assert month['summary_stats'] == week['summary_stats']
+
+
+class TestVectorizedTemporalPatterns:
+    """Test NumPy temporal pattern analysis against the pure-Python loops"""
+    
+    MESSAGES = [
+        {'timestamp': '2025-08-17T23:30:00Z'},
+        {'timestamp': '2025-08-18T00:15:00-07:00'},
+        {'timestamp': '2025-08-18 09:00:00'},
+        {'timestamp': datetime(2025, 8, 25, 9, 45)},
+        {'timestamp': '2025-08-26T14:00:00.250000+02:00'},
+        {'timestamp': '1969-12-31T22:00:00'},
+        {'timestamp': 'not a timestamp'},
+        {'timestamp': None},
+    ]
+    
+    def test_numpy_matches_python_fallback(self, monkeypatch):
+        """Hourly, daily, weekly and recurrence results do not depend on numpy"""
+        pytest.importorskip('numpy')
+        from zoneinfo import ZoneInfo
+        
+        new_york = ZoneInfo('America/New_York')
+        meetings = []
+        for week in range(6):
+            # Crosses the end of daylight saving time on 2025-11-02
+            meetings.append({'title': f'Team Sync #{week}', 'start': datetime(2025, 10, 20, 9, tzinfo=new_york)
+                             + timedelta(days=7 * week)})
+            meetings.append({'title': 'Planning (2)', 'start': f'{date(2025, 9, 1) + timedelta(days=14 * week)}T10:00:00Z'})
+            meetings.append({'title': 'Standup', 'start': datetime(2025, 9, 1 + week, 9, 30)})
+        meetings.append({'title': 'Standup', 'start': 'not a date'})
+        
+        def results():
+            analyzer = ActivityAnalyzer(db_path=':memory:')
+            return ([analyzer.analyze_temporal_patterns(self.MESSAGES, granularity)
+                     for granularity in ('daily', 'hourly', 'weekly')],
+                    analyzer.detect_recurring_patterns(meetings))
+        
+        vectorized = results()
+        monkeypatch.setattr(basic_stats, 'HAS_NUMPY', False)
+        assert vectorized == results()
+        
+        daily, hourly, weekly = vectorized[0]
+        assert [(day['date'], day['message_count']) for day in daily] == [
+            ('2025-08-26', 1), ('2025-08-25', 1), ('2025-08-18', 2), ('2025-08-17', 1), ('1969-12-31', 1)]
+        assert [hour['message_count'] for hour in hourly if hour['message_count']] == [1, 2, 1, 1, 1]
+        assert weekly == [{'week_start': '2025-08-25', 'message_count': 2}, {'week_start': '2025-08-18', 'message_count': 2},
+                          {'week_start': '2025-08-11', 'message_count': 1}, {'week_start': '1969-12-29', 'message_count': 1}]
+        assert [(p['title'], p['pattern_type']) for p in vectorized[1]] == [
+            ('team sync', 'weekly'), ('planning', 'biweekly'), ('standup', 'daily')]
+    
+    def test_temporal_profile(self):
+        """Weekday x hour matrix, inter-arrival gaps and daily periodicity"""
+        pytest.importorskip('numpy')
+        analyzer = ActivityAnalyzer(db_path=':memory:')
+        messages = [{'timestamp': f'2025-08-{day:02d}T{hour:02d}:{minute:02d}:00Z'}
+                    for day in range(4, 25) for hour in (9, 14) for minute in range(0, 60, 20)]
+        
+        profile = analyzer.analyze_temporal_profile(messages)
+        assert profile['message_count'] == 126
+        assert profile['by_hour'][9] == profile['by_hour'][14] == 63
+        # 2025-08-04 is a Monday: three full weeks
+        assert profile['weekday_hour'][0][9] == profile['weekday_hour'][6][14] == 9
+        assert sum(map(sum, profile['weekday_hour'])) == 126
+        assert profile['inter_arrival_seconds']['median'] == 1200.0
+        assert profile['dominant_period_hours'] == 24
+        assert analyzer.analyze_temporal_profile([])['dominant_period_hours'] is None
+
+
 # Run basic smoke tests if executed directly
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
\ No newline at end of file
@@ -0,0 +1,168 @@
+"""
+Tests for the persisted per-person busy-interval index
+
+References:
+- src/scheduling/busy_index.py - BusyIntervalIndex, update_busy_index, AvailabilityEngineImpl
+"""
+
+import json
+import random
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pytest
+import pytz
+
+from src.scheduling import busy_index
+from src.scheduling.availability import AvailabilityEngine
+from src.scheduling.busy_index import AvailabilityEngineImpl, BusyIntervalIndex, update_busy_index
+
+PEOPLE = [f'person{i}@example.com' for i in range(6)]
+FIRST_DAY = date(2025, 8, 18)
+
+
+def _ts(day, hour, minute=0):
+    return datetime(2025, 8, day, hour, minute, tzinfo=pytz.UTC).timestamp()
+
+
+def _write(path, events, calendar_id='owner@example.com'):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        for event in events:
+            f.write(json.dumps({'calendar_id': calendar_id, 'event': event}) + '\n')
+
+
+def _random_events(seed, count):
+    rng = random.Random(seed)
+    events = []
+    for i in range(count):
+        start = datetime(2025, 8, 18) + timedelta(days=rng.randrange(5), minutes=15 * rng.randrange(20, 70))
+        end = start + timedelta(minutes=rng.choice([15, 30, 60, 90]))
+        events.append({
+            'id': f'evt{seed}-{i}',
+            'start': {'dateTime': start.isoformat(), 'timeZone': 'America/New_York'},
+            'end': {'dateTime': end.isoformat(), 'timeZone': 'America/New_York'},
+            'attendees': [{'email': p.upper()} for p in rng.sample(PEOPLE, rng.randrange(1, 4))],
+        })
+    return events
+
+
+@pytest.fixture
+def calendar_dir(tmp_path):
+    root = tmp_path / 'calendar'
+    _write(root / '2025-08-17' / 'old.jsonl', _random_events(99, 5))
+    _write(root / '2025-08-18' / 'events.jsonl', [
+        {'id': 'a', 'start': {'dateTime': '2025-08-18T10:00:00Z'}, 'end': {'dateTime': '2025-08-18T11:00:00Z'},
+         'attendees': [{'email': 'Alice@Example.com'}, {'email': 'bob@example.com', 'responseStatus': 'declined'}]},
+        {'id': 'b', 'start': {'dateTime': '2025-08-18T10:30:00Z'}, 'end': {'dateTime': '2025-08-18T12:00:00Z'},
+         'attendees': [{'email': 'alice@example.com'}, {'email': 'bob@example.com'}]},
+        {'id': 'c', 'start': '2025-08-18T12:00:00Z', 'end': '2025-08-18T12:30:00Z'},  # calendar owner
+        {'id': 'd', 'status': 'cancelled', 'start': '2025-08-18T14:00:00Z', 'end': '2025-08-18T15:00:00Z',
+         'attendees': [{'email': 'alice@example.com'}]},
+        {'id': 'e', 'transparency': 'transparent', 'start': '2025-08-18T15:00:00Z',
+         'end': '2025-08-18T16:00:00Z', 'attendees': [{'email': 'alice@example.com'}]},
+    ])
+    # The same event collected from a second calendar counts once
+    _write(root / '2025-08-18' / 'bob.jsonl', [
+        {'id': 'b', 'start': {'dateTime': '2025-08-18T10:30:00Z'}, 'end': {'dateTime': '2025-08-18T12:00:00Z'},
+         'attendees': [{'email': 'alice@example.com'}, {'email': 'bob@example.com'}]},
+    ], calendar_id='bob@example.com')
+    return root
+
+
+class TestBusyIntervalIndex:
+    """Building, querying and memory-mapping the index"""
+
+    def test_intervals_and_merged_blocks(self, calendar_dir):
+        index = BusyIntervalIndex.open(calendar_dir)
+
+        assert index.people == ['alice@example.com', 'bob@example.com', 'owner@example.com']
+        assert index.events('ALICE@example.com') == [
+            (_ts(18, 10), _ts(18, 11), 'a'), (_ts(18, 10, 30), _ts(18, 12), 'b')]
+        assert index.busy('alice@example.com').tolist() == [[_ts(18, 10), _ts(18, 12)]]
+        assert index.busy('bob@example.com').tolist() == [[_ts(18, 10, 30), _ts(18, 12)]]
+        assert index.busy('owner@example.com').tolist() == [[_ts(18, 12), _ts(18, 12, 30)]]
+        assert 'nobody@example.com' not in index
+        assert index.busy('nobody@example.com').shape == (0, 2)
+
+        assert index.events('alice@example.com', _ts(18, 11), _ts(18, 13)) == [
+            (_ts(18, 10, 30), _ts(18, 12), 'b')]
+        assert index.busy('alice@example.com', _ts(18, 12), _ts(18, 13)).shape == (0, 2)
+        assert isinstance(index._busy, np.memmap)
+
+    def test_incremental_update(self, calendar_dir, monkeypatch):
+        assert update_busy_index(calendar_dir) is True
+        assert update_busy_index(calendar_dir) is False
+
+        parsed = []
+        original = busy_index._parse_sources
+        monkeypatch.setattr(busy_index, '_parse_sources',
+                            lambda root, names, *args: parsed.extend(names) or original(root, names, *args))
+
+        events_file = calendar_dir / '2025-08-18' / 'events.jsonl'
+        with open(events_file, 'a') as f:
+            f.write(json.dumps({'event': {
+                'id': 'f', 'start': '2025-08-18T16:00:00Z', 'end': '2025-08-18T17:00:00Z',
+                'attendees': [{'email': 'carol@example.com'}]}}) + '\n')
+        assert update_busy_index(calendar_dir) is True
+        assert parsed == ['2025-08-18/events.jsonl']
+
+        index = BusyIntervalIndex.load(calendar_dir)
+        assert index.events('carol@example.com') == [(_ts(18, 16), _ts(18, 17), 'f')]
+        assert [e[2] for e in index.events('bob@example.com')] == ['b']
+
+        (calendar_dir / '2025-08-18' / 'bob.jsonl').unlink()
+        assert update_busy_index(calendar_dir) is True
+        assert parsed == ['2025-08-18/events.jsonl']
+        index = BusyIntervalIndex.load(calendar_dir)
+        assert [e[2] for e in index.events('bob@example.com')] == ['b']
+        assert len(list(busy_index.index_dir_for(calendar_dir).glob('gen-*'))) == 1
+
+    def test_matches_raw_events(self, tmp_path):
+        root = tmp_path / 'calendar'
+        events = _random_events(1, 80)
+        _write(root / '2025-08-18' / 'events.jsonl', events[:40])
+        _write(root / '2025-08-18' / 'more.jsonl', events[40:])
+        update_busy_index(root)
+        _write(root / '2025-08-18' / 'more.jsonl', events[30:])  # overlaps the first file
+        index = BusyIntervalIndex.open(root)
+        assert set(index.people) == {a['email'].lower() for e in events for a in e['attendees']}
+
+        engine = AvailabilityEngine()
+        dates = [FIRST_DAY + timedelta(days=offset) for offset in range(5)]
+        for people in (PEOPLE[:1], PEOPLE[:3], PEOPLE):
+            calendars = [[e for e in events if p in {a['email'].lower() for a in e['attendees']}]
+                         for p in people]
+            expected = engine.find_common_slots_in_range(
+                calendars, 30, dates[0], dates[-1], timezone='America/New_York', buffer_minutes=10)
+            result = AvailabilityEngineImpl(root, timezone='America/New_York').find_free_slots(
+                people, 30, (dates[0], dates[-1].isoformat()), buffer_minutes=10)
+            assert [(s['start'], s['end']) for s in result['available_slots']] == [
+                (s.start.isoformat(), s.end.isoformat()) for s in expected]
+
+
+class TestAvailabilityEngineImpl:
+    """The query CLI engine answers from the index"""
+
+    def test_find_free_slots_and_conflicts(self, calendar_dir):
+        engine = AvailabilityEngineImpl(calendar_dir)
+
+        result = engine.find_free_slots(['alice@example.com', 'owner@example.com', 'x@example.com'],
+                                        60, ('2025-08-18', '2025-08-18'))
+        assert [(s['start'], s['end']) for s in result['available_slots']] == [
+            ('2025-08-18T09:00:00+00:00', '2025-08-18T10:00:00+00:00'),
+            ('2025-08-18T12:30:00+00:00', '2025-08-18T17:00:00+00:00')]
+        assert result['unknown_attendees'] == ['x@example.com']
+
+        conflicts = engine.check_conflicts(['alice@example.com', 'bob@example.com'], '2025-08-18 11:30', 30)
+        assert conflicts['conflicts_found'] is True
+        assert [(c['attendee'], c['event_id']) for c in conflicts['conflict_details']] == [
+            ('alice@example.com', 'b'), ('bob@example.com', 'b')]
+        assert engine.check_conflicts(['alice@example.com'], '2025-08-18T12:00:00Z', 30)[
+            'conflicts_found'] is False
+
+    def test_missing_calendar_dir(self, tmp_path):
+        result = AvailabilityEngineImpl(tmp_path / 'none').find_free_slots(
+            ['a@example.com'], 30, ('2025-08-18', '2025-08-18'))
+        assert len(result['available_slots']) == 1
+        assert result['metadata']['indexed_people'] == 0
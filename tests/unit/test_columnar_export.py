@@ -0,0 +1,140 @@
+"""
+Tests for the partitioned Parquet snapshot of the search index
+
+References:
+- src/search/columnar_export.py - export_columnar and calendar flattening
+- src/search/database.py - iter_records(after_id=...) and search_metadata
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.search.database import SearchDatabase
+from src.search import columnar_export
+from src.search.columnar_export import (
+    export_columnar, flatten_calendar_event, partition_month, get_watermark,
+    ColumnarExportError, HAS_PYARROW
+)
+
+
+def _calendar_event(i, day):
+    return {
+        'id': f'evt{i}',
+        'summary': f'Planning session {i}',
+        'start': {'dateTime': f'2025-{day}T10:00:00Z'},
+        'end': {'dateTime': f'2025-{day}T10:30:00Z'},
+        'organizer': {'email': 'alice@example.com'},
+        'attendees': [
+            {'email': 'alice@example.com', 'responseStatus': 'accepted'},
+            {'email': 'bob@example.com', 'responseStatus': 'tentative', 'optional': True},
+        ],
+    }
+
+
+class TestCalendarFlattening:
+    """Test pure-Python row shaping (no pyarrow needed)"""
+
+    def test_partition_month(self):
+        assert partition_month('2025-08-14') == '2025-08'
+        assert partition_month('') == 'unknown'
+        assert partition_month('not-a-date') == 'unknown'
+
+    def test_flatten_calendar_event(self):
+        event, attendees = flatten_calendar_event(7, '2025-08-04', _calendar_event(1, '08-04'))
+
+        assert event['event_id'] == 'evt1'
+        assert event['duration_minutes'] == 30.0
+        assert event['all_day'] is False
+        assert event['attendee_count'] == 2
+        assert [a['is_organizer'] for a in attendees] == [True, False]
+        assert attendees[1]['is_optional'] is True
+        assert all(a['message_id'] == 7 for a in attendees)
+
+    def test_all_day_event(self):
+        event, attendees = flatten_calendar_event(
+            1, '2025-08-04', {'start': {'date': '2025-08-04'}, 'end': {'date': '2025-08-05'}})
+
+        assert event['all_day'] is True
+        assert event['duration_minutes'] == 24 * 60
+        assert attendees == []
+
+    def test_missing_pyarrow_raises(self, tmp_path):
+        db = SearchDatabase(str(tmp_path / "search.db"))
+        try:
+            with patch.object(columnar_export, 'HAS_PYARROW', False):
+                with pytest.raises(ColumnarExportError, match="pyarrow"):
+                    export_columnar(db, str(tmp_path / "out"))
+        finally:
+            db.close()
+
+
+@pytest.mark.skipif(not HAS_PYARROW, reason="pyarrow not available")
+class TestColumnarExport:
+    """Test Parquet output, partitioning and watermark-driven increments"""
+
+    @pytest.fixture
+    def db(self, tmp_path):
+        db = SearchDatabase(str(tmp_path / "search.db"))
+        slack = [{'text': f'standup update {i}', 'date': f'2025-0{7 + i % 2}-0{1 + i % 5}'}
+                 for i in range(10)]
+        calendar = [_calendar_event(i, '08-04') for i in range(3)]
+        for event in calendar:
+            event['date'] = '2025-08-04'
+        db.index_records_batch(slack, 'slack')
+        db.index_records_batch(calendar, 'calendar')
+        yield db
+        db.close()
+
+    def test_partitioned_snapshot(self, db, tmp_path):
+        import pyarrow.dataset as ds
+
+        out = tmp_path / "parquet"
+        summary = export_columnar(db, str(out), row_group_size=4)
+
+        assert summary['rows']['messages'] == 13
+        assert summary['rows']['calendar_events'] == 3
+        assert summary['rows']['calendar_attendees'] == 6
+        assert (out / 'messages' / 'source=slack' / 'month=2025-07').is_dir()
+        assert (out / 'daily_rollups' / 'source=calendar' / 'month=2025-08' / 'rollup.parquet').exists()
+        assert not list(out.rglob('*.tmp'))
+
+        messages = ds.dataset(str(out / 'messages'), format='parquet', partitioning='hive')
+        august_slack = messages.to_table(
+            filter=(ds.field('source') == 'slack') & (ds.field('month') == '2025-08'))
+        assert august_slack.num_rows == 5
+
+        rollups = ds.dataset(str(out / 'daily_rollups'), partitioning='hive').to_table()
+        assert sum(rollups.column('record_count').to_pylist()) == 13
+
+    def test_rerun_appends_only_new_rows(self, db, tmp_path):
+        out = tmp_path / "parquet"
+        first = export_columnar(db, str(out))
+
+        second = export_columnar(db, str(out))
+        assert second['rows'] == {}
+        assert second['watermark'] == first['watermark']
+
+        db.index_records_batch([{'text': 'late update', 'date': '2025-09-01'}], 'slack')
+        third = export_columnar(db, str(out))
+
+        assert third['rows'] == {'messages': 1}
+        assert third['previous_watermark'] == first['watermark']
+        assert get_watermark(db, str(out)) == third['watermark']
+        new_parts = list((out / 'messages' / 'source=slack' / 'month=2025-09').glob('*.parquet'))
+        assert len(new_parts) == 1
+        assert new_parts[0].name != 'part-000000000001.parquet'
+
+    def test_full_rebuild(self, db, tmp_path):
+        import pyarrow.dataset as ds
+
+        out = tmp_path / "parquet"
+        export_columnar(db, str(out))
+        db.index_records_batch([{'text': 'late update', 'date': '2025-09-01'}], 'slack')
+        export_columnar(db, str(out))
+
+        summary = export_columnar(db, str(out), full=True)
+
+        assert summary['rows']['messages'] == 14
+        messages = ds.dataset(str(out / 'messages'), format='parquet', partitioning='hive')
+        assert messages.count_rows() == 14
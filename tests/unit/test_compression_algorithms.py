@@ -212,16 +212,19 @@ class TestSafeCompressor:
     
     def test_two_phase_commit_verification(self, compressor, test_file):
         """Test two-phase commit with verification"""
-        # Mock gzip.open to fail verification step
-        original_open = gzip.open
+        from src.core import compression_engine
         
-        def failing_verify(*args, **kwargs):
-            if 'rb' in args:
-                # Fail on verification read
-                raise gzip.BadGzipFile("Corrupted file")
-            return original_open(*args, **kwargs)
+        # Corrupt the streaming round trip that verifies the output
+        real_codec = compression_engine._new_codec
         
-        with patch('gzip.open', side_effect=failing_verify):
+        def failing_verify(*args):
+            compressor_obj, verifier = real_codec(*args)
+            corrupt = Mock()
+            corrupt.decompress.side_effect = lambda data: verifier.decompress(data)[:-1]
+            corrupt.flush.side_effect = verifier.flush
+            return compressor_obj, corrupt
+        
+        with patch.object(compression_engine, '_new_codec', side_effect=failing_verify):
             with pytest.raises(CompressionError, match="Atomic compression failed"):
                 compressor.compress_file_atomic(test_file)
         
@@ -0,0 +1,187 @@
+"""
+Tests for the parallel archive compression engine
+
+References:
+- src/core/compression_engine.py - CompressionEngine, compress_stream, open_compressed
+- src/core/compression.py - SafeCompressor.compress_old_files batch path
+"""
+
+import gzip
+import json
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.core import compression_engine
+from src.core.compression import SafeCompressor
+from src.core.compression_engine import (
+    CompressionEngine, CompressionEngineError, HAS_ZSTD, compress_stream,
+    open_compressed, scan_candidates, source_for
+)
+
+
+def _write_jsonl(path, count, source='slack'):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        for i in range(count):
+            f.write(json.dumps({'source': source, 'channel': 'C0123', 'user': f'U{i % 7}',
+                                'text': f'status update {i}', 'ts': 1754000000 + i}) + '\n')
+
+
+def _age(path, days=40):
+    old_time = time.time() - days * 86400
+    os.utime(path, (old_time, old_time))
+
+
+class TestCompressionEngine:
+    """Test single-pass verification, candidate scanning and batch compression"""
+
+    def test_compress_stream_round_trip(self, tmp_path):
+        source = tmp_path / "data.jsonl"
+        _write_jsonl(source, 500)
+
+        result = compress_stream(source, tmp_path / "data.jsonl.gz", chunk_size=4096)
+
+        assert result['original_size'] == source.stat().st_size
+        with gzip.open(tmp_path / "data.jsonl.gz", 'rb') as f:
+            assert f.read() == source.read_bytes()
+
+    def test_compress_stream_detects_bad_round_trip(self, tmp_path):
+        source = tmp_path / "data.jsonl"
+        _write_jsonl(source, 10)
+
+        class _Lossy:
+            def __init__(self, inner):
+                self.inner = inner
+
+            def decompress(self, data):
+                return self.inner.decompress(data)[:-1]
+
+            def flush(self):
+                return self.inner.flush()
+
+        real_codec = compression_engine._new_codec
+
+        def lossy_codec(*args):
+            compressor, verifier = real_codec(*args)
+            return compressor, _Lossy(verifier)
+
+        with patch.object(compression_engine, '_new_codec', side_effect=lossy_codec):
+            with pytest.raises(CompressionEngineError, match="Round-trip"):
+                compress_stream(source, tmp_path / "out.gz")
+
+    def test_scan_candidates_single_walk(self, tmp_path):
+        old = tmp_path / "slack" / "2025-07-01" / "data.jsonl"
+        done = tmp_path / "slack" / "2025-07-02" / "data.jsonl"
+        recent = tmp_path / "calendar" / "2025-08-20" / "data.jsonl"
+        backup = tmp_path / "slack" / ".backup" / "data.jsonl"
+        for path in (old, done, recent, backup):
+            _write_jsonl(path, 3)
+        (done.parent / "data.jsonl.zst").write_bytes(b'')
+        for path in (old, done, backup):
+            _age(path)
+
+        candidates = scan_candidates(tmp_path, time.time() - 30 * 86400)
+
+        assert candidates == [old]
+
+    def test_source_for(self, tmp_path):
+        assert source_for(tmp_path / "slack" / "2025-07-01" / "data.jsonl", tmp_path) == 'slack'
+        assert source_for(tmp_path / "data.jsonl", tmp_path) == 'default'
+        assert source_for(tmp_path / "data.jsonl", None) == 'default'
+
+    def test_parallel_batch_replaces_originals(self, tmp_path):
+        files = [tmp_path / "slack" / f"2025-07-{day:02d}" / "data.jsonl" for day in range(1, 7)]
+        for path in files:
+            _write_jsonl(path, 200)
+        originals = {str(path): path.read_bytes() for path in files}
+
+        outcomes = CompressionEngine('gzip', max_workers=3).compress_files(files, root=tmp_path)
+
+        assert sorted(o['status'] for o in outcomes) == ['compressed'] * 6
+        for path in files:
+            assert not path.exists()
+            with open_compressed(path.with_name('data.jsonl.gz'), 'rb') as f:
+                assert f.read() == originals[str(path)]
+        assert not list(tmp_path.rglob('*.tmp'))
+
+    def test_missing_file_reported_not_raised(self, tmp_path):
+        outcomes = CompressionEngine('gzip', max_workers=1).compress_files([tmp_path / "gone.jsonl"])
+
+        assert outcomes[0]['status'] == 'failed'
+        assert 'not found' in outcomes[0]['error']
+
+    def test_safe_compressor_batch_keeps_backups(self, tmp_path):
+        path = tmp_path / "slack" / "2025-07-01" / "data.jsonl"
+        _write_jsonl(path, 50)
+        _age(path)
+
+        compressor = SafeCompressor(max_workers=2)
+        stats = compressor.compress_old_files(tmp_path, age_days=30)
+
+        assert stats['compressed'] == 1
+        assert stats['bytes_saved'] > 0
+        assert len(list(compressor.read_compressed_jsonl(path.with_name('data.jsonl.gz')))) == 50
+        assert len(compressor.get_backup_registry()) == 1
+
+    def test_compress_file_atomic_reads_each_file_once(self, tmp_path):
+        path = tmp_path / "data.jsonl"
+        _write_jsonl(path, 200)
+        output = path.with_name('data.jsonl.gz')
+
+        reads = []
+        real_open = open
+
+        def tracking_open(file, mode='r', *args, **kwargs):
+            if 'r' in mode:
+                reads.append(os.fspath(file))
+            return real_open(file, mode, *args, **kwargs)
+
+        with patch('builtins.open', side_effect=tracking_open):
+            assert SafeCompressor().compress_file_atomic(path)
+
+        assert reads == [str(path)]
+        assert not path.exists()
+        with gzip.open(output, 'rb') as f:
+            assert len(f.read().splitlines()) == 200
+
+    def test_gzip_is_default_algorithm(self):
+        with patch.object(compression_engine, 'HAS_ZSTD', True):
+            assert CompressionEngine().algorithm == 'gzip'
+            assert CompressionEngine(None).suffix == '.gz'
+
+    def test_unknown_algorithm(self):
+        with pytest.raises(CompressionEngineError):
+            CompressionEngine('lz4')
+
+
+@pytest.mark.skipif(not HAS_ZSTD, reason="zstandard not available")
+class TestZstdDictionaries:
+    """Test per-source dictionary training and dictionary-aware reading"""
+
+    def test_dictionary_trained_per_source_and_reused(self, tmp_path):
+        slack = [tmp_path / "slack" / f"2025-07-{day:02d}" / "data.jsonl" for day in range(1, 11)]
+        calendar = [tmp_path / "calendar" / f"2025-07-{day:02d}" / "data.jsonl" for day in range(1, 11)]
+        for path in slack:
+            _write_jsonl(path, 300, 'slack')
+        for path in calendar:
+            _write_jsonl(path, 300, 'calendar')
+        expected = slack[0].read_bytes()
+
+        engine = CompressionEngine('zstd', max_workers=2)
+        outcomes = engine.compress_files(slack + calendar, root=tmp_path)
+
+        assert all(o['status'] == 'compressed' for o in outcomes)
+        dictionaries = sorted(p.name.split('-')[0] for p in (tmp_path / '.zstd_dicts').iterdir())
+        assert dictionaries == ['calendar', 'slack']
+        with open_compressed(slack[0].with_name('data.jsonl.zst'), 'rt') as f:
+            assert f.read().encode() == expected
+
+        later = tmp_path / "slack" / "2025-08-01" / "data.jsonl"
+        _write_jsonl(later, 300, 'slack')
+        first_id = {o['dictionary_id'] for o in outcomes if '/slack/' in o['path']}
+        again = engine.compress_files([later], root=tmp_path)
+        assert {again[0]['dictionary_id']} == first_id
+        assert len(list((tmp_path / '.zstd_dicts').iterdir())) == 2
@@ -0,0 +1,159 @@
+"""
+Tests for sweep-line conflict detection
+
+The sweep must report exactly what the all-pairs comparison reported: the
+reference implementations below are the previous pairwise algorithms,
+built on the detector's own has_conflict/overlap_minutes.
+
+References:
+- src/scheduling/conflicts.py - find_overlapping_pairs, ConflictDetector
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.scheduling.conflicts import ConflictDetector, find_overlapping_pairs
+
+BASE = datetime(2025, 8, 4, 8, 0)
+PEOPLE = [f'person{i}@example.com' for i in range(8)]
+ROOMS = ['Room A', 'room a ', 'Board Room', 'https://zoom.us/j/1', '']
+
+
+def _time_field(rng, moment):
+    style = rng.randrange(4)
+    if style == 0:
+        return {'dateTime': moment.isoformat() + 'Z'}
+    if style == 1:
+        return {'dateTime': moment.isoformat(), 'timeZone': 'America/New_York'}
+    if style == 2:
+        return moment.isoformat()
+    return moment
+
+
+def _events(seed, count):
+    rng = random.Random(seed)
+    events = []
+    for i in range(count):
+        start = BASE + timedelta(minutes=15 * rng.randrange(40))
+        length = rng.choice([0, 15, 30, 45, 60, 90, -30])
+        event = {
+            'id': f'evt{i}',
+            'summary': rng.choice(['Standup', 'Client demo', 'Sync', 'Quarterly review']),
+            'start': _time_field(rng, start),
+            'end': _time_field(rng, start + timedelta(minutes=length)),
+            'attendees': [{'email': p.upper()} for p in rng.sample(PEOPLE, rng.randrange(4))],
+            'location': rng.choice(ROOMS),
+        }
+        if rng.random() < 0.05:
+            event['start'] = {'date': start.strftime('%Y-%m-%d')}
+            event['end'] = {'date': (start + timedelta(days=1)).strftime('%Y-%m-%d')}
+        if rng.random() < 0.05:
+            del event['end']
+        events.append(event)
+    return events
+
+
+def _pairwise_all_conflicts(detector, events, timezone):
+    normalized = [(event, detector._normalize_event_to_timezone(event, timezone)) for event in events]
+    normalized = [(event, norm) for event, norm in normalized if norm]
+    conflicts = []
+    for i in range(len(normalized)):
+        for j in range(i + 1, len(normalized)):
+            (event1, norm1), (event2, norm2) = normalized[i], normalized[j]
+            if detector.has_conflict(norm1, norm2, timezone):
+                overlap = detector.overlap_minutes(norm1, norm2, timezone)
+                conflict_type, severity = detector._classify_conflict(event1, event2, overlap)
+                affected = set(detector._extract_attendee_emails(event1)) & set(
+                    detector._extract_attendee_emails(event2))
+                conflicts.append((event1['id'], event2['id'], overlap, conflict_type, severity,
+                                  sorted(affected)))
+
+    rooms = {}
+    for event in events:
+        location = event.get('location', '').strip().lower()
+        if location and not detector._is_virtual_location(location):
+            rooms.setdefault(location, []).append(event)
+    for room_events in rooms.values():
+        for i in range(len(room_events)):
+            for j in range(i + 1, len(room_events)):
+                event1, event2 = room_events[i], room_events[j]
+                if detector.has_conflict(event1, event2, timezone):
+                    conflicts.append((event1['id'], event2['id'],
+                                      detector.overlap_minutes(event1, event2, timezone),
+                                      'resource_double_booking', 0.7, []))
+
+    conflicts.sort(key=lambda c: c[4], reverse=True)
+    return conflicts
+
+
+def _pairwise_attendee_conflicts(detector, events, timezone):
+    normalized = [(event, detector._normalize_event_to_timezone(event, timezone)) for event in events]
+    normalized = [(event, norm) for event, norm in normalized if norm]
+    by_person = {}
+    for i in range(len(normalized)):
+        for j in range(i + 1, len(normalized)):
+            (event1, norm1), (event2, norm2) = normalized[i], normalized[j]
+            if detector.has_conflict(norm1, norm2, timezone):
+                common = set(detector._extract_attendee_emails(event1)) & set(
+                    detector._extract_attendee_emails(event2))
+                for person in common:
+                    ids = by_person.setdefault(person, [])
+                    ids.extend(e['id'] for e in (event1, event2) if e['id'] not in ids)
+    return {person: ids for person, ids in by_person.items() if len(ids) > 1}
+
+
+class TestFindOverlappingPairs:
+    """Sweep-line edge cases against the has_conflict overlap test"""
+
+    def test_boundaries(self):
+        t = [BASE + timedelta(minutes=m) for m in range(0, 200, 10)]
+        intervals = [
+            (t[0], t[3]),   # 0
+            (t[3], t[5]),   # 1 touches 0: no overlap
+            (t[2], t[2]),   # 2 empty, inside 0
+            (t[0], t[0]),   # 3 empty at 0's start: no overlap
+            None,           # 4 unparseable
+            (t[6], t[4]),   # 5 inverted, overlaps 1 by the formula
+            (t[1], t[4]),   # 6
+        ]
+
+        expected = sorted(
+            (i, j) for i in range(len(intervals)) for j in range(i + 1, len(intervals))
+            if intervals[i] and intervals[j]
+            and intervals[i][0] < intervals[j][1] and intervals[j][0] < intervals[i][1]
+        )
+        assert find_overlapping_pairs(intervals) == expected
+        assert (0, 2) in expected and (0, 1) not in expected and (0, 3) not in expected
+
+    def test_subset(self):
+        intervals = [(BASE, BASE + timedelta(hours=1))] * 4
+        assert find_overlapping_pairs(intervals, [3, 1]) == [(1, 3)]
+
+
+@pytest.mark.parametrize('seed', range(6))
+@pytest.mark.parametrize('timezone', ['UTC', 'Asia/Kolkata'])
+class TestMatchesPairwise:
+    """The sweep reports the same conflicts as the all-pairs algorithm"""
+
+    def test_detect_all_conflicts(self, seed, timezone):
+        detector = ConflictDetector()
+        events = _events(seed, 60)
+
+        conflicts = detector.detect_all_conflicts(events, timezone=timezone)
+        actual = [(c.event1['id'], c.event2['id'], c.overlap_minutes, c.conflict_type, c.severity,
+                   sorted(c.affected_attendees)) for c in conflicts]
+
+        assert actual == _pairwise_all_conflicts(detector, events, timezone)
+        assert conflicts
+
+    def test_find_attendee_conflicts(self, seed, timezone):
+        detector = ConflictDetector()
+        events = _events(seed, 60)
+
+        conflicts = detector.find_attendee_conflicts(events, timezone=timezone)
+        actual = {c['person']: [e['id'] for e in c['meetings']] for c in conflicts}
+
+        assert actual == _pairwise_attendee_conflicts(detector, events, timezone)
+        assert all(c['conflict_count'] == len(c['meetings']) for c in conflicts)
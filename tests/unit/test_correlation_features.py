@@ -0,0 +1,92 @@
+"""
+Tests for precomputed correlation features and parallel scoring
+
+References:
+- src/correlators/features.py - FeatureExtractor, NameFeatures, TitleFeatures
+- src/correlators/meeting_correlator.py - MeetingCorrelator.score_emails
+"""
+
+import pytest
+
+from src.correlators import meeting_correlator
+from src.correlators.content_matcher import ContentMatcher, SimilarityScorer
+from src.correlators.features import FeatureExtractor
+from src.correlators.meeting_correlator import MeetingCorrelator
+from src.correlators.participant_matcher import NameSimilarity, ParticipantMatcher
+from src.correlators.temporal_matcher import TemporalMatcher
+from tests.fixtures.mock_meeting_data import get_mock_meeting_records
+
+
+class TestSimilarityScores:
+    """Scores computed from features match the per-call text scores"""
+
+    @pytest.mark.parametrize('name1, name2, expected', [
+        ('Alice Jones', 'Charlie', 0.6666666666666666),
+        ('Dave Smith', 'david.smith', 0.9523809523809523),
+        ('Dave', 'David', 1.0),
+        ('', 'Bob', 0.0),
+    ])
+    def test_name_similarity(self, name1, name2, expected):
+        similarity = NameSimilarity()
+        features = FeatureExtractor(participant_matcher=ParticipantMatcher())
+
+        assert similarity.calculate_similarity(name1, name2) == expected
+        assert features.name_similarity(features.name(name1), features.name(name2)) == expected
+
+    @pytest.mark.parametrize('title1, title2, expected', [
+        ('Invitation: Weekly Team Sync', 'Team Sync Notes',
+         (0.4, (0.3333333333333333, ['team']), 0.36363636363636365, 0.5624242424242424)),
+        ('Standup', 'Standups', (0.9333333333333333, (0.0, []), 0.0, 0.27999999999999997)),
+        ('Roadmap planning', 'Budget review', (0.125, (0.0, []), 0.0, 0.0375)),
+    ])
+    def test_title_similarity(self, title1, title2, expected):
+        scorer = SimilarityScorer()
+        features1, features2 = scorer.title_features(title1), scorer.title_features(title2)
+
+        assert (scorer.string_similarity(title1, title2), scorer.keyword_similarity(title1, title2),
+                scorer.weighted_keyword_similarity(title1, title2),
+                scorer.semantic_similarity(title1, title2)) == expected
+        assert (scorer.string_similarity_features(features1, features2),
+                scorer.keyword_similarity_features(features1, features2),
+                scorer.weighted_keyword_similarity_features(features1, features2),
+                scorer.semantic_similarity_features(features1, features2)) == expected
+
+
+def test_features_are_cached_per_run():
+    features = FeatureExtractor(TemporalMatcher(), ParticipantMatcher(), ContentMatcher())
+    doc = features.doc({'id': 'doc_1', 'title': 'Budget review',
+                        'filename': 'Dave _ Priya - Budget review - 2025_06_02 09_05 UTC - Notes by Gemini.docx'})
+
+    assert doc.participants == ['Dave', 'Priya']
+    assert doc.names[0] is features.name('Dave') and doc.names[0].normalized == 'david'
+    assert doc.title_features is features.title('Budget review')
+    assert doc.time_source == 'filename_timestamp'
+    assert not hasattr(doc, '__dict__') and not hasattr(doc.title_features, '__dict__')
+
+
+def test_find_composite_match_uses_features():
+    emails, docs = get_mock_meeting_records(0, 30)
+    correlator = MeetingCorrelator(max_workers=1)
+    features = correlator.feature_extractor()
+    doc_features = [features.doc(doc) for doc in docs]
+
+    for email in emails:
+        expected = correlator.find_composite_match_features(features.email(email), doc_features, features)
+        actual = correlator.find_composite_match(email, docs)
+        assert (actual and (actual.doc_id, actual.composite_score)) == (
+            expected and (expected.doc_id, expected.composite_score))
+
+
+def test_parallel_scoring_matches_inline(monkeypatch, caplog):
+    monkeypatch.setattr(meeting_correlator, 'MIN_EMAILS_PER_WORKER', 10)
+    emails, docs = get_mock_meeting_records(1, 60)
+
+    inline = MeetingCorrelator(max_workers=1).correlate_meetings(emails, docs)
+    parallel = MeetingCorrelator(max_workers=2).correlate_meetings(emails, docs)
+
+    assert [(m.correlation_match.email_id, m.correlation_match.doc_id, m.correlation_match.confidence_score)
+            for m in parallel.correlated_meetings] == [
+        (m.correlation_match.email_id, m.correlation_match.doc_id, m.correlation_match.confidence_score)
+        for m in inline.correlated_meetings]
+    assert parallel.correlated_meetings
+    assert 'Parallel scoring failed' not in caplog.text
@@ -0,0 +1,112 @@
+"""
+Import-time budget for CLI entry points and the Slack bot
+
+Each command runs under `python -X importtime` in a fresh interpreter. The
+heavy-module checks are the precise guard; the millisecond budgets are
+deliberately loose so a loaded CI machine does not fail them, but still
+catch an eager pyarrow, requests or googleapiclient import sneaking back in.
+
+References:
+- src/core/lazy_import.py - lazy_import, is_loaded
+- tools/search_cli.py, tools/find_slots.py, tools/manage_archives.py
+- src/bot/slack_bot.py
+"""
+
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.core.lazy_import import LazyImportError, is_loaded, lazy_import
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+IMPORTTIME_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)')
+
+# command -> (budget in ms, modules that must not be imported)
+COMMANDS = {
+    'search_cli search': (
+        ['tools/search_cli.py', 'search', '--help'], 300,
+        ['pyarrow', 'numpy', 'psutil', 'src.search.indexer', 'src.search.migrations']),
+    'search_cli stats': (
+        ['tools/search_cli.py', 'stats', '--help'], 300,
+        ['pyarrow', 'numpy', 'src.search.indexer']),
+    'query_facts time': (
+        ['tools/query_facts.py', 'time', '--help'], 300,
+        ['pytz', 'requests', 'googleapiclient', 'cryptography']),
+    'daily_summary': (
+        ['tools/daily_summary.py', '--help'], 300,
+        ['requests', 'googleapiclient', 'cryptography']),
+    'find_slots': (
+        ['tools/find_slots.py', '--help'], 250,
+        ['requests', 'googleapiclient', 'numpy', 'src.collectors.calendar_collector']),
+    'manage_archives': (
+        ['tools/manage_archives.py', '--help'], 300,
+        ['core.compression_engine', 'core.safe_compression', 'verify_archive']),
+    'slack_bot': (
+        ['-c', 'import src.bot.slack_bot'], 250,
+        ['slack_bolt', 'slack_sdk', 'requests', 'src.core.auth_manager']),
+}
+
+
+def _import_profile(args):
+    """Run a command under -X importtime and return {module: cumulative_us}"""
+    result = subprocess.run([sys.executable, '-X', 'importtime', *args],
+                            capture_output=True, text=True, cwd=PROJECT_ROOT, timeout=60)
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    profile = {}
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            # Top-level entries (no indent) carry the cumulative cost of their subtree
+            profile[match.group(4)] = (int(match.group(2)), not match.group(3))
+    return profile
+
+
+@pytest.mark.parametrize('name', sorted(COMMANDS))
+def test_command_import_budget(name):
+    args, budget_ms, forbidden = COMMANDS[name]
+    profile = _import_profile(args)
+
+    loaded = sorted(module for module in forbidden if module in profile)
+    assert not loaded, f"{name} imports {loaded} before doing any work"
+
+    # Interpreter startup (site, encodings) is outside our control
+    total_ms = sum(cumulative for module, (cumulative, top_level) in profile.items()
+                   if top_level and module != 'site') / 1000
+    assert total_ms < budget_ms, f"{name} spent {total_ms:.0f}ms importing (budget {budget_ms}ms)"
+
+
+class TestLazyImport:
+    """Test deferred execution of lazily imported modules"""
+
+    def test_module_executes_on_first_attribute(self, tmp_path, monkeypatch):
+        (tmp_path / 'lazy_probe_module.py').write_text("EXECUTED = True\nimport lazy_probe_counter\nlazy_probe_counter.count += 1\n")
+        (tmp_path / 'lazy_probe_counter.py').write_text("count = 0\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.delitem(sys.modules, 'lazy_probe_module', raising=False)
+        import lazy_probe_counter
+
+        module = lazy_import('lazy_probe_module')
+        assert lazy_probe_counter.count == 0
+        assert not is_loaded('lazy_probe_module')
+
+        assert module.EXECUTED is True
+        assert lazy_probe_counter.count == 1
+        assert is_loaded('lazy_probe_module')
+        assert lazy_import('lazy_probe_module') is module
+
+        monkeypatch.delitem(sys.modules, 'lazy_probe_module')
+        monkeypatch.delitem(sys.modules, 'lazy_probe_counter')
+
+    def test_already_imported_module_is_returned(self):
+        assert lazy_import('json') is sys.modules['json']
+        assert is_loaded('json')
+
+    def test_missing_module(self):
+        with pytest.raises(LazyImportError):
+            lazy_import('src.core.no_such_module')
+        assert not is_loaded('src.core.no_such_module')
@@ -0,0 +1,176 @@
+"""
+Tests for incremental meeting pipeline runs
+
+Correlating with a previous run's state must produce the same meetings as
+correlating from scratch, while unchanged emails are only scored against
+new docs. Extractions of unchanged files are reused.
+
+References:
+- src/correlators/meeting_correlator.py - MeetingCorrelator.match_emails_incremental
+- src/orchestrators/pipeline_state.py - PipelineState
+"""
+
+import copy
+import json
+import os
+import sqlite3
+from datetime import datetime, timezone
+
+import pytest
+
+from src.correlators.meeting_correlator import CorrelationStrategy, MeetingCorrelator
+from src.orchestrators import pipeline_state
+from src.orchestrators.pipeline_state import PipelineState
+from tests.fixtures.mock_meeting_data import get_mock_meeting_records
+
+
+def _summary(results):
+    return ([(m.correlation_match.email_id, m.correlation_match.doc_id, m.correlation_match.confidence_score,
+              repr(m.correlation_match.match_details)) for m in results.correlated_meetings],
+            [(o.record_id, o.correlation_attempts) for o in results.orphaned_emails],
+            [o.record_id for o in results.orphaned_docs])
+
+
+def _correlate(strategy, emails, docs, previous_state=None):
+    correlator = MeetingCorrelator(strategy=strategy, max_workers=1)
+    return correlator.correlate_meetings(copy.deepcopy(emails), copy.deepcopy(docs), previous_state)
+
+
+class TestIncrementalCorrelation:
+    """Reusing stored matches across correlation runs"""
+
+    @pytest.mark.parametrize('strategy', [CorrelationStrategy.COMPOSITE, CorrelationStrategy.ADAPTIVE])
+    def test_matches_full_correlation(self, strategy):
+        emails, docs = get_mock_meeting_records(3, 60)
+        changed = copy.deepcopy(docs)
+        changed[10]['title'] = 'Offsite logistics'
+        runs = [
+            (emails[:40], docs[:40]),
+            (emails, docs),                                 # new emails and docs
+            (emails[5:], changed[:20] + changed[25:]),      # removed and changed docs
+            (emails[5:], changed[:20] + changed[25:]),      # nothing changed
+        ]
+
+        state = {}
+        for run_emails, run_docs in runs:
+            incremental = _correlate(strategy, run_emails, run_docs, state)
+            assert _summary(incremental) == _summary(_correlate(strategy, run_emails, run_docs))
+            state = json.loads(json.dumps(incremental.correlation_state))
+
+    def test_unchanged_emails_scored_against_new_docs(self, monkeypatch):
+        emails, docs = get_mock_meeting_records(4, 40)
+        state = _correlate(CorrelationStrategy.COMPOSITE, emails[:-3], docs[:-2], {}).correlation_state
+
+        calls = []
+        original = MeetingCorrelator.match_emails
+        monkeypatch.setattr(MeetingCorrelator, 'match_emails', lambda self, email_features, doc_features, *args: (
+            calls.append((len(email_features), len(doc_features))) or
+            original(self, email_features, doc_features, *args)))
+
+        _correlate(CorrelationStrategy.COMPOSITE, emails, docs, state)
+        assert calls == [(len(emails) - 3, 2), (3, len(docs))]
+
+    def test_state_ignored_after_settings_change(self):
+        emails, docs = get_mock_meeting_records(5, 30)
+        state = _correlate(CorrelationStrategy.COMPOSITE, emails, docs, {}).correlation_state
+
+        adaptive = _correlate(CorrelationStrategy.ADAPTIVE, emails, docs, state)
+        assert _summary(adaptive) == _summary(_correlate(CorrelationStrategy.ADAPTIVE, emails, docs))
+        assert _correlate(CorrelationStrategy.COMPOSITE, emails, docs).correlation_state is None
+
+
+class TestPipelineState:
+    """Per-file extraction cache and stored correlation state"""
+
+    @pytest.fixture
+    def extract(self):
+        calls = []
+
+        def extract(file_path):
+            calls.append(os.path.basename(file_path))
+            with open(file_path) as f:
+                text = f.read()
+            if text == 'broken':
+                raise ValueError('unparseable')
+            return {'text': text} if text else None
+
+        extract.calls = calls
+        return extract
+
+    def test_extraction_reuse(self, tmp_path, extract):
+        files = []
+        for name, text in (('a', 'alpha'), ('b', 'beta'), ('empty', ''), ('bad', 'broken')):
+            path = tmp_path / f'{name}.eml'
+            path.write_text(text)
+            files.append(str(path))
+        state = PipelineState(tmp_path / 'state' / 'pipeline_state.db')
+
+        first = state.extract_files(files, 'email', extract)
+        assert [(e.record, e.cached, e.error) for e in first] == [
+            ({'text': 'alpha'}, False, None), ({'text': 'beta'}, False, None), (None, False, None),
+            (None, False, 'unparseable')]
+
+        # Touched files are rehashed, changed files re-extracted, failures retried
+        stat = os.stat(files[0])
+        os.utime(files[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        (tmp_path / 'b.eml').write_text('gamma')
+        extract.calls.clear()
+        second = state.extract_files(files, 'email', extract)
+        assert extract.calls == ['b.eml', 'bad.eml']
+        assert [(e.record, e.cached) for e in second[:3]] == [
+            ({'text': 'alpha'}, True), ({'text': 'gamma'}, False), (None, True)]
+        assert second[0].record_id == first[0].record_id
+        assert second[1].record_id != first[1].record_id
+
+        # Removed files are dropped, other kinds are kept apart
+        extract.calls.clear()
+        assert [e.cached for e in state.extract_files(files[:1], 'email', extract)] == [True]
+        assert state.extract_files(files[1:2], 'email', extract)[0].cached is False
+        assert state.extract_files(files[:1], 'doc', extract)[0].cached is False
+        assert extract.calls == ['b.eml', 'a.eml']
+
+    def test_directories_sharing_state_keep_their_extractions(self, tmp_path, extract):
+        files = {}
+        for directory in ('a', 'b'):
+            path = tmp_path / directory / 'notes.eml'
+            path.parent.mkdir()
+            path.write_text(directory)
+            files[directory] = [str(path)]
+        state = PipelineState(tmp_path / 'pipeline_state.db')
+
+        state.extract_files(files['a'], 'email', extract, scope=str(tmp_path / 'a'))
+        state.extract_files(files['b'], 'email', extract, scope=str(tmp_path / 'b'))
+        again = state.extract_files(files['a'], 'email', extract, scope=str(tmp_path / 'a'))
+
+        assert [e.cached for e in again] == [True]
+        assert extract.calls == ['notes.eml', 'notes.eml']
+
+    def test_records_round_trip_as_json(self, tmp_path):
+        path = tmp_path / 'notes.eml'
+        path.write_text('x')
+        state = PipelineState(tmp_path / 'pipeline_state.db')
+        when = datetime(2025, 6, 2, 10, 0, tzinfo=timezone.utc)
+
+        first = state.extract_files([str(path)], 'email', lambda _: {'date': when, 'n': 1})
+        second = state.extract_files([str(path)], 'email', lambda _: None)
+
+        assert second[0].cached
+        assert second[0].record == first[0].record
+        assert datetime.fromisoformat(first[0].record['date']) == when
+        with sqlite3.connect(tmp_path / 'pipeline_state.db') as conn:
+            stored = conn.execute("SELECT record FROM extraction_cache").fetchone()[0]
+        assert json.loads(stored) == first[0].record
+
+    def test_correlation_state(self, tmp_path, monkeypatch):
+        db_path = tmp_path / 'pipeline_state.db'
+        state = PipelineState(db_path)
+        assert state.load_correlation_state(str(tmp_path)) == {}
+
+        state.save_correlation_state(str(tmp_path), {'docs': ['x'], 'emails': {}})
+        assert PipelineState(db_path).load_correlation_state(str(tmp_path / '.')) == {'docs': ['x'], 'emails': {}}
+
+        version = pipeline_state.PIPELINE_STATE_VERSION + 1
+        monkeypatch.setattr(pipeline_state, 'PIPELINE_STATE_VERSION', version)
+        assert PipelineState(db_path).load_correlation_state(str(tmp_path)) == {}
+        with sqlite3.connect(db_path) as conn:
+            assert conn.execute("PRAGMA user_version").fetchone()[0] == version
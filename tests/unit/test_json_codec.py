@@ -0,0 +1,77 @@
+"""
+Tests for the pluggable JSON codec and typed record structs
+
+References:
+- src/core/json_codec.py - codecs and selection
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from src.core import json_codec
+from src.core.json_codec import (
+    CODECS, JSONCodec, JSONCodecError, create_codec, set_codec
+)
+
+AVAILABLE = sorted(CODECS)
+
+RECORD = {'ts': '1754006400.000100', 'user': 'U1', 'text': 'déploiement terminé ✅',
+          'channel': 'C0123', 'reactions': [{'name': 'tada', 'count': 2}], 'score': 0.25,
+          'edited': None, 'pinned': False}
+
+
+@pytest.fixture
+def restore_codec():
+    previous = json_codec.get_codec()
+    yield
+    set_codec(previous)
+
+
+@pytest.mark.parametrize('name', AVAILABLE)
+class TestCodecs:
+    """Every available codec must agree with the standard library"""
+
+    def test_round_trip_matches_stdlib(self, name):
+        codec = create_codec(name)
+
+        encoded = codec.dumps(RECORD)
+        assert json.loads(encoded) == RECORD
+        assert 'déploiement' in encoded and ': ' not in encoded
+        assert codec.loads(encoded.encode()) == codec.loads(encoded) == RECORD
+
+    def test_stdlib_edge_cases(self, name):
+        codec = create_codec(name)
+
+        assert codec.loads(b'{"big": 123456789012345678901234567890}')['big'] == 123456789012345678901234567890
+        assert json.loads(codec.dumps({'big': 2 ** 70, 1: 'int key'})) == {'big': 2 ** 70, '1': 'int key'}
+        with pytest.raises(json.JSONDecodeError):
+            codec.loads(b'{"a": }')
+
+    def test_unserializable_values(self, name):
+        codec = create_codec(name)
+        if name != 'msgspec':
+            with pytest.raises(TypeError):
+                codec.dumps({'when': datetime(2025, 8, 1)})
+        assert codec.dumps({'when': datetime(2025, 8, 1)}, default=str) in (
+            '{"when":"2025-08-01 00:00:00"}', '{"when":"2025-08-01T00:00:00"}')
+
+
+class TestSelection:
+    """Test process-wide codec selection"""
+
+    def test_unknown_codec(self):
+        with pytest.raises(JSONCodecError):
+            create_codec('simdjson')
+
+    def test_env_var_pins_codec(self, monkeypatch, restore_codec):
+        monkeypatch.setenv(json_codec.CODEC_ENV_VAR, 'json')
+        assert type(set_codec(None)) is JSONCodec
+
+        monkeypatch.setenv(json_codec.CODEC_ENV_VAR, 'simdjson')
+        assert set_codec(None).name in CODECS
+
+    def test_module_helpers_use_current_codec(self, restore_codec):
+        set_codec('json')
+        assert json_codec.loads(json_codec.dumps(RECORD)) == RECORD
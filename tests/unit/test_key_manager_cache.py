@@ -0,0 +1,92 @@
+"""
+Tests for the derived-key cache and bulk retrieval in EncryptedKeyManager
+
+References:
+- src/core/key_manager.py - DerivedKeyCache, EncryptedKeyManager.retrieve_keys
+"""
+
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.core.key_manager import DerivedKeyCache, EncryptedKeyManager, PBKDF2HMAC
+
+
+@pytest.fixture
+def manager(tmp_path):
+    keys = EncryptedKeyManager(str(tmp_path / "keys.db"))
+    keys.master_key_path = str(tmp_path / ".master_key")
+    return keys
+
+
+def _count_derivations():
+    return patch.object(PBKDF2HMAC, 'derive', autospec=True, side_effect=PBKDF2HMAC.derive)
+
+
+class TestDerivedKeyCache:
+    """Test eviction, expiry and zeroization"""
+
+    def test_lru_eviction_zeroizes(self):
+        cache = DerivedKeyCache(max_entries=2)
+        cache.put(b'a', b'key-a')
+        buffer = cache._entries[b'a'][0]
+        cache.put(b'b', b'key-b')
+        cache.get(b'a')
+        cache.put(b'c', b'key-c')
+
+        assert cache.get(b'b') is None
+        assert cache.get(b'a') == b'key-a'
+
+        cache.clear()
+        assert bytes(buffer) == bytes(5)
+        assert len(cache) == 0
+
+    def test_expiry(self):
+        cache = DerivedKeyCache(ttl=0.01)
+        cache.put(b'a', b'key-a')
+        time.sleep(0.02)
+
+        assert cache.get(b'a') is None
+
+
+class TestKeyManagerCaching:
+    """Test that PBKDF2 runs once per salt"""
+
+    def test_repeated_retrieval_derives_once(self, manager):
+        assert manager.store_key('slack_tokens_test', {'bot_token': 'xoxb-test-1'})
+
+        with _count_derivations() as derive:
+            for _ in range(5):
+                assert manager.retrieve_key('slack_tokens_test') == {'bot_token': 'xoxb-test-1'}
+
+        # store_key already cached the key derived for the new salt
+        assert derive.call_count == 0
+
+        manager.clear_key_cache()
+        with _count_derivations() as derive:
+            manager.retrieve_key('slack_tokens_test')
+        assert derive.call_count == 1
+
+    def test_master_key_change_invalidates(self, manager):
+        manager.store_key('google_apis', {'client_id': 'abc'})
+        assert manager.retrieve_key('google_apis') == {'client_id': 'abc'}
+
+        with open(manager.master_key_path, 'w') as f:
+            f.write('rotated')
+        os.utime(manager.master_key_path, ns=(1, 1))
+
+        # The old ciphertext no longer decrypts once the derived key is recomputed
+        assert manager.retrieve_key('google_apis') is None
+
+    def test_retrieve_keys_bulk(self, manager):
+        manager.store_key('slack_tokens_test', {'bot_token': 'xoxb-test-1'})
+        manager.store_key('google_apis', {'client_id': 'abc'})
+
+        results = manager.retrieve_keys(['google_apis', 'missing', 'slack_tokens_test'])
+
+        assert results == {'google_apis': {'client_id': 'abc'}, 'missing': None,
+                           'slack_tokens_test': {'bot_token': 'xoxb-test-1'}}
+        actions = [entry['action'] for entry in manager.get_access_log()]
+        assert actions.count('RETRIEVE') == 2
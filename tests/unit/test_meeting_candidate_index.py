@@ -0,0 +1,64 @@
+"""
+Tests for candidate pruning in the meeting correlator
+
+Correlating through the candidate index must produce the same meetings as
+scoring every email against every doc.
+
+References:
+- src/correlators/candidate_index.py - CandidateIndex
+- src/correlators/meeting_correlator.py - MeetingCorrelator.correlate_meetings
+"""
+
+from datetime import timedelta
+
+import pytest
+
+from src.correlators.candidate_index import CandidateIndex
+from src.correlators.content_matcher import ContentMatcher
+from src.correlators.features import FeatureExtractor
+from src.correlators.meeting_correlator import CorrelationStrategy, MeetingCorrelator
+from src.correlators.participant_matcher import ParticipantMatcher
+from src.correlators.temporal_matcher import TemporalMatcher
+from tests.fixtures.mock_meeting_data import get_mock_meeting_records
+
+
+def _summary(results):
+    return ([(m.correlation_match.email_id, m.correlation_match.doc_id,
+              m.correlation_match.confidence_score) for m in results.correlated_meetings],
+            [o.record_id for o in results.orphaned_emails],
+            [o.record_id for o in results.orphaned_docs])
+
+
+@pytest.mark.parametrize('seed', range(3))
+@pytest.mark.parametrize('strategy', [CorrelationStrategy.COMPOSITE, CorrelationStrategy.ADAPTIVE])
+def test_matches_exhaustive_correlation(seed, strategy):
+    emails, docs = get_mock_meeting_records(seed, 60)
+
+    indexed = MeetingCorrelator(strategy=strategy, max_workers=1).correlate_meetings(emails, docs)
+    exhaustive = MeetingCorrelator(strategy=strategy, use_candidate_index=False,
+                                   max_workers=1).correlate_meetings(emails, docs)
+
+    assert _summary(indexed) == _summary(exhaustive)
+    assert indexed.correlated_meetings
+
+
+def test_candidates():
+    docs = [
+        {'id': 'near', 'filename': 'Alpha meeting - 2025_06_02 09_05 UTC - Notes by Gemini.docx'},
+        {'id': 'far', 'filename': 'Alpha meeting - 2025_06_09 09_05 UTC - Notes by Gemini.docx'},
+        {'id': 'person', 'title': 'Unrelated', 'meeting_metadata': {'participants': ['Dave Smith']}},
+        {'id': 'fuzzy', 'title': 'Unrelated', 'meeting_metadata': {'participants': ['Jon']}},
+        {'id': 'keyword', 'title': 'Quarterly roadmap'},
+        {'id': 'similar', 'title': 'Standups'},
+        {'id': 'other', 'title': 'Offsite logistics', 'meeting_metadata': {'participants': ['Priya']}},
+    ]
+    features = FeatureExtractor(TemporalMatcher(), ParticipantMatcher(), ContentMatcher())
+    index = CandidateIndex([features.doc(doc) for doc in docs], features, timedelta(hours=24))
+
+    def candidates(email):
+        return [docs[position]['id'] for position in index.candidates(features.email(email))]
+
+    assert candidates({'title': 'Roadmap', 'participants': ['david.smith@company.com', 'John'],
+                       'meeting_datetime': '2025-06-02T09:00:00Z'}) == ['near', 'person', 'fuzzy', 'keyword']
+    assert candidates({'title': 'Standup'}) == ['similar']
+    assert candidates({'title': ''}) == []
@@ -0,0 +1,107 @@
+"""
+Tests for process-pool DOCX/EML extraction with the per-file extraction cache
+
+References:
+- src/core/extraction_cache.py - extract_files_parallel, ExtractionCache
+- src/collectors/drive_content.py - DriveContentExtractor.extract_drive_content
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+docx = pytest.importorskip('docx')
+
+from src.collectors.drive_collector import extract_docx_archive_record
+from src.collectors.drive_content import DriveContentExtractor
+from src.collectors.email_collector import parse_eml
+from src.core import extraction_cache
+from src.core.extraction_cache import extract_files_parallel
+
+EML = """From: alice@example.com
+To: bob@example.com
+Subject: Notes: "Roadmap review" Jun 2, 2025
+Date: Mon, 2 Jun 2025 10:00:00 -0700
+Content-Type: text/plain
+
+Notes from "Roadmap review"
+Notes by Gemini
+Participants: Alice Smith, Bob Jones
+
+Summary of the roadmap discussion {i}.
+"""
+
+
+def _write_docx(path, title, paragraphs):
+    document = docx.Document()
+    document.add_heading(title, level=1)
+    for text in paragraphs:
+        document.add_paragraph(text)
+    document.save(str(path))
+
+
+@pytest.fixture
+def docx_files(tmp_path):
+    files = []
+    for i in range(5):
+        path = tmp_path / 'docs' / f'Weekly sync {i} - 2025_06_0{i + 1} 10_00 PDT - Notes by Gemini.docx'
+        path.parent.mkdir(exist_ok=True)
+        _write_docx(path, f'Weekly sync {i}', ['Summary', f'Discussed item {i}', 'Action Items', 'Ship it'])
+        files.append(str(path))
+    return files
+
+
+def test_small_batches_skip_the_pool(tmp_path):
+    files = [str(tmp_path / f'{i}.txt') for i in range(extraction_cache.MIN_FILES_PER_WORKER * 2 - 1)]
+
+    with patch.object(extraction_cache, 'ProcessPoolExecutor') as pool:
+        extract_files_parallel(files, len, max_workers=4)
+    pool.assert_not_called()
+
+
+def test_pool_matches_inline(tmp_path, docx_files, monkeypatch):
+    monkeypatch.setattr(extraction_cache, 'MIN_FILES_PER_WORKER', 1)
+    (tmp_path / 'broken.docx').write_text('not a docx')
+    files = docx_files + [str(tmp_path / 'broken.docx')]
+
+    def summary(extractions):
+        return [(e.file_path, e.content_hash, e.error is None,
+                 e.record and {k: v for k, v in e.record.items() if k != 'collected_at'})
+                for e in extractions]
+
+    pooled = extract_files_parallel(files, extract_docx_archive_record, max_workers=2)
+    assert summary(pooled) == summary(extract_files_parallel(files, extract_docx_archive_record, max_workers=1))
+    assert [e.error is None for e in pooled] == [True] * 5 + [False]
+    assert pooled[0].record['title'] and 'Discussed item 0' in pooled[0].record['content']
+
+
+def test_parse_eml_without_collector(tmp_path, monkeypatch):
+    monkeypatch.setattr(extraction_cache, 'MIN_FILES_PER_WORKER', 1)
+    files = []
+    for i in range(3):
+        path = tmp_path / f'Notes_{i}.eml'
+        path.write_text(EML.format(i=i))
+        files.append(str(path))
+
+    extractions = extract_files_parallel(files, parse_eml, max_workers=2)
+    assert [e.record.meeting_title for e in extractions] == ['Roadmap review'] * 3
+    assert 'roadmap discussion 2' in extractions[2].record.content
+
+
+def test_drive_content_reruns_reuse_extractions(tmp_path, docx_files, monkeypatch):
+    extractor = DriveContentExtractor(tmp_path, max_workers=2)
+    extractor.search_paths = [tmp_path / 'docs', tmp_path / 'docs']
+    batches = []
+    index = extractor.search_db.index_records_batch
+    monkeypatch.setattr(extractor.search_db, 'index_records_batch',
+                        lambda records, source: batches.append(len(records)) or index(records, source))
+
+    first = extractor.extract_drive_content()
+    assert (first.documents_processed, first.documents_indexed, first.errors) == (5, 5, [])
+
+    _write_docx(docx_files[2], 'Weekly sync 2', ['Summary', 'Rescheduled'])
+    second = extractor.extract_drive_content()
+    assert (second.documents_processed, second.documents_indexed, second.errors) == (5, 1, [])
+    assert len(second.extracted_documents) == 5
+    assert 'Rescheduled' in second.extracted_documents[2]['content']
+    assert batches == [5, 1]
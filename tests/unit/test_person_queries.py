@@ -368,6 +368,25 @@ class TestPersonQueryEngine:
                 metadata = json.loads(msg['metadata']) if isinstance(msg['metadata'], str) else msg['metadata']
                 assert metadata.get('author_email') == "john.doe@company.com"
     
+    def test_person_message_history_cursor_paging(self):
+        """Keyset cursors page through history newest first without overlap"""
+        first = self.engine.get_message_page("john.doe@company.com", limit=1)
+        assert len(first['messages']) == 1
+        assert first['next_cursor'] is not None
+        
+        second = self.engine.get_message_page("john.doe@company.com", limit=1,
+                                              cursor=first['next_cursor'])
+        assert len(second['messages']) == 1
+        assert second['next_cursor'] is None
+        
+        assert first['messages'][0]['id'] != second['messages'][0]['id']
+        assert first['messages'][0]['date'] >= second['messages'][0]['date']
+        
+        # Same order as the unpaged listing
+        all_messages = self.engine.get_messages_by_person("john.doe@company.com", limit=50)
+        assert [m['id'] for m in all_messages] == \
+               [first['messages'][0]['id'], second['messages'][0]['id']]
+    
     def test_person_meeting_participation(self):
         """Track meeting participation patterns"""
         meetings = self.engine.get_meetings_for_person("john.doe@company.com", "past 30 days")
@@ -0,0 +1,185 @@
+"""
+Tests for the resident query daemon and its client proxies
+
+References:
+- src/cli/query_daemon.py - QueryDaemon, QueryDaemonClient, open_search_database
+- src/scheduling/calendar_data.py - slot and conflict queries served by the daemon
+"""
+
+import json
+import shutil
+import tempfile
+import threading
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from src.cli import query_daemon
+from src.scheduling.availability import FreeSlot
+from src.scheduling.calendar_data import find_slots_in_events, load_latest_calendar_events
+from src.cli.query_daemon import (
+    DaemonUnavailableError, QueryDaemon, QueryDaemonClient, QueryDaemonError, RemoteError,
+    RemoteSearchDatabase, open_search_database
+)
+from src.search.database import SearchDatabase
+from src.search.pagination import InvalidCursorError
+
+
+@pytest.fixture
+def socket_path(monkeypatch):
+    # Unix socket paths are limited to ~100 bytes, too short for tmp_path
+    directory = Path(tempfile.mkdtemp(prefix='qd-', dir='/tmp'))
+    path = directory / 'd.sock'
+    monkeypatch.setenv(query_daemon.SOCKET_ENV_VAR, str(path))
+    monkeypatch.delenv(query_daemon.ENABLE_ENV_VAR, raising=False)
+    yield path
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+def daemon(socket_path):
+    server = QueryDaemon(socket_path)
+    server.bind()
+    thread = threading.Thread(target=server.serve, daemon=True)
+    thread.start()
+    yield server
+    server.stop()
+    thread.join(timeout=5)
+
+
+@pytest.fixture
+def search_db(tmp_path):
+    db_path = tmp_path / 'search.db'
+    db = SearchDatabase(str(db_path))
+    db.index_records_batch([
+        {'content': f'team meeting {i} about deadlines', 'source': 'slack',
+         'created_at': f'2025-08-0{i + 1}T10:00:00', 'metadata': {'channel': 'eng'}}
+        for i in range(5)
+    ], 'slack')
+    db.close()
+    return db_path
+
+
+class TestSearch:
+    """Search requests served by a running daemon"""
+
+    def test_results_match_in_process(self, daemon, search_db):
+        remote = open_search_database(str(search_db))
+        assert isinstance(remote, RemoteSearchDatabase)
+
+        local = SearchDatabase(str(search_db))
+        expected = local.search_page(query='meeting', limit=2)
+        first = remote.search_page(query='meeting', limit=2)
+        assert first == json.loads(json.dumps(expected))
+
+        second = remote.search_page(query='meeting', limit=2, cursor=first['next_cursor'])
+        assert second['results'] == json.loads(json.dumps(
+            local.search_page(query='meeting', limit=2, cursor=expected['next_cursor'])['results']))
+        assert remote.get_stats()['total_records'] == 5
+
+        remote.close()
+        local.close()
+        assert QueryDaemonClient().ping()['databases'] == [str(search_db.resolve())]
+
+    def test_errors_keep_their_type(self, daemon, search_db):
+        remote = open_search_database(str(search_db))
+        with pytest.raises(InvalidCursorError):
+            remote.search_page(query='meeting', cursor='bogus')
+        remote.close()
+
+        with QueryDaemonClient() as client:
+            with pytest.raises(RemoteError) as excinfo:
+                client.call('drop_tables')
+            assert excinfo.value.error_type == 'QueryDaemonError'
+            with pytest.raises(RemoteError):
+                client.call('activity', base_dir='.', method='__init__')
+
+    def test_falls_back_when_daemon_stops(self, daemon, search_db):
+        remote = open_search_database(str(search_db))
+        assert len(remote.search_page(query='meeting', limit=10)['results']) == 5
+
+        daemon.stop()
+        with QueryDaemonClient() as client:
+            client.call('ping')  # wake the poll loop so it exits
+        daemon.close()
+
+        assert len(remote.search_page(query='meeting', limit=10)['results']) == 5
+        remote.close()
+
+
+class TestClientSelection:
+    """Clients only use a daemon that is enabled and listening"""
+
+    def test_no_daemon(self, socket_path, search_db):
+        assert query_daemon.get_client() is None
+        assert query_daemon.call_or_none('ping') is None
+        db = open_search_database(str(search_db))
+        assert isinstance(db, SearchDatabase)
+        db.close()
+
+        with pytest.raises(DaemonUnavailableError):
+            QueryDaemonClient(socket_path).ping()
+
+    def test_disabled(self, daemon, monkeypatch):
+        monkeypatch.setenv(query_daemon.ENABLE_ENV_VAR, 'off')
+        assert query_daemon.get_client() is None
+
+    def test_single_instance_and_stale_socket(self, daemon, socket_path):
+        with pytest.raises(QueryDaemonError):
+            QueryDaemon(socket_path).bind()
+
+        daemon.stop()
+        with QueryDaemonClient() as client:
+            client.call('ping')
+        daemon.close()
+
+        socket_path.touch()  # left behind by a crashed daemon
+        replacement = QueryDaemon(socket_path)
+        replacement.bind()
+        replacement.close()
+        assert not socket_path.exists()
+
+
+class TestCalendarQueries:
+    """Slot and conflict queries run against a snapshot cached until its files change"""
+
+    @staticmethod
+    def _event(event_id, start, end):
+        return {'event': {'id': event_id, 'summary': event_id,
+                          'start': {'dateTime': start}, 'end': {'dateTime': end}}}
+
+    def test_slots_reload_on_change(self, daemon, tmp_path):
+        collection = tmp_path / 'calendar' / '2025-08-01'
+        collection.mkdir(parents=True)
+        events_file = collection / 'events.jsonl'
+        events_file.write_text(json.dumps(
+            self._event('a', '2025-08-04T10:00:00+00:00', '2025-08-04T11:00:00+00:00')) + '\n')
+        calendar_dir = str(tmp_path / 'calendar')
+        params = dict(calendar_dir=calendar_dir, date='2025-08-04', duration_minutes=60,
+                      working_hours=[9, 17], timezone='UTC')
+
+        first = query_daemon.call_or_none('calendar_slots', **params)
+        assert 'events' not in first
+        assert first['event_count'] == 1
+        assert first['source'] == str(collection)
+        local = find_slots_in_events(load_latest_calendar_events(Path(calendar_dir)).events, 60,
+                                     start_date=date(2025, 8, 4), timezone='UTC')
+        assert first['slots'] == [slot.to_dict() for slot in local]
+        assert [FreeSlot.from_dict(slot) for slot in first['slots']] == local
+
+        with events_file.open('a') as f:
+            f.write(json.dumps(
+                self._event('b', '2025-08-04T10:30:00+00:00', '2025-08-04T12:00:00+00:00')) + '\n')
+        second = query_daemon.call_or_none('calendar_slots', **params)
+        assert second['event_count'] == 2
+        assert second['slots'][-1]['start'] == '2025-08-04T12:00:00+00:00'
+
+        conflicts = query_daemon.call_or_none('calendar_conflicts', calendar_dir=calendar_dir)
+        assert conflicts['event_count'] == 2
+        assert {c['event1_id'] for c in conflicts['conflicts']} | \
+            {c['event2_id'] for c in conflicts['conflicts']} == {'a', 'b'}
+
+        missing = query_daemon.call_or_none('calendar_slots', **dict(params, calendar_dir=str(tmp_path / 'none')))
+        assert missing['exists'] is False
+        assert missing['slots'] == []
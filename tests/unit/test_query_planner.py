@@ -0,0 +1,160 @@
+"""
+Tests for the query execution planner
+
+References:
+- src/intelligence/query_planner.py - QueryPlanner / QueryPlan
+- src/search/database.py - author and date indexes used as access paths
+"""
+
+import pytest
+
+from src.queries.person_queries import PersonResolver
+from src.search.database import SearchDatabase
+from src.search.pagination import InvalidCursorError
+from src.intelligence.query_engine import ParsedQuery, QueryIntent
+from src.intelligence.query_planner import (
+    QueryPlanner, STRATEGY_FTS, STRATEGY_FTS_FILTERED, STRATEGY_PERSON,
+    STRATEGY_TIME, STRATEGY_ROLLUP
+)
+
+
+def _parsed(keywords, intent=QueryIntent.SEARCH_MESSAGES, sources=None, person=None):
+    return ParsedQuery(original_query=' '.join(keywords), intent=intent, keywords=keywords,
+                       sources=sources or [], person_filter=person)
+
+
+ROSTER = {'employees': [
+    {'name': 'Alice Smith', 'email': 'alice@example.com', 'slack_id': 'UALICE001'},
+]}
+
+
+class TestQueryPlanner:
+    """Test access path selection and plan execution"""
+
+    @pytest.fixture
+    def db(self, tmp_path):
+        """300 slack messages across three months plus a few calendar events"""
+        db = SearchDatabase(str(tmp_path / "planner.db"))
+        # Like collected Slack records: sender ID under 'user', no author field
+        slack = [{'text': f'budget review {i}', 'date': f'2025-0{6 + i % 3}-{1 + i % 28:02d}',
+                  'user': 'UALICE001' if i % 10 == 0 else 'UBOB00001'}
+                 for i in range(300)]
+        calendar = [{'title': f'budget sync {i}', 'date': '2025-07-02',
+                     'attendees': [{'email': 'carol@example.com'}]}
+                    for i in range(5)]
+        db.index_records_batch(slack, 'slack')
+        db.index_records_batch(calendar, 'calendar')
+        yield db
+        db.close()
+
+    @pytest.fixture
+    def planner(self, db):
+        return QueryPlanner(db, person_resolver=PersonResolver(employee_data=ROSTER))
+
+    def test_statistics_use_rollups(self, planner):
+        plan = planner.plan(_parsed(['statistics'], intent=QueryIntent.SHOW_STATISTICS))
+        assert plan.strategy == STRATEGY_ROLLUP
+
+        page = planner.execute(plan)
+        assert page['next_cursor'] is None
+        assert all('record_count' in result['metadata'] for result in page['results'])
+
+    def test_broad_terms_use_fts(self, planner):
+        plan = planner.plan(_parsed(['budget review']), limit=5)
+
+        assert plan.strategy == STRATEGY_FTS
+        assert plan.fts_query == '"budget" "review"'
+        assert plan.estimates['fts'] == 300
+
+    def test_selective_date_range_drives_fts(self, planner):
+        plan = planner.plan(_parsed(['budget', 'last week']), limit=5,
+                            date_range=('2025-06-01', '2025-06-01'))
+
+        assert plan.strategy == STRATEGY_FTS_FILTERED
+        assert plan.driver == 'date'
+        # Time words are answered by the date index, not required in the text
+        assert plan.fts_query == '"budget"'
+
+        results = planner.execute(plan)['results']
+        assert results and all(r['date'] == '2025-06-01' for r in results)
+
+    def test_person_without_terms_uses_author_index(self, planner):
+        plan = planner.plan(_parsed(['alice'], intent=QueryIntent.PERSON_ACTIVITY,
+                                    person='alice'), limit=50)
+
+        assert plan.strategy == STRATEGY_PERSON
+        assert plan.person_identifiers == ['alice@example.com', 'UALICE001']
+        results = planner.execute(plan)['results']
+        assert len(results) == 30
+        assert all(r['metadata']['user'] == 'UALICE001' for r in results)
+        dates = [r['date'] for r in results]
+        assert dates == sorted(dates, reverse=True)
+
+    def test_unresolved_name_stays_search_term(self, db):
+        """Names missing from the roster are matched in the text, never used as filters"""
+        db.index_records_batch([{'text': f'Alice shared the budget {i}', 'date': '2025-07-03',
+                                 'user': 'UALICE001'} for i in range(2)], 'slack')
+        baseline = [r['content'] for r in db.search('"alice" "budget"', limit=10)]
+        assert len(baseline) == 2
+
+        for planner in (QueryPlanner(db), QueryPlanner(db, person_resolver=PersonResolver({'employees': []}))):
+            plan = planner.plan(_parsed(['Alice', 'budget'], person='Alice'))
+            assert plan.person_identifiers == []
+            assert plan.fts_query == '"alice" "budget"'
+            assert sorted(r['content'] for r in planner.execute(plan)['results']) == sorted(baseline)
+
+    def test_resolved_name_filters_records_without_author(self, planner, db):
+        db.index_records_batch([{'text': 'Alice shared the budget', 'date': '2025-07-03',
+                                 'user': 'UBOB00001'}], 'slack')
+        plan = planner.plan(_parsed(['Alice', 'budget'], person='Alice'), limit=100)
+
+        # Answered by the Slack user index, so the name is not required in the text
+        assert plan.fts_query == '"budget"'
+        results = planner.execute(plan)['results']
+        assert len(results) == 30
+        assert all(r['metadata']['user'] == 'UALICE001' for r in results)
+
+    def test_calendar_attendee_lookup(self, planner):
+        plan = planner.plan(_parsed([], person='carol@example.com', sources=['calendar']))
+
+        assert plan.strategy == STRATEGY_PERSON
+        assert len(planner.execute(plan)['results']) == 5
+
+    def test_no_terms_no_filters_reads_newest(self, planner):
+        plan = planner.plan(_parsed([]), limit=3)
+
+        assert plan.strategy == STRATEGY_TIME
+        assert [r['date'] for r in planner.execute(plan)['results']] == ['2025-08-28'] * 3
+
+    def test_multi_source_fanout_pages_without_gaps(self, planner):
+        plan = planner.plan(_parsed(['budget'], sources=['slack', 'calendar']), limit=40)
+        assert plan.strategy == STRATEGY_FTS
+
+        seen = []
+        cursor = None
+        while True:
+            page = planner.execute(plan, cursor=cursor)
+            seen.extend((r['source'], r['content']) for r in page['results'])
+            cursor = page['next_cursor']
+            if not cursor:
+                break
+
+        assert len(seen) == len(set(seen)) == 305
+        assert any(line.startswith('  FAN-OUT 2 subqueries') for line in plan.explain())
+
+    def test_cursor_bound_to_plan(self, planner):
+        first = planner.plan(_parsed(['budget']), limit=5)
+        other = planner.plan(_parsed(['review']), limit=5)
+        cursor = planner.execute(first)['next_cursor']
+
+        with pytest.raises(InvalidCursorError):
+            planner.execute(other, cursor=cursor)
+
+    def test_explain_lists_estimates_and_reason(self, planner):
+        plan = planner.plan(_parsed(['budget']), date_range=('2025-06-01', '2025-06-30'))
+        lines = plan.explain()
+
+        assert lines[0].startswith('PLAN ')
+        assert any(line.startswith('  ESTIMATE fts:') for line in lines)
+        assert any(line.startswith('  ESTIMATE time_index:') for line in lines)
+        assert lines[-1].startswith('  REASON ')
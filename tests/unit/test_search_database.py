@@ -374,4 +374,69 @@ class TestSearchDatabase:
         calendar_record = {'attendees': [{'email': 'test@company.com'}, {'email': 'manager@company.com'}]}
         content = db._extract_searchable_content(calendar_record)
         assert 'test@company.com' in content
-        assert 'manager@company.com' in content
\ No newline at end of file
+        assert 'manager@company.com' in content
+
+    def test_keyset_pagination_covers_all_results(self, temp_db_path):
+        """search_page cursors walk every match exactly once without OFFSET"""
+        db = SearchDatabase(str(temp_db_path))
+        records = [
+            {'content': f'weekly sync notes {i}', 'date': '2025-08-17', 'id': f'msg_{i}'}
+            for i in range(25)
+        ]
+        db.index_records_batch(records, 'slack')
+        
+        seen = []
+        cursor = None
+        pages = 0
+        while True:
+            page = db.search_page('sync', limit=10, cursor=cursor)
+            seen.extend(r['metadata']['id'] for r in page['results'])
+            pages += 1
+            cursor = page['next_cursor']
+            if not cursor:
+                break
+        
+        assert pages == 3
+        assert len(seen) == 25
+        assert len(set(seen)) == 25
+        
+        # First page through search_page matches plain search ordering
+        assert [r['content'] for r in db.search('sync', limit=10)] == \
+               [r['content'] for r in db.search_page('sync', limit=10)['results']]
+    
+    def test_pagination_cursor_bound_to_query(self, temp_db_path):
+        """A cursor issued for one query is rejected for another"""
+        from src.search.pagination import InvalidCursorError
+        
+        db = SearchDatabase(str(temp_db_path))
+        db.index_records_batch(
+            [{'content': f'budget review {i}', 'date': '2025-08-17'} for i in range(5)], 'slack')
+        
+        cursor = db.search_page('budget', limit=2)['next_cursor']
+        assert cursor is not None
+        
+        with pytest.raises(InvalidCursorError):
+            db.search_page('review', limit=2, cursor=cursor)
+        with pytest.raises(InvalidCursorError):
+            db.search_page('budget', limit=2, cursor='not-a-cursor')
+    
+    def test_more_results_button_keeps_long_query_and_source(self, temp_db_path):
+        """The Slack "More results" button resumes long, source-filtered searches"""
+        from src.bot.utils.formatters import (
+            MAX_BUTTON_VALUE_LENGTH, format_more_results_actions, parse_more_results_value)
+        
+        db = SearchDatabase(str(temp_db_path))
+        db.index_records_batch(
+            [{'content': f'budget review {i}', 'date': '2025-08-17'} for i in range(5)], 'slack')
+        db.index_records_batch(
+            [{'content': f'budget review {i}', 'date': '2025-08-17'} for i in range(5)], 'drive')
+        
+        query = 'budget ' + ' OR '.join(['review'] * 400)
+        first = db.search_page(query, source='drive', limit=2)
+        button = format_more_results_actions(query, first['next_cursor'], 2, 'drive')['elements'][0]
+        assert len(button['value']) <= MAX_BUTTON_VALUE_LENGTH
+        
+        more = parse_more_results_value(button['value'])
+        assert (more['query'], more['source'], more['page']) == (query, 'drive', 2)
+        second = db.search_page(more['query'], source=more['source'], limit=2, cursor=more['cursor'])
+        assert [r['source'] for r in second['results']] == ['drive', 'drive']
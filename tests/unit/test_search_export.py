@@ -0,0 +1,94 @@
+"""
+Tests for streaming NDJSON/CSV export of indexed records
+
+References:
+- src/search/export.py - Streaming writers and export_messages
+- src/search/database.py - SearchDatabase.iter_records
+"""
+
+import csv
+import gzip
+import io
+import json
+
+import pytest
+
+from src.search.database import SearchDatabase
+from src.search.export import write_records, export_messages, ExportError
+
+
+class TestStreamingExport:
+    """Test constant-memory export of search database records"""
+    
+    @pytest.fixture
+    def db(self, tmp_path):
+        """Database with records spread over several days and sources"""
+        db = SearchDatabase(str(tmp_path / "export.db"))
+        slack = [{'text': f'standup update {i}', 'date': f'2025-08-{1 + i % 5:02d}', 'user': 'alice'}
+                 for i in range(20)]
+        calendar = [{'title': f'Planning session {i}', 'date': '2025-08-03'} for i in range(5)]
+        db.index_records_batch(slack, 'slack')
+        db.index_records_batch(calendar, 'calendar')
+        yield db
+        db.close()
+    
+    def test_iter_records_streams_in_date_order(self, db):
+        """iter_records yields every row in (date, id) order across fetchmany batches"""
+        rows = list(db.iter_records(batch_size=3))
+        
+        assert len(rows) == 25
+        keys = [(row[3], row[0]) for row in rows]
+        assert keys == sorted(keys)
+    
+    def test_iter_records_filters(self, db):
+        """Source, date range and FTS filters restrict streamed rows"""
+        assert len(list(db.iter_records(source='calendar'))) == 5
+        assert all(row[3] == '2025-08-02'
+                   for row in db.iter_records(date_range=('2025-08-02', '2025-08-02')))
+        assert len(list(db.iter_records(query='planning'))) == 5
+    
+    def test_ndjson_preserves_metadata(self, db):
+        """NDJSON lines are valid JSON with metadata passed through as an object"""
+        stream = io.StringIO()
+        written = write_records(db.iter_records(source='slack'), stream, 'ndjson')
+        
+        lines = stream.getvalue().splitlines()
+        assert written == len(lines) == 20
+        record = json.loads(lines[0])
+        assert record['source'] == 'slack'
+        assert record['metadata']['user'] == 'alice'
+    
+    def test_ndjson_corrupt_metadata_stays_valid(self):
+        """Stored metadata that is not valid JSON is exported as a string"""
+        stream = io.StringIO()
+        write_records([(1, 'hi', 'slack', '2025-08-18', '{"user": "alice"'),
+                       (2, 'ok', 'slack', '2025-08-18', '[1, 2]')], stream, 'ndjson')
+        
+        first, second = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert first['metadata'] == '{"user": "alice"'
+        assert second['metadata'] == [1, 2]
+    
+    def test_csv_export_and_progress(self, db):
+        """CSV export writes a header and reports progress at the interval"""
+        stream = io.StringIO()
+        progress = []
+        write_records(db.iter_records(), stream, 'csv',
+                      progress_callback=lambda n, rate: progress.append(n),
+                      progress_interval=10)
+        
+        rows = list(csv.DictReader(io.StringIO(stream.getvalue())))
+        assert len(rows) == 25
+        assert progress == [10, 20, 25]
+    
+    def test_gzip_file_export(self, db, tmp_path):
+        """export_messages writes a gzip file readable line by line"""
+        output = tmp_path / "out" / "slack.ndjson.gz"
+        count = export_messages(db, str(output), compress=True, source='slack')
+        
+        with gzip.open(output, 'rt') as f:
+            assert sum(1 for _ in f) == count == 20
+    
+    def test_unsupported_format(self, db):
+        """Unknown formats are rejected"""
+        with pytest.raises(ExportError):
+            write_records(db.iter_records(), io.StringIO(), 'xml')
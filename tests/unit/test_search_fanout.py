@@ -0,0 +1,96 @@
+"""
+Tests for concurrent per-source search with merged top-k ranking
+
+References:
+- src/search/fanout.py - FanOutSearcher and normalize_rank
+- src/search/database.py - SearchDatabase.search per-source queries
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.search.database import SearchDatabase
+from src.search.fanout import FanOutSearcher, normalize_rank
+
+
+class _SlowSourceDB:
+    """SearchDatabase stand-in with fixed per-source latency and ranks"""
+
+    pool_size = 3
+
+    def __init__(self, ranks, delays, failing=()):
+        self.ranks = ranks
+        self.delays = delays
+        self.failing = failing
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def search(self, query, source=None, date_range=None, limit=100):
+        with self._lock:
+            self.calls.append(source)
+        time.sleep(self.delays.get(source, 0))
+        if source in self.failing:
+            raise RuntimeError("database is locked")
+        return [{'content': f'{source} {i}', 'source': source, 'date': '2025-08-01',
+                 'metadata': {}, 'relevance_score': rank}
+                for i, rank in enumerate(self.ranks[source][:limit])]
+
+
+class TestFanOutSearch:
+    """Test fan-out execution, merge order and early exit"""
+
+    def test_normalize_rank(self):
+        assert normalize_rank(None) == 0.0
+        assert normalize_rank(0.5) == 0.0
+        assert normalize_rank(-1.0) == 0.5
+        assert normalize_rank(-9.0) > normalize_rank(-3.0)
+
+    def test_merge_matches_global_rank_order(self, tmp_path):
+        db = SearchDatabase(str(tmp_path / "fanout.db"))
+        try:
+            db.index_records_batch([{'text': f'roadmap review {"roadmap " * (i % 4)}',
+                                     'date': '2025-08-01'} for i in range(20)], 'slack')
+            db.index_records_batch([{'text': f'roadmap planning {i}', 'date': '2025-08-02'}
+                                    for i in range(10)], 'calendar')
+
+            outcome = FanOutSearcher(db).search('roadmap', ['slack', 'calendar'], k=12)
+
+            assert len(outcome.results) == 12
+            scores = [r['relevance_score'] for r in outcome.results]
+            assert scores == sorted(scores, reverse=True)
+
+            expected = sorted((r['relevance_score'] for r in db.search('roadmap', limit=100)))[:12]
+            assert [r['rank'] for r in outcome.results] == pytest.approx(expected)
+            assert sum(len(v) for v in outcome.by_source.values()) == 12
+        finally:
+            db.close()
+
+    def test_sources_run_concurrently(self):
+        db = _SlowSourceDB({'slack': [-2.0], 'drive': [-1.0], 'calendar': [-3.0]},
+                           {'slack': 0.2, 'drive': 0.2, 'calendar': 0.2})
+
+        outcome = FanOutSearcher(db, early_exit_score=None).search(
+            'q', ['slack', 'drive', 'calendar'], k=3)
+
+        assert outcome.duration < 0.45
+        assert [r['source'] for r in outcome.results] == ['calendar', 'slack', 'drive']
+
+    def test_early_exit_skips_slow_source(self):
+        db = _SlowSourceDB({'slack': [-20.0, -15.0], 'drive': [-0.5]},
+                           {'slack': 0.0, 'drive': 0.5})
+
+        outcome = FanOutSearcher(db, early_exit_score=0.9).search('q', ['slack', 'drive'], k=2)
+
+        assert outcome.early_exit is True
+        assert outcome.duration < 0.4
+        assert [r['source'] for r in outcome.results] == ['slack', 'slack']
+
+    def test_failed_source_is_isolated(self):
+        db = _SlowSourceDB({'slack': [-2.0], 'drive': []}, {}, failing=('drive',))
+
+        outcome = FanOutSearcher(db).search('q', ['slack', 'drive'], k=5)
+
+        assert 'drive' in outcome.failed_sources
+        assert [r['source'] for r in outcome.results] == ['slack']
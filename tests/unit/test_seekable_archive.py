@@ -0,0 +1,158 @@
+"""
+Tests for seekable block-compressed archives and their sidecar index
+
+References:
+- src/core/seekable_archive.py - FrameIndex, SeekableArchive, open_at_line
+- src/core/compression_engine.py - framed compression output
+- src/core/verification.py / src/search/indexer.py - seeking consumers
+"""
+
+import gzip
+import json
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from src.core.compression_engine import CompressionEngine, HAS_ZSTD
+from src.core.seekable_archive import (
+    FrameIndex, SeekableArchive, index_path_for, open_at_line, record_timestamp, to_epoch
+)
+from src.core.verification import ArchiveVerifier
+from src.search.database import SearchDatabase
+from src.search.indexer import ArchiveIndexer
+
+BASE_TS = 1754006400  # 2025-08-01T00:00:00Z
+
+
+def _archive(tmp_path, count=95, frame_records=10, algorithm='gzip'):
+    path = tmp_path / "slack" / "2025-08-01" / "data.jsonl"
+    path.parent.mkdir(parents=True)
+    lines = [json.dumps({'type': 'message', 'channel': 'C0123', 'user': f'U{i % 5}',
+                         'text': f'update {i}', 'ts': f'{BASE_TS + i * 60}.000100',
+                         'timestamp': datetime.fromtimestamp(BASE_TS + i * 60, timezone.utc).isoformat()})
+             for i in range(count)]
+    path.write_text('\n'.join(lines) + '\n')
+
+    engine = CompressionEngine(algorithm, max_workers=1, frame_records=frame_records)
+    outcome = engine.compress_files([path], root=tmp_path)[0]
+    assert outcome['status'] == 'compressed'
+    return engine.output_path(path), lines
+
+
+class TestFrameIndex:
+    """Test timestamp parsing and index bookkeeping"""
+
+    def test_to_epoch(self):
+        assert to_epoch('2025-08-01T00:00:00Z') == BASE_TS
+        assert to_epoch('2025-08-01') == BASE_TS
+        assert to_epoch('1754006400.000100') == pytest.approx(BASE_TS)
+        assert to_epoch('soon') is None
+
+    def test_record_timestamp(self):
+        assert record_timestamp('{"start": {"dateTime": "2025-08-01T00:00:00Z"}}') == BASE_TS
+        assert record_timestamp('') is None
+        assert record_timestamp('{"text": "no time"}') is None
+
+    def test_framed_output_is_plain_gzip_with_index(self, tmp_path):
+        path, lines = _archive(tmp_path)
+
+        with gzip.open(path, 'rt') as f:
+            assert f.read().splitlines() == lines
+
+        index = FrameIndex.load(path)
+        assert len(index.frames) == 10
+        assert index.total_lines == 95
+        assert index.frame_for_line(57).first_line == 50
+        assert index.frame_for_line(95) is None
+        assert index.frames[0].min_ts == pytest.approx(BASE_TS)
+
+    def test_stale_index_ignored(self, tmp_path):
+        path, lines = _archive(tmp_path)
+        with open(path, 'ab') as f:
+            f.write(gzip.compress(b'{"late": true}\n'))
+
+        assert FrameIndex.load(path) is None
+        assert SeekableArchive(path).read_line(95) == '{"late": true}'
+
+
+class TestSeekableReads:
+    """Test that reads decompress only the frames they need"""
+
+    def test_point_lookup_reads_one_frame(self, tmp_path):
+        path, lines = _archive(tmp_path)
+        archive = SeekableArchive(path)
+
+        with patch.object(SeekableArchive, 'read_frame', wraps=archive.read_frame) as read_frame:
+            assert archive.read_line(73) == lines[73]
+            assert read_frame.call_count == 1
+
+    def test_iter_lines_from_offset(self, tmp_path):
+        path, lines = _archive(tmp_path)
+
+        assert [line for _, line in SeekableArchive(path).iter_lines(57)] == lines[57:]
+        with open_at_line(path, 1000) as f:
+            assert f.read() == ''
+
+    def test_open_at_line_without_index(self, tmp_path):
+        path, lines = _archive(tmp_path)
+        index_path_for(path).unlink()
+
+        with open_at_line(path, 42) as f:
+            assert f.readline().rstrip('\n') == lines[42]
+
+    def test_time_range_skips_frames(self, tmp_path):
+        path, lines = _archive(tmp_path)
+        archive = SeekableArchive(path)
+        start, end = BASE_TS + 30 * 60, BASE_TS + 34 * 60 + 1
+
+        with patch.object(SeekableArchive, 'read_frame', wraps=archive.read_frame) as read_frame:
+            matches = list(archive.iter_lines_between(start, end))
+
+        assert [number for number, _ in matches] == [30, 31, 32, 33, 34]
+        assert read_frame.call_count == 1
+
+    def test_compressed_reader_resumes(self, tmp_path):
+        from src.core.compression import SafeCompressor
+
+        path, lines = _archive(tmp_path)
+
+        records = list(SafeCompressor().read_compressed_jsonl(path, start_line=90))
+
+        assert [r['text'] for r in records] == [f'update {i}' for i in range(90, 95)]
+
+    @pytest.mark.skipif(not HAS_ZSTD, reason="zstandard not available")
+    def test_zstd_frames(self, tmp_path):
+        path, lines = _archive(tmp_path, algorithm='zstd')
+
+        assert SeekableArchive(path).read_line(64) == lines[64]
+        assert [line for _, line in SeekableArchive(path).iter_lines(88)] == lines[88:]
+
+
+class TestSeekingConsumers:
+    """Test verifier resume and indexer resume on framed archives"""
+
+    def test_verifier_resume_from_line(self, tmp_path):
+        path, lines = _archive(tmp_path)
+
+        result = ArchiveVerifier().verify_jsonl_file(path, resume_from_line=80)
+
+        assert result['lines_processed'] == 95
+        assert result['valid_records'] == 15
+
+    def test_indexer_reads_compressed_and_resumes(self, tmp_path):
+        path, lines = _archive(tmp_path)
+        db = SearchDatabase(str(tmp_path / "search.db"))
+        try:
+            indexer = ArchiveIndexer(db, batch_size=20)
+            indexer._save_progress(path, 60)
+
+            stats = indexer.process_archive(path, 'slack')
+
+            assert stats.processed == 35
+            assert db.get_metadata_value(indexer._progress_key(path)) == ''
+            contents = {r['content'] for r in db.search('update', limit=200)}
+            assert any('update 94' in c for c in contents)
+            assert not any('update 59 ' in c for c in contents)
+        finally:
+            db.close()
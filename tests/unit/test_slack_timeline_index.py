@@ -0,0 +1,105 @@
+"""
+Tests for the time-indexed Slack timeline lookup
+
+References:
+- src/correlators/slack_timeline_correlator.py - SlackTimelineIndex, SlackTimelineCorrelator
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.collectors.slack_intelligence import SlackIntelligence
+from src.correlators.slack_timeline_correlator import SlackTimelineCorrelator, SlackTimelineIndex
+from src.extractors.slack_structured import SlackStructuredExtractor
+
+START = datetime(2025, 6, 2, 9, 0, tzinfo=timezone.utc)
+TEXTS = [
+    'Can we meet tomorrow at 3pm to discuss the roadmap? <@U2>',
+    "Let's schedule a sync on Friday at 10am",
+    'Lunch anyone?',
+    'Meeting notes are in the doc',
+    'Are you free for a quick call this afternoon?',
+]
+
+
+def _conversations(seed, channels=6, messages=80):
+    rng = random.Random(seed)
+    conversations = {}
+    for c in range(channels):
+        channel = []
+        for i in range(messages):
+            ts = (START + timedelta(minutes=rng.randrange(-14 * 24 * 60, 7 * 24 * 60))).timestamp()
+            channel.append({'ts': f'{ts:.6f}', 'user': f'U{rng.randrange(c, c + 3)}',
+                            'text': rng.choice(TEXTS)})
+        rng.shuffle(channel)
+        conversations[f'C{c}'] = channel
+    return conversations
+
+
+@pytest.fixture
+def correlator():
+    return SlackTimelineCorrelator(SlackIntelligence(None), SlackStructuredExtractor())
+
+
+def _scan(correlator, meeting_time, participants, conversations):
+    """Expected results from scanning every message of every channel"""
+    start = meeting_time - timedelta(hours=correlator.pre_meeting_window_hours)
+    end = meeting_time + timedelta(hours=correlator.post_meeting_window_hours)
+    contexts = [correlator._analyze_channel_for_meeting(channel_id, messages, meeting_time, participants,
+                                                         start, end)
+                for channel_id, messages in conversations.items()]
+    contexts = sorted((c for c in contexts if c), key=lambda c: c.conversation_score, reverse=True)
+
+    scheduling_start = meeting_time - timedelta(hours=correlator.scheduling_window_hours)
+    scheduling = []
+    for channel_id, messages in conversations.items():
+        for msg in correlator._find_scheduling_messages(messages, scheduling_start, meeting_time, participants):
+            msg['channel_id'] = channel_id
+            scheduling.append(msg)
+    scheduling.sort(key=lambda x: x.get('ts', 0))
+    return contexts, scheduling
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_matches_full_scan(correlator, seed):
+    conversations = _conversations(seed)
+    index = SlackTimelineIndex(conversations)
+
+    for offset in (-10, -3, 0, 2):
+        meeting_time = START + timedelta(days=offset)
+        expected_contexts, expected_scheduling = _scan(correlator, meeting_time, ['alice@example.com'],
+                                                       conversations)
+
+        contexts = correlator.find_slack_meeting_discussions(meeting_time, ['alice@example.com'], index)
+        scheduling = correlator.identify_scheduling_conversations(meeting_time, ['alice@example.com'],
+                                                                  conversations)
+
+        assert [(c.channel_id, c.conversation_score, [m['ts'] for m in c.messages]) for c in contexts] == [
+            (c.channel_id, c.conversation_score, [m['ts'] for m in c.messages]) for c in expected_contexts]
+        assert scheduling == expected_scheduling
+    assert expected_contexts and expected_scheduling
+
+
+def test_window_bounds_are_inclusive():
+    messages = [{'ts': str(START.timestamp() + offset)} for offset in (3600, -3600, 0, 3600.5, 7200)]
+    index = SlackTimelineIndex({'C1': messages})
+
+    assert index.window('C1', START, START + timedelta(hours=1)) == [messages[0], messages[2]]
+    assert index.window('C1', START + timedelta(hours=3), START + timedelta(hours=4)) == []
+    assert index.window('C9', START, START + timedelta(hours=1)) == []
+
+
+def test_participant_channels():
+    index = SlackTimelineIndex(
+        {'C1': [{'ts': '1', 'user': 'U1'}], 'C2': [{'ts': '2', 'user': 'U2'}], 'C3': [{'ts': '3', 'user': 'U1'}]},
+        slack_users=[{'id': 'U2', 'name': 'bob', 'real_name': 'Bob Smith',
+                      'profile': {'email': 'Bob@Example.com', 'display_name': 'bobby'}}])
+
+    assert index.channels_for(['U1']) == ['C1', 'C3']
+    assert index.channels_for(['bob@example.com', 'U1']) == ['C1', 'C2', 'C3']
+    assert index.channels_for(['Bob Smith']) == ['C2']
+    # Meetings whose participants are not Slack users still search every channel
+    assert index.channels_for(['carol@example.com']) == ['C1', 'C2', 'C3']
+    assert index.channels_for([]) == ['C1', 'C2', 'C3']
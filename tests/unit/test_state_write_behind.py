@@ -0,0 +1,171 @@
+"""
+Tests for write-behind batching and history retention in StateManager
+
+References:
+- src/core/state.py - StateManager(write_behind=True, history_limit=...)
+"""
+
+import gc
+import sqlite3
+import threading
+import time
+import weakref
+from unittest.mock import patch
+
+import pytest
+
+from src.core.state import StateError, StateManager
+
+
+def _stored(db_path):
+    with sqlite3.connect(str(db_path)) as conn:
+        return dict(conn.execute("SELECT key, value FROM state").fetchall())
+
+
+@pytest.fixture
+def manager(tmp_path):
+    state = StateManager(tmp_path / "state.db", write_behind=True, flush_interval=3600,
+                         flush_threshold=10)
+    yield state
+    state.close()
+
+
+class TestWriteBehind:
+    """Test buffering, coalescing and flush triggers"""
+
+    def test_reads_see_buffered_writes(self, manager):
+        manager.set_state('slack_cursor', {'page': 1})
+        manager.set_state('slack_cursor', {'page': 2})
+
+        assert manager.get_state('slack_cursor') == {'page': 2}
+        assert _stored(manager.db_path) == {}
+        assert manager.get_stats()['pending_writes'] == 1
+
+    def test_flush_coalesces_to_one_history_row(self, manager):
+        for page in range(5):
+            manager.set_state('slack_cursor', {'page': page})
+
+        assert manager.flush() == 1
+        assert _stored(manager.db_path) == {'slack_cursor': '{"page":4}'}
+        history = manager.get_state_history('slack_cursor')
+        assert [(h['value'], h['operation']) for h in history] == [({'page': 4}, 'INSERT')]
+
+        manager.set_state('slack_cursor', {'page': 5})
+        manager.flush()
+        assert manager.get_state_history('slack_cursor')[0]['operation'] == 'UPDATE'
+
+    def test_threshold_triggers_flush(self, manager):
+        for i in range(10):
+            manager.set_state(f'key_{i}', i)
+
+        assert len(_stored(manager.db_path)) == 10
+        assert manager.get_stats()['pending_writes'] == 0
+
+    def test_interval_flush(self, tmp_path):
+        state = StateManager(tmp_path / "state.db", write_behind=True, flush_interval=0.05)
+        try:
+            state.set_state('cursor', 'abc')
+            deadline = time.time() + 5
+            while not _stored(state.db_path) and time.time() < deadline:
+                time.sleep(0.02)
+            assert _stored(state.db_path) == {'cursor': '"abc"'}
+        finally:
+            state.close()
+
+    def test_delete_and_close(self, tmp_path):
+        db_path = tmp_path / "state.db"
+        StateManager(db_path).set_state('old', 1)
+
+        state = StateManager(db_path, write_behind=True, flush_interval=3600)
+        assert state.delete_state('old') is True
+        assert state.delete_state('old') is False
+        assert state.get_state('old', 'gone') == 'gone'
+        state.set_state('new', [1, 2])
+        state.close()
+
+        assert _stored(db_path) == {'new': '[1,2]'}
+        assert StateManager(db_path).get_state_history('old')[0]['operation'] == 'DELETE'
+
+    def test_failed_flush_keeps_updates(self, manager):
+        manager.set_state('cursor', 1)
+
+        with patch.object(manager, '_write_batch', side_effect=sqlite3.OperationalError("locked")):
+            with pytest.raises(StateError):
+                manager.flush()
+        manager.set_state('other', 2)
+
+        assert manager.flush() == 2
+        assert _stored(manager.db_path) == {'cursor': '1', 'other': '2'}
+
+    def test_clear_all_state_drops_cache(self, manager):
+        manager.set_state('cursor', 1)
+        manager.clear_all_state()
+
+        assert manager.get_state('cursor') is None
+        assert manager.get_all_state() == {}
+
+
+class TestFlusherLifecycle:
+    """Test the shared background flusher and cross-instance reads"""
+
+    def test_managers_share_one_flusher_thread(self, tmp_path):
+        before = {t for t in threading.enumerate() if t.name == 'state-flusher'}
+        managers = [StateManager(tmp_path / f"state_{i}.db", write_behind=True, flush_interval=3600)
+                    for i in range(5)]
+        try:
+            flushers = {t for t in threading.enumerate() if t.name == 'state-flusher'} - before
+            assert len(flushers) + len(before) == 1
+        finally:
+            for state in managers:
+                state.close()
+
+        assert all(state._connections == [] for state in managers)
+
+    def test_dropped_manager_is_collected(self, tmp_path):
+        state = StateManager(tmp_path / "state.db", write_behind=True, flush_interval=3600)
+        ref = weakref.ref(state)
+        del state
+        gc.collect()
+
+        assert ref() is None
+
+    def test_miss_sees_value_flushed_by_other_instance(self, tmp_path):
+        db_path = tmp_path / "state.db"
+        a = StateManager(db_path, write_behind=True, flush_interval=3600)
+        b = StateManager(db_path, write_behind=True, flush_interval=3600)
+        try:
+            assert a.get_state('k') is None
+            b.set_state('k', 'new')
+            b.flush()
+            assert a.get_state('k') == 'new'
+
+            assert a.delete_state('k') is True
+            a.flush()
+            b.delete_state('k')
+            b.flush()
+            b.set_state('k', 'again')
+            b.flush()
+            assert a.get_state('k') == 'again'
+        finally:
+            a.close()
+            b.close()
+
+
+class TestHistoryRetention:
+    """Test history_limit in both modes"""
+
+    def test_synchronous_history_limit(self, tmp_path):
+        state = StateManager(tmp_path / "state.db", history_limit=3)
+        for value in range(6):
+            state.set_state('cursor', value)
+        state.set_state('other', 'x')
+
+        assert [h['value'] for h in state.get_state_history('cursor')] == [5, 4, 3]
+        assert len(state.get_state_history('other')) == 1
+
+    def test_history_disabled(self, tmp_path):
+        state = StateManager(tmp_path / "state.db", write_behind=True, history_limit=0)
+        state.set_state('cursor', 1)
+        state.close()
+
+        assert state.get_stats()['history_count'] == 0
@@ -0,0 +1,178 @@
+"""
+Tests for cached, process-pool archive verification
+
+References:
+- src/core/verification_cache.py - VerificationCache, verify_files_parallel
+- src/core/verification.py - ArchiveVerifier.verify_directory
+- tools/verify_archive.py - ArchiveVerifier.verify_files_batch
+"""
+
+import gzip
+import json
+import os
+import shutil
+from unittest.mock import patch
+
+from src.core import verification, verification_cache
+from src.core.verification import ArchiveVerifier
+from src.core.verification_cache import (
+    CACHE_FILENAME, VerificationCache, file_checksum, file_signature, verify_files_parallel
+)
+from tools.verify_archive import ArchiveVerifier as FormatVerifier
+
+
+def _write_day(directory, day, count=5, broken=False):
+    path = directory / "slack" / f"2025-08-{day:02d}" / "data.jsonl"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        for i in range(count):
+            f.write(json.dumps({'timestamp': f'2025-08-{day:02d}T10:{i:02d}:00Z', 'channel': 'C1',
+                                'user': 'U1', 'text': f'message {i}'}) + '\n')
+        if broken:
+            f.write('{"broken": \n')
+    return path
+
+
+def _count_task(file_path, source):
+    return {'lines': len(source.read().splitlines())}
+
+
+class TestVerificationCache:
+    """Test cache hits, invalidation and persistence"""
+
+    def test_unchanged_file_is_a_hit(self, tmp_path):
+        path = _write_day(tmp_path, 1)
+        cache = VerificationCache(tmp_path / CACHE_FILENAME)
+        size, mtime_ns = file_signature(path)
+        cache.store(path, {'ok': True}, size, mtime_ns, file_checksum(path))
+        cache.save()
+
+        assert VerificationCache(tmp_path / CACHE_FILENAME).lookup(path) == {'ok': True}
+
+    def test_touched_file_with_same_content_is_a_hit(self, tmp_path):
+        path = _write_day(tmp_path, 1)
+        cache = VerificationCache(tmp_path / CACHE_FILENAME)
+        size, mtime_ns = file_signature(path)
+        cache.store(path, {'ok': True}, size, mtime_ns, file_checksum(path))
+
+        os.utime(path, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+
+        assert cache.lookup(path) == {'ok': True}
+
+    def test_modified_file_is_a_miss(self, tmp_path):
+        path = _write_day(tmp_path, 1)
+        cache = VerificationCache(tmp_path / CACHE_FILENAME)
+        size, mtime_ns = file_signature(path)
+        cache.store(path, {'ok': True}, size, mtime_ns, file_checksum(path))
+
+        content = path.read_bytes()
+        path.write_bytes(content.replace(b'message 0', b'message X'))
+        os.utime(path, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+
+        assert cache.lookup(path) is None
+
+    def test_parallel_run_only_verifies_changed_files(self, tmp_path):
+        files = [_write_day(tmp_path, day) for day in range(1, 5)]
+        cache = VerificationCache(tmp_path / CACHE_FILENAME)
+
+        first = list(verify_files_parallel(files, _count_task, cache=cache, max_workers=2))
+        assert sorted(r['lines'] for _, r, cached in first if not cached) == [5, 5, 5, 5]
+
+        _write_day(tmp_path, 3, count=7)
+        second = list(verify_files_parallel(files, _count_task,
+                                            cache=VerificationCache(tmp_path / CACHE_FILENAME),
+                                            max_workers=2))
+
+        fresh = [(path, r) for path, r, cached in second if not cached]
+        assert fresh == [(files[2], {'lines': 7})]
+
+    def test_missing_file_reported_not_cached(self, tmp_path):
+        cache = VerificationCache(tmp_path / CACHE_FILENAME)
+
+        results = list(verify_files_parallel([tmp_path / "gone.jsonl"], _count_task, cache=cache))
+
+        assert 'Verification failed' in results[0][1]['errors'][0]
+        assert cache.entries == {}
+
+
+    def test_checksum_taken_in_the_verification_pass(self, tmp_path):
+        path = _write_day(tmp_path, 1, count=50)
+        compressed = path.with_suffix('.jsonl.gz')
+        with gzip.open(compressed, 'wb') as f:
+            f.write(path.read_bytes())
+        path.unlink()
+        cache = VerificationCache(tmp_path / CACHE_FILENAME)
+
+        with patch.object(verification_cache, 'file_checksum') as checksum:
+            results = list(verify_files_parallel([compressed], verification._verify_file_task,
+                                                 cache=cache, max_workers=1))
+        checksum.assert_not_called()
+
+        assert results[0][1]['valid_records'] == 50
+        entry = next(iter(cache.entries.values()))
+        assert entry['checksum'] == file_checksum(compressed)
+
+    def test_hashing_reader_covers_unread_and_rewound_bytes(self, tmp_path):
+        path = tmp_path / 'blob.bin'
+        path.write_bytes(os.urandom(3 * verification_cache.CHECKSUM_CHUNK_SIZE + 17))
+
+        reader = verification_cache.HashingReader(open(path, 'rb'))
+        reader.read(18)
+        reader.seek(0)
+        reader.read(100)
+        reader.seek(5000)
+        reader.read(10)
+        reader.close()
+
+        assert reader.hexdigest() == file_checksum(path)
+
+
+class TestCachedDirectoryVerification:
+    """Test verify_directory and the tools batch verifier on top of the cache"""
+
+    def test_verify_directory_skips_unchanged_files(self, tmp_path):
+        archive = tmp_path / "archive"
+        for day in range(1, 4):
+            _write_day(archive, day)
+
+        first = ArchiveVerifier().verify_directory(archive, resume=False, max_workers=2)
+        assert first['files_checked'] == 3
+        assert first['files_cached'] == 0
+        assert first['records_verified'] == 15
+
+        with patch.object(verification, '_verify_file_task') as task:
+            second = ArchiveVerifier().verify_directory(archive, resume=False, max_workers=2)
+
+        task.assert_not_called()
+        assert second['files_cached'] == 3
+        assert second['records_verified'] == 15
+
+    def test_errors_stream_to_report(self, tmp_path):
+        archive = tmp_path / "archive"
+        _write_day(archive, 1)
+        _write_day(archive, 2, broken=True)
+        report = tmp_path / "errors.jsonl"
+
+        stats = ArchiveVerifier().verify_directory(archive, resume=False, max_workers=2,
+                                                   report_path=report)
+
+        lines = [json.loads(line) for line in report.read_text().splitlines()]
+        assert len(lines) == len(stats['errors']) == 1
+        assert lines[0]['file'].endswith('2025-08-02/data.jsonl')
+        assert lines[0]['line'] == 6
+
+    def test_format_verifier_reuses_cached_verdicts(self, tmp_path):
+        files = [_write_day(tmp_path, day, broken=(day == 2)) for day in range(1, 4)]
+        cache_path = tmp_path / CACHE_FILENAME
+
+        verifier = FormatVerifier(max_workers=2)
+        results = verifier.verify_files_batch(files, cache=VerificationCache(cache_path))
+        assert [r['valid'] for r in results] == [True, False, True]
+
+        again = FormatVerifier(max_workers=2)
+        cached = again.verify_files_batch(files, cache=VerificationCache(cache_path))
+        assert cached == results
+        assert again.files_from_cache == 3
+
+        shutil.copy2(files[0], tmp_path / "copy.jsonl")
+        assert again.verify_files_batch([tmp_path / "copy.jsonl"])[0]['valid']
@@ -26,6 +26,8 @@ import click
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from src.core.archive_catalog import catalog_for
+
 # Auth manager import causes recursion issues, use direct file checking instead
 
 __version__ = "1.0.0"
@@ -215,6 +217,11 @@ def _get_storage_status(base_dir: Path) -> Dict[str, Any]:
         if not directory.exists():
             return 0, 0
         
+        catalog = catalog_for(directory)
+        if catalog is not None:
+            totals = catalog.totals()
+            return totals['size'], totals['files']
+        
         total_size = 0
         file_count = 0
         
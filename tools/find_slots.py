@@ -7,6 +7,8 @@ References:
 - src/calendar/availability.py - AvailabilityEngine implementation
 - src/calendar/conflicts.py - ConflictDetector for validation
 - tools/collect_data.py - CLI argument patterns
+- src/cli/query_daemon.py - answers slot and conflict queries from a warm snapshot
+- src/scheduling/busy_index.py - per-attendee busy intervals for --attendees
 """
 
 import argparse
@@ -23,7 +25,13 @@ sys.path.insert(0, str(project_root))
 
 from src.scheduling.availability import AvailabilityEngine, FreeSlot
 from src.scheduling.conflicts import ConflictDetector
-from src.collectors.calendar_collector import CalendarCollector
+from src.scheduling.calendar_data import (
+    detect_conflicts_in_events, find_slots_in_events, load_latest_calendar_events
+)
+from src.cli.query_daemon import call_or_none
+from src.core.lazy_import import lazy_import
+
+busy_index = lazy_import('src.scheduling.busy_index')
 
 
 class CalendarCLI:
@@ -37,6 +45,30 @@ class CalendarCLI:
         self.conflict_detector = ConflictDetector()
         self.calendar_collector = None
         
+    def calendar_dir(self, data_path: Optional[str] = None) -> Path:
+        """Calendar data directory (default: data/raw/calendar)"""
+        if data_path:
+            return Path(data_path)
+        return project_root / "data" / "raw" / "calendar"
+    
+    def report_snapshot(self, summary: Dict[str, Any], calendar_dir: Path):
+        """
+        Print warnings and the load message for a snapshot summary
+        
+        Args:
+            summary: CalendarSnapshot.summary() output
+            calendar_dir: Directory the snapshot was read from
+        """
+        for warning in summary['warnings']:
+            print(f"Warning: {warning}")
+        
+        if not summary['exists']:
+            print(f"Calendar data directory not found: {calendar_dir}")
+        elif summary['source'] is None:
+            print("No calendar data found. Run 'python tools/collect_data.py --source=calendar' first.")
+        else:
+            print(f"Loaded {summary['event_count']} calendar events from {summary['source']}")
+    
     def load_calendar_data(self, data_path: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Load calendar data from collected JSONL files
@@ -47,39 +79,13 @@ class CalendarCLI:
         Returns:
             List of calendar events
         """
-        if data_path:
-            calendar_dir = Path(data_path)
-        else:
-            # Use default data directory
-            calendar_dir = project_root / "data" / "raw" / "calendar"
-        
+        calendar_dir = self.calendar_dir(data_path)
         events = []
         
         try:
-            # Find most recent calendar data
-            if calendar_dir.exists():
-                date_dirs = [d for d in calendar_dir.iterdir() if d.is_dir()]
-                if date_dirs:
-                    latest_dir = max(date_dirs, key=lambda d: d.name)
-                    
-                    # Load events from JSONL files
-                    for jsonl_file in latest_dir.glob("*.jsonl"):
-                        try:
-                            with open(jsonl_file, 'r') as f:
-                                for line in f:
-                                    if line.strip():
-                                        record = json.loads(line)
-                                        event = record.get('event', {})
-                                        if event:
-                                            events.append(event)
-                        except Exception as e:
-                            print(f"Warning: Error reading {jsonl_file}: {e}")
-                    
-                    print(f"Loaded {len(events)} calendar events from {latest_dir}")
-                else:
-                    print("No calendar data found. Run 'python tools/collect_data.py --source=calendar' first.")
-            else:
-                print(f"Calendar data directory not found: {calendar_dir}")
+            snapshot = load_latest_calendar_events(calendar_dir)
+            self.report_snapshot(snapshot.summary(), calendar_dir)
+            events = snapshot.events
                 
         except Exception as e:
             print(f"Error loading calendar data: {e}")
@@ -96,12 +102,9 @@ class CalendarCLI:
         Returns:
             List of available time slots
         """
-        # Load calendar events
-        events = self.load_calendar_data(args.data_path)
-        
-        if not events:
-            print("No calendar events found. Cannot determine availability.")
-            return []
+        attendees = getattr(args, 'attendees', None)
+        if attendees:
+            return self.find_common_slots(args)
         
         # Parse target date
         try:
@@ -117,9 +120,6 @@ class CalendarCLI:
             print(f"Invalid timezone: {args.timezone}")
             return []
         
-        # Group events by calendar (simulate multi-calendar scenario)
-        calendars = [events]  # For now, treat all events as one calendar
-        
         # Parse working hours
         try:
             start_hour, end_hour = map(int, args.working_hours.split('-'))
@@ -129,15 +129,32 @@ class CalendarCLI:
             return []
         
         # Find free slots
+        days = getattr(args, 'days', 1)
+        calendar_dir = self.calendar_dir(args.data_path)
         try:
-            free_slots = self.availability_engine.find_free_slots(
-                calendars=calendars,
-                duration_minutes=args.duration,
-                working_hours=working_hours,
-                date=target_date,
-                timezone=args.timezone,
-                buffer_minutes=args.buffer
+            # A running query daemon searches its warm snapshot and returns only the slots
+            result = call_or_none(
+                'calendar_slots', calendar_dir=str(calendar_dir.resolve()), date=args.date,
+                duration_minutes=args.duration, days=days, working_hours=list(working_hours),
+                timezone=args.timezone, buffer_minutes=args.buffer
             )
+            if result is not None:
+                self.report_snapshot(result, calendar_dir)
+                if not result['event_count']:
+                    print("No calendar events found. Cannot determine availability.")
+                    return []
+                free_slots = [FreeSlot.from_dict(slot) for slot in result['slots']]
+            else:
+                events = self.load_calendar_data(args.data_path)
+                if not events:
+                    print("No calendar events found. Cannot determine availability.")
+                    return []
+                # All events are treated as one calendar
+                free_slots = find_slots_in_events(
+                    events, args.duration, start_date=target_date, days=days,
+                    working_hours=working_hours, timezone=args.timezone,
+                    buffer_minutes=args.buffer
+                )
             
             print(f"\nFound {len(free_slots)} available time slots:")
             return free_slots
@@ -146,31 +163,91 @@ class CalendarCLI:
             print(f"Error finding free slots: {e}")
             return []
     
-    def check_conflicts(self, args) -> List[Dict[str, Any]]:
+    def find_common_slots(self, args) -> List[FreeSlot]:
         """
-        Check for scheduling conflicts in calendar events
+        Find slots where every attendee in args.attendees is free
+        
+        Reads the busy-interval index instead of raw calendar events; the
+        index is brought up to date with the latest collection first.
         
         Args:
             args: Parsed command line arguments
             
         Returns:
-            List of detected conflicts
+            List of available time slots
         """
-        events = self.load_calendar_data(args.data_path)
-        
-        if len(events) < 2:
-            print("Need at least 2 events to detect conflicts.")
+        attendees = [email.strip() for email in args.attendees.split(',') if email.strip()]
+        try:
+            start_date = datetime.strptime(args.date, '%Y-%m-%d').date()
+            start_hour, end_hour = map(int, args.working_hours.split('-'))
+        except ValueError:
+            print(f"Invalid date ({args.date}) or working hours ({args.working_hours})")
             return []
         
+        calendar_dir = Path(args.data_path) if args.data_path else project_root / "data" / "raw" / "calendar"
+        days = getattr(args, 'days', 1)
         try:
-            conflicts = self.conflict_detector.detect_all_conflicts(
-                events=events,
-                timezone=args.timezone,
-                include_resource_conflicts=True
+            engine = busy_index.AvailabilityEngineImpl(calendar_dir, timezone=args.timezone,
+                                                       working_hours=(start_hour, end_hour))
+            result = engine.find_free_slots(
+                attendees=attendees,
+                duration=args.duration,
+                date_range=(start_date, start_date + timedelta(days=days - 1)),
+                buffer_minutes=args.buffer
+            )
+        except (busy_index.BusyIndexError, pytz.exceptions.UnknownTimeZoneError, ValueError) as e:
+            print(f"Error finding common slots: {e}")
+            return []
+        
+        for email in result['unknown_attendees']:
+            print(f"Warning: no calendar events indexed for {email}")
+        
+        target_tz = pytz.timezone(args.timezone)
+        free_slots = [
+            FreeSlot(
+                start=datetime.fromisoformat(slot['start']).astimezone(target_tz),
+                end=datetime.fromisoformat(slot['end']).astimezone(target_tz),
+                duration_minutes=slot['duration_minutes'],
+                timezone=slot['timezone']
             )
+            for slot in result['available_slots']
+        ]
+        print(f"\nFound {len(free_slots)} slots when all {len(attendees)} attendees are free:")
+        return free_slots
+    
+    def check_conflicts(self, args) -> List[Dict[str, Any]]:
+        """
+        Check for scheduling conflicts in calendar events
+        
+        Args:
+            args: Parsed command line arguments
+            
+        Returns:
+            List of detected conflicts
+        """
+        calendar_dir = self.calendar_dir(args.data_path)
+        try:
+            # A running query daemon checks its warm snapshot and returns only the conflicts
+            result = call_or_none('calendar_conflicts', calendar_dir=str(calendar_dir.resolve()),
+                                  timezone=args.timezone)
+            if result is not None:
+                self.report_snapshot(result, calendar_dir)
+                event_count = result['event_count']
+            else:
+                events = self.load_calendar_data(args.data_path)
+                event_count = len(events)
+            
+            if event_count < 2:
+                print("Need at least 2 events to detect conflicts.")
+                return []
+            
+            if result is not None:
+                conflicts = result['conflicts']
+            else:
+                conflicts = detect_conflicts_in_events(events, timezone=args.timezone)
             
             print(f"\nDetected {len(conflicts)} scheduling conflicts:")
-            return [conflict.to_dict() for conflict in conflicts]
+            return conflicts
             
         except Exception as e:
             print(f"Error detecting conflicts: {e}")
@@ -188,6 +265,10 @@ class CalendarCLI:
             print("No available time slots found.")
             return
         
+        time_format = '%H:%M'
+        if len({slot.start.date() for slot in slots}) > 1:
+            time_format = '%m-%d %H:%M'
+        
         if format_type == "json":
             # JSON output
             slots_data = [slot.to_dict() for slot in slots]
@@ -199,7 +280,7 @@ class CalendarCLI:
             print(f"\nSummary: {len(slots)} slots totaling {total_hours:.1f} hours available")
             
             for i, slot in enumerate(slots, 1):
-                print(f"  {i}. {slot.start.strftime('%H:%M')}-{slot.end.strftime('%H:%M')} "
+                print(f"  {i}. {slot.start.strftime(time_format)}-{slot.end.strftime('%H:%M')} "
                       f"({slot.duration_hours:.1f}h)")
                       
         else:
@@ -209,8 +290,8 @@ class CalendarCLI:
             print("="*80)
             
             for i, slot in enumerate(slots, 1):
-                print(f"{i:<3} {slot.start.strftime('%H:%M'):<12} "
-                      f"{slot.end.strftime('%H:%M'):<12} "
+                print(f"{i:<3} {slot.start.strftime(time_format):<12} "
+                      f"{slot.end.strftime(time_format):<12} "
                       f"{slot.duration_hours:.1f}h{'':<6} {slot.timezone:<15}")
             
             print("="*80)
@@ -345,6 +426,12 @@ Examples:
   
   # Find slots for specific date with custom working hours
   python tools/find_slots.py find --date 2025-08-25 --working-hours 10-18
+
+  # Find 30-minute slots over the next two weeks
+  python tools/find_slots.py find --duration 30 --days 14
+
+  # Find 30 minutes when three people are all free in the next two weeks
+  python tools/find_slots.py find --duration 30 --days 14 --attendees a@x.com,b@x.com,c@x.com
   
   # Check for scheduling conflicts
   python tools/find_slots.py conflicts --timezone "America/Los_Angeles"
@@ -361,6 +448,10 @@ Examples:
     find_parser.add_argument('--date', 
                            default=date.today().strftime('%Y-%m-%d'),
                            help='Target date (YYYY-MM-DD)')
+    find_parser.add_argument('--attendees',
+                           help='Comma-separated attendee emails; finds time when all are free')
+    find_parser.add_argument('--days', type=int, default=1,
+                           help='Number of days to search starting at --date (default: 1)')
     find_parser.add_argument('--duration', type=int, default=60,
                            help='Minimum slot duration in minutes (default: 60)')
     find_parser.add_argument('--timezone', default='UTC',
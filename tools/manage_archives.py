@@ -43,12 +43,17 @@ except ImportError:
 # Add src to path so we can import from src.core
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from core.safe_compression import SafeCompressor, CompressionError
+from core.lazy_import import lazy_import
+from core.archive_catalog import catalog_for
+from core.archive_stats import ArchiveStats
+
+# Compression and verification load on first use, not for --help
+safe_compression = lazy_import('core.safe_compression')
 
 # Import verify_archive from same directory
 current_dir = Path(__file__).parent
 sys.path.insert(0, str(current_dir))
-from verify_archive import ArchiveVerifier, VerificationError
+archive_verification = lazy_import('verify_archive')
 
 # Set up enhanced logging with colors
 class ColoredFormatter(logging.Formatter):
@@ -96,7 +101,8 @@ class SafeArchiveManager:
     """
     
     def __init__(self, archive_dir: Path, dry_run: bool = False, quiet: bool = False, 
-                 backup_days: int = 7, chunk_size: int = 1024*1024):
+                 backup_days: int = 7, chunk_size: int = 1024*1024,
+                 algorithm: str = 'gzip', max_workers: Optional[int] = None):
         """
         Initialize enhanced archive manager
         
@@ -106,6 +112,8 @@ class SafeArchiveManager:
             quiet: If True, minimize output
             backup_days: Days to retain backups
             chunk_size: Chunk size for file operations
+            algorithm: 'gzip' or 'zstd' (zstd needs the zstandard package)
+            max_workers: Parallel compression and verification processes (default: CPU count)
         """
         self.archive_dir = archive_dir
         self.dry_run = dry_run
@@ -117,8 +125,11 @@ class SafeArchiveManager:
             logging.getLogger().setLevel(logging.WARNING)
         
         # Initialize components with enhanced features
-        self.compressor = SafeCompressor(backup_days=backup_days)
-        self.verifier = ArchiveVerifier()
+        self.compressor = safe_compression.SafeCompressor(backup_days=backup_days, chunk_size=chunk_size,
+                                                         algorithm=algorithm, max_workers=max_workers)
+        # Files handed to the process pool between checkpoints
+        self.batch_size = max(10, 4 * self.compressor.engine.max_workers)
+        self.verifier = archive_verification.ArchiveVerifier(max_workers=max_workers)
         
         # Operation statistics
         self.stats = {
@@ -170,7 +181,18 @@ class SafeArchiveManager:
         if HAS_TQDM and not self.quiet and len(iterable) > 5:
             return tqdm(iterable, desc=desc, unit='files')
         return iterable
-    
+
+    def _save_checkpoint(self, processed_files: set):
+        """Persist processed file list so an interrupted run can resume"""
+        temp_path = self.checkpoint_file.with_suffix('.tmp')
+        try:
+            with open(temp_path, 'w') as f:
+                json.dump({'processed_files': sorted(processed_files),
+                           'saved_at': datetime.now().isoformat()}, f)
+            temp_path.replace(self.checkpoint_file)
+        except OSError as e:
+            logger.warning(f"Could not save checkpoint: {e}")
+
     def compress_old_files(self, age_days: int = 30, resume: bool = True) -> Dict[str, Any]:
         """
         Compress files older than specified age with enhanced safety and UX
@@ -183,7 +205,7 @@ class SafeArchiveManager:
             Summary of compression operation with enhanced details
         """
         if not self.archive_dir.exists():
-            raise CompressionError(f"Archive directory does not exist: {self.archive_dir}")
+            raise safe_compression.CompressionError(f"Archive directory does not exist: {self.archive_dir}")
         
         # Enhanced summary with more details
         summary = {
@@ -263,65 +285,69 @@ class SafeArchiveManager:
                 click.echo("✅ All files already processed")
                 return summary
         
-        # Compress files with progress bar and enhanced error handling
-        for file_path in self._progress_bar(remaining_files, "Compressing"):
-            try:
+        # Compress in batches on the process pool; checkpoint after each batch
+        for batch_start in range(0, len(remaining_files), self.batch_size):
+            batch = []
+            backups = {}
+            sizes = {}
+            for file_path in remaining_files[batch_start:batch_start + self.batch_size]:
                 if not file_path.exists():
                     summary['files_skipped'] += 1
                     continue
-                
-                file_size = file_path.stat().st_size
+                sizes[str(file_path)] = file_path.stat().st_size
                 
                 # Create backup before compression
                 backup_path = self._create_backup(file_path)
                 if backup_path:
+                    backups[str(file_path)] = backup_path
                     summary['backups_created'] += 1
+                batch.append(file_path)
+            
+            try:
+                outcomes = {outcome['path']: outcome for outcome in
+                            self.compressor.compress_files(batch, root=self.archive_dir, backup=False)}
+            except Exception as e:
+                outcomes = {str(f): {'status': 'failed', 'error': f'Unexpected error: {str(e)}'}
+                            for f in batch}
+            
+            for file_path in batch:
+                key = str(file_path)
+                outcome = outcomes.get(key, {'status': 'skipped'})
+                backup_path = backups.get(key)
                 
-                # Perform compression with enhanced error handling
-                try:
-                    success = self.compressor.safe_compress(file_path)
-                    if success:
-                        compressed_path = file_path.with_suffix('.jsonl.gz')
-                        compressed_size = compressed_path.stat().st_size
-                        
-                        summary['files_compressed'] += 1
-                        summary['total_size_after'] += compressed_size
-                        summary['space_saved'] += (file_size - compressed_size)
-                        
-                        # Add to processed set
-                        processed_files.add(str(file_path))
-                        
-                        if not self.quiet and not HAS_TQDM:
-                            compression_ratio = (1 - compressed_size/file_size) * 100
-                            click.echo(f"  ✅ {file_path.name}: {file_size/1024**2:.1f}MB → "
-                                      f"{compressed_size/1024**2:.1f}MB ({compression_ratio:.1f}% saved)")
-                    else:
-                        summary['files_skipped'] += 1
+                if outcome['status'] == 'compressed':
+                    file_size = sizes[key]
+                    compressed_size = outcome['compressed_size']
+                    
+                    summary['files_compressed'] += 1
+                    summary['total_size_after'] += compressed_size
+                    summary['space_saved'] += (file_size - compressed_size)
+                    
+                    # Add to processed set
+                    processed_files.add(key)
+                    
+                    if not self.quiet and not HAS_TQDM:
+                        compression_ratio = (1 - compressed_size/file_size) * 100 if file_size else 0.0
+                        click.echo(f"  ✅ {file_path.name}: {file_size/1024**2:.1f}MB → "
+                                  f"{compressed_size/1024**2:.1f}MB ({compression_ratio:.1f}% saved)")
+                    continue
                 
-                except CompressionError as e:
+                if outcome['status'] == 'skipped':
+                    summary['files_skipped'] += 1
+                else:
                     summary['files_failed'] += 1
                     summary['errors'].append({
-                        'file': str(file_path),
-                        'error': str(e),
+                        'file': key,
+                        'error': outcome.get('error') or 'unknown error',
                         'suggestion': 'Check file permissions and available disk space'
                     })
-                    
-                    # Remove backup if compression failed
-                    if backup_path and backup_path.exists():
-                        backup_path.unlink()
-                        summary['backups_created'] -= 1
                 
-                # Save checkpoint every 10 files
-                if len(processed_files) % 10 == 0:
-                    self._save_checkpoint(processed_files)
-                    
-            except Exception as e:
-                summary['files_failed'] += 1
-                summary['errors'].append({
-                    'file': str(file_path),
-                    'error': f'Unexpected error: {str(e)}',
-                    'suggestion': 'Check system resources and file access permissions'
-                })
+                # Remove backup if the file was not compressed
+                if backup_path and backup_path.exists():
+                    backup_path.unlink()
+                    summary['backups_created'] -= 1
+            
+            self._save_checkpoint(processed_files)
         
         # Calculate final statistics
         end_time = time.time()
@@ -366,7 +392,7 @@ class SafeArchiveManager:
             
             return report
         
-        except VerificationError as e:
+        except archive_verification.VerificationError as e:
             error_report = {
                 'timestamp': datetime.now().isoformat(),
                 'archive_directory': str(self.archive_dir),
@@ -402,6 +428,46 @@ class SafeArchiveManager:
                 logger.error(f"Archive directory does not exist: {self.archive_dir}")
             return stats
         
+        catalog = catalog_for(self.archive_dir)
+        if catalog is None:
+            return self._scan_statistics(stats)
+        
+        # Totals and per-directory breakdown come from one catalog query
+        directories = {}
+        for row in catalog.breakdown():
+            stats['total_files'] += row['files']
+            stats['total_size_bytes'] += row['size']
+            if row['kind'] == 'data':
+                file_type = 'jsonl' if row['compression'] == 'none' else 'compressed'
+            else:
+                file_type = 'other'
+            stats['file_types'][file_type]['count'] += row['files']
+            stats['file_types'][file_type]['size_bytes'] += row['size']
+            if row['source']:
+                directory = directories.setdefault(row['source'], {'name': row['source'], 'files': 0,
+                                                                   'size_bytes': 0})
+                directory['files'] += row['files']
+                directory['size_bytes'] += row['size']
+        stats['directories'] = list(directories.values())
+        
+        # Health score, sources, age distribution and recommendations
+        archive_stats = ArchiveStats().calculate(self.archive_dir)
+        stats['health_score'] = archive_stats['health_score']
+        stats['recommendations'] = archive_stats['recommendations']
+        stats['by_source'] = {
+            name: {'files': source['files'], 'size_bytes': source['size_mb'] * 1024 ** 2,
+                   'latest_file': source['latest']}
+            for name, source in archive_stats['by_source'].items()
+        }
+        stats['age_distribution'] = {
+            age: {'count': bucket['count'], 'size_bytes': int(bucket['size_mb'] * 1024 ** 2)}
+            for age, bucket in archive_stats['age_distribution'].items()
+        }
+        
+        return stats
+    
+    def _scan_statistics(self, stats: Dict[str, Any]) -> Dict[str, Any]:
+        """Walk the archive directly when the catalog is unavailable"""
         # Scan all files
         for file_path in self.archive_dir.rglob('*'):
             if file_path.is_file():
@@ -414,7 +480,7 @@ class SafeArchiveManager:
                     if file_path.suffix == '.jsonl':
                         stats['file_types']['jsonl']['count'] += 1
                         stats['file_types']['jsonl']['size_bytes'] += file_size
-                    elif file_path.suffixes == ['.jsonl', '.gz']:
+                    elif file_path.suffixes in (['.jsonl', '.gz'], ['.jsonl', '.zst']):
                         stats['file_types']['compressed']['count'] += 1
                         stats['file_types']['compressed']['size_bytes'] += file_size
                     else:
@@ -579,14 +645,19 @@ def cli(ctx, archive_dir, quiet, verbose):
 @click.option('--dry-run', is_flag=True, help='Show what would be done without executing')
 @click.option('--backup-days', type=int, default=7, help='Keep backups for N days')
 @click.option('--resume', is_flag=True, help='Resume from last checkpoint', default=True)
+@click.option('--algorithm', type=click.Choice(['gzip', 'zstd']), default='gzip',
+              help='Compression algorithm; zstd trains a dictionary per source (default: gzip)')
+@click.option('--workers', type=int, default=None,
+              help='Parallel compression processes (default: CPU count)')
 @click.pass_context
-def compress(ctx, age_days, dry_run, backup_days, resume):
+def compress(ctx, age_days, dry_run, backup_days, resume, algorithm, workers):
     """Compress old archive files with safety features"""
     archive_dir = ctx.obj['archive_dir']
     quiet = ctx.obj['quiet']
     
     try:
-        manager = SafeArchiveManager(archive_dir, dry_run=dry_run, quiet=quiet, backup_days=backup_days)
+        manager = SafeArchiveManager(archive_dir, dry_run=dry_run, quiet=quiet, backup_days=backup_days,
+                                     algorithm=algorithm, max_workers=workers)
         
         if dry_run and not quiet:
             click.echo(f"🔍 {click.style('DRY RUN MODE', fg='yellow', bold=True)} - No changes will be made\n")
@@ -623,7 +694,7 @@ def compress(ctx, age_days, dry_run, backup_days, resume):
                             click.echo(f"    💡 {error['suggestion']}", err=True)
             sys.exit(1)
         
-    except (CompressionError, DiskFullError) as e:
+    except (safe_compression.CompressionError, DiskFullError) as e:
         if not quiet:
             click.echo(f"❌ Compression failed: {e}", err=True)
             if isinstance(e, DiskFullError):
@@ -641,14 +712,16 @@ def compress(ctx, age_days, dry_run, backup_days, resume):
 @click.option('--source', type=click.Choice(['slack', 'calendar', 'drive']),
               help='Verify specific source only')
 @click.option('--json', 'output_json', is_flag=True, help='Output results as JSON')
+@click.option('--workers', type=int, default=None,
+              help='Parallel verification processes (default: CPU count)')
 @click.pass_context
-def verify(ctx, resume, source, output_json):
+def verify(ctx, resume, source, output_json, workers):
     """Verify archive integrity with enhanced reporting"""
     archive_dir = ctx.obj['archive_dir']
     quiet = ctx.obj['quiet']
     
     try:
-        manager = SafeArchiveManager(archive_dir, quiet=quiet)
+        manager = SafeArchiveManager(archive_dir, quiet=quiet, max_workers=workers)
         
         if not quiet:
             if source:
@@ -672,7 +745,7 @@ def verify(ctx, resume, source, output_json):
         elif result.get('errors_found', 0) > 0:
             sys.exit(1)
         
-    except VerificationError as e:
+    except archive_verification.VerificationError as e:
         if not quiet:
             click.echo(f"❌ Verification failed: {e}", err=True)
         sys.exit(1)
@@ -319,10 +319,10 @@ class OvernightCollectionOrchestrator:
         try:
             from src.collectors.employee_collector import EmployeeCollector
             
-            collector = EmployeeCollector()
             logger.info("👥 Collecting employee roster and identity mappings...")
             
-            result = collector.collect()
+            with EmployeeCollector() as collector:
+                result = collector.collect()
             duration = time.time() - start_time
             
             # Extract metrics from result
@@ -506,10 +506,9 @@ class OvernightCollectionOrchestrator:
             from src.collectors.drive_collector import DriveCollector
             
             logger.info("🚗 Starting Drive collection (implementation stub)...")
-            collector = DriveCollector()
-            
             # Run the stub implementation
-            result = collector.collect()
+            with DriveCollector() as collector:
+                result = collector.collect()
             duration = time.time() - start_time
             
             return CollectionResult(
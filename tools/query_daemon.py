@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Query Daemon CLI - start, stop and inspect the resident query daemon
+
+search_cli.py (search, stats), query_facts.py (stats and other activity
+summaries), find_slots.py and the Slack bot's /cos search use the daemon
+automatically while it runs and fall back to in-process execution when
+it does not.
+
+Usage:
+    python tools/query_daemon.py start                      # foreground
+    python tools/query_daemon.py start --idle-timeout 3600  # exit when idle
+    python tools/query_daemon.py status
+    python tools/query_daemon.py stop
+
+References:
+- src/cli/query_daemon.py - protocol, server and client proxies
+"""
+
+import argparse
+import json
+import logging
+import signal
+import sys
+from pathlib import Path
+
+# Add the project directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.cli.query_daemon import (
+    DaemonUnavailableError, QueryDaemon, QueryDaemonClient, QueryDaemonError, default_socket_path
+)
+
+
+def start(args) -> int:
+    daemon = QueryDaemon(args.socket, idle_timeout=args.idle_timeout)
+    try:
+        daemon.bind()
+    except QueryDaemonError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+    signal.signal(signal.SIGTERM, lambda signum, frame: daemon.stop())
+    print(f"🚀 Query daemon listening on {daemon.socket_path} (Ctrl+C to stop)")
+    try:
+        daemon.serve()
+    except KeyboardInterrupt:
+        daemon.close()
+    print("👋 Query daemon stopped")
+    return 0
+
+
+def status(args) -> int:
+    try:
+        with QueryDaemonClient(args.socket) as client:
+            info = client.ping()
+    except DaemonUnavailableError:
+        print(f"Query daemon not running ({args.socket or default_socket_path()})")
+        return 1
+
+    if args.json:
+        print(json.dumps(info, indent=2))
+    else:
+        print(f"Query daemon running: pid {info['pid']}, up {info['uptime']:.0f}s, "
+              f"{info['requests']} requests served")
+        for db_path in info['databases']:
+            print(f"  warm database: {db_path}")
+    return 0
+
+
+def stop(args) -> int:
+    try:
+        with QueryDaemonClient(args.socket) as client:
+            info = client.call('shutdown')
+    except DaemonUnavailableError:
+        print("Query daemon not running")
+        return 1
+    print(f"Stopping query daemon (pid {info['pid']})")
+    return 0
+
+
+def main():
+    """Query daemon CLI"""
+    parser = argparse.ArgumentParser(description="Resident query daemon for CLI tools and the Slack bot")
+    parser.add_argument('--socket', type=Path, default=None,
+                        help='Unix socket path (default: $AICOS_QUERY_DAEMON_SOCKET or per-user runtime path)')
+    subparsers = parser.add_subparsers(dest='command', help='Available commands')
+
+    start_parser = subparsers.add_parser('start', help='Run the daemon in the foreground')
+    start_parser.add_argument('--idle-timeout', type=float, default=None,
+                              help='Exit after this many seconds without requests')
+    start_parser.add_argument('--verbose', action='store_true', help='Log every request')
+
+    status_parser = subparsers.add_parser('status', help='Show whether the daemon is running')
+    status_parser.add_argument('--json', action='store_true', help='Output status as JSON')
+
+    subparsers.add_parser('stop', help='Ask a running daemon to exit')
+
+    args = parser.parse_args()
+    if not args.command:
+        parser.print_help()
+        return
+
+    if args.command == 'start':
+        logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO,
+                            format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+        sys.exit(start(args))
+    elif args.command == 'status':
+        sys.exit(status(args))
+    else:
+        sys.exit(stop(args))
+
+
+if __name__ == '__main__':
+    main()
@@ -22,6 +22,7 @@ Usage:
     python tools/query_facts.py person "john@example.com" --time-range "last week"
     python tools/query_facts.py patterns --pattern-type todos
     python tools/query_facts.py calendar find-slots --attendees "alice@example.com,bob@example.com"
+    python tools/query_facts.py export "last month" --gzip -o last_month.ndjson.gz
     python tools/query_facts.py --interactive
 
 Integration:
@@ -105,6 +106,7 @@ def cli(ctx, interactive, output_format, verbose, config_file):
         query_facts.py patterns --pattern-type todos --time-range "today"
         query_facts.py calendar find-slots --attendees "alice@example.com,bob@example.com"
         query_facts.py stats --time-range "last week" --breakdown channel
+        query_facts.py export "last month" --source slack > slack.ndjson
         query_facts.py --interactive
     
     \b
@@ -606,6 +608,80 @@ def stats(ctx, time_range, breakdown, person_ranking, include_trends, output_for
         sys.exit(exit_code)
 
 
+@cli.command()
+@click.argument('time_expression')
+@click.option('--db', 'db_path', default='search.db',
+              help='Path to search database (default: search.db)')
+@click.option('--source', type=click.Choice(['slack', 'calendar', 'drive', 'employees']),
+              help='Export only this source type')
+@click.option('--format', 'export_format', type=click.Choice(['ndjson', 'csv']),
+              default='ndjson', help='Export format (default: ndjson)')
+@click.option('-o', '--output', 'output_path', type=click.Path(dir_okay=False),
+              help='Output file (default: stdout)')
+@click.option('--gzip', 'compress', is_flag=True,
+              help='Gzip-compress the output')
+@click.option('--progress', is_flag=True,
+              help='Report export progress on stderr')
+@click.pass_context
+def export(ctx, time_expression, db_path, source, export_format, output_path, compress, progress):
+    """
+    Stream every record in a time range to NDJSON or CSV
+    
+    Records are written as they are read, in constant memory, so large
+    ranges can be exported for offline analysis (e.g. DuckDB read_json_auto).
+    
+    \b
+    Examples:
+        query_facts.py export "last week" > last_week.ndjson
+        query_facts.py export "this month" --source slack --format csv -o slack.csv
+        query_facts.py export "past 90 days" --gzip -o q.ndjson.gz --progress
+    """
+    try:
+        from src.queries.time_utils import parse_time_expression, TimeParsingError
+        from src.search.database import SearchDatabase
+        from src.search.export import export_messages
+        
+        try:
+            time_range = parse_time_expression(time_expression)
+        except TimeParsingError:
+            time_range = None
+        if not time_range:
+            raise ValidationError(
+                f"Invalid time expression: {time_expression}",
+                suggestion="Use expressions like 'today', 'last week', 'past 30 days', or '2025-08-19'"
+            )
+        
+        start_dt, end_dt = time_range
+        date_range = (start_dt.date().isoformat(), end_dt.date().isoformat())
+        
+        if not Path(db_path).exists():
+            raise QueryError(
+                f"Search database not found: {db_path}",
+                suggestion="Index archives first with: python tools/search_cli.py index"
+            )
+        
+        def progress_callback(written: int, rate: float):
+            if progress:
+                click.echo(f"Exported {written:,} records at {rate:,.0f} records/sec", err=True)
+        
+        exported = export_messages(
+            SearchDatabase(db_path),
+            output_path=output_path,
+            output_format=export_format,
+            compress=compress,
+            source=source,
+            date_range=date_range,
+            progress_callback=progress_callback
+        )
+        
+        if progress or output_path:
+            click.echo(f"✓ Exported {exported:,} records ({date_range[0]} to {date_range[1]})", err=True)
+        
+    except Exception as e:
+        exit_code = handle_cli_error(e, quiet=False, verbose=ctx.obj['verbose'])
+        sys.exit(exit_code)
+
+
 def start_interactive_mode(ctx):
     """Start interactive query session"""
     session = InteractiveSession(
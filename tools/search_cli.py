@@ -18,6 +18,8 @@ Key Features:
 Integration:
 - Uses SearchDatabase from Sub-Agent A1 for database operations
 - Uses ArchiveIndexer from Sub-Agent A2 for indexing operations
+- Search and stats go through the query daemon when it is running
+  (tools/query_daemon.py), falling back to an in-process SearchDatabase
 - Supports all data sources: slack, calendar, drive, employees
 
 Usage:
@@ -26,6 +28,7 @@ Usage:
     python tools/search_cli.py search --interactive
     python tools/search_cli.py index --source slack /path/to/archive.jsonl
     python tools/search_cli.py stats --format json
+    python tools/search_cli.py export-columnar -o data/parquet
 
 References:
 - tasks_A.md lines 1334-1717 for implementation requirements
@@ -49,10 +52,17 @@ import click
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from src.core.lazy_import import lazy_import
 from src.search.database import SearchDatabase, DatabaseError
-from src.search.indexer import ArchiveIndexer, IndexingError
-from src.search.migrations import MigrationManager, MigrationError
-from src.search.schema_validator import SchemaValidator
+from src.search.pagination import InvalidCursorError
+from src.search.export import export_messages, ExportError, EXPORT_FORMATS
+from src.cli.query_daemon import open_search_database
+
+# Only the subcommands that use these pay for them (pyarrow, psutil, ...)
+columnar_export = lazy_import('src.search.columnar_export')
+indexer_module = lazy_import('src.search.indexer')
+search_migrations = lazy_import('src.search.migrations')
+schema_validator = lazy_import('src.search.schema_validator')
 
 
 class SearchCLIError(Exception):
@@ -75,9 +85,12 @@ def search_cli():
         search --source slack "project deadline" 
         search --start-date 2025-08-01 --end-date 2025-08-31 "birthday"
         search --format json "important announcement" > results.json
+        search --page 2 "team meeting"
+        search --cursor <token> "team meeting"
         search --interactive
         index --source slack /path/to/slack_archive.jsonl
         stats --format json
+        export --start-date 2025-08-01 --end-date 2025-08-31 --gzip -o aug.ndjson.gz
         migrate apply 001_initial_schema.sql
         migrate status
     """
@@ -98,6 +111,10 @@ def search_cli():
 @click.option('--format', 'output_format', 
               type=click.Choice(['table', 'json', 'csv']), default='table',
               help='Output format (default: table)')
+@click.option('--page', type=click.IntRange(min=1), default=1,
+              help='Page of results to show, --limit results per page (default: 1)')
+@click.option('--cursor', type=str,
+              help='Continuation token printed with a previous page')
 @click.option('--interactive', is_flag=True,
               help='Start interactive search session')
 @click.option('--verbose', is_flag=True,
@@ -105,6 +122,7 @@ def search_cli():
 @click.argument('query', required=False)
 def search(db_path: str, source: Optional[str], start_date: Optional[str], 
            end_date: Optional[str], limit: int, output_format: str,
+           page: int, cursor: Optional[str],
            interactive: bool, verbose: bool, query: Optional[str]):
     """
     Search indexed archives using natural language queries
@@ -120,20 +138,31 @@ def search(db_path: str, source: Optional[str], start_date: Optional[str],
         --source slack "meeting"     # Search only Slack messages
         --start-date 2025-08-01      # Results after date
         --limit 5                    # Top 5 results only
+        
+    \b
+    Paging Examples:
+        --page 3 "meeting"           # Third page of --limit results
+        --cursor <token> "meeting"   # Continue from a printed token
     """
     try:
-        # Initialize database
-        db = SearchDatabase(db_path)
+        # Initialize database (served by the query daemon when it is running)
+        db = open_search_database(db_path)
         
         if interactive:
             run_interactive_search(db, source, start_date, end_date, limit, output_format, verbose)
         elif query:
-            results = perform_search(db, query, source, start_date, end_date, limit)
-            display_results(results, output_format, verbose, query, db)
+            result_page = perform_search_page(db, query, source, start_date, end_date,
+                                              limit, cursor=cursor, page=page)
+            display_results(result_page['results'], output_format, verbose, query, db)
+            paging_requested = cursor is not None or page > 1
+            display_next_cursor(result_page['next_cursor'], output_format, paging_requested)
         else:
             click.echo("Error: Query required in non-interactive mode. Use --help for usage.", err=True)
             sys.exit(1)
             
+    except InvalidCursorError as e:
+        click.echo(f"Invalid cursor: {str(e)}", err=True)
+        sys.exit(1)
     except DatabaseError as e:
         click.echo(f"Database error: {str(e)}", err=True)
         sys.exit(1)
@@ -164,7 +193,7 @@ def index(db_path: str, source: str, progress: bool, batch_size: int, archive_pa
     try:
         # Initialize database and indexer
         db = SearchDatabase(db_path)
-        indexer = ArchiveIndexer(db, batch_size=batch_size)
+        indexer = indexer_module.ArchiveIndexer(db, batch_size=batch_size)
         
         archive_path = Path(archive_path)
         
@@ -206,7 +235,7 @@ def index(db_path: str, source: str, progress: bool, batch_size: int, archive_pa
                     for error in stats.errors[:5]:  # Show first 5 errors
                         click.echo(f"  • {error}")
         
-    except (DatabaseError, IndexingError) as e:
+    except (DatabaseError, indexer_module.IndexingError) as e:
         click.echo(f"Indexing error: {str(e)}", err=True)
         sys.exit(1)
     except Exception as e:
@@ -228,7 +257,7 @@ def stats(db_path: str, output_format: str):
     and database health metrics.
     """
     try:
-        db = SearchDatabase(db_path)
+        db = open_search_database(db_path)
         stats_data = db.get_stats()
         
         if output_format == 'json':
@@ -244,6 +273,163 @@ def stats(db_path: str, output_format: str):
         sys.exit(1)
 
 
+@search_cli.command()
+@click.option('--db', 'db_path', default='search.db',
+              help='Path to search database (default: search.db)')
+@click.option('--source', type=click.Choice(['slack', 'calendar', 'drive', 'employees']),
+              help='Export only this source type')
+@click.option('--start-date', type=str,
+              help='Start date filter (YYYY-MM-DD format)')
+@click.option('--end-date', type=str,
+              help='End date filter (YYYY-MM-DD format)')
+@click.option('--query', type=str,
+              help='Optional full-text query to restrict the export')
+@click.option('--format', 'output_format', type=click.Choice(list(EXPORT_FORMATS)),
+              default='ndjson', help='Export format (default: ndjson)')
+@click.option('-o', '--output', 'output_path', type=click.Path(dir_okay=False),
+              help='Output file (default: stdout)')
+@click.option('--gzip', 'compress', is_flag=True,
+              help='Gzip-compress the output')
+@click.option('--batch-size', type=click.IntRange(min=1), default=1000,
+              help='Rows fetched from SQLite per round trip (default: 1000)')
+@click.option('--progress', is_flag=True,
+              help='Report export progress on stderr')
+def export(db_path: str, source: Optional[str], start_date: Optional[str],
+           end_date: Optional[str], query: Optional[str], output_format: str,
+           output_path: Optional[str], compress: bool, batch_size: int, progress: bool):
+    """
+    Stream indexed records to NDJSON or CSV in constant memory
+    
+    Rows are written as they are read from the database, so exports of any
+    size start immediately and never hold the full result set in memory.
+    
+    \b
+    Examples:
+        export --source slack --start-date 2025-08-01 --end-date 2025-08-31 > aug.ndjson
+        export --format csv --gzip -o exports/calendar.csv.gz --source calendar
+        export --query "deadline" --progress -o deadlines.ndjson
+    """
+    try:
+        if bool(start_date) != bool(end_date):
+            raise SearchCLIError("--start-date and --end-date must be used together")
+        for date_value in (start_date, end_date):
+            if date_value and not validate_date_format(date_value):
+                raise SearchCLIError(f"Invalid date format: {date_value} (expected YYYY-MM-DD)")
+        
+        db = SearchDatabase(db_path)
+        date_range = (start_date, end_date) if start_date else None
+        
+        def progress_callback(written: int, rate: float):
+            if progress:
+                click.echo(f"Exported {written:,} records at {rate:,.0f} records/sec", err=True)
+        
+        start_time = time.time()
+        exported = export_messages(
+            db,
+            output_path=output_path,
+            output_format=output_format,
+            compress=compress,
+            query=enhance_query(query) if query else None,
+            source=source,
+            date_range=date_range,
+            batch_size=batch_size,
+            progress_callback=progress_callback
+        )
+        
+        if progress or output_path:
+            duration = time.time() - start_time
+            destination = output_path or 'stdout'
+            click.echo(f"✓ Exported {exported:,} records to {destination} in {duration:.2f} seconds",
+                       err=True)
+    
+    except (SearchCLIError, ExportError) as e:
+        click.echo(f"Export error: {str(e)}", err=True)
+        sys.exit(1)
+    except DatabaseError as e:
+        click.echo(f"Database error: {str(e)}", err=True)
+        sys.exit(1)
+    except Exception as e:
+        click.echo(f"Unexpected error: {str(e)}", err=True)
+        sys.exit(1)
+
+
+@search_cli.command('export-columnar')
+@click.option('--db', 'db_path', default='search.db',
+              help='Path to search database (default: search.db)')
+@click.option('-o', '--output', 'output_dir', required=True,
+              type=click.Path(file_okay=False),
+              help='Root directory of the Parquet dataset')
+@click.option('--full', is_flag=True,
+              help='Ignore the watermark and rebuild the dataset from scratch')
+@click.option('--compression', type=click.Choice(['zstd', 'snappy', 'gzip', 'none']),
+              default='zstd', help='Parquet compression codec (default: zstd)')
+@click.option('--row-group-size', type=click.IntRange(min=1), default=50000,
+              help='Rows per Parquet row group (default: 50000)')
+@click.option('--batch-size', type=click.IntRange(min=1), default=1000,
+              help='Rows fetched from SQLite per round trip (default: 1000)')
+@click.option('--progress', is_flag=True,
+              help='Report export progress on stderr')
+def export_columnar_command(db_path: str, output_dir: str, full: bool, compression: str,
+                            row_group_size: int, batch_size: int, progress: bool):
+    """
+    Snapshot the index into partitioned Parquet for analytics
+    
+    Writes messages, calendar events, attendees and daily rollups partitioned
+    by source and month. Reruns only export records added since the last run.
+    Requires pyarrow.
+    
+    \b
+    Examples:
+        export-columnar -o data/parquet
+        export-columnar -o data/parquet --full --compression snappy
+    
+    \b
+    DuckDB:
+        SELECT * FROM read_parquet('data/parquet/messages/*/*/*.parquet',
+                                   hive_partitioning = true)
+        WHERE source = 'slack' AND month = '2025-08'
+    """
+    try:
+        db = SearchDatabase(db_path)
+        
+        def progress_callback(read: int):
+            if progress:
+                click.echo(f"Read {read:,} records", err=True)
+        
+        start_time = time.time()
+        summary = columnar_export.export_columnar(
+            db,
+            output_dir,
+            full=full,
+            batch_size=batch_size,
+            row_group_size=row_group_size,
+            compression=compression,
+            progress_callback=progress_callback
+        )
+        duration = time.time() - start_time
+        
+        rows = summary['rows']
+        if not rows:
+            click.echo(f"✓ No new records since watermark {summary['watermark']}")
+            return
+        
+        click.echo(f"✓ Exported to {summary['output_dir']} in {duration:.2f} seconds")
+        for table, count in sorted(rows.items()):
+            click.echo(f"  {table}: {count:,} rows")
+        click.echo(f"  Files written: {summary['files_written']}")
+        click.echo(f"  Watermark: {summary['previous_watermark']} -> {summary['watermark']}")
+    
+    except columnar_export.ColumnarExportError as e:
+        click.echo(f"Export error: {str(e)}", err=True)
+        sys.exit(1)
+    except DatabaseError as e:
+        click.echo(f"Database error: {str(e)}", err=True)
+        sys.exit(1)
+    except Exception as e:
+        click.echo(f"Unexpected error: {str(e)}", err=True)
+        sys.exit(1)
+
+
 def run_interactive_search(db: SearchDatabase, source: Optional[str], 
                           start_date: Optional[str], end_date: Optional[str],
                           limit: int, output_format: str, verbose: bool):
@@ -259,10 +445,14 @@ def run_interactive_search(db: SearchDatabase, source: Optional[str],
     click.echo()
     click.echo("Special commands:")
     click.echo("  /stats  - Show database statistics") 
+    click.echo("  /more   - Show the next page of the last search")
     click.echo("  /help   - Show help information")
     click.echo("  q, quit, exit - Quit interactive mode")
     click.echo()
     
+    last_query = None
+    next_cursor = None
+    
     while True:
         try:
             query = click.prompt(click.style("Search>", fg='green'), type=str)
@@ -274,18 +464,33 @@ def run_interactive_search(db: SearchDatabase, source: Optional[str],
             if not query.strip():
                 continue
             
-            # Handle special commands
-            if query.startswith('/'):
+            # Continue the previous search from its cursor
+            if query.strip() == '/more':
+                if not next_cursor:
+                    click.echo(click.style("No more results.", fg='yellow'))
+                    continue
+                query = last_query
+                page_cursor = next_cursor
+            elif query.startswith('/'):
+                # Handle special commands
                 handle_special_command(query, db)
                 continue
+            else:
+                page_cursor = None
             
             # Perform search
             click.echo()  # Blank line before results
-            results = perform_search(db, query, source, start_date, end_date, limit)
+            result_page = perform_search_page(db, query, source, start_date, end_date,
+                                              limit, cursor=page_cursor)
+            results = result_page['results']
+            last_query = query
+            next_cursor = result_page['next_cursor']
             
             if results:
                 click.echo(f"Found {click.style(str(len(results)), fg='cyan')} results:")
                 display_results(results, output_format, verbose, query, db)
+                if next_cursor:
+                    click.echo(click.style("More results available - type /more", dim=True))
             else:
                 click.echo(click.style("No results found.", fg='yellow'))
                 suggest_alternatives(query, db)
@@ -305,6 +510,20 @@ def perform_search(db: SearchDatabase, query: str, source: Optional[str],
                   start_date: Optional[str], end_date: Optional[str],
                   limit: int) -> List[Dict[str, Any]]:
     """Perform search with query enhancement and return results"""
+    return perform_search_page(db, query, source, start_date, end_date, limit)['results']
+
+
+def perform_search_page(db: SearchDatabase, query: str, source: Optional[str],
+                        start_date: Optional[str], end_date: Optional[str],
+                        limit: int, cursor: Optional[str] = None,
+                        page: int = 1) -> Dict[str, Any]:
+    """
+    Perform a keyset-paged search and return {'results', 'next_cursor'}
+    
+    With a cursor the page after it is returned. Otherwise --page N follows the
+    cursor chain from the first page; each hop is a bounded index range, so
+    deep pages never re-rank and discard skipped rows the way OFFSET does.
+    """
     
     # Parse date range
     date_range = None
@@ -315,14 +534,44 @@ def perform_search(db: SearchDatabase, query: str, source: Optional[str],
     processed_query = enhance_query(query)
     
     # Execute search
-    results = db.search(
+    result_page = db.search_page(
         query=processed_query,
         source=source,
         date_range=date_range,
-        limit=limit
+        limit=limit,
+        cursor=cursor
     )
     
-    return results
+    for _ in range(page - 1):
+        if not result_page['next_cursor']:
+            return {'results': [], 'next_cursor': None}
+        result_page = db.search_page(
+            query=processed_query,
+            source=source,
+            date_range=date_range,
+            limit=limit,
+            cursor=result_page['next_cursor']
+        )
+    
+    return result_page
+
+
+def display_next_cursor(next_cursor: Optional[str], output_format: str,
+                        paging_requested: bool):
+    """
+    Tell the user how to fetch the next page
+    
+    Table output gets a footer line. Machine formats keep stdout clean and only
+    report the token on stderr when the caller is already paging.
+    """
+    if not next_cursor:
+        return
+    
+    if output_format == 'table':
+        click.echo()
+        click.echo(click.style(f"More results: --cursor {next_cursor}", dim=True))
+    elif paging_requested:
+        click.echo(f"next_cursor: {next_cursor}", err=True)
 
 
 def enhance_query(query: str) -> str:
@@ -536,6 +785,7 @@ def handle_special_command(command: str, db: SearchDatabase):
         click.echo()
         click.echo("Special Commands:")
         click.echo("  /stats                    # Database statistics")
+        click.echo("  /more                     # Next page of the last search")
         click.echo("  /help                     # This help message")
         click.echo("  q, quit, exit            # Quit interactive mode")
         click.echo()
@@ -608,7 +858,7 @@ def migrate():
 def status(db_path: str, migrations_dir: Optional[str]):
     """Show current migration status and available migrations"""
     try:
-        migration_manager = MigrationManager(db_path, migrations_dir)
+        migration_manager = search_migrations.MigrationManager(db_path, migrations_dir)
         status_info = migration_manager.get_migration_status()
         
         click.echo(click.style("Database Migration Status", fg='cyan', bold=True))
@@ -642,7 +892,7 @@ def status(db_path: str, migrations_dir: Optional[str]):
             for failed in status_info['failed_migrations']:
                 click.echo(f"  ✗ {failed['filename']}: {failed['error']}")
     
-    except MigrationError as e:
+    except search_migrations.MigrationError as e:
         click.echo(f"Migration error: {str(e)}", err=True)
         sys.exit(1)
     except Exception as e:
@@ -661,7 +911,7 @@ def status(db_path: str, migrations_dir: Optional[str]):
 def apply(db_path: str, migrations_dir: Optional[str], dry_run: bool, migration_file: str):
     """Apply a specific migration file"""
     try:
-        migration_manager = MigrationManager(db_path, migrations_dir)
+        migration_manager = search_migrations.MigrationManager(db_path, migrations_dir)
         
         if dry_run:
             # Show what would be applied
@@ -713,7 +963,7 @@ def apply(db_path: str, migrations_dir: Optional[str], dry_run: bool, migration_
                 click.echo(f"  Error: {result['message']}")
             sys.exit(1)
     
-    except MigrationError as e:
+    except search_migrations.MigrationError as e:
         click.echo(f"Migration error: {str(e)}", err=True)
         sys.exit(1)
     except Exception as e:
@@ -732,7 +982,7 @@ def apply(db_path: str, migrations_dir: Optional[str], dry_run: bool, migration_
 def rollback(db_path: str, migrations_dir: Optional[str], confirm: bool, target_version: int):
     """Rollback database to a specific version"""
     try:
-        migration_manager = MigrationManager(db_path, migrations_dir)
+        migration_manager = search_migrations.MigrationManager(db_path, migrations_dir)
         current_version = migration_manager.get_current_version()
         
         if target_version >= current_version:
@@ -780,7 +1030,7 @@ def rollback(db_path: str, migrations_dir: Optional[str], confirm: bool, target_
                 click.echo(f"  Error: {result['message']}")
             sys.exit(1)
     
-    except MigrationError as e:
+    except search_migrations.MigrationError as e:
         click.echo(f"Migration error: {str(e)}", err=True)
         sys.exit(1)
     except Exception as e:
@@ -797,7 +1047,7 @@ def rollback(db_path: str, migrations_dir: Optional[str], confirm: bool, target_
 def validate(db_path: str, output_format: str):
     """Validate database schema integrity and consistency"""
     try:
-        validator = SchemaValidator(db_path)
+        validator = schema_validator.SchemaValidator(db_path)
         
         click.echo("Validating database schema...")
         
@@ -874,7 +1124,7 @@ def validate(db_path: str, output_format: str):
 def discover(db_path: str, migrations_dir: Optional[str]):
     """Discover and list all available migration files"""
     try:
-        migration_manager = MigrationManager(db_path, migrations_dir)
+        migration_manager = search_migrations.MigrationManager(db_path, migrations_dir)
         migrations = migration_manager.discover_migrations()
         applied_migrations = {m['version'] for m in migration_manager.get_applied_migrations()}
         
@@ -903,7 +1153,7 @@ def discover(db_path: str, migrations_dir: Optional[str]):
             
             click.echo()
     
-    except MigrationError as e:
+    except search_migrations.MigrationError as e:
         click.echo(f"Migration error: {str(e)}", err=True)
         sys.exit(1)
     except Exception as e:
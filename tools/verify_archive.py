@@ -26,16 +26,21 @@ References: CLAUDE.md commandments about production quality code
 
 import json
 import gzip
+import io
 import sys
 import re
 import hashlib
 import traceback
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import BinaryIO, List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from collections import defaultdict
 import logging
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.verification_cache import CACHE_FILENAME, VerificationCache, verify_files_parallel
+
 # Set up comprehensive logging
 logging.basicConfig(
     level=logging.INFO,
@@ -69,9 +74,20 @@ class ArchiveVerifier:
     - Data quality assessment
     """
 
-    def __init__(self, verbose: bool = False):
-        """Initialize the comprehensive verifier"""
+    def __init__(self, verbose: bool = False, max_workers: Optional[int] = None,
+                 use_cache: bool = True):
+        """
+        Initialize the comprehensive verifier
+        
+        Args:
+            verbose: Detailed per-file logging
+            max_workers: Worker processes for file verification (defaults to CPU count)
+            use_cache: Skip files unchanged since their last verification
+        """
         self.verbose = verbose
+        self.max_workers = max_workers
+        self.use_cache = use_cache
+        self.files_from_cache = 0
         self.total_files_checked = 0
         self.total_errors_found = 0
         self.total_records_validated = 0
@@ -104,12 +120,14 @@ class ArchiveVerifier:
         if verbose:
             logger.info("📊 Verbose mode enabled - detailed validation reporting")
 
-    def validate_jsonl_format(self, file_path: Path) -> List[Dict[str, Any]]:
+    def validate_jsonl_format(self, file_path: Path,
+                              fileobj: Optional[BinaryIO] = None) -> List[Dict[str, Any]]:
         """
         Validate JSONL file format line by line
         
         Args:
             file_path: Path to JSONL file to validate
+            fileobj: Open binary stream of file_path to read instead of the path
             
         Returns:
             List of error dictionaries with line numbers and messages
@@ -123,7 +141,9 @@ class ArchiveVerifier:
         errors = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
+            stream = (io.TextIOWrapper(fileobj, encoding='utf-8') if fileobj is not None
+                      else open(file_path, 'r', encoding='utf-8'))
+            with stream as f:
                 for line_number, line in enumerate(f, 1):
                     line = line.strip()
                     if not line:  # Skip empty lines
@@ -164,12 +184,14 @@ class ArchiveVerifier:
             logger.warning(f"Error checking file {file_path}: {e}")
             return False
 
-    def validate_compressed_file(self, compressed_path: Path) -> bool:
+    def validate_compressed_file(self, compressed_path: Path,
+                                 fileobj: Optional[BinaryIO] = None) -> bool:
         """
         Validate compressed file integrity
         
         Args:
             compressed_path: Path to compressed file
+            fileobj: Open binary stream of compressed_path to read instead of the path
             
         Returns:
             True if file is valid, False otherwise
@@ -179,7 +201,7 @@ class ArchiveVerifier:
                 return False
             
             # Try to read the compressed file
-            with gzip.open(compressed_path, 'rb') as f:
+            with gzip.open(fileobj if fileobj is not None else compressed_path, 'rb') as f:
                 # Read in chunks to avoid memory issues
                 while True:
                     chunk = f.read(8192)
@@ -237,47 +259,74 @@ class ArchiveVerifier:
         
         return issues
 
-    def verify_files_batch(self, file_paths: List[Path]) -> List[Dict[str, Any]]:
+    def verify_file(self, file_path: Path, fileobj: Optional[BinaryIO] = None) -> Dict[str, Any]:
         """
-        Verify multiple files in batch
+        Verify a single archive file
         
         Args:
-            file_paths: List of file paths to verify
+            file_path: File to verify
+            fileobj: Open binary stream of file_path to read instead of the path
             
         Returns:
-            List of verification results for each file
+            Verification result with file_path, valid and errors keys
         """
-        results = []
+        result = {
+            'file_path': str(file_path),
+            'valid': True,
+            'errors': []
+        }
         
-        for file_path in file_paths:
-            result = {
-                'file_path': str(file_path),
-                'valid': True,
-                'errors': []
-            }
+        try:
+            # Check if it's a compressed file
+            if file_path.suffix == '.gz':
+                if not self.validate_compressed_file(file_path, fileobj):
+                    result['valid'] = False
+                    result['errors'].append('Compressed file integrity check failed')
+            elif file_path.suffix == '.jsonl':
+                # Validate JSONL format
+                format_errors = self.validate_jsonl_format(file_path, fileobj)
+                if format_errors:
+                    result['valid'] = False
+                    result['errors'] = format_errors
+            else:
+                # Just check if file exists and is readable
+                if not self.check_file_exists(file_path):
+                    result['valid'] = False
+                    result['errors'].append('File does not exist or is not readable')
             
-            try:
-                # Check if it's a compressed file
-                if file_path.suffix == '.gz':
-                    if not self.validate_compressed_file(file_path):
-                        result['valid'] = False
-                        result['errors'].append('Compressed file integrity check failed')
-                elif file_path.suffix == '.jsonl':
-                    # Validate JSONL format
-                    format_errors = self.validate_jsonl_format(file_path)
-                    if format_errors:
-                        result['valid'] = False
-                        result['errors'] = format_errors
-                else:
-                    # Just check if file exists and is readable
-                    if not self.check_file_exists(file_path):
-                        result['valid'] = False
-                        result['errors'].append('File does not exist or is not readable')
-                
-            except Exception as e:
-                result['valid'] = False
-                result['errors'].append(f'Verification failed: {e}')
+        except Exception as e:
+            result['valid'] = False
+            result['errors'].append(f'Verification failed: {e}')
+        
+        return result
+
+    def verify_files_batch(self, file_paths: List[Path],
+                           cache: Optional[VerificationCache] = None) -> List[Dict[str, Any]]:
+        """
+        Verify multiple files in batch on a process pool
+        
+        Args:
+            file_paths: List of file paths to verify
+            cache: Optional verdict cache; unchanged files reuse their last verdict
             
+        Returns:
+            List of verification results for each file, in input order
+        """
+        by_path = {}
+        for file_path, result, cached in verify_files_parallel(
+                file_paths, _verify_file_task, cache=cache, max_workers=self.max_workers):
+            if 'valid' not in result:
+                # File vanished or the worker died before producing a verdict
+                result = {'file_path': str(file_path), 'valid': False, 'errors': result['errors']}
+            if cached:
+                self.files_from_cache += 1
+            by_path[str(file_path)] = result
+            if not result['valid'] and self.verbose:
+                logger.warning(f"❌ {file_path}: {len(result['errors'])} issues")
+        
+        results = []
+        for file_path in file_paths:
+            result = by_path[str(file_path)]
             results.append(result)
             self.total_files_checked += 1
             if not result['valid']:
@@ -757,9 +806,12 @@ class ArchiveVerifier:
             for pattern in file_patterns:
                 files_to_check.extend(archive_dir.glob(pattern))
             
-            # Verify files in batch
+            # Verify files in batch; unchanged files reuse their cached verdict
             if files_to_check:
-                verification_results = self.verify_files_batch(files_to_check)
+                cache = VerificationCache(archive_dir / CACHE_FILENAME) if self.use_cache else None
+                self.files_from_cache = 0
+                verification_results = self.verify_files_batch(files_to_check, cache=cache)
+                report['summary']['cached_files'] = self.files_from_cache
                 
                 # Process results
                 for result in verification_results:
@@ -943,6 +995,18 @@ class ArchiveVerifier:
         logger.info("="*80)
 
 
+# One verifier per worker process, created on its first task
+_worker_verifier: Optional[ArchiveVerifier] = None
+
+
+def _verify_file_task(file_path: Path, fileobj: BinaryIO) -> Dict[str, Any]:
+    """Process-pool entry point: verify one file read from fileobj"""
+    global _worker_verifier
+    if _worker_verifier is None:
+        _worker_verifier = ArchiveVerifier()
+    return _worker_verifier.verify_file(Path(file_path), fileobj)
+
+
 def main():
     """Command line interface for comprehensive archive verification"""
     import argparse
@@ -987,6 +1051,17 @@ This tool validates:
         action='store_true', 
         help='Detailed validation output with file-by-file reporting'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Worker processes for file verification (default: CPU count)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Re-verify every file, ignoring cached verdicts for unchanged files'
+    )
     
     args = parser.parse_args()
     
@@ -999,7 +1074,8 @@ This tool validates:
         logging.getLogger().setLevel(logging.INFO)
     
     # Initialize enhanced verifier
-    verifier = ArchiveVerifier(verbose=args.verbose)
+    verifier = ArchiveVerifier(verbose=args.verbose, max_workers=args.workers,
+                               use_cache=not args.no_cache)
     
     try:
         logger.info("🔍 Starting comprehensive archive validation...")
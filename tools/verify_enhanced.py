@@ -53,7 +53,8 @@ def main():
     parser.add_argument(
         '--resume',
         action='store_true',
-        help='Resume from last checkpoint if interrupted'
+        help='Resume a line-level checkpoint if interrupted (pooled workers do not '
+             'write one; they resume per file through the verification cache)'
     )
     
     parser.add_argument(
@@ -62,6 +63,25 @@ def main():
         help='Show detailed progress and error information'
     )
     
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Worker processes for directory verification (default: CPU count)'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Re-verify every file, ignoring cached verdicts for unchanged files'
+    )
+    
+    parser.add_argument(
+        '--report',
+        type=Path,
+        help='Stream per-record errors to this JSONL file as files finish'
+    )
+    
     args = parser.parse_args()
     
     # Initialize verifier
@@ -135,13 +155,17 @@ def main():
             if args.verbose:
                 print(f"📂 Verifying entire archive directory...")
             
-            stats = verifier.verify_directory(args.archive_path, resume=args.resume)
+            stats = verifier.verify_directory(args.archive_path, resume=args.resume,
+                                              max_workers=args.workers,
+                                              use_cache=not args.no_cache,
+                                              report_path=args.report)
             
             if args.json:
                 print(json.dumps(stats, indent=2))
             else:
                 print(f"📊 Directory Verification Complete:")
                 print(f"   Files checked: {stats['files_checked']}")
+                print(f"   Unchanged (cached): {stats.get('files_cached', 0)}")
                 print(f"   Records verified: {stats['records_verified']:,}")
                 print(f"   Errors found: {len(stats['errors'])}")
                 